@@ -0,0 +1,184 @@
+"""Timing, allocation tracking and baseline comparison for the benchmarks."""
+
+import collections
+import json
+import math
+import time
+import tracemalloc
+import typing  # NOQA: F401
+
+DEFAULT_TOLERANCE = 0.5
+
+# Metrics compared against the baseline; lower is better for each.  The
+# median latency is compared rather than the mean, which a few slow calls
+# on a busy machine can skew.  Peak allocation is deterministic, so it is
+# compared without tolerance.
+COMPARED_METRICS = ('p50_us', 'alloc_bytes_per_item')
+
+# Decimal places of the metrics stored in a baseline.
+_BASELINE_DIGITS = 2
+
+
+Result_ = collections.namedtuple(
+    'Result_',
+    ['name', 'items_per_s', 'ns_per_item', 'alloc_bytes_per_item', 'p50_us', 'p99_us'])
+
+
+class Result(Result_):
+    """Measurements of one benchmarked operation.
+
+    An item is whatever the operation processes: a frame for frame
+    benchmarks, a signal value for signal benchmarks.
+
+    Attributes:
+        name(str): Benchmark name.
+        items_per_s(float): Throughput.
+        ns_per_item(float): Mean time per item.
+        alloc_bytes_per_item(float): Peak bytes per item: the most memory
+            traced during one call beyond what was allocated before it,
+            divided by the items the call processes.  This is not a count
+            of allocations, and memory freed during the call is included.
+        p50_us(float): Median call latency in microseconds.
+        p99_us(float): 99th percentile call latency in microseconds.
+    """
+
+    pass
+
+
+Regression_ = collections.namedtuple('Regression_', ['name', 'metric', 'baseline', 'current'])
+
+
+class Regression(Regression_):
+    """A metric that got worse than its baseline by more than the tolerance.
+
+    Attributes:
+        name(str): Benchmark name.
+        metric(str): The :any:`Result` field that regressed.
+        baseline(float): The stored value.
+        current(float): The measured value.
+    """
+
+    pass
+
+
+def _percentile(sorted_values, fraction):
+    # type: (typing.List[int], float) -> int
+    """Return a nearest-rank percentile.
+
+    >>> _percentile([1, 2, 3, 4], 0.5), _percentile([1, 2, 3, 4], 0.99)
+    (2, 4)
+    """
+    return sorted_values[max(0, math.ceil(fraction * len(sorted_values)) - 1)]
+
+
+def measure(name, operation, items_per_call, calls, setup=None):
+    # type: (typing.Text, typing.Callable[[], typing.Any], int, int, typing.Optional[typing.Callable[[], typing.Any]]) -> Result  # NOQA: E501
+    """Time ``calls`` calls of ``operation`` and measure one call's allocations.
+
+    ``setup`` runs before every call, outside the timed region, for example
+    to queue the frames the next read will return.
+    """
+    if setup is not None:
+        setup()
+    operation()
+
+    latencies = []
+    for _ in range(calls):
+        if setup is not None:
+            setup()
+        start = time.perf_counter_ns()
+        operation()
+        latencies.append(time.perf_counter_ns() - start)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        operation()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    ns_per_item = sum(latencies) / (len(latencies) * items_per_call)
+    return Result(
+        name,
+        1e9 / ns_per_item,
+        ns_per_item,
+        (peak - current) / items_per_call,
+        _percentile(latencies, 0.50) / 1e3,
+        _percentile(latencies, 0.99) / 1e3)
+
+
+def load_baseline(path):
+    # type: (typing.Text) -> typing.Dict[typing.Text, typing.Dict[typing.Text, float]]
+    with open(path) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path, results):
+    # type: (typing.Text, typing.Iterable[Result]) -> None
+    baseline = {
+        result.name: {metric: round(getattr(result, metric), _BASELINE_DIGITS) for metric in COMPARED_METRICS}
+        for result in results}
+    with open(path, 'w') as baseline_file:
+        json.dump(baseline, baseline_file, indent=4, sort_keys=True)
+        baseline_file.write('\n')
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    # type: (typing.Iterable[Result], typing.Dict[typing.Text, typing.Dict[typing.Text, float]], float) -> typing.List[Regression]  # NOQA: E501
+    """Return the metrics that got worse than their baseline.
+
+    The median latency may exceed its baseline by up to ``tolerance``, as a
+    fraction.  The peak bytes per item may not exceed it at all, once rounded
+    like the stored baseline.  Benchmarks missing from the baseline are not
+    compared.
+
+    >>> result = Result('read', 1e6, 1000.0, 64.001, 10.0, 20.0)
+    >>> compare([result], {'read': {'p50_us': 5.0, 'alloc_bytes_per_item': 64.0}})
+    [Regression(name='read', metric='p50_us', baseline=5.0, current=10.0)]
+    >>> compare([result], {'read': {'p50_us': 10.0, 'alloc_bytes_per_item': 63.99}})
+    [Regression(name='read', metric='alloc_bytes_per_item', baseline=63.99, current=64.001)]
+    """
+    regressions = []
+    for result in results:
+        stored = baseline.get(result.name, {})
+        for metric in COMPARED_METRICS:
+            if metric not in stored:
+                continue
+            current = getattr(result, metric)
+            if metric == 'alloc_bytes_per_item':
+                regressed = round(current, _BASELINE_DIGITS) > stored[metric]
+            else:
+                regressed = current > stored[metric] * (1 + tolerance)
+            if regressed:
+                regressions.append(Regression(result.name, metric, stored[metric], current))
+    return regressions
+
+
+def format_results(results, baseline=None):
+    # type: (typing.Iterable[Result], typing.Optional[typing.Dict[typing.Text, typing.Dict[typing.Text, float]]]) -> typing.Text  # NOQA: E501
+    """Format results as a table, with the change in median latency against ``baseline``.
+
+    The ``peak B/it`` column is :any:`Result` ``alloc_bytes_per_item``, the
+    peak bytes traced during one call per item.
+    """
+    lines = ['{:<40}{:>12}{:>10}{:>12}{:>10}{:>10}{:>10}'.format(
+        'benchmark', 'items/s', 'ns/item', 'peak B/it', 'p50 us', 'p99 us', 'vs base')]
+    for result in results:
+        change = ''
+        stored = (baseline or {}).get(result.name, {}).get('p50_us')
+        if stored:
+            change = '{:+.0%}'.format(result.p50_us / stored - 1)
+        lines.append('{:<40}{:>12.0f}{:>10.0f}{:>12.1f}{:>10.1f}{:>10.1f}{:>10}'.format(
+            result.name,
+            result.items_per_s,
+            result.ns_per_item,
+            result.alloc_bytes_per_item,
+            result.p50_us,
+            result.p99_us,
+            change))
+    return '\n'.join(lines)
@@ -0,0 +1,116 @@
+"""Per-call overhead of lazily and eagerly bound driver entry points.
+
+The driver is replaced by ctypes callbacks that return at once, so the
+numbers measure the Python side of each call: argument wrapping, the
+``_cfuncs.XnetLibrary`` dispatch and the status check.  Run it with::
+
+    python -m benchmarks.bench_cfuncs
+"""
+
+import argparse
+import ctypes  # type: ignore
+import timeit
+import typing  # NOQA: F401
+
+from unittest import mock  # type: ignore
+
+from nixnet import _buffers
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
+from nixnet import _frames
+from nixnet import _funcs
+from nixnet import _lib
+from nixnet import types
+
+HANDLE = 1
+
+_READ_FRAME = ctypes.CFUNCTYPE(
+    ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32, ctypes.c_double,
+    ctypes.POINTER(ctypes.c_uint32))
+_WRITE_FRAME = ctypes.CFUNCTYPE(
+    ctypes.c_uint32, ctypes.c_uint32, ctypes.c_void_p, ctypes.c_uint32, ctypes.c_double)
+
+
+def _read_frame(session_ref, buffer, size_of_buffer, timeout, number_of_bytes_returned):
+    number_of_bytes_returned[0] = 0
+    return 0
+
+
+def _write_frame(session_ref, buffer, size_of_buffer, timeout):
+    return 0
+
+
+class NullDriver(object):
+    """Stand-in for the NI-XNET ``ctypes.CDLL`` whose frame I/O does nothing."""
+
+    def __init__(self):
+        self._callbacks = {
+            'nxReadFrame': _READ_FRAME(_read_frame),
+            'nxWriteFrame': _WRITE_FRAME(_write_frame),
+        }
+        self._functions = {}  # type: typing.Dict[typing.Text, typing.Any]
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._callbacks:
+            raise AttributeError(name)
+        if name not in self._functions:
+            self._functions[name] = self[name]
+        return self._functions[name]
+
+    def __getitem__(self, name):
+        if name not in self._callbacks:
+            raise AttributeError(name)
+        callback = self._callbacks[name]
+        return type(callback)(ctypes.cast(callback, ctypes.c_void_p).value)
+
+
+def measure(library, number):
+    # type: (_cfuncs.XnetLibrary, int) -> typing.Dict[typing.Text, float]
+    """Return the nanoseconds per call of each benchmarked operation."""
+    read_buffer = bytearray(1024)
+    frame_bytes = bytes(_frames.serialize_frames([types.CanFrame(0x10, payload=bytes(8)).to_raw()]))
+    session_ref = _ctypedefs.nxSessionRef_t(HANDLE)
+    buffer_ctypes = (_ctypedefs.byte * len(read_buffer)).from_buffer(read_buffer)
+    size_ctypes = _ctypedefs.u32(len(read_buffer))
+    timeout_ctypes = _ctypedefs.f64(0.0)
+    returned_ctypes = _ctypedefs.u32()
+    returned_ptr = ctypes.pointer(returned_ctypes)
+
+    operations = [
+        ('lib.nx_read_frame', lambda: library.nx_read_frame(
+            session_ref, buffer_ctypes, size_ctypes, timeout_ctypes, returned_ptr)),
+        ('lib.nx_write_frame', lambda: library.nx_write_frame(
+            session_ref, buffer_ctypes, size_ctypes, timeout_ctypes)),
+        ('_funcs.nx_read_frame_into', lambda: _funcs.nx_read_frame_into(HANDLE, read_buffer, 0.0)),
+        ('_funcs.nx_write_frame', lambda: _funcs.nx_write_frame(HANDLE, frame_bytes, 0.0)),
+    ]  # type: typing.List[typing.Tuple[typing.Text, typing.Callable[[], typing.Any]]]
+    results = {}
+    with mock.patch('nixnet._cfuncs.lib', library):
+        try:
+            for name, operation in operations:
+                operation()
+                best = min(timeit.repeat(operation, number=number, repeat=5))
+                results[name] = best / number * 1e9
+        finally:
+            _buffers.pool.release(HANDLE)
+    return results
+
+
+def main(argv=None):
+    # type: (typing.Optional[typing.List[typing.Text]]) -> None
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000, help='Calls per timing run')
+    args = parser.parse_args(argv)
+
+    with mock.patch('nixnet._lib.import_lib', side_effect=lambda: _lib.XnetLibrary(NullDriver())):
+        lazy = measure(_cfuncs.XnetLibrary(), args.number)
+        eager = measure(_cfuncs.XnetLibrary(eager=True), args.number)
+
+    print('{:<28}{:>12}{:>12}{:>10}'.format('ns/call', 'lazy', 'eager', 'saved'))
+    for name in lazy:
+        print('{:<28}{:>12.0f}{:>12.0f}{:>9.0%}'.format(
+            name, lazy[name], eager[name], 1 - eager[name] / lazy[name]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,179 @@
+"""Throughput and latency of frame and signal I/O.
+
+Sessions run against the simulated driver in :any:`nixnet._sim`, so no
+hardware is needed and the numbers cover the Python side of each call plus
+the simulation's own, roughly constant, cost.  Each benchmark reports
+items (frames or signal values) per second, nanoseconds per item, peak
+bytes allocated per item (see :any:`benchmarks._harness.Result`) and the
+median and 99th percentile call latency.
+
+Against a baseline, the median latency may be slower by up to
+``--tolerance``; any growth in peak bytes per item is a regression.
+
+Compare a run against the stored baseline, failing on regressions::
+
+    python -m benchmarks.bench_io --baseline benchmarks/baseline.json
+
+The baseline only means something on the machine and interpreter that
+recorded it.  Record a new one with ``--save-baseline``.
+"""
+
+import argparse
+import contextlib
+import sys
+import typing  # NOQA: F401
+
+from unittest import mock  # type: ignore
+
+import nixnet
+from nixnet import _arrays
+from nixnet import _cfuncs
+from nixnet import _frames
+from nixnet import _lib
+from nixnet import constants
+from nixnet import convert
+from nixnet import types
+
+from benchmarks import _harness
+
+DEFAULT_FRAMES = 256
+DEFAULT_SIGNALS = 32
+DEFAULT_CALLS = 200
+
+_CLUSTER = 'Cluster'
+_DATABASE = ':memory:'
+
+Benchmark = typing.Tuple[
+    typing.Text,
+    typing.Callable[[], typing.Any],
+    int,
+    typing.Optional[typing.Callable[[], typing.Any]]]
+
+
+def _can_frames(num_frames):
+    # type: (int) -> typing.List[types.CanFrame]
+    return [types.CanFrame(0x100 + index % 64, payload=bytes(range(8))) for index in range(num_frames)]
+
+
+@contextlib.contextmanager
+def simulated_driver():
+    # type: () -> typing.Iterator[None]
+    """Run sessions created in the block against the simulated driver."""
+    driver = _lib.import_lib(_lib.SIMULATED_BACKEND)
+    with mock.patch('nixnet._lib.import_lib', return_value=driver):
+        with mock.patch('nixnet._cfuncs.lib', _cfuncs.XnetLibrary(eager=True)):
+            yield
+
+
+def codec_benchmarks(num_frames):
+    # type: (int) -> typing.Iterator[Benchmark]
+    raw_frames = [frame.to_raw() for frame in _can_frames(num_frames)]
+    frame_bytes = bytes(_frames.serialize_frames(raw_frames))
+    yield 'iterate_frames', lambda: list(_frames.iterate_frames(frame_bytes)), num_frames, None
+    yield 'serialize_frames', lambda: _frames.serialize_frames(raw_frames), num_frames, None
+
+    layout = convert.FrameLayout(0x100, [
+        convert.SignalLayout('Unsigned', 0, 12),
+        convert.SignalLayout('Big', 20, 8, constants.SigByteOrdr.BIG_ENDIAN),
+        convert.SignalLayout('Signed', 24, 16, data_type=constants.SigDataType.SIGNED, scale_fac=0.5),
+        convert.SignalLayout('Float', 32, 32, data_type=constants.SigDataType.IEEE_FLOAT),
+    ])
+    encoder = convert.SignalEncoder([layout])
+    decoder = convert.SignalDecoder([layout])
+    samples = [[index % 4096, index % 256, index % 100 - 50, index * 0.5] for index in range(num_frames)]
+    timestamps = list(range(num_frames))
+
+    def round_trip():
+        return decoder.decode_bytes(encoder.encode_bytes(samples, timestamps=timestamps))
+    yield 'SignalEncoder/SignalDecoder round trip', round_trip, num_frames, None
+
+
+def frame_benchmarks(stack, num_frames):
+    # type: (contextlib.ExitStack, int) -> typing.Iterator[Benchmark]
+    frames = _can_frames(num_frames)
+    frame_bytes = bytes(_frames.serialize_frames([frame.to_raw() for frame in frames]))
+    input_session = stack.enter_context(nixnet.FrameInStreamSession('CAN1'))
+    output_session = stack.enter_context(nixnet.FrameOutStreamSession('CAN2'))
+    input_session.start()
+
+    def queue_frames():
+        output_session.frames.write_bytes(frame_bytes)
+
+    for frame_type in (types.CanFrame, types.RawFrame, types.XnetFrame):
+        def read(frame_type=frame_type):
+            return list(input_session.frames.read(num_frames, frame_type=frame_type))
+        yield 'InFrames.read[{}]'.format(frame_type.__name__), read, num_frames, queue_frames
+
+    def write():
+        output_session.frames.write(frames)
+
+    # Nothing reads what the write delivers, so empty the input queue first.
+    yield 'OutFrames.write', write, num_frames, input_session.flush
+
+
+def signal_benchmarks(stack, num_signals):
+    # type: (contextlib.ExitStack, int) -> typing.Iterator[Benchmark]
+    names = ['Frame.Signal{}'.format(index) for index in range(num_signals)]
+    input_session = stack.enter_context(
+        nixnet.SignalInSinglePointSession('CAN1', _DATABASE, _CLUSTER, names))
+    output_session = stack.enter_context(
+        nixnet.SignalOutSinglePointSession('CAN2', _DATABASE, _CLUSTER, names))
+    values = [float(index) for index in range(num_signals)]
+    output_session.signals.write(values)
+
+    yield 'SinglePointInSignals.read', lambda: list(input_session.signals.read()), num_signals, None
+    yield 'SinglePointInSignals.read_array', input_session.signals.read_array, num_signals, None
+    yield 'SinglePointOutSignals.write', lambda: output_session.signals.write(values), num_signals, None
+    if _arrays.numpy is not None:
+        array = _arrays.numpy.array(values)
+        yield 'SinglePointOutSignals.write[ndarray]', lambda: output_session.signals.write(array), num_signals, None
+
+
+def run(calls=DEFAULT_CALLS, num_frames=DEFAULT_FRAMES, num_signals=DEFAULT_SIGNALS, pattern=''):
+    # type: (int, int, int, typing.Text) -> typing.List[_harness.Result]
+    """Run the benchmarks whose names contain ``pattern``."""
+    results = []
+    with simulated_driver(), contextlib.ExitStack() as stack:
+        benchmarks = [
+            codec_benchmarks(num_frames),
+            frame_benchmarks(stack, num_frames),
+            signal_benchmarks(stack, num_signals),
+        ]
+        for group in benchmarks:
+            for name, operation, items_per_call, setup in group:
+                if pattern in name:
+                    results.append(_harness.measure(name, operation, items_per_call, calls, setup))
+    return results
+
+
+def main(argv=None):
+    # type: (typing.Optional[typing.List[typing.Text]]) -> int
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--calls', type=int, default=DEFAULT_CALLS, help='Timed calls per benchmark')
+    parser.add_argument('--frames', type=int, default=DEFAULT_FRAMES, help='Frames per frame I/O call')
+    parser.add_argument('--signals', type=int, default=DEFAULT_SIGNALS, help='Signals per single-point session')
+    parser.add_argument('-k', dest='pattern', default='', help='Only run benchmarks whose names contain this')
+    parser.add_argument('--baseline', help='Compare against this baseline file')
+    parser.add_argument(
+        '--tolerance', type=float, default=_harness.DEFAULT_TOLERANCE,
+        help='Allowed median latency slowdown against the baseline, as a fraction')
+    parser.add_argument('--save-baseline', help='Write the results to this baseline file')
+    args = parser.parse_args(argv)
+
+    results = run(args.calls, args.frames, args.signals, args.pattern)
+    baseline = _harness.load_baseline(args.baseline) if args.baseline else None
+    print(_harness.format_results(results, baseline))
+    if args.save_baseline:
+        _harness.save_baseline(args.save_baseline, results)
+    if baseline is None:
+        return 0
+
+    regressions = _harness.compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print('REGRESSION {}: {} {:.1f} -> {:.1f}'.format(
+            regression.name, regression.metric, regression.baseline, regression.current))
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
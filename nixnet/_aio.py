@@ -0,0 +1,53 @@
+"""Run blocking driver calls from asyncio.
+
+Every session shares one bounded thread pool, so an event loop can service
+many sessions without dedicating a thread to each interface.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import threading
+import typing  # NOQA: F401
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_POLL_INTERVAL = 0.01
+
+_lock = threading.Lock()
+_executor = None  # type: typing.Optional[concurrent.futures.ThreadPoolExecutor]
+_max_workers = DEFAULT_MAX_WORKERS
+
+
+def get_executor():
+    # type: () -> concurrent.futures.ThreadPoolExecutor
+    """Return the executor shared by all sessions, creating it if needed."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=_max_workers,
+                thread_name_prefix='nixnet')
+        return _executor
+
+
+def set_max_workers(max_workers):
+    # type: (int) -> None
+    """Set the number of threads used for asynchronous driver calls.
+
+    Calls already submitted finish on the previous executor.
+    """
+    global _executor, _max_workers
+    if max_workers < 1:
+        raise ValueError('max_workers must be at least 1', max_workers)
+    with _lock:
+        previous, _executor = _executor, None
+        _max_workers = max_workers
+    if previous is not None:
+        previous.shutdown(wait=False)
+
+
+async def run(func, *args, **kwargs):
+    # type: (typing.Callable[..., typing.Any], *typing.Any, **typing.Any) -> typing.Any
+    """Await ``func(*args, **kwargs)`` run on the shared executor."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(func, *args, **kwargs))
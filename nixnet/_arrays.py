@@ -0,0 +1,107 @@
+"""Optional NumPy support.
+
+NumPy is not a required dependency of nixnet.  Features built on it import it
+from here so a missing installation is reported the same way everywhere.
+"""
+
+import array
+import ctypes  # type: ignore
+import typing  # NOQA: F401
+
+from nixnet import _buffers
+
+try:
+    import numpy  # type: ignore
+except ImportError:
+    numpy = None  # type: ignore
+
+# ``array`` typecode -> ctypes type of the same size, for pooled buffers.
+_CTYPES = {
+    'd': ctypes.c_double,
+    'Q': ctypes.c_uint64,
+    'I': ctypes.c_uint32,
+}
+
+
+def require_numpy():
+    # type: () -> typing.Any
+    """Return the numpy module, raising ImportError if it is not installed."""
+    if numpy is None:
+        raise ImportError(
+            'This feature requires NumPy. Install it with "pip install numpy".')
+    return numpy
+
+
+def zeros(typecode, count):
+    # type: (typing.Text, int) -> typing.Any
+    """Return a zero-filled 1-D array of ``count`` items of an ``array`` typecode.
+
+    This is a NumPy array if NumPy is installed, otherwise an ``array.array``.
+    Either one can be shared with the driver through the buffer protocol.
+
+    >>> len(zeros('d', 3)), memoryview(zeros('d', 3)).itemsize
+    (3, 8)
+    """
+    if numpy is not None:
+        return numpy.zeros(count, dtype=typecode)
+    return array.array(typecode, bytes(count * array.array(typecode).itemsize))
+
+
+def pooled(session_ref, name, typecode, count):
+    # type: (int, typing.Text, typing.Text, int) -> memoryview
+    """Return ``count`` items of a session's buffer from :any:`nixnet._buffers.pool`.
+
+    The buffer is reused by the next request for ``name`` on the same
+    session and thread, and released when the session closes.
+
+    >>> values = pooled(1, 'values', 'd', 4)
+    >>> len(values), values.format
+    (4, 'd')
+    >>> _buffers.pool.release(1)
+    """
+    buffer = _buffers.pool.array(session_ref, name, _CTYPES[typecode], count)
+    return memoryview(buffer).cast('B').cast(typecode)  # type: ignore
+
+
+def pooled_or_view(session_ref, name, typecode, count, buffer=None):
+    # type: (int, typing.Text, typing.Text, int, typing.Any) -> memoryview
+    """Return :func:`writable_view` of ``buffer`` if given, otherwise a :func:`pooled` one."""
+    if buffer is None:
+        return pooled(session_ref, name, typecode, count)
+    return writable_view(buffer, typecode, count)
+
+
+def writable_view(buffer, typecode, count):
+    # type: (typing.Any, typing.Text, int) -> memoryview
+    """Return the first ``count`` items of a caller's buffer as a memoryview of ``typecode``.
+
+    >>> writable_view(bytearray(24), 'd', 2).tolist()
+    [0.0, 0.0]
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        raise TypeError('Buffer must be writable')
+    view = view.cast('B').cast(typecode)  # type: ignore
+    if len(view) < count:
+        raise ValueError('Buffer must hold at least {} items'.format(count), len(view))
+    return view[:count]
+
+
+def wrap(view, typecode, start=0, length=None):
+    # type: (memoryview, typing.Text, int, typing.Optional[int]) -> typing.Any
+    """Return items of a 1-D memoryview as a NumPy array, or an ``array.array`` without NumPy.
+
+    The NumPy array shares the memoryview's buffer.  Without NumPy the items
+    are copied, so the result stays valid after the buffer is reused.
+
+    >>> values = memoryview(array.array('d', [1.0, 2.0, 3.0]))
+    >>> wrap(values, 'd', 1).tolist(), wrap(values, 'd', 0, 1).tolist()
+    ([2.0, 3.0], [1.0])
+    """
+    if length is None:
+        length = len(view) - start
+    if numpy is not None:
+        return numpy.frombuffer(view, dtype=typecode, count=length, offset=start * view.itemsize)
+    items = array.array(typecode)
+    items.frombytes(view[start:start + length].cast('B'))  # type: ignore
+    return items
@@ -0,0 +1,161 @@
+import ctypes  # type: ignore
+import threading
+import typing  # NOQA: F401
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+MIN_CAPACITY = 64
+
+
+def _grow(count):
+    # type: (int) -> int
+    """Round a requested element count up to the capacity to allocate.
+
+    >>> _grow(1)
+    64
+    >>> _grow(64)
+    64
+    >>> _grow(65)
+    128
+    >>> _grow(1000)
+    1024
+    """
+    capacity = MIN_CAPACITY
+    while capacity < count:
+        capacity *= 2
+    return capacity
+
+
+class _Entry(object):
+
+    __slots__ = [
+        "storage",
+        "view",
+        "nbytes"]
+
+    def __init__(self, storage, nbytes):
+        # type: (typing.Any, int) -> None
+        self.storage = storage
+        self.view = None  # type: typing.Any
+        self.nbytes = nbytes
+
+
+class BufferPool(object):
+    """Per-session cache of the ctypes arrays and scalars passed to the driver.
+
+    Each buffer is identified by a name chosen by the caller, so two buffers of
+    the same call never alias.  Buffers are also keyed by thread so concurrent
+    calls on one session don't share memory.
+
+    Arrays grow geometrically and are reused for any smaller request.  When
+    caching a new array would exceed ``max_bytes``, an uncached array is
+    returned instead.
+
+    A buffer returned from the pool is only valid until the next request for
+    the same name on the same session and thread.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        # type: (int) -> None
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sessions = {}  # type: typing.Dict[int, typing.Dict[typing.Tuple[int, typing.Text], typing.Any]]
+        self._num_bytes = 0
+
+    @property
+    def num_bytes(self):
+        # type: () -> int
+        """int: Bytes currently held by cached arrays."""
+        return self._num_bytes
+
+    def array(self, session_ref, name, ctype, count):
+        # type: (int, typing.Text, typing.Any, int) -> typing.Any
+        """Return a ``ctype`` array of exactly ``count`` elements.
+
+        >>> pool = BufferPool()
+        >>> first = pool.array(1, 'values', ctypes.c_double, 3)
+        >>> len(first)
+        3
+        >>> pool.array(1, 'values', ctypes.c_double, 3) is first
+        True
+        >>> len(pool.array(1, 'values', ctypes.c_double, 10))
+        10
+        >>> pool.num_bytes
+        512
+        """
+        key = (threading.get_ident(), name)
+        buffers = self._sessions.get(session_ref)
+        entry = buffers.get(key) if buffers is not None else None
+        if entry is None or len(entry.storage) < count:
+            entry = self._allocate(session_ref, key, ctype, count)
+            if entry is None:
+                return (ctype * count)()
+        view = entry.view
+        if view is None or len(view) != count:
+            view = (ctype * count).from_buffer(entry.storage)
+            entry.view = view
+        return view
+
+    def scalar(self, session_ref, name, ctype):
+        # type: (int, typing.Text, typing.Any) -> typing.Any
+        """Return a ``ctype`` scalar reset to zero.
+
+        >>> pool = BufferPool()
+        >>> count = pool.scalar(1, 'count', ctypes.c_uint)
+        >>> count.value = 5
+        >>> pool.scalar(1, 'count', ctypes.c_uint) is count, count.value
+        (True, 0)
+        """
+        key = (threading.get_ident(), name)
+        buffers = self._sessions.get(session_ref)
+        entry = buffers.get(key) if buffers is not None else None
+        if entry is None:
+            entry = self._cache(session_ref, key, _Entry(ctype(), ctypes.sizeof(ctype)))
+            if entry is None:
+                return ctype()
+        value = entry.storage
+        value.value = 0
+        return value
+
+    def release(self, session_ref):
+        # type: (int) -> None
+        """Drop every buffer cached for ``session_ref``.
+
+        >>> pool = BufferPool()
+        >>> _ = pool.array(1, 'values', ctypes.c_double, 3)
+        >>> pool.release(1)
+        >>> pool.num_bytes
+        0
+        """
+        with self._lock:
+            buffers = self._sessions.pop(session_ref, None)
+            if buffers is not None:
+                self._num_bytes -= sum(entry.nbytes for entry in buffers.values())
+
+    def clear(self):
+        # type: () -> None
+        """Drop every cached buffer."""
+        with self._lock:
+            self._sessions.clear()
+            self._num_bytes = 0
+
+    def _allocate(self, session_ref, key, ctype, count):
+        # type: (int, typing.Tuple[int, typing.Text], typing.Any, int) -> typing.Optional[_Entry]
+        capacity = _grow(count)
+        nbytes = ctypes.sizeof(ctype) * capacity
+        return self._cache(session_ref, key, _Entry((ctype * capacity)(), nbytes))
+
+    def _cache(self, session_ref, key, entry):
+        # type: (int, typing.Tuple[int, typing.Text], _Entry) -> typing.Optional[_Entry]
+        with self._lock:
+            buffers = self._sessions.setdefault(session_ref, {})
+            previous = buffers.pop(key, None)
+            if previous is not None:
+                self._num_bytes -= previous.nbytes
+            if self._num_bytes + entry.nbytes > self.max_bytes:
+                return None
+            buffers[key] = entry
+            self._num_bytes += entry.nbytes
+        return entry
+
+
+pool = BufferPool()
@@ -6,17 +6,473 @@ from nixnet import _ctypedefs
 from nixnet import _lib
 
 
+# ctypes converts fundamental (not subclassed) return types to plain Python values.
+_EAGER_STATUS = ctypes.c_uint32
+
+# Method name -> (C function name, argument types, return type)
+_PROTOTYPES = {
+    'nx_create_session': (
+        'nxCreateSession',
+        [
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.nxSessionRef_t),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_create_session_by_ref': (
+        'nxCreateSessionByRef',
+        [
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.nxDatabaseRef_t),
+            _ctypedefs.char_p,
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.nxSessionRef_t),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_get_property': (
+        'nxGetProperty',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_get_property_size': (
+        'nxGetPropertySize',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_set_property': (
+        'nxSetProperty',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_get_sub_property': (
+        'nxGetSubProperty',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_get_sub_property_size': (
+        'nxGetSubPropertySize',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_set_sub_property': (
+        'nxSetSubProperty',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_read_frame': (
+        'nxReadFrame',
+        [
+            _ctypedefs.nxSessionRef_t,
+            ctypes.POINTER(_ctypedefs.byte),
+            _ctypedefs.u32,
+            _ctypedefs.f64,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_read_signal_single_point': (
+        'nxReadSignalSinglePoint',
+        [
+            _ctypedefs.nxSessionRef_t,
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.nxTimestamp_t),
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_read_signal_waveform': (
+        'nxReadSignalWaveform',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.f64,
+            ctypes.POINTER(_ctypedefs.nxTimestamp_t),
+            ctypes.POINTER(_ctypedefs.f64),
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_read_signal_xy': (
+        'nxReadSignalXY',
+        [
+            _ctypedefs.nxSessionRef_t,
+            ctypes.POINTER(_ctypedefs.nxTimestamp_t),
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.nxTimestamp_t),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.u32),
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_read_state': (
+        'nxReadState',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+            ctypes.POINTER(_ctypedefs.nxStatus_t),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_write_frame': (
+        'nxWriteFrame',
+        [
+            _ctypedefs.nxSessionRef_t,
+            ctypes.POINTER(_ctypedefs.byte),
+            _ctypedefs.u32,
+            _ctypedefs.f64,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_write_signal_single_point': (
+        'nxWriteSignalSinglePoint',
+        [
+            _ctypedefs.nxSessionRef_t,
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_write_state': (
+        'nxWriteState',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_write_signal_waveform': (
+        'nxWriteSignalWaveform',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.f64,
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_write_signal_xy': (
+        'nxWriteSignalXY',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.f64,
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.nxTimestamp_t),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.u32),
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_convert_frames_to_signals_single_point': (
+        'nxConvertFramesToSignalsSinglePoint',
+        [
+            _ctypedefs.nxSessionRef_t,
+            ctypes.POINTER(_ctypedefs.byte),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.nxTimestamp_t),
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_convert_signals_to_frames_single_point': (
+        'nxConvertSignalsToFramesSinglePoint',
+        [
+            _ctypedefs.nxSessionRef_t,
+            ctypes.POINTER(_ctypedefs.f64),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.byte),
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_blink': (
+        'nxBlink',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_clear': (
+        'nxClear',
+        [
+            _ctypedefs.nxSessionRef_t,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_connect_terminals': (
+        'nxConnectTerminals',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_disconnect_terminals': (
+        'nxDisconnectTerminals',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_flush': (
+        'nxFlush',
+        [
+            _ctypedefs.nxSessionRef_t,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_start': (
+        'nxStart',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_stop': (
+        'nxStop',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_status_to_string': (
+        'nxStatusToString',
+        [
+            _ctypedefs.nxStatus_t,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+        ],
+        None),
+    'nx_system_open': (
+        'nxSystemOpen',
+        [
+            ctypes.POINTER(_ctypedefs.nxSessionRef_t),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_system_close': (
+        'nxSystemClose',
+        [
+            _ctypedefs.nxSessionRef_t,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nx_wait': (
+        'nxWait',
+        [
+            _ctypedefs.nxSessionRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.f64,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_open_database': (
+        'nxdbOpenDatabase',
+        [
+            _ctypedefs.char_p,
+            ctypes.POINTER(_ctypedefs.nxDatabaseRef_t),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_close_database': (
+        'nxdbCloseDatabase',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.bool32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_create_object': (
+        'nxdbCreateObject',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            ctypes.POINTER(_ctypedefs.nxDatabaseRef_t),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_find_object': (
+        'nxdbFindObject',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            ctypes.POINTER(_ctypedefs.nxDatabaseRef_t),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_delete_object': (
+        'nxdbDeleteObject',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_save_database': (
+        'nxdbSaveDatabase',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.char_p,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_get_property': (
+        'nxdbGetProperty',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_get_property_size': (
+        'nxdbGetPropertySize',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_set_property': (
+        'nxdbSetProperty',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.u32,
+            _ctypedefs.nxVoidPtr,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_get_dbc_attribute_size': (
+        'nxdbGetDBCAttributeSize',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_get_dbc_attribute': (
+        'nxdbGetDBCAttribute',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_merge': (
+        'nxdbMerge',
+        [
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.nxDatabaseRef_t,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            _ctypedefs.bool32,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_add_alias': (
+        'nxdbAddAlias',
+        [
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+            _ctypedefs.u32,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_add_alias64': (
+        'nxdbAddAlias64',
+        [
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+            _ctypedefs.u64,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_remove_alias': (
+        'nxdbRemoveAlias',
+        [
+            _ctypedefs.char_p,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_deploy': (
+        'nxdbDeploy',
+        [
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+            _ctypedefs.bool32,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_undeploy': (
+        'nxdbUndeploy',
+        [
+            _ctypedefs.char_p,
+            _ctypedefs.char_p,
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_get_database_list': (
+        'nxdbGetDatabaseList',
+        [
+            _ctypedefs.char_p,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            _ctypedefs.u32,
+            _ctypedefs.char_p,
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+    'nxdb_get_database_list_sizes': (
+        'nxdbGetDatabaseListSizes',
+        [
+            _ctypedefs.char_p,
+            ctypes.POINTER(_ctypedefs.u32),
+            ctypes.POINTER(_ctypedefs.u32),
+        ],
+        _ctypedefs.nxStatus_t),
+}  # type: typing.Dict[typing.Text, typing.Tuple[typing.Text, typing.List[typing.Any], typing.Any]]
+
+
 class XnetLibrary(object):
     """NI-XNET C library
 
     This mostly serves to benefit testing by
     - Delay loading the DLL so we can import this without it being loaded.
     - Provide a mockable interface for verifying how we use ctypes
+
+    By default, each entry point is configured on its first call and returns
+    an ``nxStatus_t``.  With ``eager`` set, every entry point in
+    ``_PROTOTYPES`` is configured when the DLL loads and replaces its method
+    on the instance, so calls go straight to the ctypes function pointer and
+    return the status as a plain ``int``.  Check either kind of status with
+    ``_errors.check_status``.
     """
 
-    def __init__(self):
+    def __init__(self, eager=False):
         self._cdll = None
-        self._load_lock = threading.Lock()
+        self._eager = eager
+        self._load_lock = threading.RLock()
         self._nx_create_session = None
         self._nx_create_session_by_ref = None
         self._nx_get_property = None
@@ -72,9 +528,45 @@ class XnetLibrary(object):
     def cdll(self):
         # type: (...) -> _lib.XnetLibrary
         if self._cdll is None:
-            self._cdll = _lib.import_lib()
+            with self._load_lock:
+                if self._cdll is None:
+                    self._cdll = _lib.import_lib()
+                    if self._eager:
+                        self.bind_all()
         return self._cdll
 
+    def bind_all(self):
+        # type: () -> typing.List[typing.Text]
+        """Configure every entry point now, returning the names the DLL lacks.
+
+        Each bound entry point is set as an instance attribute, shadowing its
+        method.  Entry points the DLL lacks keep their method, which raises
+        :any:`nixnet._lib.XnetFunctionNotSupportedError` when called.
+        """
+        missing = []
+        with self._load_lock:
+            cdll = self.cdll
+            for name, (function, argtypes, restype) in _PROTOTYPES.items():
+                try:
+                    # A new function pointer, so lazily bound entry points keep their own restype.
+                    cfunc = cdll.function(function)
+                except _lib.XnetFunctionNotSupportedError:
+                    missing.append(name)
+                    continue
+                cfunc.argtypes = argtypes
+                cfunc.restype = None if restype is None else _EAGER_STATUS
+                setattr(self, name, cfunc)
+        return missing
+
+    def _bind(self, name):
+        # type: (typing.Text) -> typing.Any
+        function, argtypes, restype = _PROTOTYPES[name]
+        with self._load_lock:
+            cfunc = getattr(self.cdll, function)
+            cfunc.argtypes = argtypes
+            cfunc.restype = restype
+        return cfunc
+
     def nx_create_session(
             self,
             database_name,  # type: _ctypedefs.char_p
@@ -86,17 +578,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_create_session is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxCreateSession
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p,
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.nxSessionRef_t)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_create_session = cfunc
+            self._nx_create_session = self._bind('nx_create_session')
         return self._nx_create_session(
             database_name,
             cluster_name,
@@ -115,16 +597,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_create_session_by_ref is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxCreateSessionByRef
-                cfunc.argtypes = [
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.nxDatabaseRef_t),
-                    _ctypedefs.char_p,
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.nxSessionRef_t)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_create_session_by_ref = cfunc
+            self._nx_create_session_by_ref = self._bind('nx_create_session_by_ref')
         return self._nx_create_session_by_ref(
             size_of_database_refs,
             database_refs,
@@ -141,15 +614,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_get_property is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxGetProperty
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_get_property = cfunc
+            self._nx_get_property = self._bind('nx_get_property')
         return self._nx_get_property(
             session_ref,
             property_id,
@@ -164,14 +629,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_get_property_size is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxGetPropertySize
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_get_property_size = cfunc
+            self._nx_get_property_size = self._bind('nx_get_property_size')
         return self._nx_get_property_size(
             session_ref,
             property_id,
@@ -186,15 +644,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_set_property is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxSetProperty
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_set_property = cfunc
+            self._nx_set_property = self._bind('nx_set_property')
         return self._nx_set_property(
             session_ref,
             property_id,
@@ -211,16 +661,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_get_sub_property is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxGetSubProperty
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_get_sub_property = cfunc
+            self._nx_get_sub_property = self._bind('nx_get_sub_property')
         return self._nx_get_sub_property(
             session_ref,
             active_index,
@@ -237,15 +678,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_get_sub_property_size is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxGetSubPropertySize
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_get_sub_property_size = cfunc
+            self._nx_get_sub_property_size = self._bind('nx_get_sub_property_size')
         return self._nx_get_sub_property_size(
             session_ref,
             active_index,
@@ -262,16 +695,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_set_sub_property is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxSetSubProperty
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_set_sub_property = cfunc
+            self._nx_set_sub_property = self._bind('nx_set_sub_property')
         return self._nx_set_sub_property(
             session_ref,
             active_index,
@@ -289,16 +713,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_read_frame is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxReadFrame
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    ctypes.POINTER(_ctypedefs.byte),
-                    _ctypedefs.u32,
-                    _ctypedefs.f64,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_read_frame = cfunc
+            self._nx_read_frame = self._bind('nx_read_frame')
         return self._nx_read_frame(
             session_ref,
             buffer,
@@ -316,16 +731,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_read_signal_single_point is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxReadSignalSinglePoint
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.nxTimestamp_t),
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_read_signal_single_point = cfunc
+            self._nx_read_signal_single_point = self._bind('nx_read_signal_single_point')
         return self._nx_read_signal_single_point(
             session_ref,
             value_buffer,
@@ -345,18 +751,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_read_signal_waveform is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxReadSignalWaveform
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.f64,
-                    ctypes.POINTER(_ctypedefs.nxTimestamp_t),
-                    ctypes.POINTER(_ctypedefs.f64),
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_read_signal_waveform = cfunc
+            self._nx_read_signal_waveform = self._bind('nx_read_signal_waveform')
         return self._nx_read_signal_waveform(
             session_ref,
             timeout,
@@ -379,19 +774,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_read_signal_xy is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxReadSignalXY
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    ctypes.POINTER(_ctypedefs.nxTimestamp_t),
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.nxTimestamp_t),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.u32),
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_read_signal_xy = cfunc
+            self._nx_read_signal_xy = self._bind('nx_read_signal_xy')
         return self._nx_read_signal_xy(
             session_ref,
             time_limit,
@@ -412,16 +795,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_read_state is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxReadState
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr,
-                    ctypes.POINTER(_ctypedefs.nxStatus_t)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_read_state = cfunc
+            self._nx_read_state = self._bind('nx_read_state')
         return self._nx_read_state(
             session_ref,
             state_id,
@@ -438,15 +812,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_write_frame is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxWriteFrame
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    ctypes.POINTER(_ctypedefs.byte),
-                    _ctypedefs.u32,
-                    _ctypedefs.f64]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_write_frame = cfunc
+            self._nx_write_frame = self._bind('nx_write_frame')
         return self._nx_write_frame(
             session_ref,
             buffer,
@@ -461,14 +827,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_write_signal_single_point is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxWriteSignalSinglePoint
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_write_signal_single_point = cfunc
+            self._nx_write_signal_single_point = self._bind('nx_write_signal_single_point')
         return self._nx_write_signal_single_point(
             session_ref,
             value_buffer,
@@ -483,15 +842,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_write_state is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxWriteState
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_write_state = cfunc
+            self._nx_write_state = self._bind('nx_write_state')
         return self._nx_write_state(
             session_ref,
             state_id,
@@ -507,15 +858,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_write_signal_waveform is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxWriteSignalWaveform
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.f64,
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_write_signal_waveform = cfunc
+            self._nx_write_signal_waveform = self._bind('nx_write_signal_waveform')
         return self._nx_write_signal_waveform(
             session_ref,
             timeout,
@@ -535,19 +878,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_write_signal_xy is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxWriteSignalXY
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.f64,
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.nxTimestamp_t),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.u32),
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_write_signal_xy = cfunc
+            self._nx_write_signal_xy = self._bind('nx_write_signal_xy')
         return self._nx_write_signal_xy(
             session_ref,
             timeout,
@@ -570,18 +901,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_convert_frames_to_signals_single_point is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxConvertFramesToSignalsSinglePoint
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    ctypes.POINTER(_ctypedefs.byte),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.nxTimestamp_t),
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_convert_frames_to_signals_single_point = cfunc
+            self._nx_convert_frames_to_signals_single_point = self._bind('nx_convert_frames_to_signals_single_point')
         return self._nx_convert_frames_to_signals_single_point(
             session_ref,
             frame_buffer,
@@ -602,17 +922,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_convert_signals_to_frames_single_point is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxConvertSignalsToFramesSinglePoint
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    ctypes.POINTER(_ctypedefs.f64),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.byte),
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_convert_signals_to_frames_single_point = cfunc
+            self._nx_convert_signals_to_frames_single_point = self._bind('nx_convert_signals_to_frames_single_point')
         return self._nx_convert_signals_to_frames_single_point(
             session_ref,
             value_buffer,
@@ -628,13 +938,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_blink is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxBlink
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_blink = cfunc
+            self._nx_blink = self._bind('nx_blink')
         return self._nx_blink(
             interface_ref,
             modifier)
@@ -645,12 +949,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_clear is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxClear
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_clear = cfunc
+            self._nx_clear = self._bind('nx_clear')
         return self._nx_clear(
             session_ref)
 
@@ -662,14 +961,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_connect_terminals is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxConnectTerminals
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_connect_terminals = cfunc
+            self._nx_connect_terminals = self._bind('nx_connect_terminals')
         return self._nx_connect_terminals(
             session_ref,
             source,
@@ -683,14 +975,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_disconnect_terminals is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxDisconnectTerminals
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_disconnect_terminals = cfunc
+            self._nx_disconnect_terminals = self._bind('nx_disconnect_terminals')
         return self._nx_disconnect_terminals(
             session_ref,
             source,
@@ -702,12 +987,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_flush is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxFlush
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_flush = cfunc
+            self._nx_flush = self._bind('nx_flush')
         return self._nx_flush(
             session_ref)
 
@@ -718,13 +998,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_start is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxStart
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_start = cfunc
+            self._nx_start = self._bind('nx_start')
         return self._nx_start(
             session_ref,
             scope)
@@ -736,13 +1010,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_stop is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxStop
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_stop = cfunc
+            self._nx_stop = self._bind('nx_stop')
         return self._nx_stop(
             session_ref,
             scope)
@@ -755,14 +1023,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> None
         if self._nx_status_to_string is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxStatusToString
-                cfunc.argtypes = [
-                    _ctypedefs.nxStatus_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p]
-                cfunc.restype = None
-                self._nx_status_to_string = cfunc
+            self._nx_status_to_string = self._bind('nx_status_to_string')
         return self._nx_status_to_string(
             status,
             size_of_status_description,
@@ -774,12 +1035,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_system_open is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxSystemOpen
-                cfunc.argtypes = [
-                    ctypes.POINTER(_ctypedefs.nxSessionRef_t)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_system_open = cfunc
+            self._nx_system_open = self._bind('nx_system_open')
         return self._nx_system_open(
             system_ref)
 
@@ -789,12 +1045,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_system_close is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxSystemClose
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_system_close = cfunc
+            self._nx_system_close = self._bind('nx_system_close')
         return self._nx_system_close(
             system_ref)
 
@@ -808,16 +1059,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nx_wait is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxWait
-                cfunc.argtypes = [
-                    _ctypedefs.nxSessionRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.f64,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nx_wait = cfunc
+            self._nx_wait = self._bind('nx_wait')
         return self._nx_wait(
             session_ref,
             condition,
@@ -832,13 +1074,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_open_database is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbOpenDatabase
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    ctypes.POINTER(_ctypedefs.nxDatabaseRef_t)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_open_database = cfunc
+            self._nxdb_open_database = self._bind('nxdb_open_database')
         return self._nxdb_open_database(
             database_name,
             database_ref)
@@ -850,13 +1086,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_close_database is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbCloseDatabase
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.bool32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_close_database = cfunc
+            self._nxdb_close_database = self._bind('nxdb_close_database')
         return self._nxdb_close_database(
             database_ref,
             close_all_refs)
@@ -870,15 +1100,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_create_object is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbCreateObject
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    ctypes.POINTER(_ctypedefs.nxDatabaseRef_t)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_create_object = cfunc
+            self._nxdb_create_object = self._bind('nxdb_create_object')
         return self._nxdb_create_object(
             parent_object_ref,
             object_class,
@@ -894,15 +1116,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_find_object is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbFindObject
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    ctypes.POINTER(_ctypedefs.nxDatabaseRef_t)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_find_object = cfunc
+            self._nxdb_find_object = self._bind('nxdb_find_object')
         return self._nxdb_find_object(
             parent_object_ref,
             object_class,
@@ -915,12 +1129,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_delete_object is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbDeleteObject
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_delete_object = cfunc
+            self._nxdb_delete_object = self._bind('nxdb_delete_object')
         return self._nxdb_delete_object(
             db_object_ref)
 
@@ -931,13 +1140,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_save_database is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbSaveDatabase
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.char_p]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_save_database = cfunc
+            self._nxdb_save_database = self._bind('nxdb_save_database')
         return self._nxdb_save_database(
             database_ref,
             db_filepath)
@@ -951,15 +1154,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_get_property is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbGetProperty
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_get_property = cfunc
+            self._nxdb_get_property = self._bind('nxdb_get_property')
         return self._nxdb_get_property(
             db_object_ref,
             property_id,
@@ -974,14 +1169,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_get_property_size is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbGetPropertySize
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_get_property_size = cfunc
+            self._nxdb_get_property_size = self._bind('nxdb_get_property_size')
         return self._nxdb_get_property_size(
             db_object_ref,
             property_id,
@@ -996,15 +1184,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_set_property is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbSetProperty
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.u32,
-                    _ctypedefs.nxVoidPtr]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_set_property = cfunc
+            self._nxdb_set_property = self._bind('nxdb_set_property')
         return self._nxdb_set_property(
             db_object_ref,
             property_id,
@@ -1020,15 +1200,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_get_dbc_attribute_size is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbGetDBCAttributeSize
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_get_dbc_attribute_size = cfunc
+            self._nxdb_get_dbc_attribute_size = self._bind('nxdb_get_dbc_attribute_size')
         return self._nxdb_get_dbc_attribute_size(
             db_object_ref,
             mode,
@@ -1046,17 +1218,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_get_dbc_attribute is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbGetDBCAttribute
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_get_dbc_attribute = cfunc
+            self._nxdb_get_dbc_attribute = self._bind('nxdb_get_dbc_attribute')
         return self._nxdb_get_dbc_attribute(
             db_object_ref,
             mode,
@@ -1076,17 +1238,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_merge is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbMerge
-                cfunc.argtypes = [
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.nxDatabaseRef_t,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    _ctypedefs.bool32,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_merge = cfunc
+            self._nxdb_merge = self._bind('nxdb_merge')
         return self._nxdb_merge(
             target_cluster_ref,
             source_obj_ref,
@@ -1103,14 +1255,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_add_alias is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbAddAlias
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p,
-                    _ctypedefs.u32]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_add_alias = cfunc
+            self._nxdb_add_alias = self._bind('nxdb_add_alias')
         return self._nxdb_add_alias(
             database_alias,
             database_filepath,
@@ -1124,14 +1269,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_add_alias64 is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbAddAlias64
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p,
-                    _ctypedefs.u64]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_add_alias64 = cfunc
+            self._nxdb_add_alias64 = self._bind('nxdb_add_alias64')
         return self._nxdb_add_alias64(
             database_alias,
             database_filepath,
@@ -1143,12 +1281,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_remove_alias is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbRemoveAlias
-                cfunc.argtypes = [
-                    _ctypedefs.char_p]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_remove_alias = cfunc
+            self._nxdb_remove_alias = self._bind('nxdb_remove_alias')
         return self._nxdb_remove_alias(
             database_alias)
 
@@ -1161,15 +1294,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_deploy is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbDeploy
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p,
-                    _ctypedefs.bool32,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_deploy = cfunc
+            self._nxdb_deploy = self._bind('nxdb_deploy')
         return self._nxdb_deploy(
             ip_address,
             database_alias,
@@ -1183,13 +1308,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_undeploy is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbUndeploy
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    _ctypedefs.char_p]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_undeploy = cfunc
+            self._nxdb_undeploy = self._bind('nxdb_undeploy')
         return self._nxdb_undeploy(
             ip_address,
             database_alias)
@@ -1205,17 +1324,7 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_get_database_list is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbGetDatabaseList
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    _ctypedefs.u32,
-                    _ctypedefs.char_p,
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_get_database_list = cfunc
+            self._nxdb_get_database_list = self._bind('nxdb_get_database_list')
         return self._nxdb_get_database_list(
             ip_address,
             size_of_alias_buffer,
@@ -1232,18 +1341,11 @@ class XnetLibrary(object):
     ):
         # type: (...) -> _ctypedefs.nxStatus_t
         if self._nxdb_get_database_list_sizes is None:
-            with self._load_lock:
-                cfunc = self.cdll.nxdbGetDatabaseListSizes
-                cfunc.argtypes = [
-                    _ctypedefs.char_p,
-                    ctypes.POINTER(_ctypedefs.u32),
-                    ctypes.POINTER(_ctypedefs.u32)]
-                cfunc.restype = _ctypedefs.nxStatus_t
-                self._nxdb_get_database_list_sizes = cfunc
+            self._nxdb_get_database_list_sizes = self._bind('nxdb_get_database_list_sizes')
         return self._nxdb_get_database_list_sizes(
             ip_address,
             sizeof_alias_buffer,
             sizeof_filepath_buffer)
 
 
-lib = XnetLibrary()
+lib = XnetLibrary(eager=True)
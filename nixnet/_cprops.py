@@ -29,7 +29,7 @@ def get_session_u8(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -45,7 +45,7 @@ def set_session_u8(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_session_u32(ref, prop_id):
@@ -60,7 +60,7 @@ def get_session_u32(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -76,7 +76,7 @@ def set_session_u32(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_session_u32_array(ref, prop_id):
@@ -93,7 +93,7 @@ def get_session_u32_array(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     for value in value_ctypes:
         yield value.value
 
@@ -112,7 +112,7 @@ def set_session_u32_array(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_session_u64(ref, prop_id):
@@ -127,7 +127,7 @@ def get_session_u64(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -143,7 +143,7 @@ def set_session_u64(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_session_f64(ref, prop_id):
@@ -158,7 +158,7 @@ def get_session_f64(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -174,7 +174,7 @@ def set_session_f64(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_session_string(ref, prop_id):
@@ -190,7 +190,7 @@ def get_session_string(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value.decode("ascii")
 
 
@@ -208,7 +208,7 @@ def set_session_string(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_session_string_array(ref, prop_id):
@@ -229,7 +229,7 @@ def get_session_ref(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -245,7 +245,7 @@ def set_session_ref(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_session_ref_array_len(ref, prop_id):
@@ -269,7 +269,7 @@ def get_session_ref_array(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     for value in value_ctypes:
         yield value.value
 
@@ -288,7 +288,7 @@ def set_session_ref_array(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def set_session_sub_u32(ref, sub, prop_id, value):
@@ -305,7 +305,7 @@ def set_session_sub_u32(ref, sub, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def set_session_sub_f64(ref, sub, prop_id, value):
@@ -322,7 +322,7 @@ def set_session_sub_f64(ref, sub, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def set_session_sub_string(ref, sub, prop_id, value):
@@ -341,7 +341,7 @@ def set_session_sub_string(ref, sub, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_bool(ref, prop_id):
@@ -366,7 +366,7 @@ def get_database_u8(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -382,7 +382,7 @@ def set_database_u8(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_u8_array(ref, prop_id):
@@ -399,7 +399,7 @@ def get_database_u8_array(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     for value in value_ctypes:
         yield value.value
 
@@ -418,7 +418,7 @@ def set_database_u8_array(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_u32(ref, prop_id):
@@ -433,7 +433,7 @@ def get_database_u32(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -449,7 +449,7 @@ def set_database_u32(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_u32_array(ref, prop_id):
@@ -466,7 +466,7 @@ def get_database_u32_array(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     for value in value_ctypes:
         yield value.value
 
@@ -485,7 +485,7 @@ def set_database_u32_array(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_u64(ref, prop_id):
@@ -500,7 +500,7 @@ def get_database_u64(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -516,7 +516,7 @@ def set_database_u64(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_f64(ref, prop_id):
@@ -531,7 +531,7 @@ def get_database_f64(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -547,7 +547,7 @@ def set_database_f64(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_string(ref, prop_id):
@@ -563,7 +563,7 @@ def get_database_string(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value.decode("ascii")
 
 
@@ -581,7 +581,7 @@ def set_database_string(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_ref(ref, prop_id):
@@ -596,7 +596,7 @@ def get_database_ref(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return value_ctypes.value
 
 
@@ -612,7 +612,7 @@ def set_database_ref(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes_ptr)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def get_database_ref_array_len(ref, prop_id):
@@ -636,7 +636,7 @@ def get_database_ref_array(ref, prop_id):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     for value in value_ctypes:
         yield value.value
 
@@ -655,4 +655,4 @@ def set_database_ref_array(ref, prop_id, value):
         prop_id_ctypes,
         prop_size_ctypes,
         value_ctypes)  # type: ignore
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
@@ -2215,3 +2215,16 @@ class FrameType(enum.Enum):
     SPECIAL_DELAY = _cconsts.NX_FRAME_TYPE_SPECIAL_DELAY
     SPECIAL_LOG_TRIGGER = _cconsts.NX_FRAME_TYPE_SPECIAL_LOG_TRIGGER
     SPECIAL_START_TRIGGER = _cconsts.NX_FRAME_TYPE_SPECIAL_START_TRIGGER
+
+
+class FlexRaySymbol(enum.Enum):
+    """FlexRay Symbol
+
+    Values:
+        MTS:
+            Media Access Test Symbol.
+        WAKEUP:
+            Wakeup Symbol.
+    """
+    MTS = _cconsts.NX_FLEX_RAY_SYMBOL_MTS
+    WAKEUP = _cconsts.NX_FLEX_RAY_SYMBOL_WAKEUP
@@ -15,6 +15,18 @@ def check_for_error(error_code):
         warnings.warn(errors.XnetWarning(status, error_code))
 
 
+def check_status(status):
+    """Check a status returned by :any:`nixnet._cfuncs.XnetLibrary`.
+
+    ``status`` is an ``int`` from eagerly bound entry points or an
+    ``nxStatus_t`` from lazily bound ones.
+    """
+    if status.__class__ is not int:
+        status = status.value
+    if status:
+        check_for_error(status)
+
+
 def raise_xnet_error(error_code):
     status = status_to_string(error_code)
     raise errors.XnetError(status, error_code)
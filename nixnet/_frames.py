@@ -1,5 +1,7 @@
 import struct
+import typing  # NOQA: F401
 
+from nixnet import _arrays
 from nixnet import _cconsts
 from nixnet import _errors
 from nixnet import constants
@@ -8,6 +10,8 @@ from nixnet import types
 
 nxFrameFixed_t = struct.Struct('QIBBBB8s')  # NOQA: N801, N816
 assert nxFrameFixed_t.size == 24, 'Incorrectly specified frame.'
+nxFrameHeader_t = struct.Struct('QIBBBB')  # NOQA: N801, N816
+assert nxFrameHeader_t.size == 16, 'Incorrectly specified frame header.'
 FRAME_TIMESTAMP_INDEX = 0
 FRAME_IDENTIFIER_INDEX = 1
 FRAME_TYPE_INDEX = 2
@@ -17,6 +21,28 @@ FRAME_PAYLOAD_LENGTH_INDEX = 5
 FRAME_PAYLOAD_INDEX = 6
 
 MAX_BASE_UNIT_PAYLOAD_LENGTH = 8
+PAYLOAD_UNIT_SIZE = 8
+BASE_UNIT_PAYLOAD_OFFSET = 16
+
+if _arrays.numpy is not None:
+    _BASE_UNIT_DTYPE = _arrays.numpy.dtype([
+        ('timestamp', '=u8'),
+        ('identifier', '=u4'),
+        ('type', 'u1'),
+        ('flags', 'u1'),
+        ('info', 'u1'),
+        ('payload_length', 'u1'),
+        ('payload', 'V8')])
+    assert _BASE_UNIT_DTYPE.itemsize == nxFrameFixed_t.size, 'Incorrectly specified frame dtype.'
+
+    FRAME_DTYPE = _arrays.numpy.dtype([
+        ('timestamp', '=u8'),
+        ('identifier', '=u4'),
+        ('type', 'u1'),
+        ('flags', 'u1'),
+        ('info', 'u1'),
+        ('payload_length', '=u2'),
+        ('payload_offset', '=u8')])
 
 
 def _get_frame_payload_length(base):
@@ -103,33 +129,262 @@ def _split_payload_length(payload_length):
 
 def iterate_frames(bytes):
     """Yields RawFrames from the bytes"""
-    base_pos = 0
-    next_pos = base_pos
-    while next_pos != len(bytes):
+    return iterate_frames_as(bytes, types.RawFrame)
+
+
+def iterate_frames_as(buffer, frame_type):
+    # type: (typing.Any, typing.Type[types.FrameFactory]) -> typing.Iterator[typing.Any]
+    """Yield the frames in raw frame bytes, created by ``frame_type``.
+
+    Each frame comes from ``frame_type.from_fields`` with the fields of the
+    base unit, so factories that override it never build a
+    :any:`nixnet.types.RawFrame`.  Factories that only override
+    ``from_raw`` get a RawFrame, even if they inherit ``from_fields``.
+
+    >>> frames = [types.RawFrame(1, 0x20000002, constants.FrameType.CAN_DATA, 0, 0, b'\\x01')]
+    >>> list(iterate_frames_as(serialize_frames(frames), types.XnetFrame))
+    [CanFrame(CanIdentifier(0x2, extended=True), timestamp=0x1, len(payload)=1)]
+    """
+    from_fields = types._decoder(frame_type)
+    frame_types = types._FRAME_TYPES
+    unpack_from = nxFrameFixed_t.unpack_from
+    size = len(buffer)
+    next_pos = 0
+    while next_pos != size:
         base_pos = next_pos
         next_pos += nxFrameFixed_t.size
-        if len(bytes) < next_pos:
+        if size < next_pos:
             _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
 
-        raw_base = bytes[base_pos:next_pos]
-        base_unit = nxFrameFixed_t.unpack(raw_base)
+        timestamp, identifier, type_value, flags, info, payload_length, base_unit_payload = unpack_from(
+            buffer, base_pos)
+        if type_value == _cconsts.NX_FRAME_TYPE_J1939_DATA:
+            # J1939 uses three bits from the Info field as the high bites.
+            payload_length |= (info & _cconsts.NX_FRAME_PAYLD_LEN_HIGH_MASK_J1939) << 8
+        if payload_length <= MAX_BASE_UNIT_PAYLOAD_LENGTH:
+            payload = base_unit_payload[:payload_length]
+        else:
+            payload_unit_end = next_pos + payload_length - MAX_BASE_UNIT_PAYLOAD_LENGTH
+            payload = base_unit_payload + bytes(buffer[next_pos:payload_unit_end])
+            next_pos += _calculate_payload_unit_size(payload_length)
+
+        frame_type_value = frame_types.get(type_value) or constants.FrameType(type_value)
+        yield from_fields(timestamp, identifier, frame_type_value, flags, info, payload)
+
+
+def iterate_base_units(buffer, start=0, end=None):
+    # type: (typing.Any, int, typing.Optional[int]) -> typing.Iterator[typing.Tuple[int, int]]
+    """Yield the offset and timestamp of each frame without decoding it.
+
+    >>> frames = [
+    ...     types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 0, 0, b'\\x01'),
+    ...     types.RawFrame(3, 4, constants.FrameType.CANFD_DATA, 0, 0, bytes(range(12))),
+    ...     types.RawFrame(5, 6, constants.FrameType.CAN_DATA, 0, 0, b'')]
+    >>> list(iterate_base_units(serialize_frames(frames)))
+    [(0, 1), (24, 3), (56, 5)]
+    """
+    if end is None:
+        end = len(buffer)
+    unpack_header = nxFrameHeader_t.unpack_from
+    pos = start
+    while pos != end:
+        if end < pos + nxFrameFixed_t.size:
+            _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
+        base_unit = unpack_header(buffer, pos)
+        yield pos, base_unit[FRAME_TIMESTAMP_INDEX]
+        pos += BASE_UNIT_PAYLOAD_OFFSET + _calculate_payload_size(_get_frame_payload_length(base_unit))
+
+
+def iterate_headers(buffer):
+    # type: (typing.Any) -> typing.Iterator[typing.Tuple[int, int, int, int]]
+    """Yield the byte range, raw identifier and type value of each frame.
+
+    >>> frames = [
+    ...     types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 0, 0, b'\\x01'),
+    ...     types.RawFrame(3, 4, constants.FrameType.CANFD_DATA, 0, 0, bytes(range(12)))]
+    >>> list(iterate_headers(serialize_frames(frames)))
+    [(0, 24, 2, 0), (24, 56, 4, 16)]
+    """
+    unpack_header = nxFrameHeader_t.unpack_from
+    for start, _ in iterate_base_units(buffer):
+        header = unpack_header(buffer, start)
+        end = start + BASE_UNIT_PAYLOAD_OFFSET + _calculate_payload_size(_get_frame_payload_length(header))
+        yield start, end, header[FRAME_IDENTIFIER_INDEX], header[FRAME_TYPE_INDEX]
+
+
+def find_timestamp(buffer, timestamp, start=0, end=None):
+    # type: (typing.Any, int, int, typing.Optional[int]) -> int
+    """Return the offset of the first frame at or after ``timestamp``.
+
+    Frames are assumed to be in timestamp order.  ``end`` is returned if
+    every frame is earlier.
+
+    >>> frames = [types.RawFrame(t, 0, constants.FrameType.CAN_DATA, 0, 0, b'') for t in (10, 20, 30)]
+    >>> buffer = serialize_frames(frames)
+    >>> find_timestamp(buffer, 20), find_timestamp(buffer, 21), find_timestamp(buffer, 31)
+    (24, 48, 72)
+    """
+    if end is None:
+        end = len(buffer)
+    for pos, frame_timestamp in iterate_base_units(buffer, start, end):
+        if timestamp <= frame_timestamp:
+            return pos
+    return end
+
+
+def parse_batch(buffer, frame_type=None):
+    # type: (bytes, typing.Optional[typing.Type[types.FrameFactory]]) -> types.FrameBatch
+    """Parse raw frame bytes into a :any:`nixnet.types.FrameBatch`.
+
+    Like :func:`iterate_frames` but only the batch's arrays are filled; the
+    payloads stay in ``buffer``.
+
+    >>> frames = [
+    ...     types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 0, 0, b'\\x01'),
+    ...     types.RawFrame(3, 4, constants.FrameType.CANFD_DATA, 0, 0, bytes(range(12)))]
+    >>> batch = parse_batch(bytes(serialize_frames(frames)), types.RawFrame)
+    >>> list(batch) == frames
+    True
+    """
+    batch = types.FrameBatch(payloads=buffer, frame_type=frame_type)
+    timestamps = batch.timestamps.append
+    identifiers = batch.identifiers.append
+    frame_types = batch.types.append
+    flags = batch.flags.append
+    info = batch.info.append
+    payload_offsets = batch.payload_offsets.append
+    payload_lengths = batch.payload_lengths.append
+    unpack_header = nxFrameHeader_t.unpack_from
+
+    pos = 0
+    end = len(buffer)
+    while pos != end:
+        if end < pos + nxFrameFixed_t.size:
+            _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
+        base_unit = unpack_header(buffer, pos)
         payload_length = _get_frame_payload_length(base_unit)
-        base_unit_length, payload_unit_length = _split_payload_length(payload_length)
+        timestamps(base_unit[FRAME_TIMESTAMP_INDEX])
+        identifiers(base_unit[FRAME_IDENTIFIER_INDEX])
+        frame_types(base_unit[FRAME_TYPE_INDEX])
+        flags(base_unit[FRAME_FLAG_INDEX])
+        info(base_unit[FRAME_INFO_INDEX])
+        payload_offsets(pos + BASE_UNIT_PAYLOAD_OFFSET)
+        payload_lengths(payload_length)
+        pos += BASE_UNIT_PAYLOAD_OFFSET + _calculate_payload_size(payload_length)
+    return batch
+
+
+def _find_base_units(data):
+    """Return the index of every base unit in ``data``, in units of 8 bytes.
+
+    Frames are variable length, so finding where each one starts is normally
+    a sequential walk.  Instead, every 8-byte unit is treated as if it started
+    a frame to compute where the following frame would start, and the units
+    reachable from the first one are found by pointer doubling.  That takes a
+    logarithmic number of vectorized passes rather than one Python step per
+    frame.
+    """
+    numpy = _arrays.numpy
+    num_bytes = len(data)
+    if num_bytes % PAYLOAD_UNIT_SIZE:
+        _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
+    num_units = num_bytes // PAYLOAD_UNIT_SIZE
+    units_per_base = nxFrameFixed_t.size // PAYLOAD_UNIT_SIZE
+
+    # Pad so the header of a (truncated) candidate at the very end can still
+    # be read; such candidates are rejected below since they overrun the data.
+    padded = numpy.zeros(num_bytes + nxFrameFixed_t.size, dtype=numpy.uint8)
+    padded[:num_bytes] = data
+    headers = padded.reshape(-1, PAYLOAD_UNIT_SIZE)[1:num_units + 1]
+    frame_type = headers[:, 4]
+    info = headers[:, 6]
+    payload_length = headers[:, 7].astype(numpy.uint16)
+    is_j1939 = frame_type == _cconsts.NX_FRAME_TYPE_J1939_DATA
+    payload_length[is_j1939] |= (
+        info[is_j1939].astype(numpy.uint16) & _cconsts.NX_FRAME_PAYLD_LEN_HIGH_MASK_J1939) << 8
+    payload_units = numpy.where(
+        payload_length > MAX_BASE_UNIT_PAYLOAD_LENGTH,
+        (payload_length.astype(numpy.intp) + 7) // PAYLOAD_UNIT_SIZE - 1,
+        0)
+
+    end = num_units
+    overrun = num_units + 1
+    jump = numpy.empty(num_units + 2, dtype=numpy.intp)
+    jump[:num_units] = numpy.arange(num_units) + units_per_base + payload_units
+    jump[:num_units][jump[:num_units] > end] = overrun
+    jump[end] = end
+    jump[overrun] = overrun
+
+    # Fast path: no payload units, so every frame is exactly one base unit.
+    regular = numpy.arange(0, num_units, units_per_base)
+    if num_units % units_per_base == 0 and numpy.array_equal(jump[regular], regular + units_per_base):
+        return regular
+
+    reached = numpy.zeros(num_units + 2, dtype=bool)
+    reached[0] = True
+    steps = 1
+    while steps <= num_units:
+        reached[jump[reached]] = True
+        jump = jump[jump]
+        steps *= 2
+    if reached[overrun]:
+        _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
+    return numpy.flatnonzero(reached[:num_units])
+
 
-        payload_pos = next_pos
-        payload_pad_pos = payload_pos + payload_unit_length
-        next_pos += _calculate_payload_unit_size(payload_length)
+def decode_frames(buffer):
+    # type: (typing.Any) -> typing.Any
+    """Decode raw frame bytes into a NumPy structured array.
 
-        base_unit_payload = base_unit[FRAME_PAYLOAD_INDEX][0:base_unit_length]
-        payload_unit = bytes[payload_pos:payload_pad_pos]
-        payload = base_unit_payload + payload_unit
-        yield types.RawFrame(
-            base_unit[FRAME_TIMESTAMP_INDEX],
-            base_unit[FRAME_IDENTIFIER_INDEX],
-            constants.FrameType(base_unit[FRAME_TYPE_INDEX]),
-            base_unit[FRAME_FLAG_INDEX],
-            base_unit[FRAME_INFO_INDEX],
-            payload)
+    This is the columnar counterpart to :func:`iterate_frames`.  No per-frame
+    Python objects are created; the result has one :data:`FRAME_DTYPE` record
+    per frame.  Payloads are not copied, ``payload_offset`` is the position of
+    the payload in ``buffer`` (the base unit and payload unit are adjacent, so
+    each payload is contiguous).
+    """
+    numpy = _arrays.require_numpy()
+    data = numpy.frombuffer(buffer, dtype=numpy.uint8)
+    starts = _find_base_units(data)
+
+    offsets = starts * PAYLOAD_UNIT_SIZE
+    base_units = data[offsets[:, numpy.newaxis] + numpy.arange(nxFrameFixed_t.size)]
+    base_units = base_units.view(_BASE_UNIT_DTYPE).reshape(-1)
+
+    frames = numpy.empty(len(base_units), dtype=FRAME_DTYPE)
+    frames['timestamp'] = base_units['timestamp']
+    frames['identifier'] = base_units['identifier']
+    frames['type'] = base_units['type']
+    frames['flags'] = base_units['flags']
+    frames['info'] = base_units['info']
+    payload_length = base_units['payload_length'].astype(numpy.uint16)
+    is_j1939 = base_units['type'] == _cconsts.NX_FRAME_TYPE_J1939_DATA
+    payload_length[is_j1939] |= (
+        base_units['info'][is_j1939].astype(numpy.uint16) & _cconsts.NX_FRAME_PAYLD_LEN_HIGH_MASK_J1939) << 8
+    frames['payload_length'] = payload_length
+    frames['payload_offset'] = offsets + BASE_UNIT_PAYLOAD_OFFSET
+    return frames
+
+
+def _encode_payload_length(frame_type, info, payload_length):
+    """Return the info and payload length fields of a base unit.
+
+    >>> _encode_payload_length(_cconsts.NX_FRAME_TYPE_CAN_DATA, 0x2, 8)
+    (2, 8)
+    >>> _encode_payload_length(_cconsts.NX_FRAME_TYPE_J1939_DATA, 0x8, 1024)
+    (12, 0)
+    """
+    if frame_type == _cconsts.NX_FRAME_TYPE_J1939_DATA:
+        if (info & _cconsts.NX_FRAME_PAYLD_LEN_HIGH_MASK_J1939) != 0:
+            # Invalid data where info_length will go.
+            _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
+        info_length = payload_length >> 8
+        if info_length != (info_length & _cconsts.NX_FRAME_PAYLD_LEN_HIGH_MASK_J1939):
+            _errors.check_for_error(_cconsts.NX_ERR_FRAME_WRITE_TOO_LARGE)
+        return info | info_length, payload_length & 0xFF
+    else:
+        if payload_length != (payload_length & 0xFF):
+            _errors.check_for_error(_cconsts.NX_ERR_NON_J1939_FRAME_SIZE)
+        return info, payload_length
 
 
 def serialize_frame(frame):
@@ -143,20 +398,7 @@ def serialize_frame(frame):
     payload_unit_padding_length = _calculate_payload_unit_size(len(payload)) - len(payload_unit)
     payload_unit += b'\0' * payload_unit_padding_length
 
-    payload_length = len(payload)
-    if frame.type == constants.FrameType.J1939_DATA:
-        if (frame.info & _cconsts.NX_FRAME_PAYLD_LEN_HIGH_MASK_J1939) != 0:
-            # Invalid data where info_length will go.
-            _errors.check_for_error(_cconsts.NX_ERR_INTERNAL_ERROR)
-        info_length = payload_length >> 8
-        if info_length != (info_length & _cconsts.NX_FRAME_PAYLD_LEN_HIGH_MASK_J1939):
-            _errors.check_for_error(_cconsts.NX_ERR_FRAME_WRITE_TOO_LARGE)
-        info = frame.info | info_length
-        payload_length &= 0xFF
-    else:
-        if payload_length != (payload_length & 0xFF):
-            _errors.check_for_error(_cconsts.NX_ERR_NON_J1939_FRAME_SIZE)
-        info = frame.info
+    info, payload_length = _encode_payload_length(frame.type.value, frame.info, len(payload))
 
     base_unit = nxFrameFixed_t.pack(
         frame.timestamp,
@@ -170,3 +412,86 @@ def serialize_frame(frame):
 
     if payload_unit:
         yield payload_unit
+
+
+def _pack_frames(rows):
+    """Pack ``(timestamp, identifier, type, flags, info, payload)`` rows.
+
+    The total size is computed up front so all frames are packed into a single
+    zero-filled ``bytearray``; padding needs no extra work.
+    """
+    rows = list(rows)
+    size = nxFrameFixed_t.size * len(rows)
+    for row in rows:
+        payload_length = len(row[5])
+        if MAX_BASE_UNIT_PAYLOAD_LENGTH < payload_length:
+            size += _calculate_payload_unit_size(payload_length)
+    buffer = bytearray(size)
+
+    pack_base_unit = nxFrameFixed_t.pack_into
+    pack_header = nxFrameHeader_t.pack_into
+    offset = 0
+    for timestamp, identifier, frame_type, flags, info, payload in rows:
+        payload_length = len(payload)
+        if payload_length <= MAX_BASE_UNIT_PAYLOAD_LENGTH and frame_type != _cconsts.NX_FRAME_TYPE_J1939_DATA:
+            # Common case: the struct pads the payload of a lone base unit.
+            if not isinstance(payload, (bytes, bytearray)):
+                payload = bytes(payload)
+            pack_base_unit(buffer, offset, timestamp, identifier, frame_type, flags, info, payload_length, payload)
+            offset += nxFrameFixed_t.size
+            continue
+        info, encoded_length = _encode_payload_length(frame_type, info, payload_length)
+        pack_header(buffer, offset, timestamp, identifier, frame_type, flags, info, encoded_length)
+        offset += BASE_UNIT_PAYLOAD_OFFSET
+        buffer[offset:offset + payload_length] = payload
+        offset += _calculate_payload_size(payload_length)
+    return buffer
+
+
+def serialize_frames(frames):
+    # type: (typing.Iterable[types.RawFrame]) -> bytearray
+    """Serialize many frames into one buffer.
+
+    Equivalent to joining :func:`serialize_frame` for each frame, but done in
+    a single pass with ``struct.pack_into``.
+
+    >>> frames = [
+    ...     types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 0, 0, b'\\x01'),
+    ...     types.RawFrame(3, 4, constants.FrameType.CANFD_DATA, 0, 0, bytes(range(12)))]
+    >>> buffer = serialize_frames(frames)
+    >>> buffer == b''.join(unit for frame in frames for unit in serialize_frame(frame))
+    True
+    """
+    return _pack_frames(
+        (frame.timestamp, frame.identifier, frame.type.value, frame.flags, frame.info, frame.payload)
+        for frame in frames)
+
+
+def serialize_columns(identifiers, frame_types, payloads, timestamps=None, flags=None, info=None):
+    # type: (typing.Iterable[int], typing.Iterable[typing.Any], typing.Iterable[typing.Any], typing.Optional[typing.Iterable[int]], typing.Optional[typing.Iterable[int]], typing.Optional[typing.Iterable[int]]) -> bytearray  # NOQA: E501
+    """Serialize frames given as parallel columns.
+
+    This skips building a frame object per row.  ``frame_types`` may hold
+    :any:`nixnet._enums.FrameType` members or their integer values and
+    ``payloads`` any bytes-like objects.  ``timestamps``, ``flags`` and
+    ``info`` default to zero.  All given columns must have the same length.
+
+    >>> buffer = serialize_columns([2, 4], [constants.FrameType.CAN_DATA, 0x01], [b'\\x01', b''])
+    >>> [frame.identifier for frame in iterate_frames(bytes(buffer))]
+    [2, 4]
+    """
+    columns = [list(identifiers), list(frame_types), list(payloads)]
+    num_frames = len(columns[0])
+    for column in (timestamps, flags, info):
+        columns.append([0] * num_frames if column is None else list(column))
+    for column in columns:
+        if len(column) != num_frames:
+            raise ValueError('Each column needs one entry per frame', num_frames, len(column))
+    identifier_column, frame_type_column, payload_column, timestamp_column, flag_column, info_column = columns
+    return _pack_frames(zip(
+        timestamp_column,
+        identifier_column,
+        (getattr(frame_type, 'value', frame_type) for frame_type in frame_type_column),
+        flag_column,
+        info_column,
+        payload_column))
@@ -1,12 +1,100 @@
 import ctypes  # type: ignore
+import sys
 import typing  # NOQA: F401
 
+from nixnet import _buffers
 from nixnet import _cfuncs
 from nixnet import _ctypedefs
 from nixnet import _enums  # NOQA: F401
 from nixnet import _errors
 
 
+def _byte_array_from_buffer(buffer):
+    # type: (typing.Any) -> typing.Any
+    """Wrap a buffer-protocol object as a ctypes byte array without per-byte work.
+
+    Writable buffers are shared with the driver; read-only ones such as
+    ``bytes`` are copied once.  Other iterables of ints are accepted for
+    compatibility and converted with ``bytes()``.
+
+    >>> data = bytearray(b'abc')
+    >>> array = _byte_array_from_buffer(data)
+    >>> array[0] = 0x41
+    >>> data
+    bytearray(b'Abc')
+    >>> bytes(_byte_array_from_buffer(b'abc'))
+    b'abc'
+    >>> bytes(_byte_array_from_buffer([1, 2]))
+    b'\\x01\\x02'
+    """
+    try:
+        view = memoryview(buffer)
+    except TypeError:
+        view = memoryview(bytes(buffer))
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    array_type = _ctypedefs.byte * view.nbytes
+    if view.readonly:
+        return array_type.from_buffer_copy(view)
+    return array_type.from_buffer(view)
+
+
+_F64_FORMATS = frozenset(['d', '@d', '=d', '<d' if sys.byteorder == 'little' else '>d'])
+
+
+def _f64_array_from_values(values):
+    # type: (typing.Any) -> typing.Any
+    """Wrap float64 values as a ctypes array, sharing float64 buffers with the driver.
+
+    Contiguous float64 buffers such as NumPy arrays, ``array.array('d')`` and
+    their memoryviews are used in place (read-only ones are copied once);
+    other iterables are converted item by item.
+
+    >>> values = memoryview(bytearray(16)).cast('d')
+    >>> _f64_array_from_values(values)[1] = 3.0
+    >>> values.tolist()
+    [0.0, 3.0]
+    >>> [value.value for value in _f64_array_from_values([1, 2.5])]
+    [1.0, 2.5]
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None and view.format in _F64_FORMATS and view.c_contiguous:
+        array_type = _ctypedefs.f64 * (view.nbytes // _ctypedefs.f64.BYTES)
+        view = view.cast('B')
+        if view.readonly:
+            return array_type.from_buffer_copy(view)
+        return array_type.from_buffer(view)
+    values = list(values)
+    return (_ctypedefs.f64 * len(values))(*values)
+
+
+def _array_from_writable_buffer(buffer, ctype):
+    # type: (typing.Any, typing.Any) -> typing.Any
+    """Share a writable buffer-protocol object with the driver as a ``ctype`` array.
+
+    The driver writes straight into ``buffer``, so it must be writable and
+    C-contiguous.
+
+    >>> values = bytearray(16)
+    >>> array = _array_from_writable_buffer(values, _ctypedefs.f64)
+    >>> array[1] = 1.0
+    >>> len(array), values[15]
+    (2, 63)
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        raise TypeError('Buffer must be writable')
+    if not view.c_contiguous:
+        raise ValueError('Buffer must be C-contiguous')
+    item_size = ctypes.sizeof(ctype)
+    if view.nbytes % item_size:
+        raise ValueError('Buffer size must be a multiple of {} bytes'.format(item_size), view.nbytes)
+    return (ctype * (view.nbytes // item_size)).from_buffer(view.cast('B'))
+
+
 def nx_create_session(
     database_name,  # type: typing.Text
     cluster_name,  # type: typing.Text
@@ -29,7 +117,7 @@ def nx_create_session(
         mode_ctypes,
         ctypes.pointer(session_ref_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return session_ref_ctypes.value
 
 
@@ -51,7 +139,7 @@ def nx_create_session_by_ref(
         mode_ctypes,
         ctypes.pointer(session_ref_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return session_ref_ctypes.value
 
 
@@ -68,7 +156,7 @@ def nx_get_property_size(
         property_id_ctypes,
         ctypes.pointer(property_size_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return property_size_ctypes.value
 
 
@@ -88,7 +176,7 @@ def nx_get_sub_property_size(
         property_id_ctypes,
         ctypes.pointer(property_size_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return property_size_ctypes.value
 
 
@@ -99,9 +187,10 @@ def nx_read_frame(
 ):
     # type: (...) -> typing.Tuple[bytes, int]
     session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
-    buffer_ctypes = (_ctypedefs.byte * bytes_to_read)()  # type: ignore
+    buffer_ctypes = _buffers.pool.array(session_ref, 'nx_read_frame.buffer', _ctypedefs.byte, bytes_to_read)
     size_of_buffer_ctypes = _ctypedefs.u32(_ctypedefs.byte.BYTES * bytes_to_read)
-    number_of_bytes_returned_ctypes = _ctypedefs.u32()
+    number_of_bytes_returned_ctypes = _buffers.pool.scalar(
+        session_ref, 'nx_read_frame.number_of_bytes_returned', _ctypedefs.u32)
     timeout_ctypes = _ctypedefs.f64(timeout)
     result = _cfuncs.lib.nx_read_frame(
         session_ref_ctypes,
@@ -109,20 +198,45 @@ def nx_read_frame(
         size_of_buffer_ctypes,
         timeout_ctypes,
         ctypes.pointer(number_of_bytes_returned_ctypes))
-    _errors.check_for_error(result.value)
-    return buffer_ctypes.raw, number_of_bytes_returned_ctypes.value  # type: ignore
+    _errors.check_status(result)
+    number_of_bytes_returned = number_of_bytes_returned_ctypes.value
+    return ctypes.string_at(buffer_ctypes, number_of_bytes_returned), number_of_bytes_returned
+
+
+def nx_read_frame_into(
+    session_ref,  # type: int
+    buffer,  # type: typing.Any
+    timeout,  # type: float
+):
+    # type: (...) -> int
+    session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
+    bytes_to_read = memoryview(buffer).nbytes
+    buffer_ctypes = (_ctypedefs.byte * bytes_to_read).from_buffer(buffer)  # type: ignore
+    size_of_buffer_ctypes = _ctypedefs.u32(_ctypedefs.byte.BYTES * bytes_to_read)
+    number_of_bytes_returned_ctypes = _buffers.pool.scalar(
+        session_ref, 'nx_read_frame.number_of_bytes_returned', _ctypedefs.u32)
+    timeout_ctypes = _ctypedefs.f64(timeout)
+    result = _cfuncs.lib.nx_read_frame(
+        session_ref_ctypes,
+        buffer_ctypes,
+        size_of_buffer_ctypes,
+        timeout_ctypes,
+        ctypes.pointer(number_of_bytes_returned_ctypes))
+    _errors.check_status(result)
+    return number_of_bytes_returned_ctypes.value
 
 
 def nx_read_signal_single_point(
     session_ref,  # type: int
-    num_signals,  # type: int
+    value_buffer,  # type: typing.Any
+    timestamp_buffer,  # type: typing.Any
 ):
-    # type: (...) -> typing.Tuple[ctypes.Array[_ctypedefs.nxTimestamp_t], ctypes.Array[_ctypedefs.f64]]
+    # type: (...) -> None
     session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
-    value_buffer_ctypes = (_ctypedefs.f64 * num_signals)()  # type: ignore
-    size_of_value_buffer_ctypes = _ctypedefs.u32(_ctypedefs.f64.BYTES * num_signals)
-    timestamp_buffer_ctypes = (_ctypedefs.nxTimestamp_t * num_signals)()  # type: ignore
-    size_of_timestamp_buffer_ctypes = _ctypedefs.u32(_ctypedefs.nxTimestamp_t.BYTES * num_signals)
+    value_buffer_ctypes = _array_from_writable_buffer(value_buffer, _ctypedefs.f64)
+    size_of_value_buffer_ctypes = _ctypedefs.u32(len(value_buffer_ctypes) * _ctypedefs.f64.BYTES)
+    timestamp_buffer_ctypes = _array_from_writable_buffer(timestamp_buffer, _ctypedefs.nxTimestamp_t)
+    size_of_timestamp_buffer_ctypes = _ctypedefs.u32(len(timestamp_buffer_ctypes) * _ctypedefs.nxTimestamp_t.BYTES)
     result = _cfuncs.lib.nx_read_signal_single_point(
         session_ref_ctypes,
         value_buffer_ctypes,
@@ -130,8 +244,62 @@ def nx_read_signal_single_point(
         timestamp_buffer_ctypes,
         size_of_timestamp_buffer_ctypes
     )
-    _errors.check_for_error(result.value)
-    return timestamp_buffer_ctypes, value_buffer_ctypes
+    _errors.check_status(result)
+
+
+def nx_read_signal_waveform(
+    session_ref,  # type: int
+    timeout,  # type: float
+    value_buffer,  # type: typing.Any
+):
+    # type: (...) -> typing.Tuple[int, float, int]
+    session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
+    timeout_ctypes = _ctypedefs.f64(timeout)
+    start_time_ctypes = _ctypedefs.nxTimestamp_t()
+    delta_time_ctypes = _ctypedefs.f64()
+    value_buffer_ctypes = _array_from_writable_buffer(value_buffer, _ctypedefs.f64)
+    size_of_value_buffer_ctypes = _ctypedefs.u32(len(value_buffer_ctypes) * _ctypedefs.f64.BYTES)
+    number_of_values_returned_ctypes = _ctypedefs.u32()
+    result = _cfuncs.lib.nx_read_signal_waveform(
+        session_ref_ctypes,
+        timeout_ctypes,
+        ctypes.pointer(start_time_ctypes),
+        ctypes.pointer(delta_time_ctypes),
+        value_buffer_ctypes,
+        size_of_value_buffer_ctypes,
+        ctypes.pointer(number_of_values_returned_ctypes),
+    )
+    _errors.check_status(result)
+    return start_time_ctypes.value, delta_time_ctypes.value, number_of_values_returned_ctypes.value
+
+
+def nx_read_signal_xy(
+    session_ref,  # type: int
+    time_limit,  # type: int
+    value_buffer,  # type: typing.Any
+    timestamp_buffer,  # type: typing.Any
+    num_pairs_buffer,  # type: typing.Any
+):
+    # type: (...) -> None
+    session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
+    time_limit_ctypes = _ctypedefs.nxTimestamp_t(time_limit)
+    value_buffer_ctypes = _array_from_writable_buffer(value_buffer, _ctypedefs.f64)
+    size_of_value_buffer_ctypes = _ctypedefs.u32(len(value_buffer_ctypes) * _ctypedefs.f64.BYTES)
+    timestamp_buffer_ctypes = _array_from_writable_buffer(timestamp_buffer, _ctypedefs.nxTimestamp_t)
+    size_of_timestamp_buffer_ctypes = _ctypedefs.u32(len(timestamp_buffer_ctypes) * _ctypedefs.nxTimestamp_t.BYTES)
+    num_pairs_buffer_ctypes = _array_from_writable_buffer(num_pairs_buffer, _ctypedefs.u32)
+    size_of_num_pairs_buffer_ctypes = _ctypedefs.u32(len(num_pairs_buffer_ctypes) * _ctypedefs.u32.BYTES)
+    result = _cfuncs.lib.nx_read_signal_xy(
+        session_ref_ctypes,
+        ctypes.pointer(time_limit_ctypes),
+        value_buffer_ctypes,
+        size_of_value_buffer_ctypes,
+        timestamp_buffer_ctypes,
+        size_of_timestamp_buffer_ctypes,
+        num_pairs_buffer_ctypes,
+        size_of_num_pairs_buffer_ctypes,
+    )
+    _errors.check_status(result)
 
 
 def nx_read_state(
@@ -152,7 +320,7 @@ def nx_read_state(
         state_value_ctypes_ptr,
         ctypes.pointer(fault_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return fault_ctypes.value
 
 
@@ -163,8 +331,8 @@ def nx_write_frame(
 ):
     # type: (...) -> None
     session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
-    buffer_ctypes = (_ctypedefs.byte * len(buffer))(*buffer)  # type: ignore
-    size_of_buffer_ctypes = _ctypedefs.u32(len(buffer) * _ctypedefs.byte.BYTES)
+    buffer_ctypes = _byte_array_from_buffer(buffer)
+    size_of_buffer_ctypes = _ctypedefs.u32(len(buffer_ctypes) * _ctypedefs.byte.BYTES)
     timeout_ctypes = _ctypedefs.f64(timeout)
     result = _cfuncs.lib.nx_write_frame(
         session_ref_ctypes,
@@ -172,23 +340,23 @@ def nx_write_frame(
         size_of_buffer_ctypes,
         timeout_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_write_signal_single_point(
     session_ref,  # type: int
-    value_buffer,  # type: typing.List[float]
+    value_buffer,  # type: typing.Any
 ):
     # type: (...) -> None
     session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
-    value_buffer_ctypes = (_ctypedefs.f64 * len(value_buffer))(*value_buffer)  # type: ignore
-    size_of_value_buffer_ctypes = _ctypedefs.u32(len(value_buffer) * _ctypedefs.f64.BYTES)
+    value_buffer_ctypes = _f64_array_from_values(value_buffer)
+    size_of_value_buffer_ctypes = _ctypedefs.u32(len(value_buffer_ctypes) * _ctypedefs.f64.BYTES)
     result = _cfuncs.lib.nx_write_signal_single_point(
         session_ref_ctypes,
         value_buffer_ctypes,
         size_of_value_buffer_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_write_signal_waveform(
@@ -207,7 +375,7 @@ def nx_write_signal_waveform(
         value_buffer_ctypes,
         size_of_value_buffer_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_write_signal_xy(
@@ -236,7 +404,7 @@ def nx_write_signal_xy(
         num_pairs_buffer_ctypes,
         size_of_num_pairs_buffer_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_write_state(
@@ -254,22 +422,23 @@ def nx_write_state(
         state_size_ctypes,
         ctypes.pointer(state_value_ctypes),  # type: ignore
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_convert_frames_to_signals_single_point(
     session_ref,  # type: int
-    frame_buffer,  # type: bytes
-    num_signals,  # type: int
+    frame_buffer,  # type: typing.Any
+    value_buffer,  # type: typing.Any
+    timestamp_buffer,  # type: typing.Any
 ):
-    # type: (...) -> typing.Tuple[ctypes.Array[_ctypedefs.nxTimestamp_t], ctypes.Array[_ctypedefs.f64]]
+    # type: (...) -> None
     session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
-    frame_buffer_ctypes = (_ctypedefs.byte * len(frame_buffer))(*frame_buffer)  # type: ignore
-    size_of_frame_buffer_ctypes = _ctypedefs.u32(len(frame_buffer) * _ctypedefs.byte.BYTES)
-    value_buffer_ctypes = (_ctypedefs.f64 * num_signals)()  # type: ignore
-    size_of_value_buffer_ctypes = _ctypedefs.u32(_ctypedefs.f64.BYTES * num_signals)
-    timestamp_buffer_ctypes = (_ctypedefs.nxTimestamp_t * num_signals)()  # type: ignore
-    size_of_timestamp_buffer_ctypes = _ctypedefs.u32(_ctypedefs.nxTimestamp_t.BYTES * num_signals)
+    frame_buffer_ctypes = _byte_array_from_buffer(frame_buffer)
+    size_of_frame_buffer_ctypes = _ctypedefs.u32(len(frame_buffer_ctypes) * _ctypedefs.byte.BYTES)
+    value_buffer_ctypes = _array_from_writable_buffer(value_buffer, _ctypedefs.f64)
+    size_of_value_buffer_ctypes = _ctypedefs.u32(len(value_buffer_ctypes) * _ctypedefs.f64.BYTES)
+    timestamp_buffer_ctypes = _array_from_writable_buffer(timestamp_buffer, _ctypedefs.nxTimestamp_t)
+    size_of_timestamp_buffer_ctypes = _ctypedefs.u32(len(timestamp_buffer_ctypes) * _ctypedefs.nxTimestamp_t.BYTES)
     result = _cfuncs.lib.nx_convert_frames_to_signals_single_point(
         session_ref_ctypes,
         frame_buffer_ctypes,
@@ -279,8 +448,7 @@ def nx_convert_frames_to_signals_single_point(
         timestamp_buffer_ctypes,
         size_of_timestamp_buffer_ctypes,
     )
-    _errors.check_for_error(result.value)
-    return timestamp_buffer_ctypes, value_buffer_ctypes
+    _errors.check_status(result)
 
 
 def nx_convert_signals_to_frames_single_point(
@@ -292,9 +460,11 @@ def nx_convert_signals_to_frames_single_point(
     session_ref_ctypes = _ctypedefs.nxSessionRef_t(session_ref)
     value_buffer_ctypes = (_ctypedefs.f64 * len(value_buffer))(*value_buffer)  # type: ignore
     size_of_value_buffer_ctypes = _ctypedefs.u32(len(value_buffer) * _ctypedefs.f64.BYTES)
-    buffer_ctypes = (_ctypedefs.byte * bytes_to_read)()  # type: ignore
+    buffer_ctypes = _buffers.pool.array(
+        session_ref, 'nx_convert_signals_to_frames_single_point.buffer', _ctypedefs.byte, bytes_to_read)
     size_of_buffer_ctypes = _ctypedefs.u32(_ctypedefs.byte.BYTES * bytes_to_read)
-    number_of_bytes_returned_ctypes = _ctypedefs.u32()
+    number_of_bytes_returned_ctypes = _buffers.pool.scalar(
+        session_ref, 'nx_convert_signals_to_frames_single_point.number_of_bytes_returned', _ctypedefs.u32)
     result = _cfuncs.lib.nx_convert_signals_to_frames_single_point(
         session_ref_ctypes,
         value_buffer_ctypes,
@@ -303,8 +473,9 @@ def nx_convert_signals_to_frames_single_point(
         size_of_buffer_ctypes,
         ctypes.pointer(number_of_bytes_returned_ctypes),
     )
-    _errors.check_for_error(result.value)
-    return buffer_ctypes.raw, number_of_bytes_returned_ctypes.value  # type: ignore
+    _errors.check_status(result)
+    number_of_bytes_returned = number_of_bytes_returned_ctypes.value
+    return ctypes.string_at(buffer_ctypes, number_of_bytes_returned), number_of_bytes_returned
 
 
 def nx_blink(
@@ -318,7 +489,7 @@ def nx_blink(
         interface_ref_ctypes,
         modifier_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_clear(
@@ -329,7 +500,7 @@ def nx_clear(
     result = _cfuncs.lib.nx_clear(
         session_ref_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_connect_terminals(
@@ -346,7 +517,7 @@ def nx_connect_terminals(
         source_ctypes,  # type: ignore
         destination_ctypes,  # type: ignore
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_disconnect_terminals(
@@ -363,7 +534,7 @@ def nx_disconnect_terminals(
         source_ctypes,  # type: ignore
         destination_ctypes,  # type: ignore
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_flush(
@@ -374,7 +545,7 @@ def nx_flush(
     result = _cfuncs.lib.nx_flush(
         session_ref_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_start(
@@ -388,7 +559,7 @@ def nx_start(
         session_ref_ctypes,
         scope_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_stop(
@@ -402,7 +573,7 @@ def nx_stop(
         session_ref_ctypes,
         scope_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_system_open(
@@ -412,7 +583,7 @@ def nx_system_open(
     result = _cfuncs.lib.nx_system_open(
         ctypes.pointer(system_ref_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return system_ref_ctypes.value
 
 
@@ -424,7 +595,7 @@ def nx_system_close(
     result = _cfuncs.lib.nx_system_close(
         system_ref_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nx_wait(
@@ -446,7 +617,7 @@ def nx_wait(
         timeout_ctypes,
         ctypes.pointer(param_out_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return param_out_ctypes.value
 
 
@@ -460,7 +631,7 @@ def nxdb_open_database(
         database_name_ctypes,  # type: ignore
         ctypes.pointer(database_ref_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return database_ref_ctypes.value
 
 
@@ -475,7 +646,7 @@ def nxdb_close_database(
         database_ref_ctypes,
         close_all_refs_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nxdb_create_object(
@@ -494,7 +665,7 @@ def nxdb_create_object(
         object_name_ctypes,  # type: ignore
         ctypes.pointer(db_object_ref_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return db_object_ref_ctypes.value
 
 
@@ -514,7 +685,7 @@ def nxdb_find_object(
         object_name_ctypes,  # type: ignore
         ctypes.pointer(db_object_ref_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return db_object_ref_ctypes.value
 
 
@@ -526,7 +697,7 @@ def nxdb_delete_object(
     result = _cfuncs.lib.nxdb_delete_object(
         db_object_ref_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nxdb_save_database(
@@ -540,7 +711,7 @@ def nxdb_save_database(
         database_ref_ctypes,
         db_filepath_ctypes,  # type: ignore
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nxdb_get_property_size(
@@ -556,7 +727,7 @@ def nxdb_get_property_size(
         property_id_ctypes,
         ctypes.pointer(property_size_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return property_size_ctypes.value
 
 
@@ -576,7 +747,7 @@ def nxdb_get_dbc_attribute_size(
         attribute_name_ctypes,  # type: ignore
         ctypes.pointer(attribute_text_size_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return attribute_text_size_ctypes.value
 
 
@@ -601,7 +772,7 @@ def nxdb_get_dbc_attribute(
         attribute_text_ctypes,  # type: ignore
         ctypes.pointer(is_default_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     attribute_text = attribute_text_ctypes.value.decode("ascii")
     is_default = bool(is_default_ctypes.value)
     return attribute_text, is_default
@@ -629,7 +800,7 @@ def nxdb_merge(
         wait_for_complete_ctypes,
         ctypes.pointer(percent_complete_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return percent_complete_ctypes.value
 
 
@@ -647,7 +818,7 @@ def nxdb_add_alias(
         database_filepath_ctypes,  # type: ignore
         default_baud_rate_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nxdb_add_alias64(
@@ -664,7 +835,7 @@ def nxdb_add_alias64(
         database_filepath_ctypes,  # type: ignore
         default_baud_rate_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nxdb_remove_alias(
@@ -675,7 +846,7 @@ def nxdb_remove_alias(
     result = _cfuncs.lib.nxdb_remove_alias(
         database_alias_ctypes,  # type: ignore
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nxdb_deploy(
@@ -694,7 +865,7 @@ def nxdb_deploy(
         wait_for_complete_ctypes,
         ctypes.pointer(percent_complete_ctypes),
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return percent_complete_ctypes.value
 
 
@@ -709,7 +880,7 @@ def nxdb_undeploy(
         ip_address_ctypes,  # type: ignore
         database_alias_ctypes,  # type: ignore
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
 
 
 def nxdb_get_database_list(
@@ -732,7 +903,7 @@ def nxdb_get_database_list(
         filepath_buffer_ctypes,  # type: ignore
         number_of_databases_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     alias_buffer = alias_buffer_ctypes.value.decode("ascii")
     filepath_buffer = filepath_buffer_ctypes.value.decode("ascii")
     return alias_buffer, filepath_buffer, number_of_databases_ctypes.value
@@ -750,5 +921,5 @@ def nxdb_get_database_list_sizes(
         size_of_alias_buffer_ctypes,
         size_of_filepath_buffer_ctypes,
     )
-    _errors.check_for_error(result.value)
+    _errors.check_status(result)
     return size_of_alias_buffer_ctypes.value, size_of_filepath_buffer_ctypes.value
@@ -1,4 +1,5 @@
 import ctypes  # type: ignore
+import os
 import sys
 
 from nixnet import errors
@@ -43,6 +44,13 @@ class XnetLibrary(object):
         except AttributeError:
             raise XnetFunctionNotSupportedError(function)
 
+    def function(self, function):
+        """Return a new function pointer, not shared with attribute access."""
+        try:
+            return self._library[function]
+        except (AttributeError, KeyError, TypeError):
+            raise XnetFunctionNotSupportedError(function)
+
 
 def _import_win_lib():
     lib_name = "nixnet"
@@ -66,9 +74,34 @@ def _import_unsupported():
     raise PlatformUnsupportedError(sys.platform)
 
 
+def _import_simulated_lib():
+    from nixnet import _sim
+    return XnetLibrary(_sim.SimulatedDriver())
+
+
 if sys.platform.startswith('win') or sys.platform.startswith('cli'):
-    import_lib = _import_win_lib
+    _import_platform_lib = _import_win_lib
 elif sys.platform.startswith('linux'):
-    import_lib = _import_linux_lib
+    _import_platform_lib = _import_linux_lib
 else:
-    import_lib = _import_unsupported
+    _import_platform_lib = _import_unsupported
+
+BACKEND_ENV = 'NIXNET_BACKEND'
+SIMULATED_BACKEND = 'simulated'
+
+
+def import_lib(backend=None):
+    """Load the NI-XNET library.
+
+    Args:
+        backend(str): ``'simulated'`` to run the in-process simulation in
+            :any:`nixnet._sim` instead of the installed driver.  Defaults
+            to the ``NIXNET_BACKEND`` environment variable.
+    """
+    if backend is None:
+        backend = os.environ.get(BACKEND_ENV, '')
+    if backend == SIMULATED_BACKEND:
+        return _import_simulated_lib()
+    if backend:
+        raise ValueError('Unknown NI-XNET backend', backend)
+    return _import_platform_lib()
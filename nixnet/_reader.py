@@ -0,0 +1,231 @@
+import collections
+import threading
+import time
+import typing  # NOQA: F401
+
+from nixnet import _frames
+from nixnet import _funcs
+from nixnet import constants
+from nixnet import types
+
+DEFAULT_CAPACITY = 16 * 1024 * 1024
+DEFAULT_CHUNK_SIZE = 64 * 1024
+DEFAULT_POLL_INTERVAL = 0.001
+
+
+ReaderStats_ = collections.namedtuple(
+    'ReaderStats_',
+    ['reads', 'bytes_read', 'overruns', 'bytes_dropped', 'high_water_mark', 'max_read_latency',
+     'mean_read_latency'])
+
+
+class ReaderStats(ReaderStats_):
+    """Background reader statistics.
+
+    Attributes:
+        reads(int): Number of driver reads that returned data.
+        bytes_read(int): Bytes returned by the driver.
+        overruns(int): Driver reads dropped because the ring buffer was full.
+        bytes_dropped(int): Bytes dropped because the ring buffer was full.
+        high_water_mark(int): Most bytes ever held in the ring buffer.
+        max_read_latency(float): Longest driver read, in seconds.
+        mean_read_latency(float): Average driver read, in seconds.
+    """
+
+    pass
+
+
+class RingBuffer(object):
+    """Single-producer, single-consumer byte ring buffer.
+
+    The producer only advances ``head`` and the consumer only advances
+    ``tail``; both count bytes since creation so a full buffer can be told
+    apart from an empty one.  Each side publishes its counter after copying,
+    so no lock is needed between one writer and one reader thread.
+
+    Writes are all-or-nothing, so when every write holds whole frames, every
+    read does too.
+
+    >>> ring = RingBuffer(8)
+    >>> ring.write(b'abcdef')
+    True
+    >>> ring.read()
+    b'abcdef'
+    >>> ring.write(b'ghijkl')
+    True
+    >>> ring.write(b'mnop')
+    False
+    >>> ring.read()
+    b'ghijkl'
+    """
+
+    def __init__(self, capacity):
+        # type: (int) -> None
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._capacity = capacity
+        self._head = 0
+        self._tail = 0
+
+    @property
+    def capacity(self):
+        # type: () -> int
+        """int: Size of the ring buffer in bytes."""
+        return self._capacity
+
+    def __len__(self):
+        return self._head - self._tail
+
+    def write(self, data):
+        # type: (typing.Any) -> bool
+        """Append ``data`` if it fits, returning whether it was written."""
+        data = memoryview(data)
+        num_bytes = data.nbytes
+        head = self._head
+        if self._capacity - (head - self._tail) < num_bytes:
+            return False
+        position = head % self._capacity
+        first = min(num_bytes, self._capacity - position)
+        self._view[position:position + first] = data[:first]
+        self._view[:num_bytes - first] = data[first:]
+        self._head = head + num_bytes
+        return True
+
+    def read(self):
+        # type: () -> bytes
+        """Remove and return everything written so far."""
+        head = self._head
+        tail = self._tail
+        num_bytes = head - tail
+        position = tail % self._capacity
+        first = min(num_bytes, self._capacity - position)
+        data = self._view[position:position + first].tobytes()
+        if first < num_bytes:
+            data += self._view[:num_bytes - first].tobytes()
+        self._tail = head
+        return data
+
+
+class BackgroundReader(object):
+    """Drain a stream session's driver queue from a dedicated thread.
+
+    The thread polls the driver and copies what it reads into a
+    :any:`nixnet._reader.RingBuffer`, so the driver queue keeps draining while
+    the consumer is busy.  If the ring buffer is full, the data read is
+    dropped and counted in :any:`nixnet._reader.BackgroundReader.stats`.
+
+    Errors raised by the driver stop the thread and are re-raised by the next
+    read.
+
+    Create it with
+    :any:`nixnet.session.FrameInStreamSession.start_background_reader`.
+    """
+
+    def __init__(
+            self,
+            handle,  # type: int
+            capacity=DEFAULT_CAPACITY,  # type: int
+            chunk_size=DEFAULT_CHUNK_SIZE,  # type: int
+            poll_interval=DEFAULT_POLL_INTERVAL,  # type: float
+    ):
+        # type: (...) -> None
+        if capacity < chunk_size:
+            raise ValueError('capacity must be at least chunk_size', capacity, chunk_size)
+        self._handle = handle
+        self._ring = RingBuffer(capacity)
+        self._chunk = bytearray(chunk_size)
+        self._poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._data_ready = threading.Event()
+        self._error = None  # type: typing.Optional[BaseException]
+
+        self._reads = 0
+        self._bytes_read = 0
+        self._overruns = 0
+        self._bytes_dropped = 0
+        self._high_water_mark = 0
+        self._max_read_latency = 0.0
+        self._total_read_latency = 0.0
+
+        self._thread = threading.Thread(target=self._run, name='nixnet-reader')
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def running(self):
+        # type: () -> bool
+        """bool: Whether the reader thread is still acquiring."""
+        return self._thread.is_alive()
+
+    @property
+    def stats(self):
+        # type: () -> ReaderStats
+        """:any:`nixnet._reader.ReaderStats`: Counters since the reader started."""
+        reads = self._reads
+        return ReaderStats(
+            reads,
+            self._bytes_read,
+            self._overruns,
+            self._bytes_dropped,
+            self._high_water_mark,
+            self._max_read_latency,
+            self._total_read_latency / reads if reads else 0.0)
+
+    def wait(self, timeout=None):
+        # type: (typing.Optional[float]) -> bool
+        """Wait for data to be available, returning whether there is any."""
+        self._data_ready.wait(timeout)
+        return bool(len(self._ring)) or self._error is not None
+
+    def read_bytes(self):
+        # type: () -> bytes
+        """Return all buffered raw bytes (frame data) without waiting."""
+        self._data_ready.clear()
+        data = self._ring.read()
+        if not data and self._error is not None:
+            raise self._error
+        return data
+
+    def read_batch(self, frame_type=types.XnetFrame):
+        # type: (typing.Type[types.FrameFactory]) -> types.FrameBatch
+        """Return all buffered frames as a :any:`nixnet.types.FrameBatch`."""
+        return _frames.parse_batch(self.read_bytes(), frame_type)
+
+    def read(self, frame_type=types.XnetFrame):
+        # type: (typing.Type[types.FrameFactory]) -> typing.List[types.Frame]
+        """Return all buffered frames."""
+        return list(_frames.iterate_frames_as(self.read_bytes(), frame_type))
+
+    def stop(self):
+        # type: () -> None
+        """Stop the reader thread, keeping buffered data readable."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        # type: () -> None
+        chunk = memoryview(self._chunk)
+        while not self._stop.is_set():
+            start = time.perf_counter()
+            try:
+                num_bytes = _funcs.nx_read_frame_into(self._handle, chunk, constants.TIMEOUT_NONE)
+            except BaseException as error:
+                self._error = error
+                self._data_ready.set()
+                return
+            latency = time.perf_counter() - start
+
+            if not num_bytes:
+                self._stop.wait(self._poll_interval)
+                continue
+
+            if self._ring.write(chunk[:num_bytes]):
+                self._high_water_mark = max(self._high_water_mark, len(self._ring))
+                self._data_ready.set()
+            else:
+                self._overruns += 1
+                self._bytes_dropped += num_bytes
+            self._total_read_latency += latency
+            self._max_read_latency = max(self._max_read_latency, latency)
+            self._bytes_read += num_bytes
+            self._reads += 1
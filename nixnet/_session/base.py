@@ -2,10 +2,13 @@ import ctypes  # type: ignore
 import typing  # NOQA: F401
 import warnings
 
+from nixnet import _aio
+from nixnet import _buffers
 from nixnet import _ctypedefs
 from nixnet import _errors
 from nixnet import _funcs
 from nixnet import _props
+from nixnet import _snapshot
 from nixnet import _utils
 from nixnet import constants
 from nixnet import errors
@@ -58,6 +61,8 @@ class SessionBase(object):
             A session base object.
         """
         self._handle = None  # To satisfy `__del__` in case nx_create_session throws
+        self._snapshot_readers = {}  # type: typing.Dict[typing.Tuple[typing.Text, ...], _snapshot.SnapshotReader]
+        self._sampler = None  # type: typing.Optional[_snapshot.SnapshotSampler]
         self._handle = _funcs.nx_create_session(database_name, cluster_name, list, interface_name, mode)
         self._intf = session_intf.Interface(self._handle)
         self._j1939 = session_j1939.J1939(self._handle)
@@ -75,6 +80,12 @@ class SessionBase(object):
     def __exit__(self, exception_type, exception_value, traceback):
         self.close()
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        await _aio.run(self.close)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             return self._handle == typing.cast(SessionBase, other)._handle
@@ -119,7 +130,10 @@ class SessionBase(object):
                 'closed', errors.XnetResourceWarning)
             return
 
+        if self._sampler is not None:
+            self._sampler.stop()
         _funcs.nx_clear(self._handle)
+        _buffers.pool.release(self._handle)
 
         self._handle = None
 
@@ -481,6 +495,63 @@ class SessionBase(object):
         second = state_value_ctypes[1].value
         return _utils.parse_lin_comm_bitfield(first, second)
 
+    def snapshot(self, fields=_snapshot.DEFAULT_FIELDS):
+        # type: (typing.Iterable[typing.Text]) -> _snapshot.SessionSnapshot
+        """Read several status properties in one pass.
+
+        Reading a property such as
+        :any:`nixnet._session.base.SessionBase.num_pend` creates its driver
+        arguments on every call.  A snapshot creates them once per set of
+        ``fields`` and reuses them, which suits polling the session's health.
+
+        Args:
+            fields(list of str): :any:`nixnet._snapshot.SessionSnapshot`
+                fields to read.  ``can_comm`` and ``lin_comm`` only apply to
+                sessions of that protocol.
+
+        Returns:
+            :any:`nixnet._snapshot.SessionSnapshot`
+        """
+        fields = tuple(fields)
+        reader = self._snapshot_readers.get(fields)
+        if reader is None:
+            reader = _snapshot.SnapshotReader(self._handle, fields)  # type: ignore
+            self._snapshot_readers[fields] = reader
+        return reader.read()
+
+    @property
+    def sampler(self):
+        # type: () -> typing.Optional[_snapshot.SnapshotSampler]
+        """:any:`nixnet._snapshot.SnapshotSampler`: The running snapshot sampler, if any."""
+        return self._sampler
+
+    def start_sampler(
+            self,
+            interval=_snapshot.DEFAULT_INTERVAL,
+            fields=_snapshot.DEFAULT_FIELDS,
+            maxlen=None):
+        # type: (float, typing.Iterable[typing.Text], typing.Optional[int]) -> _snapshot.SnapshotSampler
+        """Take snapshots periodically from a background thread.
+
+        The sampler collects a time series of
+        :any:`nixnet._session.base.SessionBase.snapshot` results for health
+        monitoring.  It is stopped when the session closes.
+
+        Args:
+            interval(float): Seconds between snapshots.
+            fields(list of str): :any:`nixnet._snapshot.SessionSnapshot`
+                fields to read.
+            maxlen(int): If set, keep only the newest ``maxlen`` snapshots.
+
+        Returns:
+            :any:`nixnet._snapshot.SnapshotSampler`
+        """
+        if self._sampler is not None and self._sampler.running:
+            raise RuntimeError('A sampler is already running for this session')
+        reader = _snapshot.SnapshotReader(self._handle, fields)  # type: ignore
+        self._sampler = _snapshot.SnapshotSampler(reader, interval, maxlen)
+        return self._sampler
+
     def check_fault(self):
         # type: () -> None
         """Check for an asynchronous fault.
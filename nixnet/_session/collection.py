@@ -15,13 +15,17 @@ class Collection(Sequence):
         # type: (int) -> None
         self._handle = handle
         self.__list_cache = None  # type: typing.Optional[typing.List[typing.Text]]
+        self.__index_cache = None  # type: typing.Optional[typing.Dict[typing.Text, int]]
+        self.__len_cache = None  # type: typing.Optional[int]
 
     def __repr__(self):
         return '{}(handle={})'.format(type(self).__name__, self._handle)
 
     def __len__(self):
         # type: () -> int
-        return _props.get_session_num_in_list(self._handle)
+        if self.__len_cache is None:
+            self.__len_cache = _props.get_session_num_in_list(self._handle)
+        return self.__len_cache
 
     def __iter__(self):
         item_count = len(self)
@@ -36,7 +40,7 @@ class Collection(Sequence):
             return 0 <= index and index < len(self._list_cache)
         elif isinstance(index, six.string_types):
             name = index
-            return name in self._list_cache
+            return name in self._index_cache
         else:
             raise TypeError(index)
 
@@ -45,11 +49,7 @@ class Collection(Sequence):
             name = self._list_cache[index]
         elif isinstance(index, six.string_types):
             name = index
-            item_names = self._list_cache
-            try:
-                index = item_names.index(name)
-            except ValueError:
-                raise KeyError(name)
+            index = self._index_cache[name]
         else:
             raise TypeError(index)
 
@@ -70,16 +70,35 @@ class Collection(Sequence):
                 return default
         elif isinstance(index, six.string_types):
             name = index
-            item_names = self._list_cache
             try:
-                index = item_names.index(name)
-            except ValueError:
+                index = self._index_cache[name]
+            except KeyError:
                 return default
         else:
             raise TypeError(index)
 
         return self._create_item(self._handle, index, name)
 
+    def indices_of(self, names):
+        # type: (typing.Iterable[typing.Text]) -> typing.List[int]
+        """Return the index of each named item.
+
+        Args:
+            names(list of str): Item names
+
+        Raises:
+            KeyError: If a name is not in the session.
+        """
+        index_cache = self._index_cache
+        return [index_cache[name] for name in names]
+
+    def invalidate_cache(self):
+        # type: () -> None
+        """Forget the cached item names and count, re-reading them from the session on next use."""
+        self.__list_cache = None
+        self.__index_cache = None
+        self.__len_cache = None
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             other_collection = typing.cast(Collection, other)
@@ -104,6 +123,17 @@ class Collection(Sequence):
             self.__list_cache = list(_props.get_session_list(self._handle))
         return self.__list_cache
 
+    @property
+    def _index_cache(self):
+        # type: () -> typing.Dict[typing.Text, int]
+        if self.__index_cache is None:
+            index_cache = {}  # type: typing.Dict[typing.Text, int]
+            for index, name in enumerate(self._list_cache):
+                # First occurrence wins, matching list.index.
+                index_cache.setdefault(name, index)
+            self.__index_cache = index_cache
+        return self.__index_cache
+
     @abc.abstractmethod
     def _create_item(self, handle, index, name):
         # type: (int, int, typing.Text) -> Item
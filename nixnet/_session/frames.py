@@ -1,11 +1,14 @@
-﻿import itertools
+﻿import asyncio
 import typing  # NOQA: F401
 
+from nixnet import _aio
+from nixnet import _arrays
 from nixnet import _frames
 from nixnet import _funcs
 from nixnet import _props
 from nixnet._session import collection
 from nixnet import constants
+from nixnet import filters  # NOQA: F401
 from nixnet import types
 
 
@@ -43,8 +46,9 @@ class InFrames(Frames):
     def read_bytes(
             self,
             num_bytes,
-            timeout=constants.TIMEOUT_NONE):
-        # type: (int, float) -> bytes
+            timeout=constants.TIMEOUT_NONE,
+            frame_filter=None):
+        # type: (int, float, typing.Optional[filters.FrameFilter]) -> bytes
         """Read data as a list of raw bytes (frame data).
 
         The raw bytes encode one or more frames using the Raw Frame Format.
@@ -78,19 +82,52 @@ class InFrames(Frames):
                 If 'timeout' is 'constants.TIMEOUT_NONE', this
                 function does not wait and immediately returns all available
                 frame bytes up to the limit 'num_bytes' specifies.
+            frame_filter(:any:`nixnet.filters.FrameFilter`): If set, frames
+                that don't match are dropped, so fewer bytes may be returned.
 
         Returns:
             A list of raw bytes representing the data.
         """
         buffer, number_of_bytes_returned = _funcs.nx_read_frame(self._handle, num_bytes, timeout)
-        return buffer[0:number_of_bytes_returned]
+        buffer = buffer[0:number_of_bytes_returned]
+        if frame_filter is not None:
+            buffer = frame_filter.filter_bytes(buffer)
+        return buffer
+
+    def read_into(
+            self,
+            buffer,
+            timeout=constants.TIMEOUT_NONE):
+        # type: (typing.Any, float) -> int
+        """Read raw bytes (frame data) into a caller-owned buffer.
+
+        This is :any:`nixnet._session.frames.InFrames.read_bytes` without
+        allocating: the driver writes directly into ``buffer``, so a polling
+        loop can reuse the same buffer for every read.
+
+        Args:
+            buffer: A writable, contiguous object supporting the buffer
+                protocol, such as a ``bytearray``, a ``memoryview`` of one or a
+                NumPy array. Up to its size in bytes is read.
+            timeout(float): The time in seconds to wait for number to read
+                frame bytes to become available.
+
+                See :any:`nixnet._session.frames.InFrames.read_bytes` for
+                details.
+
+        Returns:
+            int: The number of bytes written to the start of ``buffer``. Only
+            complete frames are returned.
+        """
+        return _funcs.nx_read_frame_into(self._handle, buffer, timeout)
 
     def read(
             self,
             num_frames,
             timeout=constants.TIMEOUT_NONE,
-            frame_type=types.XnetFrame):
-        # type: (int, float, typing.Type[types.FrameFactory]) -> typing.Iterable[types.Frame]
+            frame_type=types.XnetFrame,
+            frame_filter=None):
+        # type: (int, float, typing.Type[types.FrameFactory], typing.Optional[filters.FrameFilter]) -> typing.Iterable[types.Frame]  # NOQA: E501
         """Read frames.
 
         Args:
@@ -111,17 +148,136 @@ class InFrames(Frames):
                 limit 'num_frames' specifies.
             frame_type(:any:`nixnet.types.FrameFactory`): A factory for the
                 desired frame formats.
+            frame_filter(:any:`nixnet.filters.FrameFilter`): If set, only
+                matching frames are decoded and returned. Frames that don't
+                match are skipped without creating any frame object.
+
+        Yields:
+            :any:`nixnet.types.Frame`
+        """
+        # NOTE: If the frame payload exceeds the base unit, this will return
+        # less than num_frames
+        num_bytes = num_frames * _frames.nxFrameFixed_t.size
+        buffer = self.read_bytes(num_bytes, timeout, frame_filter)
+        yield from _frames.iterate_frames_as(buffer, frame_type)
+
+    async def aread_bytes(
+            self,
+            num_bytes,
+            timeout=constants.TIMEOUT_NONE):
+        # type: (int, float) -> bytes
+        """Read data as a list of raw bytes (frame data) without blocking the event loop.
+
+        Asynchronous version of :any:`nixnet._session.frames.InFrames.read_bytes`.
+        The driver call runs on a thread pool shared by all sessions, sized
+        by ``nixnet._aio.set_max_workers``.  A positive ``timeout`` keeps one
+        of those threads busy while waiting, so prefer
+        :any:`nixnet._session.frames.InFrames.astream` to wait for data.
+        """
+        return await _aio.run(self.read_bytes, num_bytes, timeout)
+
+    async def aread(
+            self,
+            num_frames,
+            timeout=constants.TIMEOUT_NONE,
+            frame_type=types.XnetFrame):
+        # type: (int, float, typing.Type[types.FrameFactory]) -> typing.List[types.Frame]
+        """Read frames without blocking the event loop.
+
+        Asynchronous version of :any:`nixnet._session.frames.InFrames.read`.
+        Frames are read and decoded on the shared thread pool and returned as
+        one list.
+        """
+        return await _aio.run(lambda: list(self.read(num_frames, timeout, frame_type)))
+
+    async def astream(
+            self,
+            num_frames=1024,
+            frame_type=types.XnetFrame,
+            poll_interval=_aio.DEFAULT_POLL_INTERVAL):
+        # type: (int, typing.Type[types.FrameFactory], float) -> typing.AsyncIterator[types.Frame]
+        """Asynchronously iterate over received frames.
+
+        Up to ``num_frames`` frames are read per driver call without waiting
+        in the driver; when none are available, the task sleeps for
+        ``poll_interval`` seconds.  No thread is held while waiting, so one
+        event loop can stream from many sessions.
 
         Yields:
             :any:`nixnet.types.Frame`
         """
-        from_raw = typing.cast(typing.Callable[[types.RawFrame], types.Frame], frame_type.from_raw)
+        while True:
+            frames = await self.aread(num_frames, constants.TIMEOUT_NONE, frame_type)
+            if not frames:
+                await asyncio.sleep(poll_interval)
+                continue
+            for frame in frames:
+                yield frame
+
+    def read_batch(
+            self,
+            num_frames,
+            timeout=constants.TIMEOUT_NONE,
+            frame_type=types.XnetFrame):
+        # type: (int, float, typing.Type[types.FrameFactory]) -> types.FrameBatch
+        """Read frames into a :any:`nixnet.types.FrameBatch`.
+
+        The frames are kept in compact arrays and only turned into
+        ``frame_type`` objects when accessed, which keeps long captures small.
+
+        Args:
+            num_frames(int): Number of frames to read.
+            timeout(float): The time in seconds to wait for number to read
+                frame bytes to become available.
+
+                See :any:`nixnet._session.frames.InFrames.read` for details.
+            frame_type(:any:`nixnet.types.FrameFactory`): A factory for the
+                desired frame formats.
+
+        Returns:
+            :any:`nixnet.types.FrameBatch`
+        """
+        # NOTE: If the frame payload exceeds the base unit, this will return
+        # less than num_frames
+        num_bytes = num_frames * _frames.nxFrameFixed_t.size
+        buffer = self.read_bytes(num_bytes, timeout)
+        return _frames.parse_batch(buffer, frame_type)
+
+    def read_array(
+            self,
+            num_frames,
+            timeout=constants.TIMEOUT_NONE):
+        # type: (int, float) -> typing.Tuple[typing.Any, bytes]
+        """Read frames into a NumPy structured array.
+
+        Unlike :any:`nixnet._session.frames.InFrames.read`, no Python object is
+        created per frame, which makes this the preferred way to log or
+        post-process large amounts of stream data.
+
+        .. note:: This requires NumPy to be installed.
+
+        Args:
+            num_frames(int): Number of frames to read.
+            timeout(float): The time in seconds to wait for number to read
+                frame bytes to become available.
+
+                See :any:`nixnet._session.frames.InFrames.read` for details.
+
+        Returns:
+            tuple of array and bytes: The decoded frames and the raw bytes
+            they were decoded from.
+
+            The array has the fields ``timestamp``, ``identifier``, ``type``,
+            ``flags``, ``info``, ``payload_length`` and ``payload_offset``.
+            The payload of a frame is
+            ``data[payload_offset:payload_offset + payload_length]``.
+        """
+        _arrays.require_numpy()
         # NOTE: If the frame payload exceeds the base unit, this will return
         # less than num_frames
         num_bytes = num_frames * _frames.nxFrameFixed_t.size
         buffer = self.read_bytes(num_bytes, timeout)
-        for frame in _frames.iterate_frames(buffer):
-            yield from_raw(frame)
+        return _frames.decode_frames(buffer), buffer
 
 
 class SinglePointInFrames(Frames):
@@ -145,6 +301,22 @@ class SinglePointInFrames(Frames):
             constants.TIMEOUT_NONE)
         return buffer[0:number_of_bytes_returned]
 
+    def read_into(
+            self,
+            buffer):
+        # type: (typing.Any) -> int
+        """Read raw bytes (frame data) into a caller-owned buffer.
+
+        Args:
+            buffer: A writable, contiguous object supporting the buffer
+                protocol, such as a ``bytearray``, a ``memoryview`` of one or a
+                NumPy array. Up to its size in bytes is read.
+
+        Returns:
+            int: The number of bytes written to the start of ``buffer``.
+        """
+        return _funcs.nx_read_frame_into(self._handle, buffer, constants.TIMEOUT_NONE)
+
     def read(
             self,
             frame_type=types.XnetFrame):
@@ -158,14 +330,12 @@ class SinglePointInFrames(Frames):
         Yields:
             :any:`nixnet.types.Frame`
         """
-        from_raw = typing.cast(typing.Callable[[types.RawFrame], types.Frame], frame_type.from_raw)
         # NOTE: If the frame payload exceeds the base unit, this will return
         # less than num_frames
         num_frames = len(self)
         num_bytes = num_frames * _frames.nxFrameFixed_t.size
         buffer = self.read_bytes(num_bytes)
-        for frame in _frames.iterate_frames(buffer):
-            yield from_raw(frame)
+        yield from _frames.iterate_frames_as(buffer, frame_type)
 
 
 class OutFrames(Frames):
@@ -175,13 +345,16 @@ class OutFrames(Frames):
             self,
             frame_bytes,
             timeout=10):
-        # type: (bytes, float) -> None
+        # type: (typing.Any, float) -> None
         """Write a list of raw bytes (frame data).
 
         The raw bytes encode one or more frames using the Raw Frame Format.
 
         Args:
-            frame_bytes(bytes): Frames to transmit.
+            frame_bytes(bytes-like): Frames to transmit.  Any object supporting
+                the buffer protocol (``bytes``, ``bytearray``, ``memoryview``,
+                ``array.array``) is passed to the driver without per-byte
+                conversion.
             timeout(float): The time in seconds to wait for number to read
                 frame bytes to become available.
 
@@ -198,7 +371,7 @@ class OutFrames(Frames):
                 error occurs, none of the data is queued, so you can attempt to
                 call this function again at a later time with the same data.
         """
-        _funcs.nx_write_frame(self._handle, bytes(frame_bytes), timeout)
+        _funcs.nx_write_frame(self._handle, frame_bytes, timeout)
 
     def write(
             self,
@@ -226,10 +399,38 @@ class OutFrames(Frames):
                 error occurs, none of the data is queued, so you can attempt to
                 call this function again at a later time with the same data.
         """
-        units = itertools.chain.from_iterable(
-            _frames.serialize_frame(frame.to_raw())
-            for frame in frames)
-        bytes = b"".join(units)
+        bytes = _frames.serialize_frames(frame.to_raw() for frame in frames)
+        self.write_bytes(bytes, timeout)
+
+    def write_columns(
+            self,
+            identifiers,
+            frame_types,
+            payloads,
+            timestamps=None,
+            flags=None,
+            info=None,
+            timeout=10):
+        # type: (typing.Iterable[int], typing.Iterable[typing.Any], typing.Iterable[typing.Any], typing.Optional[typing.Iterable[int]], typing.Optional[typing.Iterable[int]], typing.Optional[typing.Iterable[int]], float) -> None  # NOQA: E501
+        """Write frame data given as parallel columns.
+
+        This avoids building a :any:`nixnet.types.Frame` object per frame,
+        which matters when replaying large logs.  Each column holds one entry
+        per frame, and ``ValueError`` is raised if their lengths differ.
+
+        Args:
+            identifiers(list of int): Raw frame identifiers, as in
+                :any:`nixnet.types.RawFrame.identifier`.
+            frame_types(list of :any:`nixnet._enums.FrameType`): Frame types,
+                either enum members or their integer values.
+            payloads(list of bytes-like): Frame payloads.
+            timestamps(list of int): Optional timestamps, defaults to zero.
+            flags(list of int): Optional flags, defaults to zero.
+            info(list of int): Optional info fields, defaults to zero.
+            timeout(float): The time in seconds to wait for space to become
+                available in queues. Refer to :any:`OutFrames.write`.
+        """
+        bytes = _frames.serialize_columns(identifiers, frame_types, payloads, timestamps, flags, info)
         self.write_bytes(bytes, timeout)
 
 
@@ -239,15 +440,18 @@ class SinglePointOutFrames(Frames):
     def write_bytes(
             self,
             frame_bytes):
-        # type: (bytes) -> None
+        # type: (typing.Any) -> None
         """Write a list of raw bytes (frame data).
 
         The raw bytes encode one or more frames using the Raw Frame Format.
 
         Args:
-            frame_bytes(bytes): Frames to transmit.
+            frame_bytes(bytes-like): Frames to transmit.  Any object supporting
+                the buffer protocol (``bytes``, ``bytearray``, ``memoryview``,
+                ``array.array``) is passed to the driver without per-byte
+                conversion.
         """
-        _funcs.nx_write_frame(self._handle, bytes(frame_bytes), constants.TIMEOUT_NONE)
+        _funcs.nx_write_frame(self._handle, frame_bytes, constants.TIMEOUT_NONE)
 
     def write(
             self,
@@ -259,10 +463,7 @@ class SinglePointOutFrames(Frames):
             frames(list of float): One or more :any:`nixnet.types.Frame` objects to be
                 written to the session.
         """
-        units = itertools.chain.from_iterable(
-            _frames.serialize_frame(frame.to_raw())
-            for frame in frames)
-        bytes = b"".join(units)
+        bytes = _frames.serialize_frames(frame.to_raw() for frame in frames)
         self.write_bytes(bytes)
 
 
@@ -1,6 +1,10 @@
 ﻿import typing  # NOQA: F401
 
+import six
+
+from nixnet import _arrays
 from nixnet import _funcs
+from nixnet import constants
 
 from nixnet._session import collection
 
@@ -22,25 +26,188 @@ class SinglePointInSignals(Signals):
         Yields:
             tuple of int and float: Timestamp and signal
         """
+        timestamps, values = self.read_array()
+        # The arrays are reused by the next read, so copy out before yielding.
+        signals = list(zip(timestamps.tolist(), values.tolist()))
+        yield from signals
+
+    def read_array(self, timestamps=None, values=None):
+        # type: (typing.Any, typing.Any) -> typing.Tuple[typing.Any, typing.Any]
+        """Read data from a Signal Input Single-Point session into arrays.
+
+        Like :any:`SinglePointInSignals.read`, but the driver writes straight
+        into buffers that are returned as arrays, without creating Python
+        objects per signal.  Unless ``timestamps`` and ``values`` are given,
+        the buffers belong to the session and are overwritten by the next
+        read on the same thread, so copy the NumPy arrays to keep them.
+
+        Args:
+            timestamps: A writable, C-contiguous uint64 buffer (for example a
+                NumPy array or ``array.array('Q')``) with an item per signal
+                to read the timestamps into.
+            values: A writable, C-contiguous float64 buffer with an item per
+                signal to read the values into.
+
+        Returns:
+            tuple: Timestamps and values, one item per signal.  These are
+            uint64 and float64 NumPy arrays, or copied ``array.array`` objects
+            when NumPy isn't installed.
+        """
+        num_signals = len(self)
+        timestamps = _arrays.pooled_or_view(
+            self._handle, 'SinglePointInSignals.read_array.timestamps', 'Q', num_signals, timestamps)
+        values = _arrays.pooled_or_view(
+            self._handle, 'SinglePointInSignals.read_array.values', 'd', num_signals, values)
+        _funcs.nx_read_signal_single_point(self._handle, values, timestamps)
+        return _arrays.wrap(timestamps, 'Q'), _arrays.wrap(values, 'd')
+
+
+class WaveformInSignals(Signals):
+    """Readable signals in a Signal Input Waveform session."""
+
+    def read(
+            self,
+            num_values_per_signal,  # type: int
+            timeout=constants.TIMEOUT_NONE,  # type: float
+            out=None,  # type: typing.Any
+    ):
+        # type: (...) -> typing.Tuple[int, float, typing.List[typing.Any]]
+        """Read resampled values of every signal.
+
+        The driver writes straight into a buffer that the session keeps and
+        reuses, so no per-value Python objects are created.  With NumPy, the
+        returned rows are views of that buffer: they are overwritten by the
+        next read on the same thread, so copy them to keep them.
+
+        Args:
+            num_values_per_signal(int): The most values to read per signal.
+            timeout(float): The time in seconds to wait for
+                ``num_values_per_signal`` values. With
+                ``constants.TIMEOUT_NONE`` (the default), only the
+                values available are returned.
+            out: A writable, C-contiguous float64 buffer (for example a NumPy
+                array or ``array.array('d')``) of at least
+                ``len(signals) * num_values_per_signal`` items to read into
+                instead of the session's buffer.
+
+        Returns:
+            tuple of int, float and list: The timestamp of the first value,
+            the time in seconds between values, and one row of values per
+            signal.  Each row is a float64 NumPy array, or a copied
+            ``array.array('d')`` when NumPy isn't installed.
+        """
         num_signals = len(self)
-        timestamps, values = _funcs.nx_read_signal_single_point(self._handle, num_signals)
-        for timestamp, value in zip(timestamps, values):
-            yield timestamp.value, value.value
+        count = num_signals * num_values_per_signal
+        values = _arrays.pooled_or_view(self._handle, 'WaveformInSignals.read.values', 'd', count, out)
+        start_time, delta_time, num_values = _funcs.nx_read_signal_waveform(self._handle, timeout, values)
+        rows = [_arrays.wrap(values, 'd', index * num_values_per_signal, num_values) for index in range(num_signals)]
+        return start_time, delta_time, rows
+
+
+class XYInSignals(Signals):
+    """Readable signals in a Signal Input XY session."""
+
+    def read(
+            self,
+            num_values_per_signal,  # type: int
+            time_limit=0,  # type: int
+    ):
+        # type: (...) -> typing.List[typing.Tuple[typing.Any, typing.Any]]
+        """Read the timestamped values received for every signal.
+
+        The driver writes straight into buffers that the session keeps and
+        reuses, so no per-value Python objects are created.  With NumPy, the
+        returned arrays are views of those buffers: they are overwritten by
+        the next read on the same thread, so copy them to keep them.
+
+        Args:
+            num_values_per_signal(int): The most values to read per signal.
+            time_limit(int): Only values received up to this timestamp are
+                read. With 0 (the default), all values available are read.
+
+        Returns:
+            list of tuple: One ``(timestamps, values)`` pair per signal.  These
+            are uint64 and float64 NumPy arrays, or copied ``array.array``
+            objects when NumPy isn't installed.
+        """
+        num_signals = len(self)
+        count = num_signals * num_values_per_signal
+        values = _arrays.pooled(self._handle, 'XYInSignals.read.values', 'd', count)
+        timestamps = _arrays.pooled(self._handle, 'XYInSignals.read.timestamps', 'Q', count)
+        num_pairs = _arrays.pooled(self._handle, 'XYInSignals.read.num_pairs', 'I', num_signals)
+        _funcs.nx_read_signal_xy(self._handle, time_limit, values, timestamps, num_pairs)
+        return [
+            (_arrays.wrap(timestamps, 'Q', index * num_values_per_signal, num_pairs[index]),
+             _arrays.wrap(values, 'd', index * num_values_per_signal, num_pairs[index]))
+            for index in range(num_signals)]
 
 
 class SinglePointOutSignals(Signals):
     """Writeable signals in a session."""
 
+    def __init__(self, handle):
+        # type: (int) -> None
+        super(SinglePointOutSignals, self).__init__(handle)
+        self._values = None  # type: typing.Any
+
     def write(
             self,
             signals):
-        # type: (typing.Iterable[float]) -> None
+        # type: (typing.Any) -> None
         """Write data to a Signal Output Single-Point session.
 
+        Contiguous float64 arrays, such as NumPy arrays, ``array.array('d')``
+        and their memoryviews, are handed to the driver without copying.
+
         Args:
             signals(list of float): A list of signal values (float).
         """
-        _funcs.nx_write_signal_single_point(self._handle, list(signals))
+        _funcs.nx_write_signal_single_point(self._handle, signals)
+
+    @property
+    def values(self):
+        # type: () -> typing.Any
+        """array of float: The values :any:`SinglePointOutSignals.flush` writes, one per signal.
+
+        This is a float64 NumPy array, or an ``array.array('d')`` when NumPy
+        isn't installed, kept by the session and initially zero.  Update it in
+        place, or with :any:`SinglePointOutSignals.set_value`, then flush.
+        :any:`SinglePointOutSignals.write` does not change it.
+        """
+        num_signals = len(self)
+        if self._values is None or len(self._values) != num_signals:
+            self._values = _arrays.zeros('d', num_signals)
+        return self._values
+
+    def set_value(self, signal, value):
+        # type: (typing.Union[int, typing.Text, Signal], float) -> None
+        """Set one signal in :any:`SinglePointOutSignals.values`.
+
+        Args:
+            signal(int, str or :any:`Signal`): The signal's index or name.
+            value(float): The value to write on the next flush.
+
+        Raises:
+            KeyError: The session has no signal with this name.
+            IndexError: The index is negative or not less than the number
+                of signals.
+        """
+        values = self.values
+        if isinstance(signal, six.string_types):
+            try:
+                index = self._index_cache[signal]
+            except KeyError:
+                raise KeyError('Unknown signal', signal)
+        else:
+            index = int(signal)
+            if index < 0 or index >= len(values):
+                raise IndexError('Signal index out of range', index)
+        values[index] = value
+
+    def flush(self):
+        # type: () -> None
+        """Write :any:`SinglePointOutSignals.values` to the session."""
+        self.write(self.values)
 
 
 class Signal(collection.Item):
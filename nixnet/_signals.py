@@ -0,0 +1,236 @@
+"""Bit-level signal packing shared by the signal decoder and encoder.
+
+A signal occupies ``num_bits`` contiguous bits of an integer made from the
+start of the frame payload:
+
+- Little endian signals read the payload as a little endian integer; the
+  signal starts at bit ``start_bit``.
+- Big endian signals read the payload up to and including the byte holding
+  ``start_bit`` as a big endian integer; the signal starts at bit
+  ``start_bit % 8``.
+
+Either way a signal compiles to a :any:`SignalPlan` that a single shift and
+mask can apply in pure Python, and to per-byte segments for the vectorized
+NumPy kernels.
+"""
+
+import collections
+import struct
+import typing  # NOQA: F401
+
+from nixnet import _arrays
+from nixnet import constants
+
+MAX_NUM_BITS = 64
+
+_FLOAT_FORMATS = {
+    32: (struct.Struct('<I'), struct.Struct('<f')),
+    64: (struct.Struct('<Q'), struct.Struct('<d')),
+}
+
+
+SignalPlan = collections.namedtuple(
+    'SignalPlan',
+    ['num_bytes', 'byteorder', 'shift', 'num_bits', 'mask', 'segments', 'data_type', 'scale_fac', 'scale_off'])
+
+
+def compile_signal(
+        start_bit,  # type: int
+        num_bits,  # type: int
+        byte_order,  # type: constants.SigByteOrdr
+        data_type=constants.SigDataType.UNSIGNED,  # type: constants.SigDataType
+        scale_fac=1.0,  # type: float
+        scale_off=0.0,  # type: float
+):
+    # type: (...) -> SignalPlan
+    """Compile a signal's layout into a :any:`SignalPlan`.
+
+    ``segments`` holds one ``(byte, bit, num_bits, value_shift)`` tuple per
+    payload byte the signal touches.
+
+    >>> plan = compile_signal(12, 8, constants.SigByteOrdr.LITTLE_ENDIAN)
+    >>> plan.num_bytes, plan.segments
+    (3, [(1, 4, 4, 0), (2, 0, 4, 4)])
+    >>> plan = compile_signal(12, 8, constants.SigByteOrdr.BIG_ENDIAN)
+    >>> plan.num_bytes, plan.segments
+    (2, [(1, 4, 4, 0), (0, 0, 4, 4)])
+    """
+    if not 0 < num_bits <= MAX_NUM_BITS:
+        raise ValueError('num_bits must be between 1 and {}'.format(MAX_NUM_BITS), num_bits)
+    if start_bit < 0:
+        raise ValueError('start_bit must not be negative', start_bit)
+    data_type = constants.SigDataType(data_type)
+    if data_type == constants.SigDataType.IEEE_FLOAT and num_bits not in _FLOAT_FORMATS:
+        raise ValueError('IEEE float signals must be 32 or 64 bits', num_bits)
+
+    if constants.SigByteOrdr(byte_order) == constants.SigByteOrdr.LITTLE_ENDIAN:
+        byteorder = 'little'
+        num_bytes = (start_bit + num_bits + 7) // 8
+        shift = start_bit
+    else:
+        byteorder = 'big'
+        byte, shift = divmod(start_bit, 8)
+        if byte < (shift + num_bits - 1) // 8:
+            raise ValueError('Big endian signal runs past the start of the payload', start_bit, num_bits)
+        num_bytes = byte + 1
+
+    segments = []
+    position = shift
+    value_shift = 0
+    while value_shift < num_bits:
+        unit, bit = divmod(position, 8)
+        segment_bits = min(8 - bit, num_bits - value_shift)
+        byte = unit if byteorder == 'little' else num_bytes - 1 - unit
+        segments.append((byte, bit, segment_bits, value_shift))
+        position += segment_bits
+        value_shift += segment_bits
+
+    return SignalPlan(
+        num_bytes,
+        byteorder,
+        shift,
+        num_bits,
+        (1 << num_bits) - 1,
+        segments,
+        data_type,
+        float(scale_fac),
+        float(scale_off))
+
+
+def extract(payload, plan):
+    # type: (typing.Any, SignalPlan) -> int
+    """Return a signal's raw bits from a payload at least ``plan.num_bytes`` long.
+
+    >>> plan = compile_signal(12, 8, constants.SigByteOrdr.BIG_ENDIAN)
+    >>> hex(extract(b'\\x0A\\xB0', plan))
+    '0xab'
+    """
+    return int.from_bytes(payload[:plan.num_bytes], plan.byteorder) >> plan.shift & plan.mask
+
+
+def to_physical(raw, plan):
+    # type: (int, SignalPlan) -> float
+    """Convert raw bits to a scaled value.
+
+    >>> plan = compile_signal(0, 8, constants.SigByteOrdr.LITTLE_ENDIAN, constants.SigDataType.SIGNED, 0.5)
+    >>> to_physical(0xFE, plan)
+    -1.0
+    """
+    if plan.data_type == constants.SigDataType.IEEE_FLOAT:
+        raw_format, float_format = _FLOAT_FORMATS[plan.num_bits]
+        value = float_format.unpack(raw_format.pack(raw))[0]
+    elif plan.data_type == constants.SigDataType.SIGNED and raw >> (plan.num_bits - 1):
+        value = raw - (1 << plan.num_bits)
+    else:
+        value = raw
+    return value * plan.scale_fac + plan.scale_off
+
+
+def insert(payload, plan, raw):
+    # type: (bytearray, SignalPlan, int) -> None
+    """Write a signal's raw bits into a payload at least ``plan.num_bytes`` long.
+
+    >>> payload = bytearray(2)
+    >>> insert(payload, compile_signal(12, 8, constants.SigByteOrdr.BIG_ENDIAN), 0xAB)
+    >>> bytes(payload)
+    b'\\n\\xb0'
+    """
+    num_bytes = plan.num_bytes
+    value = int.from_bytes(payload[:num_bytes], plan.byteorder)
+    value &= ~(plan.mask << plan.shift)
+    value |= (raw & plan.mask) << plan.shift
+    payload[:num_bytes] = value.to_bytes(num_bytes, plan.byteorder)
+
+
+def to_raw(value, plan):
+    # type: (float, SignalPlan) -> int
+    """Convert a scaled value to raw bits, rounding and saturating integers.
+
+    >>> plan = compile_signal(0, 8, constants.SigByteOrdr.LITTLE_ENDIAN, constants.SigDataType.SIGNED, 0.5)
+    >>> hex(to_raw(-1.0, plan)), hex(to_raw(1000.0, plan))
+    ('0xfe', '0x7f')
+    """
+    value = (value - plan.scale_off) / plan.scale_fac
+    if plan.data_type == constants.SigDataType.IEEE_FLOAT:
+        raw_format, float_format = _FLOAT_FORMATS[plan.num_bits]
+        return raw_format.unpack(float_format.pack(value))[0]
+    low, high = _integer_range(plan)
+    return int(min(max(round(value), low), high)) & plan.mask
+
+
+def _integer_range(plan):
+    # type: (SignalPlan) -> typing.Tuple[int, int]
+    if plan.data_type == constants.SigDataType.SIGNED:
+        return -(1 << (plan.num_bits - 1)), (1 << (plan.num_bits - 1)) - 1
+    return 0, plan.mask
+
+
+def gather_payloads(data, payload_offsets, num_bytes):
+    # type: (typing.Any, typing.Any, int) -> typing.Any
+    """Return the first ``num_bytes`` of each payload as a 2-D ``uint8`` array."""
+    numpy = _arrays.numpy
+    indices = payload_offsets.astype(numpy.intp)[:, numpy.newaxis] + numpy.arange(num_bytes)
+    return data[indices]
+
+
+def extract_vectorized(payloads, plan):
+    # type: (typing.Any, SignalPlan) -> typing.Any
+    """Return the raw bits of a signal from each row of ``payloads`` as ``uint64``."""
+    numpy = _arrays.numpy
+    raw = numpy.zeros(len(payloads), dtype=numpy.uint64)
+    for byte, bit, num_bits, value_shift in plan.segments:
+        segment = (payloads[:, byte] >> numpy.uint8(bit)) & numpy.uint8((1 << num_bits) - 1)
+        raw |= segment.astype(numpy.uint64) << numpy.uint64(value_shift)
+    return raw
+
+
+def to_physical_vectorized(raw, plan):
+    # type: (typing.Any, SignalPlan) -> typing.Any
+    """Convert an array of raw bits to scaled ``float64`` values."""
+    numpy = _arrays.numpy
+    if plan.data_type == constants.SigDataType.IEEE_FLOAT:
+        if plan.num_bits == 32:
+            values = raw.astype(numpy.uint32).view(numpy.float32).astype(numpy.float64)
+        else:
+            values = raw.view(numpy.float64)
+    elif plan.data_type == constants.SigDataType.SIGNED:
+        # Move the sign bit to the top, then shift back arithmetically.
+        unused_bits = numpy.uint64(MAX_NUM_BITS - plan.num_bits)
+        values = ((raw << unused_bits).view(numpy.int64) >> numpy.int64(unused_bits)).astype(numpy.float64)
+    else:
+        values = raw.astype(numpy.float64)
+    if plan.scale_fac != 1.0 or plan.scale_off != 0.0:
+        values = values * plan.scale_fac + plan.scale_off
+    return values
+
+
+def insert_vectorized(payloads, plan, raw):
+    # type: (typing.Any, SignalPlan, typing.Any) -> None
+    """Write the ``uint64`` raw bits of a signal into each row of ``payloads``."""
+    numpy = _arrays.numpy
+    for byte, bit, num_bits, value_shift in plan.segments:
+        mask = (1 << num_bits) - 1
+        segment = ((raw >> numpy.uint64(value_shift)) & numpy.uint64(mask)).astype(numpy.uint8)
+        payloads[:, byte] &= numpy.uint8(~(mask << bit) & 0xFF)
+        payloads[:, byte] |= segment << numpy.uint8(bit)
+
+
+def to_raw_vectorized(values, plan):
+    # type: (typing.Any, SignalPlan) -> typing.Any
+    """Convert an array of scaled values to ``uint64`` raw bits."""
+    numpy = _arrays.numpy
+    values = numpy.asarray(values, dtype=numpy.float64)
+    if plan.scale_fac != 1.0 or plan.scale_off != 0.0:
+        values = (values - plan.scale_off) / plan.scale_fac
+    if plan.data_type == constants.SigDataType.IEEE_FLOAT:
+        if plan.num_bits == 32:
+            return values.astype(numpy.float32).view(numpy.uint32).astype(numpy.uint64)
+        return numpy.ascontiguousarray(values).view(numpy.uint64)
+    low, high = _integer_range(plan)
+    # Clip in float64 first so the integer conversion never overflows.
+    clipped = numpy.clip(numpy.rint(values), float(low), float(high))
+    if plan.data_type == constants.SigDataType.SIGNED:
+        raw = numpy.clip(clipped.astype(numpy.int64), low, high).view(numpy.uint64)
+    else:
+        raw = numpy.minimum(clipped.astype(numpy.uint64), numpy.uint64(high))
+    return raw & numpy.uint64(plan.mask)
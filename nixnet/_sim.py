@@ -0,0 +1,792 @@
+"""An in-process stand-in for the NI-XNET driver.
+
+:any:`nixnet._sim.SimulatedDriver` exposes the driver's C entry points as
+ctypes function pointers, so :any:`nixnet._cfuncs.XnetLibrary` binds and
+calls it exactly like ``nixnet.dll``/``libnixnet.so``.  Select it by setting
+the ``NIXNET_BACKEND`` environment variable to ``simulated`` (see
+:any:`nixnet._lib.import_lib`).
+
+The simulation covers:
+
+- Frame stream, queued and single-point sessions (input and output) on
+  interfaces named like ``CAN1`` or ``LIN2``.  Interfaces of the same
+  protocol share a bus: frames written on one are received, timestamped, by
+  the started input sessions on the others.  Single-point input sessions
+  keep the last frame received for each frame in their list.
+- Session queues sized by the Queue Size property, in bytes of frame data.
+  Frames that don't fit are dropped and the next read reports
+  ``nxErrInputQueueOverflow``.
+- Session properties and read states used for status (pending, unused,
+  queue size, mode, protocol, list, times, session state and comm state).
+  Other session properties are stored and read back as written; a CAN
+  transceiver state of sleep is reported in the comm state.
+- Waits: transmit complete and interface communicating are met right away.
+  Nothing wakes an interface remotely, so remote wakeup waits time out.
+  No synchronization terminals can be connected.
+- Signal single-point sessions.  Values written on one interface are read,
+  by signal name, on the other interfaces of the bus.  Signals are not
+  packed into frames.
+- ``nxdb`` databases held in memory: objects can be created, found,
+  deleted and their properties set and read back.  Queued sessions find
+  their frames' identifiers in these databases.
+- The ``NIXNET_example`` and ``NIXNET_exampleLDF`` databases that NI-XNET
+  installs, reduced to their clusters, frames and signals (see
+  :any:`nixnet._sim.EXAMPLE_DATABASES`).  Each is rebuilt when opened
+  again after its last reference is closed, so changes are not kept.
+
+Other sessions (signal waveform and XY, and signal conversion) are not
+simulated; creating one fails with ``nxErrUnsupportedMode``.
+"""
+
+import collections
+import ctypes  # type: ignore
+import re
+import struct
+import threading
+import time
+import typing  # NOQA: F401
+
+from nixnet import _cconsts
+from nixnet import _cfuncs
+from nixnet import _frames
+
+DEFAULT_QUEUE_SIZE = 4096 * _frames.nxFrameFixed_t.size
+
+# Seconds between 1601-01-01, the epoch of nxTimestamp_t, and 1970-01-01.
+_EPOCH_OFFSET = 11644473600
+_TICKS_PER_SECOND = 10 ** 7
+
+_INTERFACE = re.compile(r'^(CAN|LIN|FlexRay)(\d+)$')
+_PROTOCOLS = {
+    'CAN': _cconsts.NX_PROTOCOL_CAN,
+    'LIN': _cconsts.NX_PROTOCOL_LIN,
+    'FlexRay': _cconsts.NX_PROTOCOL_FLEX_RAY,
+}
+_MAX_PAYLOAD = {
+    'CAN': 64,
+    'LIN': 8,
+    'FlexRay': 254,
+}
+_FRAME_INPUT_MODES = frozenset([
+    _cconsts.NX_MODE_FRAME_IN_STREAM,
+    _cconsts.NX_MODE_FRAME_IN_QUEUED,
+    _cconsts.NX_MODE_FRAME_IN_SINGLE_POINT])
+_FRAME_OUTPUT_MODES = frozenset([
+    _cconsts.NX_MODE_FRAME_OUT_STREAM,
+    _cconsts.NX_MODE_FRAME_OUT_QUEUED,
+    _cconsts.NX_MODE_FRAME_OUT_SINGLE_POINT])
+_SIGNAL_MODES = frozenset([_cconsts.NX_MODE_SIGNAL_IN_SINGLE_POINT, _cconsts.NX_MODE_SIGNAL_OUT_SINGLE_POINT])
+_MODES = _FRAME_INPUT_MODES | _FRAME_OUTPUT_MODES | _SIGNAL_MODES
+# Frame sessions created with a list of frames from a database.
+_FRAME_LIST_MODES = (_FRAME_INPUT_MODES | _FRAME_OUTPUT_MODES) - frozenset([
+    _cconsts.NX_MODE_FRAME_IN_STREAM, _cconsts.NX_MODE_FRAME_OUT_STREAM])
+
+# Sleep bit of the CAN comm state.
+_CAN_COMM_SLEEP = 0x20
+
+_U32 = struct.Struct('I')
+_U64 = struct.Struct('Q')
+_F64 = struct.Struct('d')
+
+# Default sizes of session and database properties that were never set.
+_DEFAULT_SIZES = {
+    _cconsts.NX_PRPTYPE_U32: _U32.size,
+    _cconsts.NX_PRPTYPE_REF: _U32.size,
+    _cconsts.NX_PRPTYPE_BOOL: 1,
+    _cconsts.NX_PRPTYPE_F64: _F64.size,
+    _cconsts.NX_PRPTYPE_U64: _U64.size,
+    _cconsts.NX_PRPTYPE_TIME: _U64.size,
+    _cconsts.NX_PRPTYPE_STRING: 1,
+    _cconsts.NX_PRPTYPE_1_DSTRING: 1,
+}
+_STRING_TYPES = frozenset([_cconsts.NX_PRPTYPE_STRING, _cconsts.NX_PRPTYPE_1_DSTRING])
+
+# Object class -> its name property.
+_NAME_PROPERTIES = {
+    _cconsts.NX_CLASS_CLUSTER: _cconsts.NX_PROP_CLST_NAME,
+    _cconsts.NX_CLASS_FRAME: _cconsts.NX_PROP_FRM_NAME,
+    _cconsts.NX_CLASS_SIGNAL: _cconsts.NX_PROP_SIG_NAME,
+    _cconsts.NX_CLASS_SUBFRAME: _cconsts.NX_PROP_SUBFRM_NAME,
+    _cconsts.NX_CLASS_ECU: _cconsts.NX_PROP_ECU_NAME,
+    _cconsts.NX_CLASS_LIN_SCHED: _cconsts.NX_PROP_LIN_SCHED_NAME,
+    _cconsts.NX_CLASS_LIN_SCHED_ENTRY: _cconsts.NX_PROP_LIN_SCHED_ENTRY_NAME,
+    _cconsts.NX_CLASS_PDU: _cconsts.NX_PROP_PDU_NAME,
+}
+
+# (Parent class, child class) -> (parent properties listing the child, child property referencing the parent).
+_RELATIONS = {
+    (_cconsts.NX_CLASS_DATABASE, _cconsts.NX_CLASS_CLUSTER): (
+        [_cconsts.NX_PROP_DATABASE_CLST_REFS], _cconsts.NX_PROP_CLST_DATABASE_REF),
+    (_cconsts.NX_CLASS_CLUSTER, _cconsts.NX_CLASS_FRAME): (
+        [_cconsts.NX_PROP_CLST_FRM_REFS], _cconsts.NX_PROP_FRM_CLUSTER_REF),
+    (_cconsts.NX_CLASS_CLUSTER, _cconsts.NX_CLASS_ECU): (
+        [_cconsts.NX_PROP_CLST_ECU_REFS], _cconsts.NX_PROP_ECU_CLST_REF),
+    (_cconsts.NX_CLASS_CLUSTER, _cconsts.NX_CLASS_PDU): (
+        [_cconsts.NX_PROP_CLST_PDU_REFS], _cconsts.NX_PROP_PDU_CLUSTER_REF),
+    (_cconsts.NX_CLASS_CLUSTER, _cconsts.NX_CLASS_LIN_SCHED): (
+        [_cconsts.NX_PROP_CLST_LIN_SCHEDULES], _cconsts.NX_PROP_LIN_SCHED_CLST_REF),
+    (_cconsts.NX_CLASS_LIN_SCHED, _cconsts.NX_CLASS_LIN_SCHED_ENTRY): (
+        [_cconsts.NX_PROP_LIN_SCHED_ENTRIES], _cconsts.NX_PROP_LIN_SCHED_ENTRY_SCHED),
+    (_cconsts.NX_CLASS_FRAME, _cconsts.NX_CLASS_SIGNAL): (
+        [_cconsts.NX_PROP_FRM_SIG_REFS, _cconsts.NX_PROP_FRM_MUX_STATIC_SIG_REFS], _cconsts.NX_PROP_SIG_FRAME_REF),
+    (_cconsts.NX_CLASS_FRAME, _cconsts.NX_CLASS_SUBFRAME): (
+        [_cconsts.NX_PROP_FRM_MUX_SUBFRAME_REFS], _cconsts.NX_PROP_SUBFRM_FRM_REF),
+    (_cconsts.NX_CLASS_PDU, _cconsts.NX_CLASS_SIGNAL): (
+        [_cconsts.NX_PROP_PDU_SIG_REFS, _cconsts.NX_PROP_PDU_MUX_STATIC_SIG_REFS], _cconsts.NX_PROP_SIG_PDU_REF),
+    (_cconsts.NX_CLASS_SUBFRAME, _cconsts.NX_CLASS_SIGNAL): (
+        [_cconsts.NX_PROP_SUBFRM_DYN_SIG_REFS], _cconsts.NX_PROP_SIG_MUX_SUBFRM_REF),
+}  # type: typing.Dict[typing.Tuple[int, int], typing.Tuple[typing.List[int], int]]
+
+# Database name -> clusters as ``(name, protocol, frames)``, each frame as
+# ``(name, identifier, payload length, signal names)``.  Signals are 16-bit
+# fields, one after the other from the start of the payload.
+EXAMPLE_DATABASES = {
+    'NIXNET_example': [
+        ('CAN_Cluster', _cconsts.NX_PROTOCOL_CAN, [
+            ('CANCyclicFrame1', 64, 8, ['CANCyclicSignal1', 'CANCyclicSignal2']),
+            ('CANCyclicFrame2', 65, 8, ['CANCyclicSignal3', 'CANCyclicSignal4']),
+            ('CANEventFrame1', 66, 8, ['CANEventSignal1', 'CANEventSignal2']),
+            ('CANEventFrame2', 67, 8, ['CANEventSignal3', 'CANEventSignal4']),
+        ]),
+    ],
+    'NIXNET_exampleLDF': [
+        ('Cluster', _cconsts.NX_PROTOCOL_LIN, [
+            ('MasterFrame1', 1, 8, ['MasterSignal1', 'MasterSignal2']),
+            ('SlaveFrame1', 2, 8, ['SlaveSignal1', 'SlaveSignal2']),
+        ]),
+    ],
+}  # type: typing.Dict[typing.Text, typing.List[typing.Tuple[typing.Text, int, typing.List[typing.Tuple[typing.Text, int, int, typing.List[typing.Text]]]]]]  # NOQA: E501
+_SIGNAL_BITS = 16
+
+
+class SimulationError(Exception):
+    """Raised by a simulated entry point to return an error status."""
+
+    def __init__(self, status):
+        # type: (int) -> None
+        super(SimulationError, self).__init__(status)
+        self.status = status
+
+
+def host_time():
+    # type: () -> int
+    """Return the host time as an ``nxTimestamp_t`` (100 ns ticks since 1601)."""
+    return int((time.time() + _EPOCH_OFFSET) * _TICKS_PER_SECOND)
+
+
+def _fundamental(ctype):
+    # type: (typing.Any) -> typing.Any
+    """Return the ctypes fundamental type a callback receives an argument as.
+
+    Strings arrive as addresses: ctypes would pass a ``c_char_p`` argument
+    as a copied ``bytes``, and some are output buffers the handler fills.
+    """
+    if issubclass(ctype, ctypes.c_char_p):
+        return ctypes.c_void_p
+    for base in ctype.__mro__:
+        if base.__module__ == 'ctypes' and not base.__name__.startswith('_'):
+            return base
+    return ctypes.c_void_p
+
+
+def _read(address, size):
+    # type: (typing.Optional[int], int) -> bytes
+    return ctypes.string_at(address, size) if address and size else b''
+
+
+def _string(address):
+    # type: (typing.Optional[int]) -> typing.Text
+    return ctypes.string_at(address).decode('ascii') if address else ''
+
+
+def _write(address, size, data):
+    # type: (typing.Optional[int], int, bytes) -> None
+    if len(data) > size:
+        raise SimulationError(_cconsts.NX_ERR_INVALID_PROPERTY_SIZE)
+    if address and data:
+        ctypes.memmove(address, data, len(data))
+
+
+def _write_u32(address, value):
+    # type: (typing.Optional[int], int) -> None
+    _write(address, _U32.size, _U32.pack(value))
+
+
+class _DatabaseObject(object):
+
+    def __init__(self, ref, object_class, name, database, parent=None):
+        # type: (int, int, typing.Text, typing.Any, typing.Optional[_DatabaseObject]) -> None
+        self.ref = ref
+        self.object_class = object_class
+        self.name = name
+        self.database = database
+        self.parent = parent
+        self.children = []  # type: typing.List[_DatabaseObject]
+        self.properties = {}  # type: typing.Dict[int, bytes]
+
+    def descendants(self):
+        # type: () -> typing.Iterator[_DatabaseObject]
+        for child in self.children:
+            yield child
+            for descendant in child.descendants():
+                yield descendant
+
+
+class _Session(object):
+
+    def __init__(self, ref, mode, interface, database_name, cluster_name, items, identifiers):
+        # type: (int, int, typing.Text, typing.Text, typing.Text, typing.List[typing.Text], typing.Optional[typing.List[int]]) -> None  # NOQA: E501
+        self.ref = ref
+        self.mode = mode
+        self.interface = interface
+        self.bus = _INTERFACE.match(interface).group(1)  # type: ignore
+        self.database_name = database_name
+        self.cluster_name = cluster_name
+        self.items = items
+        self.identifiers = identifiers
+        self.queue_size = DEFAULT_QUEUE_SIZE
+        self.auto_start = True
+        self.start_time = 0
+        self.queue = collections.deque()  # type: typing.Deque[bytes]
+        self.queued_bytes = 0
+        self.overflowed = False
+        self.properties = {}  # type: typing.Dict[int, bytes]
+        # Identifier -> last frame received, for single-point input.
+        self.latest = {}  # type: typing.Dict[int, bytes]
+
+    @property
+    def started(self):
+        # type: () -> bool
+        return bool(self.start_time)
+
+    def enqueue(self, frame):
+        # type: (bytes) -> bool
+        if self.queued_bytes + len(frame) > self.queue_size:
+            return False
+        self.queue.append(frame)
+        self.queued_bytes += len(frame)
+        return True
+
+    def clear(self):
+        # type: () -> None
+        self.queue.clear()
+        self.queued_bytes = 0
+        self.overflowed = False
+
+
+class Simulator(object):
+    """State and behavior of the simulated driver.
+
+    Each ``nx*`` method implements the C entry point of the same name.
+    Arguments arrive as ctypes fundamentals: integers, floats and
+    addresses for pointers and strings.
+
+    Args:
+        clock(callable): Returns the current time as an ``nxTimestamp_t``.
+        examples(bool): Provide the databases of
+            :any:`nixnet._sim.EXAMPLE_DATABASES`.
+    """
+
+    def __init__(self, clock=host_time, examples=True):
+        # type: (typing.Callable[[], int], bool) -> None
+        self.clock = clock
+        self._examples = EXAMPLE_DATABASES if examples else {}
+        self._lock = threading.RLock()
+        self._received = threading.Condition(self._lock)
+        self._next_ref = 1
+        self._sessions = {}  # type: typing.Dict[int, _Session]
+        self._databases = {}  # type: typing.Dict[typing.Text, _DatabaseObject]
+        self._database_opens = collections.Counter()  # type: typing.Counter[typing.Text]
+        self._objects = {}  # type: typing.Dict[int, _DatabaseObject]
+        # (Bus, signal name) -> (timestamp, value) of the last value written.
+        self._signal_values = {}  # type: typing.Dict[typing.Tuple[typing.Text, typing.Text], typing.Tuple[int, float]]  # NOQA: E501
+
+    def _new_ref(self):
+        # type: () -> int
+        ref = self._next_ref
+        self._next_ref += 1
+        return ref
+
+    def _session(self, ref, modes=None):
+        # type: (int, typing.Optional[typing.Iterable[int]]) -> _Session
+        try:
+            session = self._sessions[ref]
+        except KeyError:
+            raise SimulationError(_cconsts.NX_ERR_INVALID_SESSION_HANDLE)
+        if modes is not None and session.mode not in modes:
+            raise SimulationError(_cconsts.NX_ERR_INVALID_MODE)
+        return session
+
+    def _object(self, ref):
+        # type: (int) -> _DatabaseObject
+        try:
+            return self._objects[ref]
+        except KeyError:
+            raise SimulationError(_cconsts.NX_ERR_DATABASE_BAD_REFERENCE)
+
+    def _database(self, name):
+        # type: (typing.Text) -> typing.Optional[_DatabaseObject]
+        """Return the open database ``name``, building it if it is an example."""
+        database = self._databases.get(name)
+        if database is None and name in self._examples:
+            database = self._new_database(name)
+            for cluster_name, protocol, frames in self._examples[name]:
+                cluster = self._new_object(database, _cconsts.NX_CLASS_CLUSTER, cluster_name)
+                cluster.properties[_cconsts.NX_PROP_CLST_PROTOCOL] = _U32.pack(protocol)
+                for frame_name, identifier, payload_length, signal_names in frames:
+                    frame = self._new_object(cluster, _cconsts.NX_CLASS_FRAME, frame_name)
+                    frame.properties[_cconsts.NX_PROP_FRM_ID] = _U32.pack(identifier)
+                    frame.properties[_cconsts.NX_PROP_FRM_PAYLOAD_LEN] = _U32.pack(payload_length)
+                    for index, signal_name in enumerate(signal_names):
+                        signal = self._new_object(frame, _cconsts.NX_CLASS_SIGNAL, signal_name)
+                        signal.properties[_cconsts.NX_PROP_SIG_START_BIT] = _U32.pack(index * _SIGNAL_BITS)
+                        signal.properties[_cconsts.NX_PROP_SIG_NUM_BITS] = _U32.pack(_SIGNAL_BITS)
+        return database
+
+    def _new_database(self, name):
+        # type: (typing.Text) -> _DatabaseObject
+        database = _DatabaseObject(self._new_ref(), _cconsts.NX_CLASS_DATABASE, name, None)
+        database.database = database
+        self._databases[name] = database
+        self._objects[database.ref] = database
+        return database
+
+    def _new_object(self, parent, object_class, name):
+        # type: (_DatabaseObject, int, typing.Text) -> _DatabaseObject
+        obj = _DatabaseObject(self._new_ref(), object_class, name, parent.database, parent)
+        parent.children.append(obj)
+        self._objects[obj.ref] = obj
+        return obj
+
+    # Sessions
+
+    def nxCreateSession(self, database_name, cluster_name, items, interface, mode, session_ref):  # NOQA: N802
+        database_name = _string(database_name)
+        cluster_name = _string(cluster_name)
+        interface = _string(interface)
+        item_names = [item for item in _string(items).split(',') if item]
+        if mode not in _MODES:
+            raise SimulationError(_cconsts.NX_ERR_UNSUPPORTED_MODE)
+        if not _INTERFACE.match(interface):
+            raise SimulationError(_cconsts.NX_ERR_INVALID_INTERFACE)
+        with self._lock:
+            identifiers = None
+            if mode in _FRAME_LIST_MODES:
+                identifiers = list(self._frame_identifiers(database_name, cluster_name, item_names))
+            ref = self._new_ref()
+            self._sessions[ref] = _Session(
+                ref, mode, interface, database_name, cluster_name, item_names, identifiers)
+        _write_u32(session_ref, ref)
+
+    def _frame_identifiers(self, database_name, cluster_name, frame_names):
+        # type: (typing.Text, typing.Text, typing.List[typing.Text]) -> typing.Iterator[int]
+        database = self._database(database_name)
+        if database is None:
+            raise SimulationError(_cconsts.NX_ERR_CANNOT_OPEN_DATABASE_FILE)
+        clusters = [
+            child for child in database.children
+            if child.object_class == _cconsts.NX_CLASS_CLUSTER and child.name in (cluster_name, '')]
+        if cluster_name:
+            clusters = [cluster for cluster in clusters if cluster.name == cluster_name]
+        if not clusters:
+            raise SimulationError(_cconsts.NX_ERR_CLUSTER_NOT_FOUND)
+        frames = {
+            child.name: child for child in clusters[0].children if child.object_class == _cconsts.NX_CLASS_FRAME}
+        for name in frame_names:
+            frame = frames.get(name.split('.')[-1])
+            if frame is None:
+                raise SimulationError(_cconsts.NX_ERR_FRAME_NOT_FOUND)
+            identifier = _U32.unpack(frame.properties.get(_cconsts.NX_PROP_FRM_ID, bytes(_U32.size)))[0]
+            if frame.properties.get(_cconsts.NX_PROP_FRM_CAN_EXT_ID, b'\x00')[0]:
+                identifier |= _cconsts.NX_FRAME_ID_CAN_IS_EXTENDED
+            yield identifier
+
+    def nxClear(self, session_ref):  # NOQA: N802
+        with self._lock:
+            self._session(session_ref)
+            del self._sessions[session_ref]
+
+    def nxStart(self, session_ref, scope):  # NOQA: N802
+        with self._lock:
+            self._start(self._session(session_ref))
+
+    def _start(self, session):
+        # type: (_Session) -> None
+        if session.started:
+            return
+        session.start_time = self.clock()
+        if session.mode in _FRAME_OUTPUT_MODES:
+            pending = list(session.queue)
+            session.clear()
+            for frame in pending:
+                self._transmit(session, frame)
+
+    def nxStop(self, session_ref, scope):  # NOQA: N802
+        with self._lock:
+            self._session(session_ref).start_time = 0
+
+    def nxFlush(self, session_ref):  # NOQA: N802
+        with self._lock:
+            self._session(session_ref).clear()
+
+    def nxWait(self, session_ref, condition, param_in, timeout, param_out):  # NOQA: N802
+        with self._lock:
+            self._session(session_ref)
+        if condition == _cconsts.NX_CONDITION_INTF_REMOTE_WAKEUP:
+            if timeout > 0:
+                time.sleep(timeout)
+            raise SimulationError(_cconsts.NX_ERR_EVENT_TIMEOUT)
+        _write_u32(param_out, 0)
+
+    def nxBlink(self, interface_ref, modifier):  # NOQA: N802
+        pass
+
+    def nxConnectTerminals(self, session_ref, source, destination):  # NOQA: N802
+        with self._lock:
+            self._session(session_ref)
+        raise SimulationError(_cconsts.NX_ERR_INVALID_SYNCHRONIZATION_COMBINATION)
+
+    def nxDisconnectTerminals(self, session_ref, source, destination):  # NOQA: N802
+        with self._lock:
+            self._session(session_ref)
+        raise SimulationError(_cconsts.NX_ERR_INVALID_SYNCHRONIZATION_COMBINATION)
+
+    def nxWriteState(self, session_ref, state_id, state_size, state_value):  # NOQA: N802
+        with self._lock:
+            self._session(session_ref)
+
+    def nxReadState(self, session_ref, state_id, state_size, state_value, fault):  # NOQA: N802
+        with self._lock:
+            session = self._session(session_ref)
+            if state_id == _cconsts.NX_STATE_TIME_CURRENT:
+                data = _U64.pack(self.clock())
+            elif state_id in (_cconsts.NX_STATE_TIME_START, _cconsts.NX_STATE_TIME_COMMUNICATING):
+                data = _U64.pack(session.start_time)
+            elif state_id == _cconsts.NX_STATE_SESSION_INFO:
+                data = _U32.pack(
+                    _cconsts.NX_SESSION_INFO_STATE_STARTED if session.started
+                    else _cconsts.NX_SESSION_INFO_STATE_STOPPED)
+            elif state_id == _cconsts.NX_STATE_CAN_COMM:
+                # Error active, no errors: every other field is zero.
+                tcvr_state = _U32.unpack(session.properties.get(
+                    _cconsts.NX_PROP_SESSION_INTF_CAN_TCVR_STATE, _U32.pack(_cconsts.NX_CAN_TCVR_STATE_NORMAL)))[0]
+                data = _U32.pack(_CAN_COMM_SLEEP if tcvr_state == _cconsts.NX_CAN_TCVR_STATE_SLEEP else 0)
+            elif state_id == _cconsts.NX_STATE_LIN_COMM:
+                data = bytes(state_size)
+            else:
+                raise SimulationError(_cconsts.NX_ERR_INVALID_PROPERTY_ID)
+        _write(state_value, state_size, data)
+        _write_u32(fault, _cconsts.NX_SUCCESS)
+
+    # Frame I/O
+
+    def nxWriteFrame(self, session_ref, buffer, size_of_buffer, timeout):  # NOQA: N802
+        data = _read(buffer, size_of_buffer)
+        with self._lock:
+            session = self._session(session_ref, _FRAME_OUTPUT_MODES)
+            if not session.started and session.auto_start:
+                self._start(session)
+            for start, end, _, _ in _frames.iterate_headers(data):
+                frame = data[start:end]
+                if session.started:
+                    self._transmit(session, frame)
+                elif not session.enqueue(frame):
+                    raise SimulationError(_cconsts.NX_ERR_OUTPUT_QUEUE_OVERFLOW)
+
+    def _transmit(self, sender, frame):
+        # type: (_Session, bytes) -> None
+        """Deliver a frame to the started input sessions on the sender's bus."""
+        stamped = bytearray(frame)
+        _U64.pack_into(stamped, 0, self.clock())
+        identifier = _frames.nxFrameHeader_t.unpack_from(frame)[_frames.FRAME_IDENTIFIER_INDEX]
+        received = bytes(stamped)
+        for session in self._sessions.values():
+            if session.mode not in _FRAME_INPUT_MODES or not session.started:
+                continue
+            if session.bus != sender.bus or session.interface == sender.interface:
+                continue
+            if session.identifiers is not None and identifier not in session.identifiers:
+                continue
+            if session.mode == _cconsts.NX_MODE_FRAME_IN_SINGLE_POINT:
+                session.latest[identifier] = received
+            elif not session.enqueue(received):
+                session.overflowed = True
+        self._received.notify_all()
+
+    def nxReadFrame(self, session_ref, buffer, size_of_buffer, timeout, number_of_bytes_returned):  # NOQA: N802
+        with self._lock:
+            session = self._session(session_ref, _FRAME_INPUT_MODES)
+            if not session.started and session.auto_start:
+                self._start(session)
+            if session.overflowed:
+                session.overflowed = False
+                raise SimulationError(_cconsts.NX_ERR_INPUT_QUEUE_OVERFLOW)
+            data = bytearray()
+            if session.mode == _cconsts.NX_MODE_FRAME_IN_SINGLE_POINT:
+                for identifier in session.identifiers or []:
+                    frame = session.latest.get(identifier, b'')
+                    if len(data) + len(frame) <= size_of_buffer:
+                        data += frame
+            else:
+                if not session.queue and timeout != 0:
+                    self._received.wait(None if timeout < 0 else timeout)
+                while session.queue and len(data) + len(session.queue[0]) <= size_of_buffer:
+                    frame = session.queue.popleft()
+                    session.queued_bytes -= len(frame)
+                    data += frame
+        _write(buffer, size_of_buffer, bytes(data))
+        _write_u32(number_of_bytes_returned, len(data))
+
+    # Signal I/O
+
+    def nxWriteSignalSinglePoint(self, session_ref, value_buffer, size_of_value_buffer):  # NOQA: N802
+        with self._lock:
+            session = self._session(session_ref, [_cconsts.NX_MODE_SIGNAL_OUT_SINGLE_POINT])
+            num_values = min(len(session.items), size_of_value_buffer // _F64.size)
+            values = struct.unpack('{}d'.format(num_values), _read(value_buffer, num_values * _F64.size))
+            if not session.started and session.auto_start:
+                self._start(session)
+            timestamp = self.clock()
+            for name, value in zip(session.items, values):
+                self._signal_values[session.bus, name] = (timestamp, value)
+
+    def nxReadSignalSinglePoint(  # NOQA: N802
+            self, session_ref, value_buffer, size_of_value_buffer, timestamp_buffer, size_of_timestamp_buffer):
+        with self._lock:
+            session = self._session(session_ref, [_cconsts.NX_MODE_SIGNAL_IN_SINGLE_POINT])
+            if not session.started and session.auto_start:
+                self._start(session)
+            latest = [self._signal_values.get((session.bus, name), (0, 0.0)) for name in session.items]
+        timestamps = struct.pack('{}Q'.format(len(latest)), *[timestamp for timestamp, _ in latest])
+        values = struct.pack('{}d'.format(len(latest)), *[value for _, value in latest])
+        _write(value_buffer, size_of_value_buffer, values[:size_of_value_buffer])
+        _write(timestamp_buffer, size_of_timestamp_buffer, timestamps[:size_of_timestamp_buffer])
+
+    # Properties
+
+    def nxGetPropertySize(self, session_ref, property_id, property_size):  # NOQA: N802
+        with self._lock:
+            data = self._get_session_property(self._session(session_ref), property_id)
+        _write_u32(property_size, len(data))
+
+    def nxGetProperty(self, session_ref, property_id, property_size, property_value):  # NOQA: N802
+        with self._lock:
+            data = self._get_session_property(self._session(session_ref), property_id)
+        if property_id & _cconsts.NX_PRPTYPE_MASK in _STRING_TYPES:
+            data = data[:property_size]
+        _write(property_value, property_size, data)
+
+    def nxSetProperty(self, session_ref, property_id, property_size, property_value):  # NOQA: N802
+        data = _read(property_value, property_size)
+        with self._lock:
+            session = self._session(session_ref)
+            if property_id == _cconsts.NX_PROP_SESSION_QUEUE_SIZE:
+                if len(data) != _U32.size:
+                    raise SimulationError(_cconsts.NX_ERR_INVALID_PROPERTY_SIZE)
+                session.queue_size = _U32.unpack(data)[0]
+            elif property_id == _cconsts.NX_PROP_SESSION_AUTO_START:
+                if not data:
+                    raise SimulationError(_cconsts.NX_ERR_INVALID_PROPERTY_SIZE)
+                session.auto_start = bool(data[0])
+            else:
+                session.properties[property_id] = _stored_value(property_id, data)
+
+    def _get_session_property(self, session, property_id):
+        # type: (_Session, int) -> bytes
+        frame_size = _frames.nxFrameFixed_t.size
+        computed = {
+            _cconsts.NX_PROP_SESSION_MODE: lambda: _U32.pack(session.mode),
+            _cconsts.NX_PROP_SESSION_PROTOCOL: lambda: _U32.pack(_PROTOCOLS[session.bus]),
+            _cconsts.NX_PROP_SESSION_QUEUE_SIZE: lambda: _U32.pack(session.queue_size),
+            _cconsts.NX_PROP_SESSION_AUTO_START: lambda: bytes([session.auto_start]),
+            _cconsts.NX_PROP_SESSION_NUM_PEND: lambda: _U32.pack(len(session.queue)),
+            _cconsts.NX_PROP_SESSION_NUM_UNUSED: lambda: _U32.pack(
+                max(0, session.queue_size - session.queued_bytes) // frame_size),
+            _cconsts.NX_PROP_SESSION_NUM_IN_LIST: lambda: _U32.pack(len(session.items)),
+            _cconsts.NX_PROP_SESSION_NUM_FRAMES: lambda: _U32.pack(len(session.items)),
+            _cconsts.NX_PROP_SESSION_PAYLD_LEN_MAX: lambda: _U32.pack(_MAX_PAYLOAD[session.bus]),
+            _cconsts.NX_PROP_SESSION_LIST: lambda: ','.join(session.items).encode('ascii') + b'\x00',
+            _cconsts.NX_PROP_SESSION_INTF_NAME: lambda: session.interface.encode('ascii') + b'\x00',
+            _cconsts.NX_PROP_SESSION_DATABASE_NAME: lambda: session.database_name.encode('ascii') + b'\x00',
+            _cconsts.NX_PROP_SESSION_CLUSTER_NAME: lambda: session.cluster_name.encode('ascii') + b'\x00',
+        }  # type: typing.Dict[int, typing.Callable[[], bytes]]
+        if property_id in computed:
+            return computed[property_id]()
+        return _stored_or_default(session.properties, property_id)
+
+    # System
+
+    def nxSystemOpen(self, system_ref):  # NOQA: N802
+        with self._lock:
+            _write_u32(system_ref, self._new_ref())
+
+    def nxSystemClose(self, system_ref):  # NOQA: N802
+        pass
+
+    def nxStatusToString(self, status, size_of_status_description, status_description):  # NOQA: N802
+        description = 'Simulated NI-XNET status 0x{:08X}.'.format(status).encode('ascii')
+        description = description[:max(0, size_of_status_description - 1)] + b'\x00'
+        _write(status_description, size_of_status_description, description)
+
+    # Databases
+
+    def nxdbOpenDatabase(self, database_name, database_ref):  # NOQA: N802
+        name = _string(database_name)
+        with self._lock:
+            database = self._database(name)
+            if database is None:
+                database = self._new_database(name)
+            self._database_opens[name] += 1
+        _write_u32(database_ref, database.ref)
+
+    def nxdbCloseDatabase(self, database_ref, close_all_refs):  # NOQA: N802
+        with self._lock:
+            database = self._object(database_ref)
+            if database.object_class != _cconsts.NX_CLASS_DATABASE:
+                raise SimulationError(_cconsts.NX_ERR_DATABASE_BAD_REFERENCE)
+            self._database_opens[database.name] -= 1
+            if close_all_refs or self._database_opens[database.name] <= 0:
+                del self._database_opens[database.name]
+                del self._databases[database.name]
+                for obj in [database] + list(database.descendants()):
+                    del self._objects[obj.ref]
+
+    def nxdbSaveDatabase(self, database_ref, db_filepath):  # NOQA: N802
+        with self._lock:
+            self._object(database_ref)
+
+    def nxdbCreateObject(self, parent_object_ref, object_class, object_name, db_object_ref):  # NOQA: N802
+        name = _string(object_name)
+        with self._lock:
+            parent = self._object(parent_object_ref)
+            if (parent.object_class, object_class) not in _RELATIONS:
+                raise SimulationError(_cconsts.NX_ERR_OBJECT_RELATION)
+            if any(child.object_class == object_class and child.name == name for child in parent.children):
+                raise SimulationError(_cconsts.NX_ERR_DATABASE_OBJECT_LOCKED)
+            obj = self._new_object(parent, object_class, name)
+        _write_u32(db_object_ref, obj.ref)
+
+    def nxdbFindObject(self, parent_object_ref, object_class, object_name, db_object_ref):  # NOQA: N802
+        name = _string(object_name)
+        with self._lock:
+            parent = self._object(parent_object_ref)
+            for obj in parent.descendants():
+                if obj.object_class == object_class and obj.name == name:
+                    break
+            else:
+                raise SimulationError(_cconsts.NX_ERR_DATABASE_OBJECT_NOT_FOUND)
+        _write_u32(db_object_ref, obj.ref)
+
+    def nxdbDeleteObject(self, db_object_ref):  # NOQA: N802
+        with self._lock:
+            obj = self._object(db_object_ref)
+            if obj.parent is None:
+                raise SimulationError(_cconsts.NX_ERR_OBJECT_RELATION)
+            obj.parent.children.remove(obj)
+            for removed in [obj] + list(obj.descendants()):
+                del self._objects[removed.ref]
+
+    def nxdbGetPropertySize(self, db_object_ref, property_id, property_size):  # NOQA: N802
+        with self._lock:
+            data = self._get_database_property(self._object(db_object_ref), property_id)
+        _write_u32(property_size, len(data))
+
+    def nxdbGetProperty(self, db_object_ref, property_id, property_size, property_value):  # NOQA: N802
+        with self._lock:
+            data = self._get_database_property(self._object(db_object_ref), property_id)
+        if property_id & _cconsts.NX_PRPTYPE_MASK in _STRING_TYPES:
+            data = data[:property_size]
+        _write(property_value, property_size, data)
+
+    def nxdbSetProperty(self, db_object_ref, property_id, property_size, property_value):  # NOQA: N802
+        data = _read(property_value, property_size)
+        with self._lock:
+            obj = self._object(db_object_ref)
+            if property_id == _NAME_PROPERTIES.get(obj.object_class):
+                obj.name = data.split(b'\x00')[0].decode('ascii')
+            else:
+                obj.properties[property_id] = _stored_value(property_id, data)
+
+    def _get_database_property(self, obj, property_id):
+        # type: (_DatabaseObject, int) -> bytes
+        if obj.object_class == _cconsts.NX_CLASS_DATABASE and property_id == _cconsts.NX_PROP_DATABASE_NAME:
+            return obj.name.encode('ascii') + b'\x00'
+        if property_id == _NAME_PROPERTIES.get(obj.object_class):
+            return obj.name.encode('ascii') + b'\x00'
+        if obj.parent is not None:
+            if property_id == _RELATIONS[obj.parent.object_class, obj.object_class][1]:
+                return _U32.pack(obj.parent.ref)
+        children = [
+            child.ref for child in obj.children
+            if property_id in _RELATIONS[obj.object_class, child.object_class][0]]
+        if children:
+            return struct.pack('{}I'.format(len(children)), *children)
+        return _stored_or_default(obj.properties, property_id)
+
+
+def _stored_value(property_id, data):
+    # type: (int, bytes) -> bytes
+    if property_id & _cconsts.NX_PRPTYPE_MASK in _STRING_TYPES:
+        return data.split(b'\x00')[0] + b'\x00'
+    return data
+
+
+def _stored_or_default(properties, property_id):
+    # type: (typing.Dict[int, bytes], int) -> bytes
+    if property_id in properties:
+        return properties[property_id]
+    return bytes(_DEFAULT_SIZES.get(property_id & _cconsts.NX_PRPTYPE_MASK, 0))
+
+
+class SimulatedDriver(object):
+    """A ``ctypes.CDLL`` stand-in whose functions run a :any:`nixnet._sim.Simulator`.
+
+    Like ``ctypes.CDLL``, attribute access returns the same function pointer
+    each time while item access returns a new one.
+
+    Args:
+        simulator(:any:`nixnet._sim.Simulator`): The simulation to run.
+            Defaults to a new one.
+    """
+
+    def __init__(self, simulator=None):
+        # type: (typing.Optional[Simulator]) -> None
+        self.simulator = simulator if simulator is not None else Simulator()
+        self._callbacks = {}  # type: typing.Dict[typing.Text, typing.Any]
+        self._functions = {}  # type: typing.Dict[typing.Text, typing.Any]
+        for function, argtypes, restype in _cfuncs._PROTOTYPES.values():
+            handler = getattr(self.simulator, function, None)
+            if handler is None:
+                continue
+            prototype = ctypes.CFUNCTYPE(
+                None if restype is None else ctypes.c_uint32,
+                *[_fundamental(argtype) for argtype in argtypes])
+            self._callbacks[function] = prototype(self._wrap(handler, restype is not None))
+
+    @staticmethod
+    def _wrap(handler, returns_status):
+        # type: (typing.Callable[..., None], bool) -> typing.Callable[..., typing.Optional[int]]
+        def call(*args):
+            try:
+                handler(*args)
+            except SimulationError as error:
+                return error.status if returns_status else None
+            except Exception:
+                # An exception escaping a ctypes callback is only printed
+                # and leaves the return value undefined.
+                return _cconsts.NX_ERR_INTERNAL_ERROR if returns_status else None
+            return _cconsts.NX_SUCCESS if returns_status else None
+        return call
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._callbacks:
+            raise AttributeError(name)
+        if name not in self._functions:
+            self._functions[name] = self[name]
+        return self._functions[name]
+
+    def __getitem__(self, name):
+        if name not in self._callbacks:
+            raise AttributeError(name)
+        callback = self._callbacks[name]
+        return type(callback)(ctypes.cast(callback, ctypes.c_void_p).value)
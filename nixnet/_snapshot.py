@@ -0,0 +1,215 @@
+import collections
+import ctypes  # type: ignore
+import threading
+import time
+import typing  # NOQA: F401
+
+from nixnet import _cconsts
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
+from nixnet import _errors
+from nixnet import _utils
+from nixnet import constants
+
+DEFAULT_FIELDS = ('num_pend', 'num_unused', 'queue_size', 'state', 'time_current')
+DEFAULT_INTERVAL = 1.0
+
+
+SessionSnapshot_ = collections.namedtuple(
+    'SessionSnapshot_',
+    ['timestamp', 'num_pend', 'num_unused', 'queue_size', 'state', 'time_current', 'can_comm', 'lin_comm'])
+
+
+class SessionSnapshot(SessionSnapshot_):
+    """Session status read in one pass.
+
+    Properties that were not requested are ``None``.
+
+    Attributes:
+        timestamp(float): Host time the snapshot was taken, from
+            ``time.time()``.
+        num_pend(int): :any:`nixnet._session.base.SessionBase.num_pend`
+        num_unused(int): :any:`nixnet._session.base.SessionBase.num_unused`
+        queue_size(int): :any:`nixnet._session.base.SessionBase.queue_size`
+        state(:any:`nixnet._enums.SessionInfoState`):
+            :any:`nixnet._session.base.SessionBase.state`
+        time_current(int): :any:`nixnet._session.base.SessionBase.time_current`
+        can_comm(:any:`nixnet.types.CanComm`):
+            :any:`nixnet._session.base.SessionBase.can_comm`
+        lin_comm(:any:`nixnet.types.LinComm`):
+            :any:`nixnet._session.base.SessionBase.lin_comm`
+    """
+
+    pass
+
+
+def _parse_u32(value_ctypes):
+    # type: (typing.Any) -> int
+    return value_ctypes.value
+
+
+def _parse_state(value_ctypes):
+    # type: (typing.Any) -> constants.SessionInfoState
+    return constants.SessionInfoState(value_ctypes.value)
+
+
+def _parse_can_comm(value_ctypes):
+    # type: (typing.Any) -> typing.Any
+    return _utils.parse_can_comm_bitfield(value_ctypes.value)
+
+
+def _parse_lin_comm(value_ctypes):
+    # type: (typing.Any) -> typing.Any
+    return _utils.parse_lin_comm_bitfield(value_ctypes[0].value, value_ctypes[1].value)
+
+
+# Field name -> (property ID, None, value type, parser) for session properties
+# or (None, read state ID, value type, parser) for read states.
+_FIELDS = {
+    'num_pend': (_cconsts.NX_PROP_SESSION_NUM_PEND, None, _ctypedefs.u32, _parse_u32),
+    'num_unused': (_cconsts.NX_PROP_SESSION_NUM_UNUSED, None, _ctypedefs.u32, _parse_u32),
+    'queue_size': (_cconsts.NX_PROP_SESSION_QUEUE_SIZE, None, _ctypedefs.u32, _parse_u32),
+    'state': (None, constants.ReadState.SESSION_INFO, _ctypedefs.u32, _parse_state),
+    'time_current': (None, constants.ReadState.TIME_CURRENT, _ctypedefs.nxTimestamp_t, _parse_u32),
+    'can_comm': (None, constants.ReadState.CAN_COMM, _ctypedefs.u32, _parse_can_comm),
+    'lin_comm': (None, constants.ReadState.LIN_COMM, _ctypedefs.u32 * 2, _parse_lin_comm),
+}  # type: typing.Dict[typing.Text, typing.Tuple[typing.Optional[int], typing.Optional[constants.ReadState], typing.Any, typing.Callable[[typing.Any], typing.Any]]]  # NOQA: E501
+
+
+class SnapshotReader(object):
+    """Read a fixed set of session properties with pre-built driver arguments.
+
+    The ctypes arguments for every driver call are created once, so taking a
+    snapshot only calls the driver and parses the results.
+
+    Create it with :any:`nixnet._session.base.SessionBase.snapshot`.
+
+    Args:
+        handle(int): Session handle.
+        fields(list of str): :any:`nixnet._snapshot.SessionSnapshot` fields
+            to read.
+    """
+
+    def __init__(self, handle, fields=DEFAULT_FIELDS):
+        # type: (int, typing.Iterable[typing.Text]) -> None
+        fields = tuple(fields)
+        unknown = [field for field in fields if field not in _FIELDS]
+        if unknown:
+            raise ValueError('Unknown snapshot fields', unknown)
+        self._fields = fields
+
+        handle_ctypes = _ctypedefs.nxSessionRef_t(handle)
+        fault_ctypes = _ctypedefs.nxStatus_t()
+        self._property_calls = []  # type: typing.List[typing.Tuple[typing.Text, typing.Tuple[typing.Any, ...], typing.Any, typing.Callable[[typing.Any], typing.Any]]]  # NOQA: E501
+        self._state_calls = []  # type: typing.List[typing.Tuple[typing.Text, typing.Tuple[typing.Any, ...], typing.Any, typing.Callable[[typing.Any], typing.Any]]]  # NOQA: E501
+        for field in fields:
+            prop_id, state_id, value_type, parse = _FIELDS[field]
+            value_ctypes = value_type()
+            size_ctypes = _ctypedefs.u32(ctypes.sizeof(value_ctypes))
+            if state_id is None:
+                arguments = (
+                    handle_ctypes,
+                    _ctypedefs.u32(typing.cast(int, prop_id)),
+                    size_ctypes,
+                    ctypes.pointer(value_ctypes))  # type: typing.Tuple[typing.Any, ...]
+                self._property_calls.append((field, arguments, value_ctypes, parse))
+            else:
+                arguments = (
+                    handle_ctypes,
+                    _ctypedefs.u32(state_id.value),
+                    size_ctypes,
+                    ctypes.pointer(value_ctypes),
+                    ctypes.pointer(fault_ctypes))
+                self._state_calls.append((field, arguments, value_ctypes, parse))
+
+    @property
+    def fields(self):
+        # type: () -> typing.Tuple[typing.Text, ...]
+        """tuple of str: The fields each snapshot reads."""
+        return self._fields
+
+    def read(self):
+        # type: () -> SessionSnapshot
+        """Read the session properties into a :any:`nixnet._snapshot.SessionSnapshot`."""
+        lib = _cfuncs.lib
+        values = {}  # type: typing.Dict[typing.Text, typing.Any]
+        timestamp = time.time()
+        for field, arguments, value_ctypes, parse in self._property_calls:
+            _errors.check_status(lib.nx_get_property(*arguments))
+            values[field] = parse(value_ctypes)
+        for field, arguments, value_ctypes, parse in self._state_calls:
+            _errors.check_status(lib.nx_read_state(*arguments))
+            values[field] = parse(value_ctypes)
+        return _EMPTY_SNAPSHOT._replace(timestamp=timestamp, **values)
+
+
+_EMPTY_SNAPSHOT = SessionSnapshot(*([None] * len(SessionSnapshot._fields)))
+
+
+class SnapshotSampler(object):
+    """Take session snapshots periodically from a dedicated thread.
+
+    Errors raised by the driver stop the thread and are re-raised once by
+    the next call to :any:`nixnet._snapshot.SnapshotSampler.samples`.
+
+    Create it with :any:`nixnet._session.base.SessionBase.start_sampler`.
+
+    Args:
+        reader(:any:`nixnet._snapshot.SnapshotReader`): Reads each snapshot.
+        interval(float): Seconds between snapshots.
+        maxlen(int): If set, keep only the newest ``maxlen`` snapshots.
+    """
+
+    def __init__(self, reader, interval=DEFAULT_INTERVAL, maxlen=None):
+        # type: (SnapshotReader, float, typing.Optional[int]) -> None
+        if interval <= 0:
+            raise ValueError('interval must be positive', interval)
+        self._reader = reader
+        self._interval = interval
+        self._snapshots = collections.deque(maxlen=maxlen)  # type: typing.Deque[SessionSnapshot]
+        self._stop = threading.Event()
+        self._error = None  # type: typing.Optional[BaseException]
+        self._thread = threading.Thread(target=self._run, name='nixnet-sampler')
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def running(self):
+        # type: () -> bool
+        """bool: Whether the sampler thread is still taking snapshots."""
+        return self._thread.is_alive()
+
+    def samples(self):
+        # type: () -> typing.List[SessionSnapshot]
+        """Return the snapshots taken so far, oldest first."""
+        error = self._error
+        if error is not None:
+            self._error = None
+            raise error
+        return list(self._snapshots)
+
+    def series(self, field):
+        # type: (typing.Text) -> typing.Tuple[typing.List[float], typing.List[typing.Any]]
+        """Return the timestamps and values of one field across the snapshots."""
+        if field not in self._reader.fields:
+            raise ValueError('Field is not sampled', field)
+        snapshots = self.samples()
+        return [snapshot.timestamp for snapshot in snapshots], [getattr(snapshot, field) for snapshot in snapshots]
+
+    def stop(self):
+        # type: () -> None
+        """Stop the sampler thread, keeping the snapshots taken."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        # type: () -> None
+        next_sample = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                self._snapshots.append(self._reader.read())
+            except BaseException as error:
+                self._error = error
+                return
+            next_sample += self._interval
+            self._stop.wait(max(0.0, next_sample - time.perf_counter()))
@@ -1,10 +1,16 @@
-import itertools
+import array
+import collections
 import typing  # NOQA: F401
 import warnings
 
+from nixnet import _aio
+from nixnet import _arrays
+from nixnet import _buffers
+from nixnet import _cconsts
 from nixnet import _frames
 from nixnet import _funcs
 from nixnet import _props
+from nixnet import _signals
 from nixnet import _utils
 from nixnet import constants
 from nixnet import errors
@@ -15,7 +21,30 @@ from nixnet._session import signals as session_signals
 
 
 __all__ = [
-    "SignalConversionSinglePointSession"]
+    "SignalConversionSinglePointSession",
+    "ConversionStats",
+    "SignalLayout",
+    "FrameLayout",
+    "SignalDecoder",
+    "SignalEncoder"]
+
+
+ConversionStats_ = collections.namedtuple(
+    'ConversionStats_',
+    ['conversions', 'resizes', 'buffer_size'])
+
+
+class ConversionStats(ConversionStats_):
+    """Signal to frame conversion statistics.
+
+    Attributes:
+        conversions(int): Signal to frame conversions done.
+        resizes(int): Times the output buffer was too small and had to grow.
+        buffer_size(int): Current output buffer size in bytes, or 0 before
+            the first conversion.
+    """
+
+    pass
 
 
 class SignalConversionSinglePointSession(object):
@@ -73,6 +102,9 @@ class SignalConversionSinglePointSession(object):
             constants.CreateSessionMode.SIGNAL_CONVERSION_SINGLE_POINT)
         self._j1939 = session_j1939.J1939(self._handle)
         self._signals = session_signals.Signals(self._handle)
+        self._frames_size = None  # type: typing.Optional[int]
+        self._conversions = 0
+        self._resizes = 0
 
     def __del__(self):
         if self._handle is not None:
@@ -87,6 +119,12 @@ class SignalConversionSinglePointSession(object):
     def __exit__(self, exception_type, exception_value, traceback):
         self.close()
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exception_type, exception_value, traceback):
+        await _aio.run(self.close)
+
     def __eq__(self, other):
         if isinstance(other, self.__class__):
             return self._handle == typing.cast(SignalConversionSinglePointSession, other)._handle
@@ -117,6 +155,7 @@ class SignalConversionSinglePointSession(object):
             return
 
         _funcs.nx_clear(self._handle)
+        _buffers.pool.release(self._handle)
 
         self._handle = None
 
@@ -126,6 +165,12 @@ class SignalConversionSinglePointSession(object):
         """:any:`nixnet._session.signals.Signals`: Operate on session's signals"""
         return self._signals
 
+    @property
+    def conversion_stats(self):
+        # type: () -> ConversionStats
+        """:any:`ConversionStats`: Signal to frame conversion counters."""
+        return ConversionStats(self._conversions, self._resizes, self._frames_size or 0)
+
     @property
     def j1939(self):
         # type: () -> session_j1939.J1939
@@ -172,12 +217,45 @@ class SignalConversionSinglePointSession(object):
             _props.get_session_protocol(self._handle))  # type: ignore
 
     def _convert_bytes_to_signals(self, bytes):
-        # type: (bytes) -> typing.Iterable[typing.Tuple[int, float]]
+        # type: (typing.Any) -> typing.Iterable[typing.Tuple[int, float]]
+        timestamps, values = self.convert_bytes_to_signals_array(bytes)
+        # The arrays are reused by the next conversion, so copy out before yielding.
+        signals = list(zip(timestamps.tolist(), values.tolist()))
+        yield from signals
+
+    def convert_bytes_to_signals_array(self, frame_bytes, timestamps=None, values=None):
+        # type: (typing.Any, typing.Any, typing.Any) -> typing.Tuple[typing.Any, typing.Any]
+        """Convert raw bytes (frame data) to signals, returning arrays.
+
+        Like :any:`SignalConversionSinglePointSession.convert_frames_to_signals`,
+        but the driver writes straight into buffers that are returned as
+        arrays, without creating Python objects per signal.  Unless
+        ``timestamps`` and ``values`` are given, the buffers belong to the
+        session and are overwritten by the next conversion on the same
+        thread, so copy the arrays to keep them.
+
+        Args:
+            frame_bytes(bytes): Raw bytes (frame data), such as returned by
+                :any:`nixnet._session.frames.InFrames.read_bytes`.
+            timestamps: A writable, C-contiguous uint64 buffer (for example a
+                NumPy array or ``array.array('Q')``) with an item per signal
+                to convert the timestamps into.
+            values: A writable, C-contiguous float64 buffer with an item per
+                signal to convert the values into.
+
+        Returns:
+            tuple: Timestamps and values, one item per signal.  These are
+            uint64 and float64 NumPy arrays, or copied ``array.array`` objects
+            when NumPy isn't installed.
+        """
         num_signals = len(self.signals)
-        timestamps, values = _funcs.nx_convert_frames_to_signals_single_point(
-            self._handle, bytes, num_signals)  # type: ignore
-        for timestamp, value in zip(timestamps, values):
-            yield timestamp.value, value.value
+        timestamps = _arrays.pooled_or_view(
+            self._handle, 'convert_bytes_to_signals_array.timestamps', 'Q', num_signals, timestamps)  # type: ignore
+        values = _arrays.pooled_or_view(
+            self._handle, 'convert_bytes_to_signals_array.values', 'd', num_signals, values)  # type: ignore
+        _funcs.nx_convert_frames_to_signals_single_point(
+            self._handle, frame_bytes, values, timestamps)  # type: ignore
+        return _arrays.wrap(timestamps, 'Q'), _arrays.wrap(values, 'd')
 
     def convert_frames_to_signals(self, frames):
         # type: (typing.Iterable[types.Frame]) -> typing.Iterable[typing.Tuple[int, float]]
@@ -198,12 +276,25 @@ class SignalConversionSinglePointSession(object):
 
         .. note:: Frames unknown to the session are silently ignored.
         """
-        units = itertools.chain.from_iterable(
-            _frames.serialize_frame(frame.to_raw())
-            for frame in frames)
-        bytes = b"".join(units)
+        bytes = _frames.serialize_frames(frame.to_raw() for frame in frames)
         return self._convert_bytes_to_signals(bytes)
 
+    def _required_frames_size(self):
+        # type: () -> int
+        """Return the bytes needed to hold one of each frame in the session.
+
+        Every frame is sized for the largest payload in the session, so this
+        is an upper bound that the driver never reports as too small.
+        """
+        try:
+            num_frames = _props.get_session_num_frames(self._handle)  # type: ignore
+            payload_length = _props.get_session_payld_len_max(self._handle)  # type: ignore
+        except errors.XnetError:
+            # Unknown; start small and let the conversion grow the buffer.
+            return 5 * _frames.nxFrameFixed_t.size
+        frame_size = _frames.BASE_UNIT_PAYLOAD_OFFSET + _frames._calculate_payload_size(payload_length)
+        return max(num_frames, 1) * frame_size
+
     def _convert_signals_to_bytes(self, signals, num_bytes):
         # type: (typing.Iterable[float], int) -> bytes
         buffer, number_of_bytes_returned = _funcs.nx_convert_signals_to_frames_single_point(
@@ -226,6 +317,10 @@ class SignalConversionSinglePointSession(object):
         The frame header values are filled with appropriate values so that this
         function's output can be directly written to a Frame Output session.
 
+        The output buffer is sized once from the number of frames in the
+        session and their maximum payload length, then reused; resizes are
+        counted in :any:`SignalConversionSinglePointSession.conversion_stats`.
+
         Args:
             signals(list of float): Values corresponding to signals configured
                 in this session.
@@ -235,18 +330,469 @@ class SignalConversionSinglePointSession(object):
         Yields:
             :any:`nixnet.types.Frame`
         """
-        from_raw = typing.cast(typing.Callable[[types.RawFrame], types.Frame], frame_type.from_raw)
-        # Unlike some session reads, this should be safe from asking to read too much.
-        num_frames_to_read = 5
+        # Signals may be an iterator, and a resize converts them again.
+        signals = list(signals)
+        if self._frames_size is None:
+            self._frames_size = self._required_frames_size()
         while True:
             try:
-                num_bytes_to_read = num_frames_to_read * _frames.nxFrameFixed_t.size
-                buffer = self._convert_signals_to_bytes(signals, num_bytes_to_read)
+                buffer = self._convert_signals_to_bytes(signals, self._frames_size)
                 break
             except errors.XnetError as e:
                 if e.error_type == constants.Err.BUFFER_TOO_SMALL:
-                    num_frames_to_read *= 2
+                    self._frames_size *= 2
+                    self._resizes += 1
                 else:
                     raise
-        for frame in _frames.iterate_frames(buffer):
-            yield from_raw(frame)
+        self._conversions += 1
+        yield from _frames.iterate_frames_as(buffer, frame_type)
+
+
+SignalLayout_ = collections.namedtuple(
+    'SignalLayout_',
+    ['name', 'start_bit', 'num_bits', 'byte_order', 'data_type', 'scale_fac', 'scale_off',
+     'mux_is_data_mux', 'mux_is_dynamic', 'mux_value'])
+
+
+class SignalLayout(SignalLayout_):
+    """Where a signal is in its frame's payload and how to scale it.
+
+    The fields mirror the :any:`nixnet.database._signal.Signal` properties of
+    the same name, so a layout can be read from a database with
+    :any:`SignalLayout.from_signal` or written out by hand.
+
+    Attributes:
+        name(str): Signal name, used to key decoded values.
+        start_bit(int): Least significant bit position in the frame payload.
+        num_bits(int): Signal size in bits.
+        byte_order(:any:`nixnet._enums.SigByteOrdr`): Byte order in the payload.
+        data_type(:any:`nixnet._enums.SigDataType`): How the bits are interpreted.
+        scale_fac(float): Scaling factor.
+        scale_off(float): Scaling offset.
+        mux_is_data_mux(bool): Whether this is the frame's multiplexer signal.
+        mux_is_dynamic(bool): Whether this signal is only present for one
+            multiplexer value.
+        mux_value(int): The multiplexer value of a dynamic signal.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+            cls,
+            name,  # type: typing.Text
+            start_bit,  # type: int
+            num_bits,  # type: int
+            byte_order=constants.SigByteOrdr.LITTLE_ENDIAN,  # type: constants.SigByteOrdr
+            data_type=constants.SigDataType.UNSIGNED,  # type: constants.SigDataType
+            scale_fac=1.0,  # type: float
+            scale_off=0.0,  # type: float
+            mux_is_data_mux=False,  # type: bool
+            mux_is_dynamic=False,  # type: bool
+            mux_value=0,  # type: int
+    ):
+        # type: (...) -> SignalLayout
+        return super(SignalLayout, cls).__new__(
+            cls, name, start_bit, num_bits, byte_order, data_type, scale_fac, scale_off,
+            mux_is_data_mux, mux_is_dynamic, mux_value)
+
+    @classmethod
+    def from_signal(cls, signal):
+        # type: (typing.Any) -> SignalLayout
+        """Read a layout from a :any:`nixnet.database._signal.Signal`."""
+        mux_is_dynamic = signal.mux_is_dynamic
+        return cls(
+            signal.name_unique_to_cluster,
+            signal.start_bit,
+            signal.num_bits,
+            signal.byte_ordr,
+            signal.data_type,
+            signal.scale_fac,
+            signal.scale_off,
+            signal.mux_is_data_mux,
+            mux_is_dynamic,
+            signal.mux_value if mux_is_dynamic else 0)
+
+
+FrameLayout_ = collections.namedtuple(
+    'FrameLayout_',
+    ['identifier', 'signals', 'frame_type', 'payload_length', 'default_payload'])
+
+
+class FrameLayout(FrameLayout_):
+    """The signals carried by one frame.
+
+    Attributes:
+        identifier(int): Raw frame identifier, as in
+            :any:`nixnet.types.RawFrame.identifier`.
+        signals(list of :any:`SignalLayout`): Signals in the frame.
+        frame_type(:any:`nixnet._enums.FrameType`): Frame type.
+        payload_length(int): Payload length in bytes.
+        default_payload(bytes): Payload bits not covered by a signal.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+            cls,
+            identifier,  # type: typing.Union[int, types.CanIdentifier]
+            signals,  # type: typing.Iterable[SignalLayout]
+            frame_type=constants.FrameType.CAN_DATA,  # type: constants.FrameType
+            payload_length=8,  # type: int
+            default_payload=None,  # type: typing.Optional[bytes]
+    ):
+        # type: (...) -> FrameLayout
+        if default_payload is None:
+            default_payload = bytes(payload_length)
+        return super(FrameLayout, cls).__new__(
+            cls, int(identifier), list(signals), frame_type, payload_length, bytes(default_payload))
+
+    @classmethod
+    def from_frame(cls, frame):
+        # type: (typing.Any) -> FrameLayout
+        """Read a layout from a :any:`nixnet.database._frame.Frame`."""
+        protocol = frame.cluster.protocol
+        identifier = frame.id
+        payload_length = frame.payload_len
+        if protocol == constants.Protocol.FLEX_RAY:
+            frame_type = constants.FrameType.FLEX_RAY_DATA
+        elif protocol == constants.Protocol.LIN:
+            frame_type = constants.FrameType.LIN_DATA
+        else:
+            if frame.can_ext_id:
+                identifier |= _cconsts.NX_FRAME_ID_CAN_IS_EXTENDED
+            if payload_length > _frames.MAX_BASE_UNIT_PAYLOAD_LENGTH:
+                frame_type = constants.FrameType.CANFD_DATA
+            else:
+                frame_type = constants.FrameType.CAN_DATA
+        return cls(
+            identifier,
+            [SignalLayout.from_signal(signal) for signal in frame.sigs],
+            frame_type,
+            payload_length,
+            bytes(bytearray(frame.default_payload)))
+
+
+_CompiledFrame = collections.namedtuple('_CompiledFrame', ['num_bytes', 'mux', 'mux_index', 'signals'])
+
+
+def _compile_plan(layout):
+    # type: (SignalLayout) -> _signals.SignalPlan
+    return _signals.compile_signal(
+        layout.start_bit, layout.num_bits, layout.byte_order, layout.data_type, layout.scale_fac, layout.scale_off)
+
+
+def _compile_frame(layout):
+    # type: (FrameLayout) -> _CompiledFrame
+    """Compile a frame's signals into ``(name, plan, mux_value)`` tuples."""
+    mux = mux_index = None
+    signals = []
+    for index, signal in enumerate(layout.signals):
+        plan = _compile_plan(signal)
+        if signal.mux_is_data_mux:
+            if mux is not None:
+                raise ValueError('Frame has more than one multiplexer signal', layout.identifier)
+            mux, mux_index = plan, index
+        signals.append((signal.name, plan, signal.mux_value if signal.mux_is_dynamic else None))
+    if mux is None and any(mux_value is not None for _, _, mux_value in signals):
+        raise ValueError('Frame has dynamic signals but no multiplexer signal', layout.identifier)
+    num_bytes = max([plan.num_bytes for _, plan, _ in signals] or [0])
+    return _CompiledFrame(num_bytes, mux, mux_index, signals)
+
+
+def _group_indices(keys):
+    # type: (typing.Any) -> typing.Dict[int, typing.Any]
+    """Map each value of a 1-D NumPy array to the indices holding it, in order.
+
+    Sorting once and splitting at each new value costs O(N log N), instead of
+    one O(N) comparison per key looked up.
+    """
+    numpy = _arrays.numpy
+    order = numpy.argsort(keys, kind='stable')
+    unique, starts = numpy.unique(keys[order], return_index=True)
+    ends = numpy.append(starts[1:], len(order))
+    return {
+        key: order[start:end]
+        for key, start, end in zip(unique.tolist(), starts.tolist(), ends.tolist())}
+
+
+class SignalDecoder(object):
+    """Decode signals from raw frame bytes without an NI-XNET session.
+
+    Each frame's signal layout is compiled once; after that, whole buffers of
+    frames are decoded into one time series per signal.  With NumPy installed
+    every signal is extracted with a handful of vectorized operations per
+    buffer, otherwise it falls back to pure Python.
+
+    Frames are matched by their raw identifier.  Frames too short to hold all
+    of their frame's signals are skipped, and dynamic signals only get values
+    from frames whose multiplexer signal matches their ``mux_value``.
+
+    Args:
+        frames(list of :any:`FrameLayout`): The frames to decode.
+
+    >>> decoder = SignalDecoder([FrameLayout(0x10, [
+    ...     SignalLayout('Speed', 0, 16, scale_fac=0.1),
+    ...     SignalLayout('Gear', 16, 4, data_type=constants.SigDataType.SIGNED)])])
+    >>> frames = [types.CanFrame(0x10, payload=b'\\x64\\x00\\x0F'), types.CanFrame(0x20)]
+    >>> timestamps, values = decoder.decode(frames)['Gear']
+    >>> len(timestamps), float(values[0])
+    (1, -1.0)
+    """
+
+    def __init__(self, frames):
+        # type: (typing.Iterable[FrameLayout]) -> None
+        self._frames = collections.OrderedDict()  # type: typing.Dict[int, _CompiledFrame]
+        self._signals = []  # type: typing.List[typing.Text]
+        for layout in frames:
+            if layout.identifier in self._frames:
+                raise ValueError('Duplicate frame identifier', layout.identifier)
+            compiled = _compile_frame(layout)
+            self._frames[layout.identifier] = compiled
+            self._signals.extend(name for name, _, _ in compiled.signals)
+        if len(set(self._signals)) != len(self._signals):
+            raise ValueError('Signal names must be unique', self._signals)
+
+    @classmethod
+    def from_database(cls, frames):
+        # type: (typing.Iterable[typing.Any]) -> SignalDecoder
+        """Create a decoder for :any:`nixnet.database._frame.Frame` objects.
+
+        Signals are named by
+        :any:`nixnet.database._signal.Signal.name_unique_to_cluster`.
+        """
+        return cls(FrameLayout.from_frame(frame) for frame in frames)
+
+    @property
+    def signals(self):
+        # type: () -> typing.List[typing.Text]
+        """list of str: Names of the decoded signals, in frame order."""
+        return list(self._signals)
+
+    def decode(self, frames):
+        # type: (typing.Iterable[types.Frame]) -> typing.Dict[typing.Text, typing.Tuple[typing.Any, typing.Any]]
+        """Decode frames, see :any:`SignalDecoder.decode_bytes`."""
+        return self.decode_bytes(_frames.serialize_frames(frame.to_raw() for frame in frames))
+
+    def decode_bytes(self, frame_bytes):
+        # type: (typing.Any) -> typing.Dict[typing.Text, typing.Tuple[typing.Any, typing.Any]]
+        """Decode raw bytes (frame data) into one time series per signal.
+
+        Returns:
+            dict: Maps each signal name to a ``(timestamps, values)`` pair of
+            arrays. With NumPy these are ``uint64`` and ``float64`` NumPy
+            arrays, otherwise ``array.array`` of typecodes ``'Q'`` and ``'d'``.
+        """
+        if _arrays.numpy is not None:
+            return self._decode_vectorized(frame_bytes)
+        series = collections.OrderedDict(
+            (name, (array.array('Q'), array.array('d'))) for name in self._signals)
+        compiled_frames = self._frames
+        for frame in _frames.iterate_frames(frame_bytes):
+            compiled = compiled_frames.get(frame.identifier)
+            if compiled is None or len(frame.payload) < compiled.num_bytes:
+                continue
+            payload = frame.payload
+            mux = compiled.mux
+            mux_raw = _signals.extract(payload, mux) if mux is not None else None
+            for name, plan, mux_value in compiled.signals:
+                if mux_value is not None and mux_value != mux_raw:
+                    continue
+                timestamps, values = series[name]
+                timestamps.append(frame.timestamp)
+                values.append(_signals.to_physical(_signals.extract(payload, plan), plan))
+        return series
+
+    def _decode_vectorized(self, frame_bytes):
+        # type: (typing.Any) -> typing.Dict[typing.Text, typing.Tuple[typing.Any, typing.Any]]
+        numpy = _arrays.numpy
+        data = numpy.frombuffer(frame_bytes, dtype=numpy.uint8)
+        decoded = _frames.decode_frames(frame_bytes)
+        series = collections.OrderedDict()  # type: typing.Dict[typing.Text, typing.Tuple[typing.Any, typing.Any]]
+        no_indices = numpy.empty(0, dtype=numpy.intp)
+        frame_indices = _group_indices(decoded['identifier'])
+        for identifier, compiled in self._frames.items():
+            selected = decoded[frame_indices.get(identifier, no_indices)]
+            selected = selected[selected['payload_length'] >= compiled.num_bytes]
+            payloads = _signals.gather_payloads(data, selected['payload_offset'], compiled.num_bytes)
+            timestamps = selected['timestamp']
+            mux = compiled.mux
+            if mux is not None:
+                mux_indices = _group_indices(_signals.extract_vectorized(payloads, mux))
+            for name, plan, mux_value in compiled.signals:
+                if mux_value is None:
+                    rows = payloads
+                    signal_timestamps = timestamps
+                else:
+                    present = mux_indices.get(mux_value, no_indices)
+                    rows = payloads[present]
+                    signal_timestamps = timestamps[present]
+                values = _signals.to_physical_vectorized(_signals.extract_vectorized(rows, plan), plan)
+                series[name] = (numpy.array(signal_timestamps, dtype=numpy.uint64), values)
+        return series
+
+
+class SignalEncoder(object):
+    """Encode many samples of signal values into raw frame bytes.
+
+    This is the batched counterpart of
+    :any:`SignalConversionSinglePointSession.convert_signals_to_frames`, done
+    without an NI-XNET session.  Each frame's signal layout is compiled once;
+    every sample (one value per signal) then produces one frame per
+    :any:`FrameLayout`, starting from the frame's default payload.  With NumPy
+    installed whole columns of samples are packed with vectorized operations.
+
+    Values are scaled back to raw integers by rounding and saturating to the
+    signal's range.  A dynamic signal is only written when the sample's
+    multiplexer value selects it; its column is ignored otherwise.
+
+    Args:
+        frames(list of :any:`FrameLayout`): The frames to encode.
+
+    >>> encoder = SignalEncoder([FrameLayout(0x10, [
+    ...     SignalLayout('Speed', 0, 16, scale_fac=0.1),
+    ...     SignalLayout('Gear', 16, 4, data_type=constants.SigDataType.SIGNED)], payload_length=3)])
+    >>> frames = list(encoder.encode([[10.0, -1], [25.6, 2]], timestamps=[100, 200]))
+    >>> [(frame.timestamp, frame.payload) for frame in frames]
+    [(100, b'd\\x00\\x0f'), (200, b'\\x00\\x01\\x02')]
+    """
+
+    def __init__(self, frames):
+        # type: (typing.Iterable[FrameLayout]) -> None
+        self._frames = []  # type: typing.List[typing.Tuple[FrameLayout, _CompiledFrame]]
+        self._signals = []  # type: typing.List[typing.Text]
+        for layout in frames:
+            if len(layout.default_payload) != layout.payload_length:
+                raise ValueError(
+                    'Default payload must be payload_length bytes', layout.identifier, layout.default_payload)
+            compiled = _compile_frame(layout)
+            if compiled.num_bytes > layout.payload_length:
+                raise ValueError('Signals do not fit in the frame payload', layout.identifier)
+            self._frames.append((layout, compiled))
+            self._signals.extend(name for name, _, _ in compiled.signals)
+        if len(set(self._signals)) != len(self._signals):
+            raise ValueError('Signal names must be unique', self._signals)
+
+    @classmethod
+    def from_database(cls, frames):
+        # type: (typing.Iterable[typing.Any]) -> SignalEncoder
+        """Create an encoder for :any:`nixnet.database._frame.Frame` objects.
+
+        Signals are named by
+        :any:`nixnet.database._signal.Signal.name_unique_to_cluster` and
+        frames start from :any:`nixnet.database._frame.Frame.default_payload`.
+        """
+        return cls(FrameLayout.from_frame(frame) for frame in frames)
+
+    @property
+    def signals(self):
+        # type: () -> typing.List[typing.Text]
+        """list of str: Names of the encoded signals; the column order of samples."""
+        return list(self._signals)
+
+    def encode(self, samples, timestamps=None, frame_type=types.XnetFrame):
+        # type: (typing.Any, typing.Optional[typing.Iterable[int]], typing.Type[types.FrameFactory]) -> typing.Iterable[types.Frame]  # NOQA: E501
+        """Encode samples into frames, see :any:`SignalEncoder.encode_bytes`.
+
+        Yields:
+            :any:`nixnet.types.Frame`
+        """
+        yield from _frames.iterate_frames_as(self.encode_bytes(samples, timestamps), frame_type)
+
+    def encode_bytes(self, samples, timestamps=None):
+        # type: (typing.Any, typing.Optional[typing.Iterable[int]]) -> bytes
+        """Encode samples into raw bytes (frame data).
+
+        Args:
+            samples(2-D array of float): One row per sample and one column
+                per signal, in the order of :any:`SignalEncoder.signals`.
+            timestamps(list of int): Timestamp of each sample's frames.
+                Defaults to zero.
+
+        Returns:
+            bytes: For each sample in turn, one frame per frame layout.  This
+            can be passed directly to
+            :any:`nixnet._session.frames.OutFrames.write_bytes`.
+        """
+        if _arrays.numpy is not None:
+            return self._encode_vectorized(samples, timestamps)
+        num_signals = len(self._signals)
+        identifiers = []  # type: typing.List[int]
+        frame_types = []  # type: typing.List[int]
+        payloads = []  # type: typing.List[bytearray]
+        for sample_index, sample in enumerate(samples):
+            sample = list(sample)
+            if len(sample) != num_signals:
+                raise ValueError('Each sample needs one value per signal', sample_index, sample)
+            column = 0
+            for layout, compiled in self._frames:
+                values = sample[column:column + len(compiled.signals)]
+                column += len(compiled.signals)
+                payload = bytearray(layout.default_payload)
+                mux_raw = None
+                if compiled.mux is not None:
+                    mux_raw = _signals.to_raw(values[compiled.mux_index], compiled.mux)
+                for value, (_, plan, mux_value) in zip(values, compiled.signals):
+                    if mux_value is None or mux_value == mux_raw:
+                        _signals.insert(payload, plan, _signals.to_raw(value, plan))
+                identifiers.append(layout.identifier)
+                frame_types.append(constants.FrameType(layout.frame_type).value)
+                payloads.append(payload)
+        frame_timestamps = None  # type: typing.Optional[typing.List[int]]
+        if timestamps is not None:
+            sample_timestamps = list(timestamps)
+            if len(sample_timestamps) * len(self._frames) != len(payloads):
+                raise ValueError('Each sample needs one timestamp', len(sample_timestamps))
+            frame_timestamps = [timestamp for timestamp in sample_timestamps for _ in self._frames]
+        return bytes(_frames.serialize_columns(identifiers, frame_types, payloads, frame_timestamps))
+
+    def _encode_vectorized(self, samples, timestamps):
+        # type: (typing.Any, typing.Optional[typing.Iterable[int]]) -> bytes
+        numpy = _arrays.numpy
+        samples = numpy.asarray(samples, dtype=numpy.float64)
+        if samples.size == 0:
+            samples = samples.reshape(-1, len(self._signals))
+        if samples.ndim != 2 or samples.shape[1] != len(self._signals):
+            raise ValueError('Each sample needs one value per signal', samples.shape)
+        num_samples = len(samples)
+        if timestamps is None:
+            sample_timestamps = numpy.zeros(num_samples, dtype=numpy.uint64)
+        else:
+            sample_timestamps = numpy.asarray(list(timestamps), dtype=numpy.uint64)
+            if len(sample_timestamps) != num_samples:
+                raise ValueError('Each sample needs one timestamp', len(sample_timestamps))
+
+        records = []
+        column = 0
+        for layout, compiled in self._frames:
+            values = samples[:, column:column + len(compiled.signals)]
+            column += len(compiled.signals)
+
+            frame_type = constants.FrameType(layout.frame_type).value
+            info, encoded_length = _frames._encode_payload_length(frame_type, 0, layout.payload_length)
+            header = _frames.nxFrameHeader_t.pack(0, layout.identifier, frame_type, 0, info, encoded_length)
+            record_size = _frames.BASE_UNIT_PAYLOAD_OFFSET + _frames._calculate_payload_size(layout.payload_length)
+            record = numpy.zeros((num_samples, record_size), dtype=numpy.uint8)
+            record[:, :len(header)] = numpy.frombuffer(header, dtype=numpy.uint8)
+            record[:, :8] = sample_timestamps.view(numpy.uint8).reshape(-1, 8)
+
+            payloads = numpy.tile(numpy.frombuffer(layout.default_payload, dtype=numpy.uint8), (num_samples, 1))
+            mux_raw = None
+            if compiled.mux is not None:
+                mux_raw = _signals.to_raw_vectorized(values[:, compiled.mux_index], compiled.mux)
+            for index, (_, plan, mux_value) in enumerate(compiled.signals):
+                raw = _signals.to_raw_vectorized(values[:, index], plan)
+                if mux_value is None:
+                    _signals.insert_vectorized(payloads, plan, raw)
+                else:
+                    present = mux_raw == mux_value
+                    rows = payloads[present]
+                    _signals.insert_vectorized(rows, plan, raw[present])
+                    payloads[present] = rows
+            payload_start = _frames.BASE_UNIT_PAYLOAD_OFFSET
+            record[:, payload_start:payload_start + layout.payload_length] = payloads
+            records.append(record)
+
+        if not records:
+            return b''
+        # Interleave the frames so each sample's frames are adjacent.
+        return numpy.concatenate(records, axis=1).tobytes()
@@ -0,0 +1,177 @@
+"""Select and route frames by identifier and type before decoding them.
+
+Filtering works on the raw frame bytes: only the header of each frame is
+inspected, and frames that don't match are dropped before any
+:any:`nixnet.types.Frame` object is created.
+"""
+
+import collections
+import typing  # NOQA: F401
+
+from nixnet import _arrays
+from nixnet import _frames
+from nixnet import constants
+from nixnet import types
+
+__all__ = [
+    "FrameFilter",
+    "FrameDemultiplexer"]
+
+
+class FrameFilter(object):
+    """Match frames by raw identifier and frame type.
+
+    A frame matches if its type is in ``frame_types`` and its raw identifier
+    is in ``identifiers`` or matches one of the ``masks``.  Criteria left as
+    ``None`` match every frame.
+
+    Raw identifiers are the values of :any:`nixnet.types.RawFrame.identifier`;
+    extended CAN identifiers include the extended bit, which
+    ``int(CanIdentifier(...))`` takes care of.
+
+    Args:
+        identifiers(list of int or :any:`nixnet.types.CanIdentifier`):
+            Identifiers to accept.
+        masks(list of tuple of int): ``(mask, match)`` pairs; an identifier
+            is accepted if ``identifier & mask == match & mask``.
+        frame_types(list of :any:`nixnet._enums.FrameType`): Frame types to
+            accept.
+
+    >>> frame_filter = FrameFilter(identifiers=[0x10], masks=[(0x700, 0x100)])
+    >>> frame_filter.matches(0x10, constants.FrameType.CAN_DATA)
+    True
+    >>> frame_filter.matches(0x1AB, constants.FrameType.CAN_DATA)
+    True
+    >>> frame_filter.matches(0x20, constants.FrameType.CAN_DATA)
+    False
+    """
+
+    def __init__(self, identifiers=None, masks=None, frame_types=None):
+        # type: (typing.Optional[typing.Iterable[typing.Union[int, types.CanIdentifier]]], typing.Optional[typing.Iterable[typing.Tuple[int, int]]], typing.Optional[typing.Iterable[constants.FrameType]]) -> None  # NOQA: E501
+        self._identifiers = None  # type: typing.Optional[typing.FrozenSet[int]]
+        if identifiers is not None:
+            self._identifiers = frozenset(int(identifier) for identifier in identifiers)
+        self._masks = None  # type: typing.Optional[typing.Tuple[typing.Tuple[int, int], ...]]
+        if masks is not None:
+            self._masks = tuple((mask, match & mask) for mask, match in masks)
+        self._frame_types = None  # type: typing.Optional[typing.FrozenSet[int]]
+        if frame_types is not None:
+            self._frame_types = frozenset(constants.FrameType(frame_type).value for frame_type in frame_types)
+
+    def matches(self, identifier, frame_type):
+        # type: (int, typing.Union[int, constants.FrameType]) -> bool
+        """Return whether a frame with this raw identifier and type matches."""
+        if self._frame_types is not None:
+            if getattr(frame_type, 'value', frame_type) not in self._frame_types:
+                return False
+        if self._identifiers is None and self._masks is None:
+            return True
+        if self._identifiers is not None and identifier in self._identifiers:
+            return True
+        if self._masks is not None:
+            return any(identifier & mask == match for mask, match in self._masks)
+        return False
+
+    def filter_bytes(self, frame_bytes):
+        # type: (typing.Any) -> bytes
+        """Return the raw bytes of the frames in ``frame_bytes`` that match."""
+        if _arrays.numpy is not None:
+            return self._filter_vectorized(frame_bytes)
+        kept = []
+        run_start = run_end = 0
+        for start, end, identifier, frame_type in _frames.iterate_headers(frame_bytes):
+            if self.matches(identifier, frame_type):
+                if start != run_end:
+                    kept.append(frame_bytes[run_start:run_end])
+                    run_start = start
+                run_end = end
+        kept.append(frame_bytes[run_start:run_end])
+        return b''.join(kept)
+
+    def _mask(self, identifiers, frame_types):
+        # type: (typing.Any, typing.Any) -> typing.Any
+        numpy = _arrays.numpy
+        selected = numpy.ones(len(identifiers), dtype=bool)
+        if self._frame_types is not None:
+            selected &= numpy.isin(frame_types, list(self._frame_types))
+        if self._identifiers is None and self._masks is None:
+            return selected
+        by_identifier = numpy.zeros(len(identifiers), dtype=bool)
+        if self._identifiers is not None:
+            by_identifier |= numpy.isin(identifiers, list(self._identifiers))
+        for mask, match in self._masks or ():
+            by_identifier |= (identifiers & mask) == match
+        return selected & by_identifier
+
+    def _filter_vectorized(self, frame_bytes):
+        # type: (typing.Any) -> bytes
+        numpy = _arrays.numpy
+        data = numpy.frombuffer(frame_bytes, dtype=numpy.uint8)
+        frames = _frames.decode_frames(frame_bytes)
+        selected = self._mask(frames['identifier'], frames['type'])
+        if selected.all():
+            return data.tobytes()
+        frames = frames[selected]
+        starts = frames['payload_offset'].astype(numpy.intp) - _frames.BASE_UNIT_PAYLOAD_OFFSET
+        payload_length = frames['payload_length'].astype(numpy.intp)
+        lengths = _frames.BASE_UNIT_PAYLOAD_OFFSET + numpy.maximum(
+            (payload_length + 7) // _frames.PAYLOAD_UNIT_SIZE * _frames.PAYLOAD_UNIT_SIZE,
+            _frames.MAX_BASE_UNIT_PAYLOAD_LENGTH)
+        # Gather each selected frame's bytes into one contiguous array.
+        output_starts = numpy.cumsum(lengths) - lengths
+        indices = numpy.arange(lengths.sum()) + numpy.repeat(starts - output_starts, lengths)
+        return data[indices].tobytes()
+
+
+class FrameDemultiplexer(object):
+    """Route frames from raw bytes to one queue per identifier.
+
+    Only frames whose raw identifier has a queue are decoded; everything
+    else is skipped after reading its header.
+
+    Args:
+        identifiers(list of int or :any:`nixnet.types.CanIdentifier`):
+            Identifiers to route.
+        frame_type(:any:`nixnet.types.FrameFactory`): A factory for the
+            frames put in the queues.
+        maxlen(int): If set, each queue keeps only its newest ``maxlen``
+            frames.
+
+    >>> demux = FrameDemultiplexer([0x10, 0x20])
+    >>> frames = [types.CanFrame(identifier) for identifier in (0x10, 0x30, 0x20, 0x10)]
+    >>> demux.feed(_frames.serialize_frames(frame.to_raw() for frame in frames))
+    3
+    >>> len(demux[0x10]), len(demux[0x20])
+    (2, 1)
+    """
+
+    def __init__(self, identifiers, frame_type=types.XnetFrame, maxlen=None):
+        # type: (typing.Iterable[typing.Union[int, types.CanIdentifier]], typing.Type[types.FrameFactory], typing.Optional[int]) -> None  # NOQA: E501
+        self._frame_type = frame_type
+        self._queues = collections.OrderedDict(
+            (int(identifier), collections.deque(maxlen=maxlen))
+            for identifier in identifiers)  # type: typing.Dict[int, typing.Deque[types.Frame]]
+
+    def __getitem__(self, identifier):
+        # type: (typing.Union[int, types.CanIdentifier]) -> typing.Deque[types.Frame]
+        """Return the queue of frames for a raw identifier."""
+        return self._queues[int(identifier)]
+
+    def __iter__(self):
+        return iter(self._queues)
+
+    def __len__(self):
+        return len(self._queues)
+
+    def feed(self, frame_bytes):
+        # type: (typing.Any) -> int
+        """Route the frames in raw bytes (frame data), returning how many were queued."""
+        frame_type = self._frame_type
+        queues = self._queues
+        routed = 0
+        for start, end, identifier, _ in _frames.iterate_headers(frame_bytes):
+            queue = queues.get(identifier)
+            if queue is not None:
+                queue.extend(_frames.iterate_frames_as(frame_bytes[start:end], frame_type))
+                routed += 1
+        return routed
@@ -0,0 +1,272 @@
+"""Reassemble J1939 messages from the CAN frames of a stream.
+
+J1939 sends messages longer than 8 bytes with its transport protocol: a
+connection management frame (TP.CM) announces the message, either as a
+broadcast (BAM) or as a connection to one receiver (RTS/CTS, CMDT), and
+data transfer frames (TP.DT) carry 7 bytes each.  NI-XNET reassembles these
+on J1939 sessions; :any:`J1939Reassembler` does the same for the raw CAN
+frames of a stream session or a log, in one pass.
+
+Each message is collected in a buffer allocated once at its announced size,
+so reassembly doesn't repeatedly concatenate bytes, and the number of
+messages in progress is bounded.
+"""
+
+import collections
+import typing  # NOQA: F401
+
+from nixnet import _cconsts
+from nixnet import _frames
+from nixnet import constants
+from nixnet import types
+
+__all__ = [
+    "ReassemblyStats",
+    "J1939Reassembler"]
+
+TP_CM_PGN = 0xEC00
+TP_DT_PGN = 0xEB00
+
+CM_RTS = 16
+CM_CTS = 17
+CM_EOM_ACK = 19
+CM_BAM = 32
+CM_ABORT = 255
+
+DEFAULT_TIMEOUT = 0.75
+DEFAULT_MAX_TRANSFERS = 32
+
+_BYTES_PER_PACKET = 7
+_TICKS_PER_SECOND = 10 ** 7
+
+_CAN_FRAME_TYPES = frozenset([
+    constants.FrameType.CAN_DATA,
+    constants.FrameType.CAN20_DATA,
+    constants.FrameType.CANFD_DATA,
+    constants.FrameType.CANFDBRS_DATA])
+
+
+ReassemblyStats_ = collections.namedtuple(
+    'ReassemblyStats_',
+    ['completed', 'aborted', 'timed_out', 'dropped', 'pending'])
+
+
+class ReassemblyStats(ReassemblyStats_):
+    """J1939 reassembly counters.
+
+    Attributes:
+        completed(int): Multi-packet messages reassembled.
+        aborted(int): Transfers aborted by the sender or receiver, or
+            replaced by a new announcement from the same sender.
+        timed_out(int): Transfers dropped because a packet arrived too late.
+        dropped(int): Transfers dropped to stay within ``max_transfers``.
+        pending(int): Transfers still in progress.
+    """
+
+    pass
+
+
+class _Transfer(object):
+
+    __slots__ = [
+        "pgn",
+        "priority",
+        "size",
+        "packets",
+        "data",
+        "received",
+        "count",
+        "last_timestamp"]
+
+    def __init__(self, pgn, priority, size, packets, timestamp):
+        # type: (int, int, int, int, int) -> None
+        self.pgn = pgn
+        self.priority = priority
+        self.size = size
+        self.packets = packets
+        self.data = bytearray(packets * _BYTES_PER_PACKET)
+        self.received = bytearray(packets)
+        self.count = 0
+        self.last_timestamp = timestamp
+
+
+class J1939Reassembler(object):
+    """Reassemble J1939 messages from raw CAN frames.
+
+    Feed it the frames of a CAN stream in the order received.  It yields a
+    :any:`nixnet.types.J1939Frame` for every J1939 message: single-frame
+    messages as they come, and multi-packet messages (BAM or CMDT) when
+    their last packet arrives, timestamped with that packet.  The transport
+    protocol frames themselves are consumed.  Frames with standard
+    identifiers and non-CAN frames are skipped, while
+    ``FrameType.J1939_DATA`` frames, already reassembled
+    by NI-XNET, are passed through.
+
+    Args:
+        timeout(float): Longest time, in seconds, between two packets of a
+            message before the message is dropped.  Defaults to the
+            J1939-21 T1 timeout.
+        max_transfers(int): Most messages reassembled at once.  When a new
+            one is announced, the transfer that has waited longest for a
+            packet is dropped.
+        pgns(list of int): If set, only reassemble multi-packet messages
+            with these PGNs.  Single-frame messages are always yielded.
+    """
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, max_transfers=DEFAULT_MAX_TRANSFERS, pgns=None):
+        # type: (float, int, typing.Optional[typing.Iterable[int]]) -> None
+        if max_transfers < 1:
+            raise ValueError('max_transfers must be positive', max_transfers)
+        self._timeout = int(timeout * _TICKS_PER_SECOND)
+        self._max_transfers = max_transfers
+        self._pgns = None if pgns is None else frozenset(pgns)
+        # (source address, destination address) -> transfer in progress
+        self._transfers = {}  # type: typing.Dict[typing.Tuple[int, int], _Transfer]
+        self._completed = 0
+        self._aborted = 0
+        self._timed_out = 0
+        self._dropped = 0
+
+    @property
+    def stats(self):
+        # type: () -> ReassemblyStats
+        """:any:`ReassemblyStats`: Reassembly counters."""
+        return ReassemblyStats(
+            self._completed, self._aborted, self._timed_out, self._dropped, len(self._transfers))
+
+    def reset(self):
+        # type: () -> None
+        """Drop the transfers in progress and clear the counters."""
+        self._transfers.clear()
+        self._completed = self._aborted = self._timed_out = self._dropped = 0
+
+    def feed(self, frames):
+        # type: (typing.Iterable[types.Frame]) -> typing.Iterator[types.J1939Frame]
+        """Reassemble messages from frames.
+
+        Frames are processed as the returned iterator is consumed.
+
+        Args:
+            frames(list of :any:`nixnet.types.Frame`): Frames in the order
+                received, like :any:`nixnet.types.RawFrame` or
+                :any:`nixnet.types.CanFrame`.
+
+        Yields:
+            :any:`nixnet.types.J1939Frame`
+        """
+        for frame in frames:
+            raw = frame.to_raw()
+            message = self._process(raw.timestamp, raw.identifier, raw.type, raw.flags, raw.info, raw.payload)
+            if message is not None:
+                yield message
+
+    def feed_bytes(self, frame_bytes):
+        # type: (typing.Any) -> typing.Iterator[types.J1939Frame]
+        """Reassemble messages from raw bytes (frame data).
+
+        Frames are processed as the returned iterator is consumed.
+
+        Yields:
+            :any:`nixnet.types.J1939Frame`
+        """
+        for raw in _frames.iterate_frames(frame_bytes):
+            message = self._process(raw.timestamp, raw.identifier, raw.type, raw.flags, raw.info, raw.payload)
+            if message is not None:
+                yield message
+
+    def _process(self, timestamp, identifier, frame_type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> typing.Optional[types.J1939Frame]
+        if frame_type == constants.FrameType.J1939_DATA:
+            return types.J1939Frame.from_fields(timestamp, identifier, frame_type, flags, info, payload)
+        if frame_type not in _CAN_FRAME_TYPES or not identifier & _cconsts.NX_FRAME_ID_CAN_IS_EXTENDED:
+            return None
+
+        frame = types.J1939Frame.from_fields(timestamp, identifier, frame_type, flags, info, payload)
+        if frame.pgn == TP_DT_PGN:
+            return self._data_transfer(frame)
+        if frame.pgn == TP_CM_PGN:
+            self._connection_management(frame)
+            return None
+        return frame
+
+    def _connection_management(self, frame):
+        # type: (types.J1939Frame) -> None
+        payload = frame.payload
+        if len(payload) < 8:
+            return
+        control = payload[0]
+        pgn = int.from_bytes(payload[5:8], 'little')
+        key = (frame.source_address, frame.destination_address)
+        if control == CM_ABORT:
+            # Either side can abort; the sender's transfer is keyed from its side.
+            for transfer_key in (key, (frame.destination_address, frame.source_address)):
+                transfer = self._transfers.get(transfer_key)
+                if transfer is not None and transfer.pgn == pgn:
+                    del self._transfers[transfer_key]
+                    self._aborted += 1
+        elif control == CM_BAM or control == CM_RTS:
+            if control == CM_BAM:
+                key = (frame.source_address, types.J1939Frame.GLOBAL_ADDRESS)
+            if self._pgns is not None and pgn not in self._pgns:
+                return
+            size = int.from_bytes(payload[1:3], 'little')
+            packets = payload[3]
+            if not (_BYTES_PER_PACKET < size <= types.J1939Frame.MAX_PAYLOAD_LENGTH):
+                return
+            if packets != -(-size // _BYTES_PER_PACKET):
+                return
+            if self._transfers.pop(key, None) is not None:
+                self._aborted += 1
+            self._expire(frame.timestamp)
+            if len(self._transfers) >= self._max_transfers:
+                oldest = min(self._transfers, key=lambda k: self._transfers[k].last_timestamp)
+                del self._transfers[oldest]
+                self._dropped += 1
+            self._transfers[key] = _Transfer(pgn, frame.priority, size, packets, frame.timestamp)
+        # CTS and EOM_ACK come from the receiver and don't change the data.
+
+    def _data_transfer(self, frame):
+        # type: (types.J1939Frame) -> typing.Optional[types.J1939Frame]
+        key = (frame.source_address, frame.destination_address)
+        transfer = self._transfers.get(key)
+        payload = frame.payload
+        if transfer is None or len(payload) < 2:
+            return None
+        if frame.timestamp - transfer.last_timestamp > self._timeout:
+            del self._transfers[key]
+            self._timed_out += 1
+            return None
+        transfer.last_timestamp = frame.timestamp
+
+        sequence = payload[0]
+        if not 1 <= sequence <= transfer.packets:
+            return None
+        index = sequence - 1
+        offset = index * _BYTES_PER_PACKET
+        chunk = payload[1:1 + _BYTES_PER_PACKET]
+        transfer.data[offset:offset + len(chunk)] = chunk
+        if not transfer.received[index]:
+            transfer.received[index] = 1
+            transfer.count += 1
+        if transfer.count < transfer.packets:
+            return None
+
+        del self._transfers[key]
+        self._completed += 1
+        message = types.J1939Frame(
+            transfer.pgn,
+            frame.source_address,
+            frame.destination_address,
+            transfer.priority,
+            bytes(transfer.data[:transfer.size]))
+        message.timestamp = frame.timestamp
+        return message
+
+    def _expire(self, timestamp):
+        # type: (int) -> None
+        expired = [
+            key for key, transfer in self._transfers.items()
+            if timestamp - transfer.last_timestamp > self._timeout]
+        for key in expired:
+            del self._transfers[key]
+            self._timed_out += 1
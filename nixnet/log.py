@@ -0,0 +1,424 @@
+"""Raw frame log files.
+
+A log stores frame data exactly as returned by
+:any:`nixnet._session.frames.InFrames.read_bytes`, so writing needs no
+conversion.  The file is made of:
+
+* A file header with a magic number, format version and the byte order of
+  the frame data.
+* Data blocks, each holding the bytes passed to one
+  :any:`nixnet.log.LogWriter.write_bytes` call and the timestamp of their
+  first frame.
+* Index blocks, written periodically, listing the first timestamp and file
+  offset of the preceding data blocks and linking to the previous index
+  block.
+* A trailer pointing at the last index block, written on close.
+
+:any:`nixnet.log.LogReader` memory-maps the file and only reads the index to
+open it, so large captures open immediately and can be read from any
+timestamp.  :any:`nixnet.log.TimestampIndex` provides the same kind of
+time-window queries over a capture held in memory.  A log that was not closed (for example after a crash) has no
+trailer; its blocks are then found by walking the block headers.
+"""
+
+import array
+import bisect
+import mmap
+import struct
+import sys
+import typing  # NOQA: F401
+
+from nixnet import _arrays
+from nixnet import _frames
+from nixnet import constants  # NOQA: F401
+from nixnet import types
+
+__all__ = [
+    "LogWriter",
+    "LogReader",
+    "TimestampIndex"]
+
+FILE_MAGIC = b'NXLOG\0\0\0'
+TRAILER_MAGIC = b'NXLOGEND'
+VERSION = 1
+DATA_BLOCK = b'DATA'
+INDEX_BLOCK = b'INDX'
+DEFAULT_INDEX_INTERVAL = 64
+
+_BYTE_ORDERS = {'little': 0, 'big': 1}
+
+_FILE_HEADER = struct.Struct('<8sHB5x')
+_BLOCK_HEADER = struct.Struct('<4sIQ')
+_INDEX_ENTRY = struct.Struct('<QQ')
+_TRAILER = struct.Struct('<8sQ')
+_TIMESTAMP = struct.Struct('=Q')
+
+
+class LogWriter(object):
+    """Append raw frame data to a log file.
+
+    Args:
+        path(str): File to create. An existing file is overwritten.
+        index_interval(int): Number of data blocks between index blocks.
+    """
+
+    def __init__(self, path, index_interval=DEFAULT_INDEX_INTERVAL):
+        # type: (typing.Text, int) -> None
+        if index_interval < 1:
+            raise ValueError('index_interval must be at least 1', index_interval)
+        self._index_interval = index_interval
+        self._file = open(path, 'wb')
+        self._file.write(_FILE_HEADER.pack(FILE_MAGIC, VERSION, _BYTE_ORDERS[sys.byteorder]))
+        self._offset = _FILE_HEADER.size
+        self._entries = []  # type: typing.List[typing.Tuple[int, int]]
+        self._last_index = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    @property
+    def closed(self):
+        # type: () -> bool
+        """bool: Whether the log has been closed."""
+        return self._file.closed
+
+    def write_bytes(self, frame_bytes):
+        # type: (typing.Any) -> None
+        """Append raw bytes (frame data) as one data block.
+
+        Args:
+            frame_bytes(bytes-like): Whole frames in the Raw Frame Format,
+                such as the result of
+                :any:`nixnet._session.frames.InFrames.read_bytes`.
+        """
+        frame_bytes = memoryview(frame_bytes)
+        if not frame_bytes.nbytes:
+            return
+        timestamp = _TIMESTAMP.unpack_from(frame_bytes)[0]
+        self._entries.append((timestamp, self._offset))
+        self._write_block(DATA_BLOCK, timestamp, frame_bytes)
+        if len(self._entries) >= self._index_interval:
+            self._write_index()
+
+    def write(self, frames):
+        # type: (typing.Iterable[types.Frame]) -> None
+        """Append frames as one data block."""
+        self.write_bytes(_frames.serialize_frames(frame.to_raw() for frame in frames))
+
+    def flush(self):
+        # type: () -> None
+        """Flush written blocks to the operating system."""
+        self._file.flush()
+
+    def close(self):
+        # type: () -> None
+        """Write the final index block and trailer and close the file."""
+        if self._file.closed:
+            return
+        self._write_index()
+        self._file.write(_TRAILER.pack(TRAILER_MAGIC, self._last_index))
+        self._file.close()
+
+    def _write_block(self, kind, value, payload):
+        # type: (bytes, int, typing.Any) -> None
+        length = memoryview(payload).nbytes
+        self._file.write(_BLOCK_HEADER.pack(kind, length, value))
+        self._file.write(payload)
+        self._offset += _BLOCK_HEADER.size + length
+
+    def _write_index(self):
+        # type: () -> None
+        if not self._entries:
+            return
+        payload = b''.join(_INDEX_ENTRY.pack(*entry) for entry in self._entries)
+        offset = self._offset
+        self._write_block(INDEX_BLOCK, self._last_index, payload)
+        self._last_index = offset
+        self._entries = []
+
+
+class LogReader(object):
+    """Read a log file written by :any:`nixnet.log.LogWriter`.
+
+    The file is memory-mapped; blocks are only read when iterated.  Iterating
+    the reader yields :any:`nixnet.types.XnetFrame` frames.
+
+    Args:
+        path(str): Log file to open.
+    """
+
+    def __init__(self, path):
+        # type: (typing.Text) -> None
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError('Not a NI-XNET log file', path)
+        try:
+            self._check_header(path)
+            self._timestamps, self._offsets = self._load_index()
+        except ValueError:
+            self.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exception_type, exception_value, traceback):
+        self.close()
+
+    def __iter__(self):
+        return self.frames()
+
+    @property
+    def num_blocks(self):
+        # type: () -> int
+        """int: Number of data blocks in the log."""
+        return len(self._offsets)
+
+    @property
+    def block_timestamps(self):
+        # type: () -> typing.List[int]
+        """list of int: Timestamp of the first frame of each data block."""
+        return list(self._timestamps)
+
+    def close(self):
+        # type: () -> None
+        """Close the file."""
+        self._map.close()
+        self._file.close()
+
+    def blocks(self, start_timestamp=None):
+        # type: (typing.Optional[int]) -> typing.Iterator[bytes]
+        """Yield the raw bytes (frame data) of each data block.
+
+        Args:
+            start_timestamp(int): If set, start at the last block beginning
+                before this timestamp, which may hold the first frames at
+                or after it.
+        """
+        first = self._find_block(start_timestamp) if start_timestamp is not None else 0
+        for offset in self._offsets[first:]:
+            _, length, _ = _BLOCK_HEADER.unpack_from(self._map, offset)
+            start = offset + _BLOCK_HEADER.size
+            yield self._map[start:start + length]
+
+    def frames(self, start_timestamp=None, frame_type=types.XnetFrame):
+        # type: (typing.Optional[int], typing.Type[types.FrameFactory]) -> typing.Iterator[types.Frame]
+        """Yield the logged frames.
+
+        Args:
+            start_timestamp(int): If set, skip frames before this timestamp.
+            frame_type(:any:`nixnet.types.FrameFactory`): A factory for the
+                desired frame formats.
+        """
+        for block in self.blocks(start_timestamp):
+            for frame in _frames.iterate_frames_as(block, frame_type):
+                if start_timestamp is not None and frame.timestamp < start_timestamp:
+                    continue
+                yield frame
+
+    def batches(self, start_timestamp=None, frame_type=types.XnetFrame):
+        # type: (typing.Optional[int], typing.Type[types.FrameFactory]) -> typing.Iterator[types.FrameBatch]
+        """Yield one :any:`nixnet.types.FrameBatch` per data block.
+
+        ``start_timestamp`` selects the first block, as in
+        :any:`nixnet.log.LogReader.blocks`.
+        """
+        for block in self.blocks(start_timestamp):
+            yield _frames.parse_batch(block, frame_type)
+
+    def arrays(self, start_timestamp=None):
+        # type: (typing.Optional[int]) -> typing.Iterator[typing.Tuple[typing.Any, bytes]]
+        """Yield one NumPy structured array per data block.
+
+        Each item is the array and the block bytes its payload offsets refer
+        to, as returned by :any:`nixnet._session.frames.InFrames.read_array`.
+        ``start_timestamp`` selects the first block, as in
+        :any:`nixnet.log.LogReader.blocks`.
+
+        .. note:: This requires NumPy to be installed.
+        """
+        _arrays.require_numpy()
+        for block in self.blocks(start_timestamp):
+            yield _frames.decode_frames(block), block
+
+    def window_blocks(self, start_timestamp, end_timestamp):
+        # type: (int, int) -> typing.Iterator[bytes]
+        """Yield the raw bytes of the frames from ``start_timestamp`` up to, not including, ``end_timestamp``.
+
+        The index locates the first block; only the frame headers of the
+        blocks at the edges of the window are scanned.  Frames are assumed to
+        be in timestamp order.  Each item holds the frames of one block.
+        """
+        first = self._find_block(start_timestamp)
+        for index in range(first, len(self._offsets)):
+            if end_timestamp <= self._timestamps[index]:
+                break
+            offset = self._offsets[index]
+            _, length, _ = _BLOCK_HEADER.unpack_from(self._map, offset)
+            block = memoryview(self._map[offset + _BLOCK_HEADER.size:offset + _BLOCK_HEADER.size + length])
+            start = _frames.find_timestamp(block, start_timestamp) if index == first else 0
+            end = _frames.find_timestamp(block, end_timestamp, start)
+            if start != end:
+                yield block[start:end].tobytes()
+
+    def window(self, start_timestamp, end_timestamp, frame_type=types.XnetFrame):
+        # type: (int, int, typing.Type[types.FrameFactory]) -> typing.Iterator[types.Frame]
+        """Yield the frames from ``start_timestamp`` up to, not including, ``end_timestamp``.
+
+        See :any:`nixnet.log.LogReader.window_blocks`.
+        """
+        for block in self.window_blocks(start_timestamp, end_timestamp):
+            yield from _frames.iterate_frames_as(block, frame_type)
+
+    def _find_block(self, timestamp):
+        # type: (int) -> int
+        # The last block starting before ``timestamp``: the frames at
+        # ``timestamp`` may begin at the end of that block rather than in a
+        # later block starting at the same timestamp.
+        return max(bisect.bisect_left(self._timestamps, timestamp) - 1, 0)
+
+    def _check_header(self, path):
+        # type: (typing.Text) -> None
+        if len(self._map) < _FILE_HEADER.size:
+            raise ValueError('Not a NI-XNET log file', path)
+        magic, version, byte_order = _FILE_HEADER.unpack_from(self._map)
+        if magic != FILE_MAGIC:
+            raise ValueError('Not a NI-XNET log file', path)
+        if version != VERSION:
+            raise ValueError('Unsupported NI-XNET log version', version)
+        if byte_order != _BYTE_ORDERS[sys.byteorder]:
+            raise ValueError('NI-XNET log was written with a different byte order', path)
+
+    def _load_index(self):
+        # type: () -> typing.Tuple[typing.List[int], typing.List[int]]
+        size = len(self._map)
+        if _FILE_HEADER.size + _TRAILER.size <= size:
+            magic, last_index = _TRAILER.unpack_from(self._map, size - _TRAILER.size)
+            if magic == TRAILER_MAGIC:
+                return self._read_index_blocks(last_index)
+        return self._scan_blocks(size)
+
+    def _read_index_blocks(self, offset):
+        # type: (int) -> typing.Tuple[typing.List[int], typing.List[int]]
+        chunks = []
+        while offset:
+            _, length, previous = _BLOCK_HEADER.unpack_from(self._map, offset)
+            start = offset + _BLOCK_HEADER.size
+            chunks.append(list(_INDEX_ENTRY.iter_unpack(self._map[start:start + length])))
+            offset = previous
+        entries = [entry for chunk in reversed(chunks) for entry in chunk]
+        return [entry[0] for entry in entries], [entry[1] for entry in entries]
+
+    def _scan_blocks(self, size):
+        # type: (int) -> typing.Tuple[typing.List[int], typing.List[int]]
+        timestamps = []
+        offsets = []
+        offset = _FILE_HEADER.size
+        while offset + _BLOCK_HEADER.size <= size:
+            kind, length, value = _BLOCK_HEADER.unpack_from(self._map, offset)
+            end = offset + _BLOCK_HEADER.size + length
+            if kind not in (DATA_BLOCK, INDEX_BLOCK) or size < end:
+                # Truncated by an interrupted write.
+                break
+            if kind == DATA_BLOCK:
+                timestamps.append(value)
+                offsets.append(offset)
+            offset = end
+        return timestamps, offsets
+
+
+class TimestampIndex(object):
+    """Index of a frame buffer by timestamp, for time-window queries.
+
+    Building the index walks the buffer once, recording the offset of the
+    first frame in each ``interval`` of timestamps.  Queries then bisect the
+    index and only scan the frames of the intervals at the edges of the
+    window.  Frames are assumed to be in timestamp order, as they are when
+    read from a stream session.
+
+    Args:
+        buffer(bytes-like): Raw bytes (frame data), such as the result of
+            :any:`nixnet._session.frames.InFrames.read_bytes`.
+        interval(int): Timestamp interval between index entries, in the
+            units of the frame timestamps (100 ns).
+
+    Attributes:
+        timestamps(array.array): Timestamp of each indexed frame.
+        offsets(array.array): Offset of each indexed frame in the buffer.
+
+    >>> frames = [types.RawFrame(t, 0, constants.FrameType.CAN_DATA, 0, 0, b'') for t in range(0, 100, 10)]
+    >>> index = TimestampIndex(_frames.serialize_frames(frames), interval=30)
+    >>> list(index.timestamps)
+    [0, 30, 60, 90]
+    >>> [frame.timestamp for frame in index.window(25, 55, types.RawFrame)]
+    [30, 40, 50]
+    """
+
+    def __init__(self, buffer, interval):
+        # type: (typing.Any, int) -> None
+        if interval < 1:
+            raise ValueError('interval must be at least 1', interval)
+        self._buffer = buffer
+        self._interval = interval
+        self.timestamps = array.array('Q')
+        self.offsets = array.array('Q')
+        if _arrays.numpy is not None:
+            self._build_vectorized()
+        else:
+            self._build()
+
+    @property
+    def interval(self):
+        # type: () -> int
+        """int: Timestamp interval between index entries."""
+        return self._interval
+
+    def span(self, start_timestamp, end_timestamp):
+        # type: (int, int) -> typing.Tuple[int, int]
+        """Return the byte range of the frames from ``start_timestamp`` up to, not including, ``end_timestamp``."""
+        start = _frames.find_timestamp(self._buffer, start_timestamp, self._scan_from(start_timestamp))
+        end = _frames.find_timestamp(self._buffer, end_timestamp, max(self._scan_from(end_timestamp), start))
+        return start, end
+
+    def window_bytes(self, start_timestamp, end_timestamp):
+        # type: (int, int) -> memoryview
+        """Return the raw bytes of the frames in a window without copying."""
+        start, end = self.span(start_timestamp, end_timestamp)
+        return memoryview(self._buffer)[start:end]
+
+    def window(self, start_timestamp, end_timestamp, frame_type=types.XnetFrame):
+        # type: (int, int, typing.Type[types.FrameFactory]) -> typing.Iterator[types.Frame]
+        """Yield the frames from ``start_timestamp`` up to, not including, ``end_timestamp``."""
+        yield from _frames.iterate_frames_as(self.window_bytes(start_timestamp, end_timestamp), frame_type)
+
+    def _scan_from(self, timestamp):
+        # type: (int) -> int
+        index = bisect.bisect_right(self.timestamps, timestamp) - 1
+        return self.offsets[index] if 0 <= index else 0
+
+    def _build(self):
+        # type: () -> None
+        last_bin = None
+        for offset, timestamp in _frames.iterate_base_units(self._buffer):
+            timestamp_bin = timestamp // self._interval
+            if timestamp_bin != last_bin:
+                self.timestamps.append(timestamp)
+                self.offsets.append(offset)
+                last_bin = timestamp_bin
+
+    def _build_vectorized(self):
+        # type: () -> None
+        numpy = _arrays.numpy
+        frames = _frames.decode_frames(self._buffer)
+        bins = frames['timestamp'] // self._interval
+        first_in_bin = numpy.ones(len(bins), dtype=bool)
+        first_in_bin[1:] = bins[1:] != bins[:-1]
+        self.timestamps.frombytes(frames['timestamp'][first_in_bin].astype('=u8').tobytes())
+        offsets = frames['payload_offset'][first_in_bin] - _frames.BASE_UNIT_PAYLOAD_OFFSET
+        self.offsets.frombytes(offsets.astype('=u8').tobytes())
@@ -1,6 +1,8 @@
 import typing  # NOQA: F401
 
 from nixnet import _funcs
+from nixnet import _props
+from nixnet import _reader
 from nixnet import _utils
 from nixnet import constants
 
@@ -17,7 +19,9 @@ __all__ = [
     "FrameInSinglePointSession",
     "FrameOutSinglePointSession",
     "SignalInSinglePointSession",
-    "SignalOutSinglePointSession"]
+    "SignalOutSinglePointSession",
+    "SignalInWaveformSession",
+    "SignalInXYSession"]
 
 
 class FrameInStreamSession(base.SessionBase):
@@ -83,6 +87,7 @@ class FrameInStreamSession(base.SessionBase):
             interface_name,
             constants.CreateSessionMode.FRAME_IN_STREAM)
         self._frames = session_frames.InFrames(self._handle)  # type: ignore
+        self._reader = None  # type: typing.Optional[_reader.BackgroundReader]
 
     @property
     def frames(self):
@@ -90,6 +95,51 @@ class FrameInStreamSession(base.SessionBase):
         """:any:`nixnet._session.frames.InFrames`: Operate on session's frames"""
         return self._frames
 
+    @property
+    def background_reader(self):
+        # type: () -> typing.Optional[_reader.BackgroundReader]
+        """:any:`nixnet._reader.BackgroundReader`: The running background reader, if any."""
+        return self._reader
+
+    def start_background_reader(
+            self,
+            capacity=_reader.DEFAULT_CAPACITY,
+            chunk_size=_reader.DEFAULT_CHUNK_SIZE,
+            poll_interval=_reader.DEFAULT_POLL_INTERVAL):
+        # type: (int, int, float) -> _reader.BackgroundReader
+        """Start draining the driver queue from a background thread.
+
+        The thread copies received frames into a ring buffer of ``capacity``
+        bytes, reading up to ``chunk_size`` bytes per driver call, so the
+        driver queue does not overflow while the application is busy.  Read
+        frames from the returned :any:`nixnet._reader.BackgroundReader`
+        rather than from :any:`nixnet.session.FrameInStreamSession.frames`.
+
+        The reader is stopped when the session closes.
+
+        Args:
+            capacity(int): Size of the ring buffer in bytes.
+            chunk_size(int): Most bytes read per driver call.
+            poll_interval(float): Seconds to sleep when no frames are pending.
+
+        Returns:
+            :any:`nixnet._reader.BackgroundReader`
+        """
+        if self._reader is not None and self._reader.running:
+            raise RuntimeError('A background reader is already running for this session')
+        self._reader = _reader.BackgroundReader(self._handle, capacity, chunk_size, poll_interval)  # type: ignore
+        return self._reader
+
+    def close(self):
+        # type: () -> None
+        """Close (clear) the XNET session, stopping any background reader.
+
+        See :any:`nixnet._session.base.SessionBase.close`.
+        """
+        if self._reader is not None:
+            self._reader.stop()
+        base.SessionBase.close(self)
+
 
 class FrameOutStreamSession(base.SessionBase):
     """Frame Output Stream session.
@@ -622,6 +672,148 @@ class SignalOutSinglePointSession(base.SessionBase):
         return self._signals
 
 
+class SignalInWaveformSession(base.SessionBase):
+    """Signal Input Waveform session.
+
+    Using the time when the signal frame is received, this session resamples
+    the signal data to a waveform with a fixed sample rate, set by
+    :any:`SignalInWaveformSession.resamp_rate`.
+
+    Use :any:`nixnet._session.signals.WaveformInSignals.read` for this session.
+
+    .. note:: Typical use case: Synchronizing signal data with analog
+       acquisition at a common sample rate.
+    """
+
+    def __init__(
+            self,
+            interface_name,  # type: typing.Text
+            database_name,  # type: typing.Text
+            cluster_name,  # type: typing.Text
+            signals,  # type: typing.Union[typing.Text, typing.List[typing.Text]]
+    ):
+        # type: (...) -> None
+        """Create a Signal Input Waveform session.
+
+        This function creates a Signal Input Waveform session using the named
+        references to database objects.
+
+        Args:
+            interface_name(str): XNET Interface name to use for
+                this session.
+            database_name(str): XNET database name to use for
+                interface configuration. The database name must use the <alias>
+                or <filepath> syntax (refer to Databases).
+            cluster_name(str): XNET cluster name to use for
+                interface configuration. The name must specify a cluster from
+                the database given in the database_name parameter. If it is left
+                blank, the cluster is extracted from the ``signals`` parameter.
+            signals(list of str): Strings describing signals for the session. The
+                list syntax is as follows:
+
+                ``signals`` contains one or more XNET Signal names. Each name must
+                be one of the following options, whichever uniquely
+                identifies a signal within the database given:
+
+                    - ``<Signal>``
+                    - ``<Frame>.<Signal>``
+                    - ``<Cluster>.<Frame>.<Signal>``
+                    - ``<PDU>.<Signal>``
+                    - ``<Cluster>.<PDU>.<Signal>``
+        """
+        flattened_list = _utils.flatten_items(signals)
+        base.SessionBase.__init__(
+            self,
+            database_name,
+            cluster_name,
+            flattened_list,
+            interface_name,
+            constants.CreateSessionMode.SIGNAL_IN_WAVEFORM)
+        self._signals = session_signals.WaveformInSignals(self._handle)  # type: ignore
+
+    @property
+    def signals(self):
+        # type: () -> session_signals.WaveformInSignals
+        """:any:`nixnet._session.signals.WaveformInSignals`: Operate on session's signals"""
+        return self._signals
+
+    @property
+    def resamp_rate(self):
+        # type: () -> float
+        """float: Get or set the rate, in Hertz, that signal values are resampled at."""
+        return _props.get_session_resamp_rate(self._handle)  # type: ignore
+
+    @resamp_rate.setter
+    def resamp_rate(self, value):
+        # type: (float) -> None
+        _props.set_session_resamp_rate(self._handle, value)  # type: ignore
+
+
+class SignalInXYSession(base.SessionBase):
+    """Signal Input XY session.
+
+    This session returns every value received for each signal, each with the
+    timestamp of the frame it was received in.
+
+    Use :any:`nixnet._session.signals.XYInSignals.read` for this session.
+
+    .. note:: Typical use case: Analyzing signal values as they were
+       received, such as logging or measuring the timing of a signal.
+    """
+
+    def __init__(
+            self,
+            interface_name,  # type: typing.Text
+            database_name,  # type: typing.Text
+            cluster_name,  # type: typing.Text
+            signals,  # type: typing.Union[typing.Text, typing.List[typing.Text]]
+    ):
+        # type: (...) -> None
+        """Create a Signal Input XY session.
+
+        This function creates a Signal Input XY session using the named
+        references to database objects.
+
+        Args:
+            interface_name(str): XNET Interface name to use for
+                this session.
+            database_name(str): XNET database name to use for
+                interface configuration. The database name must use the <alias>
+                or <filepath> syntax (refer to Databases).
+            cluster_name(str): XNET cluster name to use for
+                interface configuration. The name must specify a cluster from
+                the database given in the database_name parameter. If it is left
+                blank, the cluster is extracted from the ``signals`` parameter.
+            signals(list of str): Strings describing signals for the session. The
+                list syntax is as follows:
+
+                ``signals`` contains one or more XNET Signal names. Each name must
+                be one of the following options, whichever uniquely
+                identifies a signal within the database given:
+
+                    - ``<Signal>``
+                    - ``<Frame>.<Signal>``
+                    - ``<Cluster>.<Frame>.<Signal>``
+                    - ``<PDU>.<Signal>``
+                    - ``<Cluster>.<PDU>.<Signal>``
+        """
+        flattened_list = _utils.flatten_items(signals)
+        base.SessionBase.__init__(
+            self,
+            database_name,
+            cluster_name,
+            flattened_list,
+            interface_name,
+            constants.CreateSessionMode.SIGNAL_IN_XY)
+        self._signals = session_signals.XYInSignals(self._handle)  # type: ignore
+
+    @property
+    def signals(self):
+        # type: () -> session_signals.XYInSignals
+        """:any:`nixnet._session.signals.XYInSignals`: Operate on session's signals"""
+        return self._signals
+
+
 def create_session_by_ref(
         database_refs,
         interface_name,
@@ -632,24 +824,17 @@ def create_session_by_ref(
 def read_signal_waveform(
         session_ref,
         timeout,
-        start_time,
-        delta_time,
-        value_buffer,
-        size_of_value_buffer,
-        number_of_values_returned):
-    raise NotImplementedError("Placeholder")
+        value_buffer):
+    return _funcs.nx_read_signal_waveform(session_ref, timeout, value_buffer)
 
 
 def read_signal_xy(
         session_ref,
         time_limit,
         value_buffer,
-        size_of_value_buffer,
         timestamp_buffer,
-        size_of_timestamp_buffer,
-        num_pairs_buffer,
-        size_of_num_pairs_buffer):
-    raise NotImplementedError("Placeholder")
+        num_pairs_buffer):
+    _funcs.nx_read_signal_xy(session_ref, time_limit, value_buffer, timestamp_buffer, num_pairs_buffer)
 
 
 def write_signal_waveform(
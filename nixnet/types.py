@@ -1,4 +1,5 @@
 import abc
+import array
 import collections
 import typing  # NOQA: F401
 
@@ -18,14 +19,22 @@ __all__ = [
     'RawFrame',
     'CanFrame',
     'CanBusErrorFrame',
+    'J1939Frame',
+    'FlexRayFrame',
+    'FlexRayNullFrame',
+    'FlexRaySymbolFrame',
     'LinFrame',
     'LinBusErrorFrame',
     'DelayFrame',
     'LogTriggerFrame',
     'StartTriggerFrame',
     'XnetFrame',
+    'FrameBatch',
     'PduProperties']
 
+# Raw frame type value -> FrameType, without going through the Enum constructor.
+_FRAME_TYPES = {frame_type.value: frame_type for frame_type in constants.FrameType}
+
 
 DriverVersion_ = collections.namedtuple(
     'DriverVersion_',
@@ -273,6 +282,44 @@ class FrameFactory(object):
         """Convert from RawFrame."""
         pass
 
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> typing.Any
+        """Create a frame from the fields of a raw frame.
+
+        Frame decoders call this rather than ``from_raw`` so a factory can
+        skip building the intermediate :any:`nixnet.types.RawFrame`.  By
+        default, it builds one and calls ``from_raw``.
+        """
+        return cls.from_raw(RawFrame(timestamp, identifier, type, flags, info, payload))
+
+
+def _decoder(factory):
+    # type: (typing.Type[FrameFactory]) -> typing.Callable[..., typing.Any]
+    """Return the callable that creates ``factory`` frames from the fields of a raw frame.
+
+    This is ``factory.from_fields``, unless ``factory`` overrides ``from_raw``
+    in a subclass of the class that defines its ``from_fields``.  That
+    ``from_fields`` would skip the override, so frames go through ``from_raw``.
+
+    >>> class EchoFrame(CanFrame):
+    ...     @classmethod
+    ...     def from_raw(cls, frame):
+    ...         return 'echo'
+    >>> _decoder(CanFrame) == CanFrame.from_fields, _decoder(EchoFrame)(0, 1, constants.FrameType.CAN_DATA, 0, 0, b'')
+    (True, 'echo')
+    """
+    for klass in factory.__mro__:
+        if 'from_fields' in vars(klass):
+            return factory.from_fields
+        if 'from_raw' in vars(klass):
+            break
+    from_raw = factory.from_raw
+
+    def from_fields(timestamp, identifier, type, flags, info, payload):
+        return from_raw(RawFrame(timestamp, identifier, type, flags, info, payload))
+    return from_fields
+
 
 @six.add_metaclass(abc.ABCMeta)
 class Frame(FrameFactory):
@@ -342,6 +389,12 @@ class RawFrame(Frame):
         """Convert from RawFrame."""
         return frame
 
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> RawFrame
+        """Create a RawFrame from its fields."""
+        return RawFrame(timestamp, identifier, type, flags, info, payload)
+
     def to_raw(self):
         """Convert to RawFrame."""
         return self
@@ -427,10 +480,28 @@ class CanFrame(Frame):
         >>> CanFrame.from_raw(raw)
         CanFrame(CanIdentifier(0x1, extended=True), echo=True, timestamp=0x5)
         """
-        identifier = CanIdentifier.from_raw(frame.identifier)
-        can_frame = CanFrame(identifier, constants.FrameType(frame.type), frame.payload)
-        can_frame.timestamp = frame.timestamp
-        can_frame.echo = bool(frame.flags & _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO)
+        return cls.from_fields(
+            frame.timestamp, frame.identifier, constants.FrameType(frame.type), frame.flags, frame.info, frame.payload)
+
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> CanFrame
+        """Create a CanFrame from the fields of a raw frame.
+
+        >>> CanFrame.from_fields(5, 0x20000001, constants.FrameType.CAN_DATA, 0, 0, b'\x01')
+        CanFrame(CanIdentifier(0x1, extended=True), timestamp=0x5, len(payload)=1)
+        """
+        # Skip __init__: the fields are already parsed, and this is the hot
+        # path for every CAN frame read.
+        can_frame = object.__new__(cls)
+        if identifier & _cconsts.NX_FRAME_ID_CAN_IS_EXTENDED:
+            can_frame.identifier = CanIdentifier(identifier & CanIdentifier._EXTENDED_FRAME_ID_MASK, True)
+        else:
+            can_frame.identifier = CanIdentifier(identifier & CanIdentifier._FRAME_ID_MASK)
+        can_frame.echo = bool(flags & _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO)
+        can_frame._type = type
+        can_frame.timestamp = timestamp
+        can_frame.payload = payload
         return can_frame
 
     def to_raw(self):
@@ -597,6 +668,436 @@ class CanBusErrorFrame(Frame):
             self.rx_err_count)
 
 
+class J1939Frame(Frame):
+    """J1939 Frame.
+
+    A J1939 message, with a payload of up to
+    ``J1939Frame.MAX_PAYLOAD_LENGTH`` bytes.  Messages longer than 8
+    bytes are reassembled by NI-XNET on J1939 sessions, or from the
+    transport protocol frames of a CAN stream by
+    :any:`nixnet.j1939.J1939Reassembler`.
+
+    Attributes:
+        pgn(int): Parameter Group Number.
+        source_address(int): Address of the sender.
+        destination_address(int): Address of the receiver, or
+            ``J1939Frame.GLOBAL_ADDRESS`` for broadcasts.  PDU2 format
+            PGNs (PF of 240 and above) are always broadcast.
+        priority(int): Message priority, 0 (highest) to 7 (lowest).
+        echo(bool): If the frame is an echo of a successful
+            transmit rather than being received from the network.
+        timestamp(int): Absolute time the XNET interface received the end-of-frame.
+        payload(bytes): Payload.
+    """
+
+    __slots__ = [
+        "pgn",
+        "source_address",
+        "destination_address",
+        "priority",
+        "echo",
+        "timestamp",
+        "payload"]
+
+    GLOBAL_ADDRESS = 0xFF
+    DEFAULT_PRIORITY = 6
+    MAX_PAYLOAD_LENGTH = 1785
+    _PDU2_FORMAT = 240
+
+    def __init__(
+            self,
+            pgn,  # type: int
+            source_address,  # type: int
+            destination_address=GLOBAL_ADDRESS,  # type: int
+            priority=DEFAULT_PRIORITY,  # type: int
+            payload=b"",  # type: bytes
+    ):
+        # type: (...) -> None
+        self.pgn = pgn
+        self.source_address = source_address
+        self.destination_address = destination_address
+        self.priority = priority
+        self.echo = False  # Used only for Read
+        self.timestamp = 0  # Used only for Read
+        self.payload = payload
+
+    @classmethod
+    def from_raw(cls, frame):
+        """Convert from RawFrame.
+
+        >>> raw = RawFrame(5, 0x38FEF100 | 0x20000000, constants.FrameType.J1939_DATA, 0, 0, b'\\x01')
+        >>> J1939Frame.from_raw(raw)
+        J1939Frame(pgn=0xfef1, source_address=0x0, priority=6, timestamp=0x5, len(payload)=1)
+        """
+        return cls.from_fields(frame.timestamp, frame.identifier, frame.type, frame.flags, frame.info, frame.payload)
+
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> J1939Frame
+        """Create a J1939Frame from the fields of a raw frame.
+
+        >>> J1939Frame.from_fields(5, 0x18EA2100, constants.FrameType.J1939_DATA, 0, 0, b'')
+        J1939Frame(pgn=0xea00, source_address=0x0, destination_address=0x21, priority=6, timestamp=0x5)
+        """
+        pdu_format = identifier >> 16 & 0xFF
+        if pdu_format < cls._PDU2_FORMAT:
+            pgn = identifier >> 8 & 0x3FF00
+            destination_address = identifier >> 8 & 0xFF
+        else:
+            pgn = identifier >> 8 & 0x3FFFF
+            destination_address = cls.GLOBAL_ADDRESS
+        j1939_frame = cls(pgn, identifier & 0xFF, destination_address, identifier >> 26 & 0x7, payload)
+        j1939_frame.echo = bool(flags & _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO)
+        j1939_frame.timestamp = timestamp
+        return j1939_frame
+
+    @property
+    def identifier(self):
+        # type: () -> int
+        """int: The 29-bit CAN identifier carrying the priority, PGN and addresses.
+
+        >>> hex(J1939Frame(0xEA00, 0x00, 0x21).identifier)
+        '0x18ea2100'
+        >>> hex(J1939Frame(0xFEF1, 0x00, 0x21).identifier)
+        '0x18fef100'
+        """
+        identifier = self.priority << 26 | self.source_address
+        if (self.pgn >> 8 & 0xFF) < self._PDU2_FORMAT:
+            return identifier | (self.pgn & 0x3FF00) << 8 | self.destination_address << 8
+        return identifier | (self.pgn & 0x3FFFF) << 8
+
+    def to_raw(self):
+        """Convert to RawFrame.
+
+        >>> J1939Frame(0xFEF1, 0x00, payload=b'\\x01').to_raw()
+        RawFrame(timestamp=0x0, identifier=0x38fef100, type=FrameType.J1939_DATA, len(payload)=1)
+        """
+        in_range = all((
+            0 <= self.priority <= 7,
+            0 <= self.pgn <= 0x3FFFF,
+            0 <= self.source_address <= 0xFF,
+            0 <= self.destination_address <= 0xFF))
+        if not in_range:
+            _errors.check_for_error(_cconsts.NX_ERR_UNDEFINED_FRAME_ID)
+        if len(self.payload) > self.MAX_PAYLOAD_LENGTH:
+            _errors.check_for_error(_cconsts.NX_ERR_FRAME_WRITE_TOO_LARGE)
+        flags = 0
+        if self.echo:
+            flags |= _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO
+        identifier = self.identifier | _cconsts.NX_FRAME_ID_CAN_IS_EXTENDED
+        return RawFrame(self.timestamp, identifier, self.type, flags, 0, self.payload)
+
+    @property
+    def type(self):
+        return constants.FrameType.J1939_DATA
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            other_frame = typing.cast(J1939Frame, other)
+            return all((
+                self.pgn == other_frame.pgn,
+                self.source_address == other_frame.source_address,
+                self.destination_address == other_frame.destination_address,
+                self.priority == other_frame.priority,
+                self.echo == other_frame.echo,
+                self.timestamp == other_frame.timestamp,
+                self.payload == other_frame.payload))
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        # type: () -> typing.Text
+        """J1939Frame debug representation.
+
+        >>> J1939Frame(0xFEF1, 0x10)
+        J1939Frame(pgn=0xfef1, source_address=0x10, priority=6)
+        """
+        optional = []
+        if self.destination_address != self.GLOBAL_ADDRESS:
+            optional.append('destination_address=0x{:x}'.format(self.destination_address))
+        optional.append('priority={}'.format(self.priority))
+        if self.echo:
+            optional.append('echo={}'.format(self.echo))
+        if self.timestamp != 0:
+            optional.append('timestamp=0x{:x}'.format(self.timestamp))
+        if self.payload:
+            optional.append('len(payload)={}'.format(len(self.payload)))
+        return "{}(pgn=0x{:x}, source_address=0x{:x}, {})".format(
+            type(self).__name__,
+            self.pgn,
+            self.source_address,
+            ", ".join(optional))
+
+
+class FlexRayFrame(Frame):
+    """FlexRay Frame.
+
+    Attributes:
+        slot_id(int): Slot the frame was transmitted in, 1 to
+            ``FlexRayFrame.MAX_SLOT_ID``.
+        cycle_count(int): Communication cycle the frame was transmitted in,
+            0 to ``FlexRayFrame.MAX_CYCLE_COUNT``.
+        channel(:any:`nixnet._enums.FrmFlexRayChAssign`): Channels the frame
+            was received on, or is transmitted on.
+        startup(bool): Startup frame indicator.
+        sync(bool): Sync frame indicator.
+        preamble(bool): Payload preamble indicator, set for network
+            management vectors and message IDs.
+        echo(bool): If the frame is an echo of a successful
+            transmit rather than being received from the network.
+        timestamp(int): Absolute time the XNET interface received the end-of-frame.
+        payload(bytes): Payload.
+    """
+
+    __slots__ = [
+        "slot_id",
+        "cycle_count",
+        "channel",
+        "startup",
+        "sync",
+        "preamble",
+        "echo",
+        "timestamp",
+        "payload"]
+
+    MAX_SLOT_ID = 2047
+    MAX_CYCLE_COUNT = 63
+    MAX_PAYLOAD_LENGTH = 254
+
+    def __init__(
+            self,
+            slot_id,  # type: int
+            cycle_count=0,  # type: int
+            channel=constants.FrmFlexRayChAssign.A,  # type: constants.FrmFlexRayChAssign
+            payload=b"",  # type: bytes
+    ):
+        # type: (...) -> None
+        self.slot_id = slot_id
+        self.cycle_count = cycle_count
+        self.channel = channel
+        self.startup = False
+        self.sync = False
+        self.preamble = False
+        self.echo = False  # Used only for Read
+        self.timestamp = 0  # Used only for Read
+        self.payload = payload
+
+    @classmethod
+    def from_raw(cls, frame):
+        """Convert from RawFrame.
+
+        >>> raw = RawFrame(5, 12, constants.FrameType.FLEX_RAY_DATA, 0x33, 7, b'\\x01\\x02')
+        >>> FlexRayFrame.from_raw(raw)
+        FlexRayFrame(slot_id=12, cycle_count=7, channel=FrmFlexRayChAssign.AAND_B, startup=True, sync=True, timestamp=0x5, len(payload)=2)
+        """  # NOQA: E501
+        return cls.from_fields(frame.timestamp, frame.identifier, frame.type, frame.flags, frame.info, frame.payload)
+
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> FlexRayFrame
+        """Create a FlexRayFrame from the fields of a raw frame.
+
+        >>> FlexRayFrame.from_fields(5, 12, constants.FrameType.FLEX_RAY_DATA, 0x10, 7, b'')
+        FlexRayFrame(slot_id=12, cycle_count=7, timestamp=0x5)
+        """
+        # Skip __init__ and the channel enum lookup: FlexRay captures run to
+        # tens of thousands of frames per second.
+        flex_ray_frame = object.__new__(cls)
+        flex_ray_frame.slot_id = identifier
+        flex_ray_frame.cycle_count = info
+        flex_ray_frame.channel = _FLEX_RAY_CHANNELS[flags >> 4 & 0x3]
+        flex_ray_frame.startup = bool(flags & _cconsts.NX_FRAME_FLAGS_FLEX_RAY_STARTUP)
+        flex_ray_frame.sync = bool(flags & _cconsts.NX_FRAME_FLAGS_FLEX_RAY_SYNC)
+        flex_ray_frame.preamble = bool(flags & _cconsts.NX_FRAME_FLAGS_FLEX_RAY_PREAMBLE)
+        flex_ray_frame.echo = bool(flags & _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO)
+        flex_ray_frame.timestamp = timestamp
+        flex_ray_frame.payload = payload
+        return flex_ray_frame
+
+    def to_raw(self):
+        """Convert to RawFrame.
+
+        >>> FlexRayFrame(12, 7, payload=b'\\x01').to_raw()
+        RawFrame(timestamp=0x0, identifier=0xc, type=FrameType.FLEX_RAY_DATA, flags=0x10, info=0x7, len(payload)=1)
+        """
+        if not (1 <= self.slot_id <= self.MAX_SLOT_ID and 0 <= self.cycle_count <= self.MAX_CYCLE_COUNT):
+            _errors.check_for_error(_cconsts.NX_ERR_UNDEFINED_FRAME_ID)
+        if len(self.payload) > self.MAX_PAYLOAD_LENGTH:
+            _errors.check_for_error(_cconsts.NX_ERR_FRAME_WRITE_TOO_LARGE)
+        flags = _flex_ray_channel_flags(self.channel)
+        if self.startup:
+            flags |= _cconsts.NX_FRAME_FLAGS_FLEX_RAY_STARTUP
+        if self.sync:
+            flags |= _cconsts.NX_FRAME_FLAGS_FLEX_RAY_SYNC
+        if self.preamble:
+            flags |= _cconsts.NX_FRAME_FLAGS_FLEX_RAY_PREAMBLE
+        if self.echo:
+            flags |= _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO
+        return RawFrame(self.timestamp, self.slot_id, self.type, flags, self.cycle_count, self.payload)
+
+    @property
+    def type(self):
+        return constants.FrameType.FLEX_RAY_DATA
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            other_frame = typing.cast(FlexRayFrame, other)
+            return all((
+                self.type == other_frame.type,
+                self.slot_id == other_frame.slot_id,
+                self.cycle_count == other_frame.cycle_count,
+                self.channel == other_frame.channel,
+                self.startup == other_frame.startup,
+                self.sync == other_frame.sync,
+                self.preamble == other_frame.preamble,
+                self.echo == other_frame.echo,
+                self.timestamp == other_frame.timestamp,
+                self.payload == other_frame.payload))
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        # type: () -> typing.Text
+        """FlexRayFrame debug representation.
+
+        >>> FlexRayFrame(12, 7, constants.FrmFlexRayChAssign.B)
+        FlexRayFrame(slot_id=12, cycle_count=7, channel=FrmFlexRayChAssign.B)
+        """
+        optional = []
+        if self.channel != constants.FrmFlexRayChAssign.A:
+            optional.append('channel={}'.format(self.channel))
+        for flag in ('startup', 'sync', 'preamble', 'echo'):
+            if getattr(self, flag):
+                optional.append('{}=True'.format(flag))
+        if self.timestamp != 0:
+            optional.append('timestamp=0x{:x}'.format(self.timestamp))
+        if self.payload:
+            optional.append('len(payload)={}'.format(len(self.payload)))
+        if optional:
+            optional_params = ', {}'.format(", ".join(optional))
+        else:
+            optional_params = ''
+        return "{}(slot_id={}, cycle_count={}{})".format(
+            type(self).__name__,
+            self.slot_id,
+            self.cycle_count,
+            optional_params)
+
+
+class FlexRayNullFrame(FlexRayFrame):
+    """FlexRay null frame.
+
+    A frame the slot's owner sent with its null frame indicator set, so the
+    payload holds no valid data.  Null frames are only read when
+    ``Interface.flex_ray_null_to_in_strm`` is
+    enabled.  The attributes are the same as :any:`FlexRayFrame`.
+
+    >>> raw = RawFrame(5, 12, constants.FrameType.FLEX_RAY_NULL, 0x10, 7, b'')
+    >>> FlexRayNullFrame.from_raw(raw)
+    FlexRayNullFrame(slot_id=12, cycle_count=7, timestamp=0x5)
+    """
+
+    __slots__ = ()
+
+    @property
+    def type(self):
+        return constants.FrameType.FLEX_RAY_NULL
+
+
+class FlexRaySymbolFrame(Frame):
+    """FlexRay symbol received on a :any:`nixnet.session.FrameInStreamSession`.
+
+    .. note:: This requires enabling
+       ``Interface.flex_ray_sym_to_in_strm``.
+
+    Attributes:
+        timestamp(int): Absolute time the symbol was received.
+        symbol(:any:`nixnet._enums.FlexRaySymbol`): Symbol received.
+        channel(:any:`nixnet._enums.FrmFlexRayChAssign`): Channels the
+            symbol was received on.
+    """
+
+    __slots__ = [
+        "timestamp",
+        "symbol",
+        "channel"]
+
+    def __init__(self, timestamp, symbol, channel=constants.FrmFlexRayChAssign.A):
+        # type: (int, constants.FlexRaySymbol, constants.FrmFlexRayChAssign) -> None
+        self.timestamp = timestamp
+        self.symbol = symbol
+        self.channel = channel
+
+    @classmethod
+    def from_raw(cls, frame):
+        """Convert from RawFrame.
+
+        >>> raw = RawFrame(0x64, 0, constants.FrameType.FLEX_RAY_SYMBOL, 0x20, 0, b'\\x01')
+        >>> FlexRaySymbolFrame.from_raw(raw)
+        FlexRaySymbolFrame(0x64, FlexRaySymbol.WAKEUP, FrmFlexRayChAssign.B)
+        """
+        return cls.from_fields(frame.timestamp, frame.identifier, frame.type, frame.flags, frame.info, frame.payload)
+
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> FlexRaySymbolFrame
+        """Create a FlexRaySymbolFrame from the fields of a raw frame."""
+        symbol = constants.FlexRaySymbol(six.indexbytes(payload, 0))
+        return cls(timestamp, symbol, _FLEX_RAY_CHANNELS[flags >> 4 & 0x3])
+
+    def to_raw(self):
+        """Convert to RawFrame.
+
+        >>> FlexRaySymbolFrame(100, constants.FlexRaySymbol.MTS).to_raw()
+        RawFrame(timestamp=0x64, identifier=0x0, type=FrameType.FLEX_RAY_SYMBOL, flags=0x10, len(payload)=1)
+        """
+        identifier = 0
+        info = 0
+        payload = bytes(bytearray([self.symbol.value]))
+        return RawFrame(self.timestamp, identifier, self.type, _flex_ray_channel_flags(self.channel), info, payload)
+
+    @property
+    def type(self):
+        return constants.FrameType.FLEX_RAY_SYMBOL
+
+    def __eq__(self, other):
+        if isinstance(other, self.__class__):
+            other_frame = typing.cast(FlexRaySymbolFrame, other)
+            return all((
+                self.timestamp == other_frame.timestamp,
+                self.symbol == other_frame.symbol,
+                self.channel == other_frame.channel))
+        else:
+            return NotImplemented
+
+    def __repr__(self):
+        # type: () -> typing.Text
+        """FlexRaySymbolFrame debug representation.
+
+        >>> FlexRaySymbolFrame(100, constants.FlexRaySymbol.MTS, constants.FrmFlexRayChAssign.AAND_B)
+        FlexRaySymbolFrame(0x64, FlexRaySymbol.MTS, FrmFlexRayChAssign.AAND_B)
+        """
+        return "{}(0x{:x}, {}, {})".format(
+            type(self).__name__,
+            self.timestamp,
+            self.symbol,
+            self.channel)
+
+
+# Channel A and B flag bits, shifted down -> channel assignment.
+_FLEX_RAY_CHANNELS = (
+    constants.FrmFlexRayChAssign.NONE,
+    constants.FrmFlexRayChAssign.A,
+    constants.FrmFlexRayChAssign.B,
+    constants.FrmFlexRayChAssign.AAND_B,
+)
+
+
+def _flex_ray_channel_flags(channel):
+    # type: (constants.FrmFlexRayChAssign) -> int
+    return _FLEX_RAY_CHANNELS.index(constants.FrmFlexRayChAssign(channel)) << 4
+
+
 class LinFrame(object):
     """LIN Frame.
 
@@ -645,13 +1146,19 @@ class LinFrame(object):
         >>> LinFrame.from_raw(raw)
         LinFrame(identifier=0x2, echo=True, timestamp=0x5, len(payload)=1)
         """
-        identifier = frame.identifier & cls._FRAME_ID_MASK
-        lin_frame = LinFrame(identifier, constants.FrameType(frame.type), frame.payload)
-        lin_frame.timestamp = frame.timestamp
-        lin_frame.echo = bool(frame.flags & _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO)
-        lin_frame.eventslot = bool(frame.flags & _cconsts.NX_FRAME_FLAGS_LIN_EVENT_SLOT)
+        return cls.from_fields(
+            frame.timestamp, frame.identifier, constants.FrameType(frame.type), frame.flags, frame.info, frame.payload)
+
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> LinFrame
+        """Create a LinFrame from the fields of a raw frame."""
+        lin_frame = LinFrame(identifier & cls._FRAME_ID_MASK, type, payload)
+        lin_frame.timestamp = timestamp
+        lin_frame.echo = bool(flags & _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO)
+        lin_frame.eventslot = bool(flags & _cconsts.NX_FRAME_FLAGS_LIN_EVENT_SLOT)
         if lin_frame.eventslot:
-            lin_frame.eventid = frame.info
+            lin_frame.eventid = info
         else:
             lin_frame.eventid = 0
 
@@ -1023,18 +1530,268 @@ class XnetFrame(FrameFactory):
     @classmethod
     def from_raw(cls, frame):
         """Convert from RawFrame."""
-        frame_type = {
-            constants.FrameType.CAN_DATA: CanFrame,
-            constants.FrameType.CAN20_DATA: CanFrame,
-            constants.FrameType.CANFD_DATA: CanFrame,
-            constants.FrameType.CANFDBRS_DATA: CanFrame,
-            constants.FrameType.CAN_REMOTE: CanFrame,
-            constants.FrameType.CAN_BUS_ERROR: CanBusErrorFrame,
-            constants.FrameType.LIN_DATA: LinFrame,
-            constants.FrameType.SPECIAL_DELAY: DelayFrame,
-            constants.FrameType.SPECIAL_LOG_TRIGGER: LogTriggerFrame,
-            constants.FrameType.SPECIAL_START_TRIGGER: StartTriggerFrame,
-        }.get(frame.type)
-        if frame_type is None:
+        try:
+            factory = _XNET_FACTORIES[frame.type]
+        except KeyError:
             raise NotImplementedError("Unsupported frame type", frame.type)
-        return frame_type.from_raw(frame)
+        return factory.from_raw(frame)
+
+    @classmethod
+    def from_fields(cls, timestamp, identifier, type, flags, info, payload):
+        # type: (int, int, constants.FrameType, int, int, bytes) -> typing.Any
+        """Create a frame from the fields of a raw frame, based on its type."""
+        try:
+            from_fields = _XNET_DECODERS[type]
+        except KeyError:
+            raise NotImplementedError("Unsupported frame type", type)
+        return from_fields(timestamp, identifier, type, flags, info, payload)
+
+    @classmethod
+    def register_frame_type(cls, frame_type, factory):
+        # type: (constants.FrameType, typing.Optional[typing.Type[FrameFactory]]) -> typing.Optional[typing.Type[FrameFactory]]  # NOQA: E501
+        """Create frames of ``frame_type`` with ``factory``.
+
+        Use this to decode frame types that XnetFrame doesn't know about,
+        or to replace a built-in factory.
+
+        Args:
+            frame_type(:any:`nixnet._enums.FrameType`): Frame type to decode.
+            factory(:any:`nixnet.types.FrameFactory`): Creates the frames.
+                ``None`` unregisters the frame type.
+
+        Returns:
+            :any:`nixnet.types.FrameFactory`: The factory previously
+            registered for ``frame_type``, or ``None``.
+
+        >>> raw = RawFrame(5, 1, constants.FrameType.LIN_NO_RESPONSE, 0, 0, b'')
+        >>> XnetFrame.register_frame_type(constants.FrameType.LIN_NO_RESPONSE, RawFrame)
+        >>> XnetFrame.from_raw(raw)
+        RawFrame(timestamp=0x5, identifier=0x1, type=FrameType.LIN_NO_RESPONSE)
+        >>> XnetFrame.register_frame_type(constants.FrameType.LIN_NO_RESPONSE, None)
+        <class 'nixnet.types.RawFrame'>
+        """
+        frame_type = constants.FrameType(frame_type)
+        previous = _XNET_FACTORIES.pop(frame_type, None)
+        _XNET_DECODERS.pop(frame_type, None)
+        if factory is not None:
+            _XNET_FACTORIES[frame_type] = factory
+            _XNET_DECODERS[frame_type] = _decoder(factory)
+        return previous
+
+
+# Frame type -> factory that XnetFrame dispatches to, and that factory's
+# decoder, looked up once per frame.
+_XNET_FACTORIES = {
+    constants.FrameType.CAN_DATA: CanFrame,
+    constants.FrameType.CAN20_DATA: CanFrame,
+    constants.FrameType.CANFD_DATA: CanFrame,
+    constants.FrameType.CANFDBRS_DATA: CanFrame,
+    constants.FrameType.CAN_REMOTE: CanFrame,
+    constants.FrameType.CAN_BUS_ERROR: CanBusErrorFrame,
+    constants.FrameType.J1939_DATA: J1939Frame,
+    constants.FrameType.FLEX_RAY_DATA: FlexRayFrame,
+    constants.FrameType.FLEX_RAY_NULL: FlexRayNullFrame,
+    constants.FrameType.FLEX_RAY_SYMBOL: FlexRaySymbolFrame,
+    constants.FrameType.LIN_DATA: LinFrame,
+    constants.FrameType.SPECIAL_DELAY: DelayFrame,
+    constants.FrameType.SPECIAL_LOG_TRIGGER: LogTriggerFrame,
+    constants.FrameType.SPECIAL_START_TRIGGER: StartTriggerFrame,
+}  # type: typing.Dict[constants.FrameType, typing.Any]
+_XNET_DECODERS = {
+    frame_type: _decoder(factory) for frame_type, factory in _XNET_FACTORIES.items()
+}  # type: typing.Dict[constants.FrameType, typing.Callable[..., typing.Any]]
+
+
+# Raw frame types whose info field is the FlexRay cycle count.
+_FLEX_RAY_CYCLE_TYPES = frozenset([
+    _cconsts.NX_FRAME_TYPE_FLEX_RAY_DATA,
+    _cconsts.NX_FRAME_TYPE_FLEX_RAY_NULL])
+
+
+def _as_array(typecode, values):
+    # type: (typing.Text, typing.Optional[typing.Iterable[int]]) -> array.array[int]
+    if isinstance(values, array.array) and values.typecode == typecode:
+        return values
+    return array.array(typecode, values or ())
+
+
+class FrameBatch(object):
+    """Frames stored in contiguous arrays.
+
+    Each field is kept in an ``array.array`` and the payloads in one shared
+    buffer, so a batch costs a few dozen bytes per frame instead of several
+    Python objects.  Frame objects are only created when an item is accessed,
+    using ``frame_type``.
+
+    Slicing and filtering return new batches sharing the payload buffer.
+
+    Attributes:
+        timestamps(array.array): Timestamp of each frame.
+        identifiers(array.array): Raw identifier of each frame.
+        types(array.array): :any:`nixnet._enums.FrameType` value of each frame.
+        flags(array.array): Flags of each frame.
+        info(array.array): Info of each frame.
+        payload_offsets(array.array): Start of each payload in ``payloads``.
+        payload_lengths(array.array): Length of each payload.
+        payloads(bytes): Buffer holding the payloads.
+        frame_type(:any:`nixnet.types.FrameFactory`): Type of the frame
+            objects returned when indexing or iterating.
+
+    >>> batch = FrameBatch.from_frames([CanFrame(1, payload=b'\\x01'), CanFrame(2)])
+    >>> len(batch)
+    2
+    >>> batch[0]
+    CanFrame(CanIdentifier(0x1), len(payload)=1)
+    >>> list(batch.filter_by_identifier([2]))
+    [CanFrame(CanIdentifier(0x2))]
+    """
+
+    __slots__ = [
+        "timestamps",
+        "identifiers",
+        "types",
+        "flags",
+        "info",
+        "payload_offsets",
+        "payload_lengths",
+        "payloads",
+        "frame_type"]
+
+    def __init__(
+            self,
+            timestamps=None,
+            identifiers=None,
+            types=None,
+            flags=None,
+            info=None,
+            payload_offsets=None,
+            payload_lengths=None,
+            payloads=b"",
+            frame_type=None):
+        # type: (...) -> None
+        self.timestamps = _as_array('Q', timestamps)
+        self.identifiers = _as_array('I', identifiers)
+        self.types = _as_array('B', types)
+        self.flags = _as_array('B', flags)
+        self.info = _as_array('B', info)
+        self.payload_offsets = _as_array('Q', payload_offsets)
+        self.payload_lengths = _as_array('H', payload_lengths)
+        self.payloads = payloads
+        self.frame_type = XnetFrame if frame_type is None else frame_type
+
+    @classmethod
+    def from_frames(cls, frames, frame_type=None):
+        # type: (typing.Iterable[Frame], typing.Optional[typing.Type[FrameFactory]]) -> FrameBatch
+        """Pack frame objects into a batch."""
+        batch = cls(frame_type=frame_type)
+        payloads = bytearray()
+        for frame in frames:
+            raw = frame.to_raw()
+            batch.timestamps.append(raw.timestamp)
+            batch.identifiers.append(raw.identifier)
+            batch.types.append(raw.type.value)
+            batch.flags.append(raw.flags)
+            batch.info.append(raw.info)
+            batch.payload_offsets.append(len(payloads))
+            batch.payload_lengths.append(len(raw.payload))
+            payloads += raw.payload
+        batch.payloads = bytes(payloads)
+        return batch
+
+    def raw(self, index):
+        # type: (int) -> RawFrame
+        """Return the frame at ``index`` as a :any:`nixnet.types.RawFrame`."""
+        return self._decode(index, RawFrame.from_fields)
+
+    def _decode(self, index, from_fields):
+        # type: (int, typing.Callable[..., typing.Any]) -> typing.Any
+        offset = self.payload_offsets[index]
+        return from_fields(
+            self.timestamps[index],
+            self.identifiers[index],
+            _FRAME_TYPES.get(self.types[index]) or constants.FrameType(self.types[index]),
+            self.flags[index],
+            self.info[index],
+            bytes(self.payloads[offset:offset + self.payload_lengths[index]]))
+
+    def take(self, indices):
+        # type: (typing.Iterable[int]) -> FrameBatch
+        """Return a batch of the frames at ``indices``."""
+        indices = list(indices)
+        return FrameBatch(
+            [self.timestamps[i] for i in indices],
+            [self.identifiers[i] for i in indices],
+            [self.types[i] for i in indices],
+            [self.flags[i] for i in indices],
+            [self.info[i] for i in indices],
+            [self.payload_offsets[i] for i in indices],
+            [self.payload_lengths[i] for i in indices],
+            self.payloads,
+            self.frame_type)
+
+    def filter_by_identifier(self, identifiers):
+        # type: (typing.Iterable[typing.Union[int, CanIdentifier]]) -> FrameBatch
+        """Return a batch of the frames with one of the raw ``identifiers``."""
+        wanted = set(int(identifier) for identifier in identifiers)
+        return self.take(i for i, identifier in enumerate(self.identifiers) if identifier in wanted)
+
+    def group_by_cycle(self):
+        # type: () -> typing.Iterator[typing.Tuple[typing.Optional[int], FrameBatch]]
+        """Split the batch into FlexRay communication cycles.
+
+        A new group starts at each FlexRay data or null frame whose cycle
+        count differs from the previous one.  Symbol frames and frames of
+        other types stay in the current group, and any before the first
+        FlexRay frame are grouped with a cycle count of ``None``.  Only the
+        cycle count column is scanned, and each group is a slice of this
+        batch, so no frame objects are created.
+
+        Yields:
+            tuple(int, :any:`nixnet.types.FrameBatch`): The cycle count and
+            the frames of each cycle, in order.
+
+        >>> frames = [FlexRayFrame(slot, cycle) for cycle in (7, 8) for slot in (1, 2)]
+        >>> [(cycle, len(frames)) for cycle, frames in FrameBatch.from_frames(frames).group_by_cycle()]
+        [(7, 2), (8, 2)]
+        """
+        start = 0
+        cycle_count = None  # type: typing.Optional[int]
+        for index, (type_value, info) in enumerate(zip(self.types, self.info)):
+            if type_value in _FLEX_RAY_CYCLE_TYPES and info != cycle_count:
+                if index != start:
+                    yield cycle_count, self[start:index]
+                start = index
+                cycle_count = info
+        if start != len(self):
+            yield cycle_count, self[start:]
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return FrameBatch(
+                self.timestamps[index],
+                self.identifiers[index],
+                self.types[index],
+                self.flags[index],
+                self.info[index],
+                self.payload_offsets[index],
+                self.payload_lengths[index],
+                self.payloads,
+                self.frame_type)
+        return self._decode(index, _decoder(self.frame_type))
+
+    def __iter__(self):
+        from_fields = _decoder(self.frame_type)
+        for index in range(len(self)):
+            yield self._decode(index, from_fields)
+
+    def __repr__(self):
+        # type: () -> typing.Text
+        """FrameBatch debug representation.
+
+        >>> FrameBatch()
+        FrameBatch(len=0)
+        """
+        return "{}(len={})".format(type(self).__name__, len(self))
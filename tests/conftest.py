@@ -1,7 +1,11 @@
+import ctypes
 import os
 
 import pytest  # type: ignore
 
+from nixnet import _arrays
+from nixnet import _ctypedefs
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -60,3 +64,26 @@ def custom_database_path():
     root_path = os.path.dirname(tests_path)
     database_path = os.path.join(root_path, 'nixnet_examples', 'databases', 'custom_database.dbc')
     return database_path
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def implementation(request, monkeypatch):
+    if request.param == 'numpy':
+        if _arrays.numpy is None:
+            pytest.skip("Requires NumPy")
+    else:
+        monkeypatch.setattr(_arrays, 'numpy', None)
+    return request.param
+
+
+@pytest.fixture
+def mock_read_frame():
+    """Return a factory of `nx_read_frame` side effects returning `data`."""
+    def _mock_read_frame(data):
+        def _read_frame(session_ref, buffer, size_of_buffer, timeout, number_of_bytes_returned):
+            returned = data[0:size_of_buffer.value]
+            ctypes.memmove(buffer, returned, len(returned))
+            number_of_bytes_returned.contents.value = len(returned)
+            return _ctypedefs.u32(0)
+        return _read_frame
+    return _mock_read_frame
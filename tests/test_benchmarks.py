@@ -0,0 +1,24 @@
+from benchmarks import _harness
+from benchmarks import bench_io
+
+
+def test_bench_io():
+    results = bench_io.run(calls=2, num_frames=4, num_signals=2)
+    names = [result.name for result in results]
+    assert 'InFrames.read[XnetFrame]' in names
+    assert 'SinglePointOutSignals.write' in names
+    assert all(result.ns_per_item > 0 and result.p99_us >= result.p50_us for result in results)
+
+    baseline = {result.name: {'p50_us': result.p50_us * 10, 'alloc_bytes_per_item': 0.0} for result in results}
+    regressions = _harness.compare(results, baseline)
+    assert {regression.metric for regression in regressions} <= {'alloc_bytes_per_item'}
+
+
+def test_bench_io_main(tmpdir, capsys):
+    baseline = str(tmpdir.join('baseline.json'))
+    arguments = ['--calls', '2', '--frames', '2', '-k', 'InFrames']
+    assert bench_io.main(arguments + ['--save-baseline', baseline]) == 0
+    assert set(_harness.load_baseline(baseline)) == {
+        'InFrames.read[CanFrame]', 'InFrames.read[RawFrame]', 'InFrames.read[XnetFrame]'}
+    assert bench_io.main(arguments + ['--baseline', baseline, '--tolerance', '100']) == 0
+    assert 'InFrames.read[CanFrame]' in capsys.readouterr().out
@@ -1,8 +1,18 @@
+import ctypes  # type: ignore
+
+from unittest import mock  # type: ignore
+
 import pytest  # type: ignore
 
+from nixnet import _buffers
+from nixnet import _cconsts
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
+from nixnet import _frames
 from nixnet import constants
 from nixnet import convert
 from nixnet import errors
+from nixnet import types
 
 
 def raise_code(code):
@@ -97,3 +107,75 @@ def test_conversion_multiframe():
         converted_signals = session.convert_frames_to_signals(frames)
         for expected, (_, converted) in zip(expected_signals, converted_signals):
             assert pytest.approx(expected) == converted
+
+
+def mock_convert_signals_to_frames(data, min_size=0):
+    """Create a `nx_convert_signals_to_frames_single_point` side effect returning `data`."""
+    def _convert(session_ref, value_buffer, size_of_value_buffer, buffer, size_of_buffer, number_of_bytes_returned):
+        if size_of_buffer.value < max(min_size, len(data)):
+            return _ctypedefs.u32(_cconsts.NX_ERR_BUFFER_TOO_SMALL)
+        ctypes.memmove(buffer, data, len(data))
+        number_of_bytes_returned.contents.value = len(data)
+        return _ctypedefs.u32(0)
+    return _convert
+
+
+def mock_conversion_lib(data, min_size=0):
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_convert_signals_to_frames_single_point.side_effect = mock_convert_signals_to_frames(data, min_size)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    return lib
+
+
+def test_convert_signals_to_frames_sized_from_session():
+    frames = [types.RawFrame(0, identifier, constants.FrameType.CAN_DATA, 0, 0, bytes(8)) for identifier in (1, 2, 3)]
+    data = bytes(_frames.serialize_frames(frames))
+    lib = mock_conversion_lib(data)
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_frames', return_value=3), \
+            mock.patch('nixnet._props.get_session_payld_len_max', return_value=8):
+        with convert.SignalConversionSinglePointSession('db', 'cluster', ['a', 'b']) as session:
+            for _ in range(3):
+                converted = list(session.convert_signals_to_frames(iter([1.0, 2.0]), types.RawFrame))
+                assert converted == frames
+            assert session.conversion_stats == convert.ConversionStats(3, 0, len(data))
+    assert lib.nx_convert_signals_to_frames_single_point.call_count == 3
+
+
+def test_convert_signals_to_frames_resize():
+    frames = [types.RawFrame(0, 1, constants.FrameType.CAN_DATA, 0, 0, b'\x01')]
+    data = bytes(_frames.serialize_frames(frames))
+    lib = mock_conversion_lib(data, min_size=300)
+    unknown = errors.XnetError("", _cconsts.NX_ERR_INTERNAL_ERROR)
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_frames', side_effect=unknown):
+        with convert.SignalConversionSinglePointSession('db', 'cluster', ['a']) as session:
+            assert list(session.convert_signals_to_frames(iter([1.0]), types.RawFrame)) == frames
+            assert session.conversion_stats == convert.ConversionStats(1, 2, 480)
+            assert list(session.convert_signals_to_frames([1.0], types.RawFrame)) == frames
+            assert session.conversion_stats == convert.ConversionStats(2, 2, 480)
+
+
+def test_convert_bytes_to_signals_array():
+    def _convert(
+            session_ref, frame_buffer, size_of_frame_buffer, value_buffer, size_of_value_buffer,
+            timestamp_buffer, size_of_timestamp_buffer):
+        assert size_of_value_buffer.value == 2 * _ctypedefs.f64.BYTES
+        timestamp_buffer[1] = 5
+        value_buffer[1] = float(size_of_frame_buffer.value)
+        return _ctypedefs.u32(0)
+
+    lib = mock_conversion_lib(b'')
+    lib.nx_convert_frames_to_signals_single_point.side_effect = _convert
+    data = bytes(_frames.serialize_frames([types.RawFrame(5, 1, constants.FrameType.CAN_DATA, 0, 0, b'\x01')]))
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_in_list', return_value=2):
+        with convert.SignalConversionSinglePointSession('db', 'cluster', ['a', 'b']) as session:
+            timestamps, values = session.convert_bytes_to_signals_array(data)
+            assert list(timestamps) == [0, 5]
+            assert list(values) == [0.0, len(data)]
+            frames = _frames.iterate_frames(data)
+            assert list(session.convert_frames_to_signals(frames)) == [(0, 0.0), (5, len(data))]
+            assert _buffers.pool.num_bytes > 0
+    assert _buffers.pool.num_bytes == 0
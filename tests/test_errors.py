@@ -4,6 +4,7 @@ import pytest  # type: ignore
 
 from nixnet import _cconsts
 from nixnet import _cfuncs
+from nixnet import _ctypedefs
 from nixnet import _enums
 from nixnet import _errors
 from nixnet import errors
@@ -17,6 +18,16 @@ def test_success():
     _errors.check_for_error(_cconsts.NX_SUCCESS)
 
 
+@mock.patch('nixnet._cfuncs.lib', MockXnetLibrary)
+def test_check_status():
+    _errors.check_status(_cconsts.NX_SUCCESS)
+    _errors.check_status(_ctypedefs.nxStatus_t(_cconsts.NX_SUCCESS))
+    for status in (_enums.Err.SELF_TEST_ERROR1.value, _ctypedefs.nxStatus_t(_enums.Err.SELF_TEST_ERROR1.value)):
+        with pytest.raises(errors.XnetError) as excinfo:
+            _errors.check_status(status)
+        assert excinfo.value.error_type == _enums.Err.SELF_TEST_ERROR1
+
+
 @mock.patch('nixnet._cfuncs.lib', MockXnetLibrary)
 def test_known_error():
     with pytest.raises(errors.XnetError) as excinfo:
@@ -0,0 +1,88 @@
+from unittest import mock  # type: ignore
+
+import pytest  # type: ignore
+
+import nixnet
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
+from nixnet import _frames
+from nixnet import constants
+from nixnet import filters
+from nixnet import types
+
+
+def raw_frames():
+    return [
+        types.RawFrame(1, 0x100, constants.FrameType.CAN_DATA, 0, 0, b'\x01'),
+        types.RawFrame(2, 0x101, constants.FrameType.CANFD_DATA, 0, 0, bytes(bytearray(range(20)))),
+        types.RawFrame(3, int(types.CanIdentifier(0x200, True)), constants.FrameType.CAN_DATA, 0, 0, b''),
+        types.RawFrame(4, 0x100, constants.FrameType.CAN_REMOTE, 0, 0, b''),
+        types.RawFrame(5, 0x300, constants.FrameType.CANFD_DATA, 0, 0, bytes(bytearray(range(64)))),
+        types.RawFrame(6, 0x101, constants.FrameType.CAN_DATA, 0, 0, b'\x02\x03')]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {},
+    {'identifiers': [0x100]},
+    {'identifiers': [types.CanIdentifier(0x200, True)]},
+    {'identifiers': []},
+    {'masks': [(0x700, 0x100)]},
+    {'identifiers': [0x300], 'masks': [(0x7FF, 0x101)]},
+    {'frame_types': [constants.FrameType.CANFD_DATA]},
+    {'identifiers': [0x100, 0x101], 'frame_types': [constants.FrameType.CAN_DATA]},
+])
+def test_filter_bytes(implementation, kwargs):
+    frames = raw_frames()
+    buffer = bytes(_frames.serialize_frames(frames))
+    frame_filter = filters.FrameFilter(**kwargs)
+    expected = [frame for frame in frames if frame_filter.matches(frame.identifier, frame.type)]
+    filtered = frame_filter.filter_bytes(buffer)
+    assert list(_frames.iterate_frames(filtered)) == expected
+
+
+def test_frame_filter_matches():
+    frame_filter = filters.FrameFilter(masks=[(0x700, 0x1FF)])
+    assert frame_filter.matches(0x123, constants.FrameType.CAN_DATA)
+    assert not frame_filter.matches(0x223, constants.FrameType.CAN_DATA)
+
+    frame_filter = filters.FrameFilter(frame_types=[constants.FrameType.LIN_DATA])
+    assert frame_filter.matches(1, constants.FrameType.LIN_DATA.value)
+    assert not frame_filter.matches(1, constants.FrameType.CAN_DATA)
+
+
+def test_read_with_filter(mock_read_frame):
+    frames = raw_frames()
+    buffer = bytes(_frames.serialize_frames(frames))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frame(buffer)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    frame_filter = filters.FrameFilter(identifiers=[0x101])
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            data = input_session.frames.read_bytes(len(buffer), frame_filter=frame_filter)
+            assert list(_frames.iterate_frames(data)) == [frames[1], frames[5]]
+            read_frames = list(input_session.frames.read(len(buffer), frame_filter=frame_filter))
+            assert read_frames == [types.XnetFrame.from_raw(frames[1]), types.XnetFrame.from_raw(frames[5])]
+
+
+def test_demultiplexer():
+    frames = raw_frames()
+    buffer = bytes(_frames.serialize_frames(frames))
+    demux = filters.FrameDemultiplexer([0x101, types.CanIdentifier(0x200, True)], frame_type=types.RawFrame)
+    assert demux.feed(buffer) == 3
+    assert list(demux) == [0x101, int(types.CanIdentifier(0x200, True))]
+    assert len(demux) == 2
+    assert list(demux[0x101]) == [frames[1], frames[5]]
+    assert list(demux[types.CanIdentifier(0x200, True)]) == [frames[2]]
+    with pytest.raises(KeyError):
+        demux[0x100]
+
+
+def test_demultiplexer_maxlen():
+    frames = raw_frames()
+    buffer = bytes(_frames.serialize_frames(frames))
+    demux = filters.FrameDemultiplexer([0x101], frame_type=types.RawFrame, maxlen=1)
+    demux.feed(buffer)
+    demux.feed(buffer)
+    assert list(demux[0x101]) == [frames[5]]
@@ -1,3 +1,5 @@
+import asyncio
+import ctypes  # type: ignore
 import time
 
 from unittest import mock  # type: ignore
@@ -5,16 +7,35 @@ from unittest import mock  # type: ignore
 import pytest  # type: ignore
 
 import nixnet
+from nixnet import _arrays
+from nixnet import _buffers
+from nixnet import _cconsts
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
 from nixnet import _frames
 from nixnet import constants
 from nixnet import errors
 from nixnet import types
 
 
+requires_numpy = pytest.mark.skipif(_arrays.numpy is None, reason="Requires NumPy")
+
+
 def raise_code(code):
     raise errors.XnetError("", code)
 
 
+def mixed_raw_frames():
+    return [
+        types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 4, 5, b''),
+        types.RawFrame(6, 7, constants.FrameType.CAN_DATA, 8, 9, b'\x01\x02\x03\x04\x05\x06\x07\x08'),
+        types.RawFrame(10, 11, constants.FrameType.CANFD_DATA, 0, 0, bytes(bytearray(range(64)))),
+        types.RawFrame(12, 13, constants.FrameType.CAN_DATA, 0, 0, b'\x01'),
+        types.RawFrame(14, 15, constants.FrameType.J1939_DATA, 0, 0x8, bytes(bytearray(range(256))) * 4),
+        types.RawFrame(16, 17, constants.FrameType.CANFD_DATA, 0, 0, bytes(bytearray(range(9)))),
+    ]
+
+
 def test_iterate_frames_with_empty_payload():
     payload = b'\x00\x00\x00\x00\x00\x00\x00\x00'
     empty_bytes = b'\x01\x00\x00\x00\x00\x00\x00\x00\x02\x00\x00\x00\x00\x04\x05\x00' + payload
@@ -60,6 +81,279 @@ def test_iterate_frames_corrupted_frame():
         list(_frames.iterate_frames(empty_bytes))
 
 
+@requires_numpy
+def test_decode_frames_matches_iterate_frames():
+    buffer = b"".join(
+        unit
+        for frame in mixed_raw_frames()
+        for unit in _frames.serialize_frame(frame))
+    expected_frames = list(_frames.iterate_frames(buffer))
+
+    decoded = _frames.decode_frames(buffer)
+    assert len(decoded) == len(expected_frames)
+    for expected, actual in zip(expected_frames, decoded):
+        assert int(actual['timestamp']) == expected.timestamp
+        assert int(actual['identifier']) == expected.identifier
+        assert int(actual['type']) == expected.type.value
+        assert int(actual['flags']) == expected.flags
+        assert int(actual['info']) == expected.info
+        offset = int(actual['payload_offset'])
+        assert buffer[offset:offset + int(actual['payload_length'])] == expected.payload
+
+
+@requires_numpy
+def test_decode_frames_with_base_units_only():
+    frames = [types.RawFrame(i, i, constants.FrameType.CAN_DATA, 0, 0, b'\x01\x02') for i in range(3)]
+    buffer = b"".join(unit for frame in frames for unit in _frames.serialize_frame(frame))
+    decoded = _frames.decode_frames(buffer)
+    assert decoded['identifier'].tolist() == [0, 1, 2]
+    assert decoded['payload_offset'].tolist() == [16, 40, 64]
+
+
+@requires_numpy
+def test_decode_frames_empty():
+    assert len(_frames.decode_frames(b'')) == 0
+
+
+@requires_numpy
+@mock.patch('nixnet._errors.check_for_error', raise_code)
+def test_decode_frames_corrupted_frame():
+    with pytest.raises(errors.XnetError):
+        _frames.decode_frames(b'\x01\x00\x00\x00\x00\x00\x00')
+    with pytest.raises(errors.XnetError):
+        _frames.decode_frames(24 * b'\x00' + 8 * b'\x00')
+    payload_unit_missing = types.RawFrame(1, 2, constants.FrameType.CANFD_DATA, 0, 0, 16 * b'\x01')
+    base_unit = next(_frames.serialize_frame(payload_unit_missing))
+    with pytest.raises(errors.XnetError):
+        _frames.decode_frames(base_unit)
+
+
+@requires_numpy
+def test_read_array(mock_read_frame):
+    buffer = b"".join(
+        unit
+        for frame in mixed_raw_frames()
+        for unit in _frames.serialize_frame(frame))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frame(buffer)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            frames, data = input_session.frames.read_array(100)
+    assert data == buffer
+    assert frames['identifier'].tolist() == [2, 7, 11, 13, 15, 17]
+    assert frames['payload_length'].tolist() == [0, 8, 64, 1, 1024, 9]
+
+
+def test_read_into(mock_read_frame):
+    buffer = b"".join(
+        unit
+        for frame in mixed_raw_frames()
+        for unit in _frames.serialize_frame(frame))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frame(buffer)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            data = bytearray(len(buffer) + 10)
+            assert input_session.frames.read_into(data) == len(buffer)
+            assert data[:len(buffer)] == buffer
+
+            view = memoryview(bytearray(30))[4:28]
+            assert input_session.frames.read_into(view) == 24
+            assert view.tobytes() == buffer[:24]
+
+            with pytest.raises(TypeError):
+                input_session.frames.read_into(bytes(24))
+
+        with nixnet.FrameInSinglePointSession('CAN1', 'db', 'cluster', 'frame') as input_session:
+            data = bytearray(24)
+            assert input_session.frames.read_into(data) == 24
+            assert data == buffer[:24]
+
+
+@requires_numpy
+def test_read_into_numpy(mock_read_frame):
+    buffer = b"".join(
+        unit
+        for frame in mixed_raw_frames()
+        for unit in _frames.serialize_frame(frame))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frame(buffer)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            data = _arrays.numpy.zeros(len(buffer), dtype=_arrays.numpy.uint8)
+            assert input_session.frames.read_into(data) == len(buffer)
+            assert data.tobytes() == buffer
+
+
+def test_read_reuses_buffers(mock_read_frame):
+    buffer = b"".join(
+        unit
+        for frame in mixed_raw_frames()
+        for unit in _frames.serialize_frame(frame))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frame(buffer)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            first = input_session.frames.read_bytes(len(buffer))
+            second = input_session.frames.read_bytes(24)
+            assert first == buffer
+            assert second == buffer[:24]
+
+            first_call, second_call = lib.nx_read_frame.call_args_list
+            assert ctypes.addressof(first_call[0][1]) == ctypes.addressof(second_call[0][1])
+            assert _buffers.pool.num_bytes > 0
+        assert _buffers.pool.num_bytes == 0
+
+
+def test_write_bytes_buffer_protocol():
+    buffer = b"".join(
+        unit
+        for frame in mixed_raw_frames()
+        for unit in _frames.serialize_frame(frame))
+    written = []
+
+    def _write_frame(session_ref, buffer, size_of_buffer, timeout):
+        written.append(ctypes.string_at(buffer, size_of_buffer.value))
+        return _ctypedefs.u32(0)
+
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_write_frame.side_effect = _write_frame
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameOutStreamSession('CAN1') as output_session:
+            output_session.frames.write_bytes(buffer)
+            output_session.frames.write_bytes(bytearray(buffer))
+            output_session.frames.write_bytes(memoryview(buffer)[24:48])
+            output_session.frames.write_bytes(list(buffer[:24]))
+    assert written == [buffer, buffer, buffer[24:48], buffer[:24]]
+
+
+def test_buffer_pool_limit():
+    pool = _buffers.BufferPool(max_bytes=128)
+    cached = pool.array(1, 'buffer', ctypes.c_ubyte, 100)
+    assert pool.array(1, 'buffer', ctypes.c_ubyte, 100) is cached
+    assert pool.num_bytes == 128
+
+    uncached = pool.array(2, 'buffer', ctypes.c_ubyte, 10)
+    assert len(uncached) == 10
+    assert pool.array(2, 'buffer', ctypes.c_ubyte, 10) is not uncached
+    assert pool.num_bytes == 128
+
+    pool.release(1)
+    assert pool.num_bytes == 0
+
+
+def test_parse_batch_matches_iterate_frames():
+    buffer = bytes(_frames.serialize_frames(mixed_raw_frames()))
+    batch = _frames.parse_batch(buffer, types.RawFrame)
+    assert len(batch) == len(mixed_raw_frames())
+    assert list(batch) == list(_frames.iterate_frames(buffer))
+    assert batch.payloads is buffer
+
+
+@mock.patch('nixnet._errors.check_for_error', raise_code)
+def test_parse_batch_corrupted_frame():
+    buffer = bytes(_frames.serialize_frames(mixed_raw_frames()))
+    with pytest.raises(errors.XnetError):
+        _frames.parse_batch(buffer[:-8])
+
+
+def test_frame_batch():
+    frames = [
+        types.CanFrame(1, payload=b'\x01'),
+        types.CanFrame(types.CanIdentifier(2, True), constants.FrameType.CANFD_DATA, bytes(bytearray(range(20)))),
+        types.LinFrame(3, payload=b'\x02\x03'),
+        types.CanFrame(1)]
+    batch = types.FrameBatch.from_frames(frames)
+    assert len(batch) == 4
+    assert list(batch) == frames
+    assert batch[1] == frames[1]
+    assert batch[-1] == frames[-1]
+
+    sliced = batch[1:3]
+    assert isinstance(sliced, types.FrameBatch)
+    assert list(sliced) == frames[1:3]
+    assert sliced.payloads is batch.payloads
+
+    assert list(batch.filter_by_identifier([1])) == [frames[0], frames[3]]
+    assert list(batch.filter_by_identifier([types.CanIdentifier(2, True)])) == [frames[1]]
+    assert len(batch.filter_by_identifier([])) == 0
+
+    raw_batch = types.FrameBatch.from_frames(frames, types.RawFrame)
+    assert raw_batch[2] == frames[2].to_raw()
+
+
+def test_read_batch(mock_read_frame):
+    buffer = bytes(_frames.serialize_frames(mixed_raw_frames()))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frame(buffer)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            batch = input_session.frames.read_batch(len(buffer), frame_type=types.RawFrame)
+    assert list(batch) == list(_frames.iterate_frames(buffer))
+
+
+def test_async_read(mock_read_frame):
+    frames = mixed_raw_frames()
+    buffer = bytes(_frames.serialize_frames(frames))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frame(buffer)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+
+    async def _read():
+        async with nixnet.FrameInStreamSession('CAN1') as input_session:
+            data = await input_session.frames.aread_bytes(len(buffer))
+            read_frames = await input_session.frames.aread(len(buffer), frame_type=types.RawFrame)
+        return data, read_frames
+
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        data, read_frames = asyncio.run(_read())
+    assert data == buffer
+    assert read_frames == list(_frames.iterate_frames(buffer))
+    lib.nx_clear.assert_called_once()
+
+
+def test_async_stream(mock_read_frame):
+    frames = mixed_raw_frames()
+    buffer = bytes(_frames.serialize_frames(frames))
+    reads = iter([b'', buffer, b'', buffer])
+
+    def _read_frame(session_ref, data, size_of_buffer, timeout, number_of_bytes_returned):
+        return mock_read_frame(next(reads, b''))(
+            session_ref, data, size_of_buffer, timeout, number_of_bytes_returned)
+
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = _read_frame
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+
+    async def _stream(count):
+        received = []
+        async with nixnet.FrameInStreamSession('CAN1') as input_session:
+            stream = input_session.frames.astream(num_frames=len(buffer), frame_type=types.RawFrame, poll_interval=0)
+            async for frame in stream:
+                received.append(frame)
+                if len(received) == count:
+                    break
+        return received
+
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        received = asyncio.run(_stream(2 * len(frames)))
+    assert received == 2 * list(_frames.iterate_frames(buffer))
+
+
 def test_can_identifier_equality():
     assert types.CanIdentifier(130) == types.CanIdentifier(130)
     assert types.CanIdentifier(130, True) == types.CanIdentifier(130, True)
@@ -109,6 +403,104 @@ def test_raw_frame_conversion():
     assert base_frame == base_frame.to_raw()
 
 
+def xnet_raw_frames():
+    return [
+        types.RawFrame(1, 0x20000002, constants.FrameType.CAN_DATA, _cconsts.NX_FRAME_FLAGS_TRANSMIT_ECHO, 0, b'\x01'),
+        types.RawFrame(3, 4, constants.FrameType.CANFD_DATA, 0, 0, bytes(bytearray(range(12)))),
+        types.RawFrame(5, 0, constants.FrameType.CAN_BUS_ERROR, 0, 0, b'\x00\x01\x02\x03\x04'),
+        types.RawFrame(6, 0x42, constants.FrameType.LIN_DATA, 0x81, 1, b'\x01\x02'),
+        types.RawFrame(7, 0, constants.FrameType.SPECIAL_DELAY, 0, 0, b''),
+        types.RawFrame(8, 0, constants.FrameType.SPECIAL_START_TRIGGER, 0, 0, b''),
+    ]
+
+
+@pytest.mark.parametrize('frame_type', [types.RawFrame, types.CanFrame, types.XnetFrame])
+def test_iterate_frames_as(frame_type):
+    raw_frames = xnet_raw_frames()
+    if frame_type is types.CanFrame:
+        raw_frames = raw_frames[:2]
+    frame_bytes = _frames.serialize_frames(raw_frames)
+    expected = [frame_type.from_raw(frame) for frame in _frames.iterate_frames(frame_bytes)]
+    assert list(_frames.iterate_frames_as(frame_bytes, frame_type)) == expected
+
+
+def test_iterate_frames_as_xnet_frame():
+    frame_bytes = _frames.serialize_frames(xnet_raw_frames())
+    frames = _frames.iterate_frames_as(frame_bytes, types.XnetFrame)
+    assert [type(frame).__name__ for frame in frames] == [
+        'CanFrame', 'CanFrame', 'CanBusErrorFrame', 'LinFrame', 'DelayFrame', 'StartTriggerFrame']
+
+
+def test_subclass_overriding_from_raw():
+    class TaggedCanFrame(types.CanFrame):
+
+        @classmethod
+        def from_raw(cls, frame):
+            return ('Tagged', frame.identifier, frame.type)
+
+    class DerivedCanFrame(types.CanFrame):
+        pass
+
+    raw_frames = xnet_raw_frames()[:2]
+    frame_bytes = _frames.serialize_frames(raw_frames)
+    expected = [('Tagged', frame.identifier, frame.type) for frame in raw_frames]
+    assert list(_frames.iterate_frames_as(frame_bytes, TaggedCanFrame)) == expected
+    batch = _frames.parse_batch(frame_bytes, TaggedCanFrame)
+    assert list(batch) == expected
+    assert batch[1] == expected[1]
+
+    previous = types.XnetFrame.register_frame_type(constants.FrameType.CAN_DATA, TaggedCanFrame)
+    try:
+        assert list(_frames.iterate_frames_as(frame_bytes, types.XnetFrame))[0] == expected[0]
+    finally:
+        types.XnetFrame.register_frame_type(constants.FrameType.CAN_DATA, previous)
+
+    # Subclasses that don't override from_raw keep the fused path.
+    frames = list(_frames.iterate_frames_as(frame_bytes, DerivedCanFrame))
+    assert [type(frame) for frame in frames] == [DerivedCanFrame, DerivedCanFrame]
+    assert frames == [types.CanFrame.from_raw(frame) for frame in raw_frames]
+
+
+def test_can_frame_from_raw_coerces_type():
+    raw = types.RawFrame(1, 2, constants.FrameType.CAN_DATA.value, 0, 0, b'')
+    assert types.CanFrame.from_raw(raw).type is constants.FrameType.CAN_DATA
+    with pytest.raises(ValueError):
+        types.CanFrame.from_raw(types.RawFrame(1, 2, 0xFE, 0, 0, b''))
+
+
+def test_xnet_frame_register_frame_type():
+    class NoResponseFrame(types.FrameFactory):
+
+        @classmethod
+        def from_raw(cls, frame):
+            return ('NoResponse', frame.identifier, frame.payload)
+
+    raw = types.RawFrame(1, 2, constants.FrameType.LIN_NO_RESPONSE, 0, 0, b'\x01')
+    frame_bytes = _frames.serialize_frames([raw])
+    with pytest.raises(NotImplementedError):
+        types.XnetFrame.from_raw(raw)
+    with pytest.raises(NotImplementedError):
+        list(_frames.iterate_frames_as(frame_bytes, types.XnetFrame))
+
+    assert types.XnetFrame.register_frame_type(constants.FrameType.LIN_NO_RESPONSE, NoResponseFrame) is None
+    try:
+        assert types.XnetFrame.from_raw(raw) == ('NoResponse', 2, b'\x01')
+        assert list(_frames.iterate_frames_as(frame_bytes, types.XnetFrame)) == [('NoResponse', 2, b'\x01')]
+        batch = _frames.parse_batch(frame_bytes, types.XnetFrame)
+        assert list(batch) == [('NoResponse', 2, b'\x01')]
+    finally:
+        assert types.XnetFrame.register_frame_type(constants.FrameType.LIN_NO_RESPONSE, None) is NoResponseFrame
+    with pytest.raises(NotImplementedError):
+        types.XnetFrame.from_raw(raw)
+
+    previous = types.XnetFrame.register_frame_type(constants.FrameType.CAN_DATA, types.RawFrame)
+    try:
+        assert previous is types.CanFrame
+        assert types.XnetFrame.from_raw(xnet_raw_frames()[0]) == xnet_raw_frames()[0]
+    finally:
+        types.XnetFrame.register_frame_type(constants.FrameType.CAN_DATA, previous)
+
+
 def test_can_frame_equality():
     empty_frame = types.CanFrame(0, constants.FrameType.CAN_DATA, b'')
     base_frame = types.CanFrame(0, constants.FrameType.CAN_DATA, b'\x01')
@@ -135,6 +527,131 @@ def test_can_bus_error_frame_equality():
     assert frame != 5
 
 
+def test_j1939_frame_equality():
+    empty_frame = types.J1939Frame(0xFEF1, 0x10)
+    base_frame = types.J1939Frame(0xFEF1, 0x10, payload=b'\x01')
+
+    assert empty_frame == empty_frame
+    assert not (empty_frame == base_frame)
+    assert not (empty_frame == 5)
+
+    assert not (empty_frame != empty_frame)
+    assert empty_frame != base_frame
+    assert empty_frame != 5
+
+
+@pytest.mark.parametrize('frame', [
+    types.J1939Frame(0xEA00, 0x21, 0x42, 3, b'\x00\xee\x00'),
+    types.J1939Frame(0xFEF1, 0x00, payload=bytes(bytearray(range(200)))),
+    types.J1939Frame(0x1F004, 0xFE, priority=0, payload=b'\x01' * types.J1939Frame.MAX_PAYLOAD_LENGTH),
+])
+def test_j1939_frame_conversion(frame):
+    frame.timestamp = 10
+    raw = frame.to_raw()
+    assert raw.type == constants.FrameType.J1939_DATA
+    assert raw.identifier & _cconsts.NX_FRAME_ID_CAN_IS_EXTENDED
+    assert types.J1939Frame.from_raw(raw) == frame
+    assert types.XnetFrame.from_raw(raw) == frame
+    assert list(_frames.iterate_frames_as(_frames.serialize_frames([raw]), types.XnetFrame)) == [frame]
+
+
+def test_j1939_frame_pdu2_is_broadcast():
+    frame = types.J1939Frame.from_fields(0, 0x0CFE6C17, constants.FrameType.J1939_DATA, 0, 0, b'')
+    assert (frame.pgn, frame.source_address, frame.priority) == (0xFE6C, 0x17, 3)
+    assert frame.destination_address == types.J1939Frame.GLOBAL_ADDRESS
+
+
+@mock.patch('nixnet._errors.check_for_error', raise_code)
+def test_j1939_frame_overflow():
+    with pytest.raises(errors.XnetError):
+        types.J1939Frame(0x40000, 0).to_raw()
+    with pytest.raises(errors.XnetError):
+        types.J1939Frame(0xFEF1, 0x100).to_raw()
+    with pytest.raises(errors.XnetError):
+        types.J1939Frame(0xFEF1, 0, priority=8).to_raw()
+    with pytest.raises(errors.XnetError):
+        types.J1939Frame(0xFEF1, 0, payload=bytes(types.J1939Frame.MAX_PAYLOAD_LENGTH + 1)).to_raw()
+
+
+def test_flex_ray_frame_equality():
+    frame = types.FlexRayFrame(12, 7, payload=b'\x01')
+    other_frame = types.FlexRayFrame(12, 8, payload=b'\x01')
+    null_frame = types.FlexRayNullFrame(12, 7, payload=b'\x01')
+
+    assert frame == frame
+    assert not (frame == other_frame)
+    assert not (frame == null_frame)
+    assert not (null_frame == frame)
+    assert not (frame == 5)
+
+    assert not (frame != frame)
+    assert frame != other_frame
+    assert frame != 5
+
+
+def flex_ray_frames():
+    data = types.FlexRayFrame(12, 7, constants.FrmFlexRayChAssign.AAND_B, bytes(bytearray(range(254))))
+    data.startup = True
+    data.sync = True
+    data.preamble = True
+    data.timestamp = 10
+    echo = types.FlexRayFrame(2047, 63, constants.FrmFlexRayChAssign.B)
+    echo.echo = True
+    return [
+        data,
+        echo,
+        types.FlexRayNullFrame(1, 0, constants.FrmFlexRayChAssign.NONE, bytes(16)),
+        types.FlexRaySymbolFrame(20, constants.FlexRaySymbol.WAKEUP, constants.FrmFlexRayChAssign.A),
+    ]
+
+
+@pytest.mark.parametrize('frame', flex_ray_frames())
+def test_flex_ray_frame_conversion(frame):
+    raw = frame.to_raw()
+    assert raw.type == frame.type
+    assert type(frame).from_raw(raw) == frame
+    assert types.XnetFrame.from_raw(raw) == frame
+    assert list(_frames.iterate_frames_as(_frames.serialize_frames([raw]), types.XnetFrame)) == [frame]
+
+
+@mock.patch('nixnet._errors.check_for_error', raise_code)
+def test_flex_ray_frame_overflow():
+    with pytest.raises(errors.XnetError):
+        types.FlexRayFrame(0).to_raw()
+    with pytest.raises(errors.XnetError):
+        types.FlexRayFrame(2048).to_raw()
+    with pytest.raises(errors.XnetError):
+        types.FlexRayFrame(1, 64).to_raw()
+    with pytest.raises(errors.XnetError):
+        types.FlexRayFrame(1, payload=bytes(255)).to_raw()
+
+
+def test_frame_batch_group_by_cycle():
+    frames = [
+        types.StartTriggerFrame(0),
+        types.FlexRayFrame(1, 62),
+        types.FlexRayFrame(5, 62),
+        types.FlexRaySymbolFrame(1, constants.FlexRaySymbol.MTS),
+        types.FlexRayNullFrame(1, 63),
+        types.FlexRayFrame(2, 63),
+        types.FlexRayFrame(1, 0),
+    ]
+    raw_frames = [frame.to_raw() for frame in frames]
+    batch = _frames.parse_batch(_frames.serialize_frames(raw_frames), types.XnetFrame)
+    groups = list(batch.group_by_cycle())
+    assert [(cycle_count, list(group)) for cycle_count, group in groups] == [
+        (None, frames[:1]),
+        (62, frames[1:4]),
+        (63, frames[4:6]),
+        (0, frames[6:]),
+    ]
+    assert groups[1][1].raw(2) == raw_frames[3]
+
+    assert list(types.FrameBatch().group_by_cycle()) == []
+    batch = types.FrameBatch.from_frames([types.FlexRayFrame(1, 3), types.FlexRayFrame(2, 3)])
+    assert [(cycle_count, len(group)) for cycle_count, group in batch.group_by_cycle()] == [(3, 2)]
+
+
 def test_lin_frame_equality():
     empty_frame = types.LinFrame(2, constants.FrameType.LIN_DATA, b'')
     base_frame = types.LinFrame(2, constants.FrameType.LIN_DATA, b'\x01')
@@ -238,6 +755,78 @@ def test_serialize_frame_with_excessive_payload():
         list(_frames.serialize_frame(base_frame))
 
 
+def test_serialize_frames():
+    frames = mixed_raw_frames()
+    expected = b"".join(
+        unit
+        for frame in frames
+        for unit in _frames.serialize_frame(frame))
+    assert _frames.serialize_frames(frames) == expected
+    assert _frames.serialize_frames([]) == b''
+
+
+def test_serialize_columns():
+    frames = mixed_raw_frames()
+    expected = b"".join(
+        unit
+        for frame in frames
+        for unit in _frames.serialize_frame(frame))
+    buffer = _frames.serialize_columns(
+        [frame.identifier for frame in frames],
+        [frame.type.value for frame in frames],
+        [memoryview(frame.payload) for frame in frames],
+        timestamps=[frame.timestamp for frame in frames],
+        flags=[frame.flags for frame in frames],
+        info=[frame.info for frame in frames])
+    assert buffer == expected
+
+    buffer = _frames.serialize_columns([2], [constants.FrameType.CAN_DATA], [b'\x01'])
+    assert list(_frames.iterate_frames(bytes(buffer))) == [
+        types.RawFrame(0, 2, constants.FrameType.CAN_DATA, 0, 0, b'\x01')]
+
+
+def test_serialize_columns_mismatched_lengths():
+    with pytest.raises(ValueError):
+        _frames.serialize_columns([1, 2, 3], [0, 0, 0], [b'a', b'b'])
+    with pytest.raises(ValueError):
+        _frames.serialize_columns([1, 2], [0, 0], [b'a', b'b'], timestamps=[0])
+    with pytest.raises(ValueError):
+        _frames.serialize_columns(iter([1]), iter([0, 0]), [b'a'])
+
+
+@mock.patch('nixnet._errors.check_for_error', raise_code)
+def test_serialize_frames_with_excessive_payload():
+    payload = 0xFF * b'\x01\x02\x03\x04\x05\x06\x07\x08'
+    base_frame = types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 4, 5, payload)
+    with pytest.raises(errors.XnetError):
+        _frames.serialize_frames([base_frame])
+
+
+def test_write_columns():
+    frames = mixed_raw_frames()
+    written = []
+
+    def _write_frame(session_ref, buffer, size_of_buffer, timeout):
+        written.append(ctypes.string_at(buffer, size_of_buffer.value))
+        return _ctypedefs.u32(0)
+
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_write_frame.side_effect = _write_frame
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameOutStreamSession('CAN1') as output_session:
+            output_session.frames.write(frames)
+            output_session.frames.write_columns(
+                [frame.identifier for frame in frames],
+                [frame.type for frame in frames],
+                [frame.payload for frame in frames],
+                timestamps=[frame.timestamp for frame in frames],
+                flags=[frame.flags for frame in frames],
+                info=[frame.info for frame in frames])
+    assert written[0] == written[1] == _frames.serialize_frames(frames)
+
+
 def assert_can_frame(index, sent, received):
     assert sent.identifier == received.identifier
     assert sent.echo == received.echo
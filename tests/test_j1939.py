@@ -0,0 +1,179 @@
+import pytest  # type: ignore
+
+from nixnet import _frames
+from nixnet import constants
+from nixnet import j1939
+from nixnet import types
+
+
+SENDER = 0x21
+RECEIVER = 0x42
+PGN = 0xFECA
+MS = 10000
+
+
+def can_frame(timestamp, pgn, source_address, destination_address, payload, priority=7):
+    identifier = types.J1939Frame(pgn, source_address, destination_address, priority).identifier
+    frame = types.CanFrame(types.CanIdentifier(identifier, True), payload=payload)
+    frame.timestamp = timestamp
+    return frame
+
+
+def connection_management(timestamp, control, size, packets, source_address, destination_address, pgn=PGN):
+    payload = bytes(bytearray([control])) + size.to_bytes(2, 'little') + bytes(bytearray([packets, 0xFF]))
+    return can_frame(
+        timestamp, j1939.TP_CM_PGN, source_address, destination_address, payload + pgn.to_bytes(3, 'little'))
+
+
+def transfer(data, destination_address=types.J1939Frame.GLOBAL_ADDRESS, start=0):
+    """Frames sending `data` with the transport protocol, 50 ms apart."""
+    packets = -(-len(data) // 7)
+    control = j1939.CM_BAM if destination_address == types.J1939Frame.GLOBAL_ADDRESS else j1939.CM_RTS
+    frames = [connection_management(start, control, len(data), packets, SENDER, destination_address)]
+    for index in range(packets):
+        chunk = data[index * 7:index * 7 + 7].ljust(7, b'\xff')
+        frames.append(can_frame(
+            start + (index + 1) * 50 * MS, j1939.TP_DT_PGN, SENDER, destination_address,
+            bytes(bytearray([index + 1])) + chunk))
+    return frames
+
+
+def test_broadcast():
+    data = bytes(bytearray(range(20)))
+    single = can_frame(5, 0xFEF1, SENDER, types.J1939Frame.GLOBAL_ADDRESS, b'\x01' * 8, priority=6)
+    reassembler = j1939.J1939Reassembler()
+
+    messages = list(reassembler.feed([single] + transfer(data, start=10)))
+    assert messages == [types.J1939Frame.from_raw(single.to_raw()), messages[1]]
+    message = messages[1]
+    assert (message.pgn, message.source_address, message.destination_address) == (
+        PGN, SENDER, types.J1939Frame.GLOBAL_ADDRESS)
+    assert message.priority == 7
+    assert message.payload == data
+    assert message.timestamp == 10 + 3 * 50 * MS
+    assert reassembler.stats == j1939.ReassemblyStats(1, 0, 0, 0, 0)
+
+
+def test_connection_mode():
+    data = bytes(bytearray(range(255))) * 7
+    frames = transfer(data, RECEIVER)
+    # The receiver's clear to send and acknowledgement don't carry data.
+    frames.insert(1, connection_management(1, j1939.CM_CTS, 0, 0, RECEIVER, SENDER))
+    frames.append(connection_management(frames[-1].timestamp, j1939.CM_EOM_ACK, len(data), 255, RECEIVER, SENDER))
+    assert len(data) == types.J1939Frame.MAX_PAYLOAD_LENGTH
+
+    reassembler = j1939.J1939Reassembler()
+    messages = list(reassembler.feed(frames))
+    assert [(message.destination_address, message.payload) for message in messages] == [(RECEIVER, data)]
+
+
+def test_out_of_order_and_repeated_packets():
+    data = bytes(bytearray(range(30)))
+    frames = transfer(data)
+    frames[1:] = [frames[3], frames[1], frames[1], frames[5], frames[2], frames[4]]
+    reassembler = j1939.J1939Reassembler()
+    assert [message.payload for message in reassembler.feed(frames)] == [data]
+
+
+def test_interleaved_senders():
+    first = bytes(bytearray(range(10)))
+    second = bytes(bytearray(range(100, 120)))
+    frames = transfer(first) + transfer(second, RECEIVER, start=MS)
+    frames.sort(key=lambda frame: frame.timestamp)
+    reassembler = j1939.J1939Reassembler()
+    assert sorted(message.payload for message in reassembler.feed(frames)) == [first, second]
+
+
+def test_abort():
+    frames = transfer(bytes(20), RECEIVER)
+    frames.insert(2, connection_management(60 * MS, j1939.CM_ABORT, 0xFFFF, 0xFF, RECEIVER, SENDER))
+    reassembler = j1939.J1939Reassembler()
+    assert list(reassembler.feed(frames)) == []
+    assert reassembler.stats == j1939.ReassemblyStats(0, 1, 0, 0, 0)
+
+
+def test_restart_replaces_transfer():
+    data = bytes(bytearray(range(20)))
+    frames = transfer(bytes(30))[:2] + transfer(data, start=200 * MS)
+    reassembler = j1939.J1939Reassembler()
+    assert [message.payload for message in reassembler.feed(frames)] == [data]
+    assert reassembler.stats == j1939.ReassemblyStats(1, 1, 0, 0, 0)
+
+
+def test_timeout():
+    frames = transfer(bytes(20))
+    frames[-1].timestamp += 800 * MS
+    reassembler = j1939.J1939Reassembler()
+    assert list(reassembler.feed(frames)) == []
+    assert reassembler.stats == j1939.ReassemblyStats(0, 0, 1, 0, 0)
+
+    reassembler = j1939.J1939Reassembler(timeout=1.0)
+    assert len(list(reassembler.feed(frames))) == 1
+
+
+def test_max_transfers():
+    reassembler = j1939.J1939Reassembler(max_transfers=2)
+    announcements = [
+        connection_management(index, j1939.CM_RTS, 20, 3, SENDER, destination)
+        for index, destination in enumerate([1, 2, 3])]
+    assert list(reassembler.feed(announcements)) == []
+    assert reassembler.stats == j1939.ReassemblyStats(0, 0, 0, 1, 2)
+
+    # The oldest transfer, to address 1, was dropped.
+    packets = [
+        can_frame(10, j1939.TP_DT_PGN, SENDER, destination, bytes(bytearray([sequence])) + bytes(7))
+        for destination in [1, 2] for sequence in [1, 2, 3]]
+    messages = list(reassembler.feed(packets))
+    assert [message.destination_address for message in messages] == [2]
+
+    reassembler.reset()
+    assert reassembler.stats == j1939.ReassemblyStats(0, 0, 0, 0, 0)
+    with pytest.raises(ValueError):
+        j1939.J1939Reassembler(max_transfers=0)
+
+
+def test_invalid_announcements_are_ignored():
+    reassembler = j1939.J1939Reassembler(pgns=[PGN + 1])
+    frames = [
+        connection_management(0, j1939.CM_BAM, 20, 3, SENDER, 0xFF),
+        connection_management(0, j1939.CM_RTS, 20, 3, SENDER, RECEIVER, pgn=PGN + 1),
+        connection_management(0, j1939.CM_RTS, 20, 2, 0x30, RECEIVER, pgn=PGN + 1),
+        connection_management(0, j1939.CM_RTS, 1786, 0xFF, 0x31, RECEIVER, pgn=PGN + 1),
+        connection_management(0, j1939.CM_RTS, 5, 1, 0x32, RECEIVER, pgn=PGN + 1),
+    ]
+    assert list(reassembler.feed(frames)) == []
+    assert reassembler.stats.pending == 1
+
+    packets = [
+        can_frame(1, j1939.TP_DT_PGN, SENDER, 0xFF, b'\x01' + bytes(7)),
+        can_frame(1, j1939.TP_DT_PGN, SENDER, RECEIVER, b'\x04' + bytes(7)),
+        can_frame(1, j1939.TP_DT_PGN, SENDER, RECEIVER, b'\x00' + bytes(7)),
+    ]
+    assert list(reassembler.feed(packets)) == []
+    assert reassembler.stats.pending == 1
+
+
+def test_skips_other_frames():
+    frames = [
+        types.RawFrame(1, 0x18FEF121, constants.FrameType.CAN_DATA, 0, 0, b'\x01'),
+        types.RawFrame(2, 0x100, constants.FrameType.CAN_DATA, 0, 0, b'\x01'),
+        types.RawFrame(3, 0x42, constants.FrameType.LIN_DATA, 0, 0, b'\x01'),
+    ]
+    reassembler = j1939.J1939Reassembler()
+    assert list(reassembler.feed(frames)) == []
+
+    message = types.J1939Frame(PGN, SENDER, payload=bytes(100))
+    assert list(reassembler.feed([message])) == [message]
+
+
+def test_feed_bytes():
+    data = bytes(bytearray(range(50)))
+    frames = transfer(data) + transfer(data, RECEIVER, start=MS)
+    frames.sort(key=lambda frame: frame.timestamp)
+    frame_bytes = _frames.serialize_frames([frame.to_raw() for frame in frames])
+
+    reassembler = j1939.J1939Reassembler()
+    messages = list(reassembler.feed_bytes(frame_bytes))
+    assert messages == list(j1939.J1939Reassembler().feed(frames))
+    assert [(message.destination_address, message.payload) for message in messages] == [
+        (types.J1939Frame.GLOBAL_ADDRESS, data), (RECEIVER, data)]
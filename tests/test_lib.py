@@ -1,5 +1,11 @@
+import ctypes  # type: ignore
+
+from unittest import mock  # type: ignore
+
 import pytest  # type: ignore
 
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
 from nixnet import _lib
 
 
@@ -25,3 +31,63 @@ def test_function_not_supported():
     with pytest.raises(_lib.XnetFunctionNotSupportedError) as excinfo:
         lib.strange_and_unusual_funcion
     print(excinfo.value.args)
+
+
+class FakeLibrary(object):
+    """Stand-in for a ``ctypes.CDLL`` exporting ``nxClear`` and ``nxStop``."""
+
+    prototype = ctypes.CFUNCTYPE(ctypes.c_uint32, ctypes.c_uint32)
+
+    def __init__(self):
+        self.calls = []
+        self._functions = {}
+        self._callbacks = {
+            'nxClear': self.prototype(lambda session_ref: self._call('nxClear', session_ref)),
+            'nxStop': self.prototype(lambda session_ref, scope: self._call('nxStop', session_ref)),
+        }
+
+    def _call(self, name, session_ref):
+        self.calls.append((name, session_ref))
+        return 0
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._callbacks:
+            raise AttributeError(name)
+        if name not in self._functions:
+            self._functions[name] = self[name]
+        return self._functions[name]
+
+    def __getitem__(self, name):
+        # Like CDLL, item access returns a new function pointer each time.
+        if name not in self._callbacks:
+            raise AttributeError(name)
+        return self.prototype(ctypes.cast(self._callbacks[name], ctypes.c_void_p).value)
+
+
+def test_lazy_binding():
+    fake = FakeLibrary()
+    with mock.patch('nixnet._lib.import_lib', return_value=_lib.XnetLibrary(fake)):
+        lib = _cfuncs.XnetLibrary()
+        status = lib.nx_clear(_ctypedefs.nxSessionRef_t(5))
+    assert isinstance(status, _ctypedefs.nxStatus_t)
+    assert status.value == 0
+    assert fake.calls == [('nxClear', 5)]
+
+
+def test_eager_binding():
+    fake = FakeLibrary()
+    with mock.patch('nixnet._lib.import_lib', return_value=_lib.XnetLibrary(fake)):
+        lib = _cfuncs.XnetLibrary(eager=True)
+        lib.cdll
+        assert lib.nx_clear is not _cfuncs.XnetLibrary.nx_clear.__get__(lib)
+        status = lib.nx_clear(_ctypedefs.nxSessionRef_t(5))
+        assert type(status) is int
+        assert status == 0
+        assert fake.calls == [('nxClear', 5)]
+
+        missing = lib.bind_all()
+        assert 'nx_clear' not in missing
+        assert 'nx_stop' not in missing
+        assert 'nx_read_frame' in missing
+        with pytest.raises(_lib.XnetFunctionNotSupportedError):
+            lib.nx_read_frame(None, None, None, None, None)
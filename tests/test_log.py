@@ -0,0 +1,177 @@
+import array
+
+import pytest  # type: ignore
+
+from nixnet import _arrays
+from nixnet import _frames
+from nixnet import constants
+from nixnet import log
+from nixnet import types
+
+
+requires_numpy = pytest.mark.skipif(_arrays.numpy is None, reason="Requires NumPy")
+
+
+def make_blocks(num_blocks, frames_per_block):
+    blocks = []
+    for block in range(num_blocks):
+        frames = [
+            types.RawFrame(
+                10 * (block * frames_per_block + i),
+                i,
+                constants.FrameType.CAN_DATA,
+                0,
+                0,
+                bytes(bytearray([i] * (i % 12))))
+            for i in range(frames_per_block)]
+        blocks.append(bytes(_frames.serialize_frames(frames)))
+    return blocks
+
+
+def test_log_round_trip(tmp_path):
+    path = str(tmp_path / 'capture.nxlog')
+    blocks = make_blocks(10, 5)
+    with log.LogWriter(path, index_interval=3) as writer:
+        for block in blocks:
+            writer.write_bytes(block)
+        writer.write_bytes(b'')
+        writer.write([types.CanFrame(0x123, payload=b'\x01')])
+
+    with log.LogReader(path) as reader:
+        assert reader.num_blocks == 11
+        assert list(reader.blocks())[:10] == blocks
+        assert reader.block_timestamps[:10] == [50 * i for i in range(10)]
+        frames = list(reader.frames(frame_type=types.RawFrame))
+        assert frames[:50] == [frame for block in blocks for frame in _frames.iterate_frames(block)]
+        assert list(reader)[-1] == types.CanFrame(0x123, payload=b'\x01')
+
+
+def test_log_seek(tmp_path):
+    path = str(tmp_path / 'capture.nxlog')
+    blocks = make_blocks(10, 5)
+    with log.LogWriter(path, index_interval=4) as writer:
+        for block in blocks:
+            writer.write_bytes(block)
+
+    with log.LogReader(path) as reader:
+        frames = list(reader.frames(start_timestamp=125, frame_type=types.RawFrame))
+        assert [frame.timestamp for frame in frames] == list(range(130, 500, 10))
+        assert list(reader.blocks(start_timestamp=250)) == blocks[4:]
+        assert list(reader.blocks(start_timestamp=251)) == blocks[5:]
+        assert list(reader.blocks(start_timestamp=0)) == blocks
+        batches = list(reader.batches(start_timestamp=401, frame_type=types.RawFrame))
+        assert [len(batch) for batch in batches] == [5, 5]
+
+
+def test_log_without_trailer(tmp_path):
+    path = str(tmp_path / 'capture.nxlog')
+    blocks = make_blocks(3, 4)
+    writer = log.LogWriter(path, index_interval=2)
+    for block in blocks:
+        writer.write_bytes(block)
+    writer.flush()
+    with open(path, 'ab') as f:
+        # Simulate a block cut short by a crash.
+        f.write(b'DATA\xff\x00\x00\x00')
+
+    with log.LogReader(path) as reader:
+        assert list(reader.blocks()) == blocks
+    writer.close()
+
+
+def test_log_invalid_file(tmp_path):
+    path = tmp_path / 'capture.nxlog'
+    path.write_bytes(b'')
+    with pytest.raises(ValueError):
+        log.LogReader(str(path))
+    path.write_bytes(b'not a log file at all')
+    with pytest.raises(ValueError):
+        log.LogReader(str(path))
+
+
+@requires_numpy
+def test_log_arrays(tmp_path):
+    path = str(tmp_path / 'capture.nxlog')
+    blocks = make_blocks(3, 4)
+    with log.LogWriter(path) as writer:
+        for block in blocks:
+            writer.write_bytes(block)
+
+    with log.LogReader(path) as reader:
+        arrays = list(reader.arrays())
+    assert len(arrays) == 3
+    for (frames, data), block in zip(arrays, blocks):
+        assert data == block
+        assert frames['timestamp'].tolist() == [frame.timestamp for frame in _frames.iterate_frames(block)]
+
+
+def capture(timestamps):
+    frames = [
+        types.RawFrame(timestamp, i, constants.FrameType.CAN_DATA, 0, 0, bytes(bytearray([i % 256] * (i % 20))))
+        for i, timestamp in enumerate(timestamps)]
+    return bytes(_frames.serialize_frames(frames)), frames
+
+
+@pytest.mark.parametrize('vectorized', [False, True])
+def test_timestamp_index(monkeypatch, vectorized):
+    if vectorized and _arrays.numpy is None:
+        pytest.skip("Requires NumPy")
+    if not vectorized:
+        monkeypatch.setattr(log.TimestampIndex, '_build_vectorized', log.TimestampIndex._build)
+    timestamps = [t * 7 for t in range(200)]
+    buffer, frames = capture(timestamps)
+    index = log.TimestampIndex(buffer, interval=100)
+    assert list(index.timestamps) == [next(t for t in timestamps if t >= mark) for mark in range(0, 1400, 100)]
+
+    for start, end in [(0, 1400), (0, 0), (50, 700), (99, 101), (700, 100000), (-1, 5), (2000, 3000)]:
+        expected = [frame for frame in frames if start <= frame.timestamp < end]
+        assert list(index.window(max(start, 0), end, types.RawFrame)) == expected
+        window = index.window_bytes(max(start, 0), end)
+        assert bytes(window) == bytes(_frames.serialize_frames(expected))
+
+
+def test_timestamp_index_empty():
+    index = log.TimestampIndex(b'', interval=10)
+    assert len(index.timestamps) == 0
+    assert list(index.window(0, 100)) == []
+
+
+def test_log_window(tmp_path):
+    path = str(tmp_path / 'capture.nxlog')
+    timestamps = [t * 3 for t in range(300)]
+    buffer, frames = capture(timestamps)
+    with log.LogWriter(path, index_interval=2) as writer:
+        for start in range(0, 300, 50):
+            writer.write([types.RawFrame.from_raw(frame) for frame in frames[start:start + 50]])
+
+    with log.LogReader(path) as reader:
+        for start, end in [(0, 900), (100, 160), (149, 151), (151, 152), (800, 10000)]:
+            expected = [frame for frame in frames if start <= frame.timestamp < end]
+            assert list(reader.window(start, end, types.RawFrame)) == expected
+            assert b''.join(reader.window_blocks(start, end)) == bytes(_frames.serialize_frames(expected))
+
+
+def test_log_equal_timestamps_across_blocks(tmp_path):
+    path = str(tmp_path / 'capture.nxlog')
+    frames = [types.RawFrame(t, i, constants.FrameType.CAN_DATA, 0, 0, b'') for i, t in enumerate([1, 5, 5, 9])]
+    with log.LogWriter(path) as writer:
+        writer.write(frames[:2])
+        writer.write(frames[2:])
+
+    with log.LogReader(path) as reader:
+        assert reader.block_timestamps == [1, 5]
+        assert list(reader.frames(5, types.RawFrame)) == frames[1:]
+        assert list(reader.window(5, 10, types.RawFrame)) == frames[1:]
+        assert list(reader.window(5, 6, types.RawFrame)) == frames[1:3]
+        assert b''.join(reader.window_blocks(5, 9)) == bytes(_frames.serialize_frames(frames[1:3]))
+
+
+def test_log_write_bytes_buffer_format(tmp_path):
+    path = str(tmp_path / 'capture.nxlog')
+    block = make_blocks(1, 3)[0]
+    with log.LogWriter(path) as writer:
+        writer.write_bytes(memoryview(block).cast('I'))
+        writer.write_bytes(array.array('I', block))
+
+    with log.LogReader(path) as reader:
+        assert list(reader.blocks()) == [block, block]
@@ -0,0 +1,116 @@
+import ctypes  # type: ignore
+import time
+
+from unittest import mock  # type: ignore
+
+import pytest  # type: ignore
+
+import nixnet
+from nixnet import _cconsts
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
+from nixnet import _frames
+from nixnet import _reader
+from nixnet import constants
+from nixnet import errors
+from nixnet import types
+
+
+def mock_read_frames(chunks):
+    """Create a `nx_read_frame` side effect returning each of `chunks`, then nothing."""
+    chunks = iter(chunks)
+
+    def _read_frame(session_ref, buffer, size_of_buffer, timeout, number_of_bytes_returned):
+        returned = next(chunks, b'')
+        ctypes.memmove(buffer, returned, len(returned))
+        number_of_bytes_returned.contents.value = len(returned)
+        return _ctypedefs.u32(0)
+    return _read_frame
+
+
+def wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_ring_buffer_wraps():
+    ring = _reader.RingBuffer(10)
+    assert ring.write(b'0123456')
+    assert ring.read() == b'0123456'
+    assert ring.write(b'abcdefgh')
+    assert len(ring) == 8
+    assert ring.read() == b'abcdefgh'
+    assert len(ring) == 0
+    assert ring.read() == b''
+
+
+def test_ring_buffer_full():
+    ring = _reader.RingBuffer(8)
+    assert ring.write(b'abcd')
+    assert not ring.write(b'efghi')
+    assert ring.write(b'efgh')
+    assert not ring.write(b'i')
+    assert ring.read() == b'abcdefgh'
+
+
+def test_background_reader():
+    frames = [
+        types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 0, 0, b'\x01'),
+        types.RawFrame(3, 4, constants.FrameType.CANFD_DATA, 0, 0, bytes(bytearray(range(20))))]
+    chunk = bytes(_frames.serialize_frames(frames))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frames([chunk, chunk])
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            reader = input_session.start_background_reader(capacity=1024, chunk_size=256, poll_interval=0)
+            assert input_session.background_reader is reader
+            with pytest.raises(RuntimeError):
+                input_session.start_background_reader()
+
+            wait_for(lambda: reader.stats.reads == 2)
+            assert reader.wait(0)
+            batch = reader.read_batch(types.RawFrame)
+            assert list(batch) == 2 * list(_frames.iterate_frames(chunk))
+            assert reader.read() == []
+
+            stats = reader.stats
+            assert stats.bytes_read == 2 * len(chunk)
+            assert stats.high_water_mark == 2 * len(chunk)
+            assert stats.overruns == 0
+            assert stats.max_read_latency >= stats.mean_read_latency >= 0
+        assert not reader.running
+
+
+def test_background_reader_overrun():
+    chunk = bytes(_frames.serialize_frames(
+        [types.RawFrame(1, 2, constants.FrameType.CAN_DATA, 0, 0, b'')] * 4))
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = mock_read_frames([chunk, chunk, chunk])
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            reader = input_session.start_background_reader(
+                capacity=2 * len(chunk), chunk_size=len(chunk), poll_interval=0)
+            wait_for(lambda: reader.stats.reads == 3)
+            assert reader.stats.overruns == 1
+            assert reader.stats.bytes_dropped == len(chunk)
+            assert reader.read_bytes() == 2 * chunk
+
+
+def test_background_reader_error():
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_read_frame.side_effect = errors.XnetError("", _cconsts.NX_ERR_INTERNAL_ERROR)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            reader = input_session.start_background_reader(capacity=1024, chunk_size=256)
+            assert reader.wait(5)
+            with pytest.raises(errors.XnetError):
+                reader.read_bytes()
+            assert not reader.running
@@ -0,0 +1,208 @@
+import struct
+
+from unittest import mock  # type: ignore
+
+import pytest  # type: ignore
+
+from nixnet import _arrays
+from nixnet import _frames
+from nixnet import constants
+from nixnet import convert
+from nixnet import types
+
+LITTLE = constants.SigByteOrdr.LITTLE_ENDIAN
+BIG = constants.SigByteOrdr.BIG_ENDIAN
+SIGNED = constants.SigDataType.SIGNED
+FLOAT = constants.SigDataType.IEEE_FLOAT
+
+
+def frame_layouts():
+    return [
+        convert.FrameLayout(0x10, [
+            convert.SignalLayout('Little', 4, 12),
+            convert.SignalLayout('Big', 28, 8, BIG),
+            convert.SignalLayout('Signed', 32, 16, data_type=SIGNED, scale_fac=0.5, scale_off=10),
+        ]),
+        convert.FrameLayout(0x20, [
+            convert.SignalLayout('Double', 0, 64, data_type=FLOAT),
+            convert.SignalLayout('Single', 88, 32, BIG, FLOAT),
+        ], constants.FrameType.CANFD_DATA, 16),
+        convert.FrameLayout(0x30, [
+            convert.SignalLayout('Mux', 0, 8, mux_is_data_mux=True),
+            convert.SignalLayout('Static', 8, 8),
+            convert.SignalLayout('Dynamic1', 16, 8, mux_is_dynamic=True, mux_value=1),
+            convert.SignalLayout('Dynamic2', 16, 16, mux_is_dynamic=True, mux_value=2),
+        ], payload_length=4),
+    ]
+
+
+def raw_frames():
+    def frame(timestamp, identifier, payload, frame_type=constants.FrameType.CAN_DATA):
+        return types.RawFrame(timestamp, identifier, frame_type, 0, 0, payload)
+    return [
+        frame(1, 0x10, b'\x3A\xBC\x0A\xB0\xFF\xFF\x00\x00'),
+        frame(2, 0x30, b'\x01\x05\x07\x00'),
+        frame(3, 0x20, struct.pack('<d', 1.25) + struct.pack('>f', -2.5) + bytes(4), constants.FrameType.CANFD_DATA),
+        frame(4, 0x99, bytes(8)),
+        frame(5, 0x10, b'\x00\x01'),
+        frame(6, 0x30, b'\x02\x06\x34\x12'),
+        frame(7, 0x10, b'\x00\x00\x00\x00\x02\x00'),
+        frame(8, 0x30, b'\x03\x08\x00\x00'),
+    ]
+
+
+def test_decoder(implementation):
+    decoder = convert.SignalDecoder(frame_layouts())
+    assert decoder.signals == [
+        'Little', 'Big', 'Signed', 'Double', 'Single', 'Mux', 'Static', 'Dynamic1', 'Dynamic2']
+
+    series = decoder.decode_bytes(bytes(_frames.serialize_frames(raw_frames())))
+    decoded = {name: (list(timestamps), list(values)) for name, (timestamps, values) in series.items()}
+    assert decoded == {
+        'Little': ([1, 7], [0xBC3, 0]),
+        'Big': ([1, 7], [0xAB, 0]),
+        'Signed': ([1, 7], [9.5, 11]),
+        'Double': ([3], [1.25]),
+        'Single': ([3], [-2.5]),
+        'Mux': ([2, 6, 8], [1, 2, 3]),
+        'Static': ([2, 6, 8], [5, 6, 8]),
+        'Dynamic1': ([2], [7]),
+        'Dynamic2': ([6], [0x1234]),
+    }
+
+
+def test_decoder_frames(implementation):
+    decoder = convert.SignalDecoder(frame_layouts())
+    frames = [types.CanFrame(0x30, payload=b'\x02\x06\x34\x12'), types.CanFrame(0x10)]
+    timestamps, values = decoder.decode(frames)['Dynamic2']
+    assert list(values) == [0x1234]
+    timestamps, values = decoder.decode([])['Static']
+    assert len(timestamps) == len(values) == 0
+
+
+def test_decoder_from_database():
+    cluster = mock.Mock(protocol=constants.Protocol.CAN)
+    signal = mock.Mock(
+        name_unique_to_cluster='Frame.Signal',
+        start_bit=8,
+        num_bits=8,
+        byte_ordr=LITTLE,
+        data_type=SIGNED,
+        scale_fac=2.0,
+        scale_off=0.0,
+        mux_is_data_mux=False,
+        mux_is_dynamic=False)
+    frame = mock.Mock(
+        cluster=cluster,
+        id=0x123,
+        can_ext_id=True,
+        payload_len=2,
+        default_payload=[0, 0],
+        sigs=[signal])
+    layout = convert.FrameLayout.from_frame(frame)
+    assert layout.identifier == int(types.CanIdentifier(0x123, True))
+    assert layout.frame_type == constants.FrameType.CAN_DATA
+    assert layout.signals == [convert.SignalLayout('Frame.Signal', 8, 8, LITTLE, SIGNED, 2.0)]
+
+    decoder = convert.SignalDecoder.from_database([frame])
+    frames = [types.CanFrame(types.CanIdentifier(0x123, True), payload=b'\x00\xFF')]
+    timestamps, values = decoder.decode(frames)['Frame.Signal']
+    assert list(values) == [-2.0]
+
+
+@pytest.mark.parametrize('layouts', [
+    [convert.FrameLayout(1, [convert.SignalLayout('A', 0, 0)])],
+    [convert.FrameLayout(1, [convert.SignalLayout('A', 0, 65)])],
+    [convert.FrameLayout(1, [convert.SignalLayout('A', 0, 16, data_type=FLOAT)])],
+    [convert.FrameLayout(1, [convert.SignalLayout('A', 4, 8, BIG)])],
+    [convert.FrameLayout(1, [convert.SignalLayout('A', 0, 8, mux_is_dynamic=True)])],
+    [
+        convert.FrameLayout(1, [convert.SignalLayout('A', 0, 8)]),
+        convert.FrameLayout(2, [convert.SignalLayout('A', 0, 8)])],
+    [convert.FrameLayout(1, []), convert.FrameLayout(1, [])],
+])
+def test_decoder_invalid_layout(layouts):
+    with pytest.raises(ValueError):
+        convert.SignalDecoder(layouts)
+
+
+def test_encoder(implementation):
+    layouts = frame_layouts()
+    layouts[0] = layouts[0]._replace(default_payload=b'\x0A\x00\x00\x00\x00\x00\xEE\xEE')
+    encoder = convert.SignalEncoder(layouts)
+    assert encoder.signals == convert.SignalDecoder(layouts).signals
+
+    samples = [
+        [0xBC3, 0xAB, 9.5, 1.25, -2.5, 1, 5, 7, 0],
+        [5000, 0, -1e9, 0, 0, 2, 6, 99, 0x1234],
+        [0, 0, 10, 0, 0, 3, 8, 0, 0],
+    ]
+    buffer = encoder.encode_bytes(samples, timestamps=[1, 2, 3])
+    frames = list(_frames.iterate_frames(buffer))
+    assert [(frame.timestamp, frame.identifier, frame.type) for frame in frames] == [
+        (timestamp, identifier, frame_type)
+        for timestamp in (1, 2, 3)
+        for identifier, frame_type in [
+            (0x10, constants.FrameType.CAN_DATA),
+            (0x20, constants.FrameType.CANFD_DATA),
+            (0x30, constants.FrameType.CAN_DATA)]]
+    assert frames[0].payload == b'\x3A\xBC\x0A\xB0\xFF\xFF\xEE\xEE'
+    assert frames[1].payload == struct.pack('<d', 1.25) + struct.pack('>f', -2.5) + bytes(4)
+    assert frames[2].payload == b'\x01\x05\x07\x00'
+
+    series = convert.SignalDecoder(layouts).decode_bytes(buffer)
+    decoded = {name: list(values) for name, (_, values) in series.items()}
+    assert decoded['Little'] == [0xBC3, 0xFFF, 0]
+    assert decoded['Signed'] == [9.5, -32768 * 0.5 + 10, 10]
+    assert decoded['Dynamic1'] == [7]
+    assert decoded['Dynamic2'] == [0x1234]
+    assert list(series['Dynamic2'][0]) == [2]
+
+
+@pytest.mark.skipif(_arrays.numpy is None, reason="Requires NumPy")
+def test_encoder_implementations_match(monkeypatch):
+    encoder = convert.SignalEncoder(frame_layouts())
+    numpy = _arrays.numpy
+    samples = numpy.random.RandomState(0).uniform(-1000, 1000, (50, len(encoder.signals)))
+    samples[:, encoder.signals.index('Mux')] = numpy.arange(50) % 3
+    vectorized = encoder.encode_bytes(samples, timestamps=range(50))
+    monkeypatch.setattr(_arrays, 'numpy', None)
+    assert encoder.encode_bytes(samples.tolist(), timestamps=range(50)) == vectorized
+
+
+def test_encoder_empty(implementation):
+    encoder = convert.SignalEncoder(frame_layouts())
+    assert encoder.encode_bytes([]) == b''
+    with pytest.raises(ValueError):
+        encoder.encode_bytes([[0.0]])
+    with pytest.raises(ValueError):
+        encoder.encode_bytes([[0.0] * len(encoder.signals)], timestamps=[1, 2])
+
+
+@pytest.mark.parametrize('layout', [
+    convert.FrameLayout(1, [convert.SignalLayout('A', 0, 16)], payload_length=1),
+    convert.FrameLayout(1, [], payload_length=2, default_payload=b'\x00'),
+])
+def test_encoder_invalid_layout(layout):
+    with pytest.raises(ValueError):
+        convert.SignalEncoder([layout])
+
+
+@pytest.mark.skipif(_arrays.numpy is None, reason="Requires NumPy")
+def test_decoder_implementations_match(monkeypatch):
+    decoder = convert.SignalDecoder(frame_layouts())
+    numpy = _arrays.numpy
+    random = numpy.random.RandomState(0)
+    frames = [
+        types.RawFrame(
+            timestamp, int(identifier), constants.FrameType.CAN_DATA, 0, 0,
+            bytes(bytearray([timestamp % 4])) + random.bytes(15))
+        for timestamp, identifier in enumerate(random.choice([0x10, 0x20, 0x30, 0x99], 200))]
+    frame_bytes = bytes(_frames.serialize_frames(frames))
+    vectorized = decoder.decode_bytes(frame_bytes)
+    monkeypatch.setattr(_arrays, 'numpy', None)
+    expected = decoder.decode_bytes(frame_bytes)
+    assert list(vectorized) == list(expected)
+    for name, (timestamps, values) in expected.items():
+        assert vectorized[name][0].tolist() == timestamps.tolist()
+        assert numpy.array_equal(vectorized[name][1], numpy.array(values), equal_nan=True)
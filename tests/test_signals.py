@@ -1,8 +1,56 @@
+import array
+import ctypes  # type: ignore
 import time
 
+from unittest import mock  # type: ignore
+
 import pytest  # type: ignore
 
 import nixnet
+from nixnet import _arrays
+from nixnet import _buffers
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
+
+from nixnet._session import signals as session_signals
+
+
+def mock_signal_lib():
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    return lib
+
+
+def mock_read_signal_waveform(rows):
+    """Create a `nx_read_signal_waveform` side effect returning one row of values per signal."""
+    def _read_signal_waveform(
+            session_ref, timeout, start_time, delta_time, value_buffer, size_of_value_buffer,
+            number_of_values_returned):
+        num_values_per_signal = size_of_value_buffer.value // _ctypedefs.f64.BYTES // len(rows)
+        for index, row in enumerate(rows):
+            for offset, value in enumerate(row):
+                value_buffer[index * num_values_per_signal + offset] = value
+        start_time.contents.value = 1000
+        delta_time.contents.value = 0.5
+        number_of_values_returned.contents.value = len(rows[0])
+        return _ctypedefs.u32(0)
+    return _read_signal_waveform
+
+
+def mock_read_signal_xy(pairs):
+    """Create a `nx_read_signal_xy` side effect returning `(timestamp, value)` pairs per signal."""
+    def _read_signal_xy(
+            session_ref, time_limit, value_buffer, size_of_value_buffer, timestamp_buffer,
+            size_of_timestamp_buffer, num_pairs_buffer, size_of_num_pairs_buffer):
+        num_values_per_signal = size_of_value_buffer.value // _ctypedefs.f64.BYTES // len(pairs)
+        for index, signal_pairs in enumerate(pairs):
+            for offset, (timestamp, value) in enumerate(signal_pairs):
+                timestamp_buffer[index * num_values_per_signal + offset] = timestamp
+                value_buffer[index * num_values_per_signal + offset] = value
+            num_pairs_buffer[index] = len(signal_pairs)
+        return _ctypedefs.u32(0)
+    return _read_signal_xy
 
 
 @pytest.mark.integration
@@ -40,6 +88,42 @@ def test_signals_container(can_in_interface):
         assert input_session.signals.get("<random>") is None
 
 
+def test_signals_lookup_cached():
+    with mock.patch('nixnet._props.get_session_num_in_list', return_value=3) as get_num, \
+            mock.patch('nixnet._props.get_session_list', return_value=['a', 'b', 'c']) as get_list:
+        signals = session_signals.Signals(1)
+        assert len(signals) == 3
+        assert [str(signal) for signal in signals] == ['a', 'b', 'c']
+        assert int(signals['c']) == 2
+        assert int(signals.get('b')) == 1
+        assert signals.get('d') is None
+        assert 'a' in signals and 'd' not in signals
+        assert signals.indices_of(['c', 'a']) == [2, 0]
+        with pytest.raises(KeyError):
+            signals['d']
+        with pytest.raises(KeyError):
+            signals.indices_of(['a', 'd'])
+        assert get_num.call_count == 1
+        assert get_list.call_count == 1
+
+        get_list.return_value = ['d']
+        get_num.return_value = 1
+        signals.invalidate_cache()
+        assert len(signals) == 1
+        assert signals.indices_of(['d']) == [0]
+        assert get_num.call_count == 2
+        assert get_list.call_count == 2
+
+
+def test_signals_lookup_repeated_name():
+    with mock.patch('nixnet._props.get_session_num_in_list', return_value=3), \
+            mock.patch('nixnet._props.get_session_list', return_value=['a', 'b', 'a']):
+        signals = session_signals.Signals(1)
+        assert int(signals['a']) == 0
+        assert int(signals.get('a')) == 0
+        assert signals.indices_of(['b', 'a']) == [1, 0]
+
+
 @pytest.mark.integration
 def test_singlepoint_loopback(can_in_interface, can_out_interface):
     database_name = 'NIXNET_example'
@@ -70,3 +154,145 @@ def test_singlepoint_loopback(can_in_interface, can_out_interface):
             actual_signals = list(input_session.signals.read())
             for expected, (_, actual) in zip(expected_signals, actual_signals):
                 assert pytest.approx(expected, rel=1) == actual
+
+
+def test_waveform_read(implementation):
+    lib = mock_signal_lib()
+    lib.nx_read_signal_waveform.side_effect = mock_read_signal_waveform([[1.0, 2.0], [3.0, 4.0]])
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_in_list', return_value=2):
+        with nixnet.SignalInWaveformSession('CAN1', 'db', 'cluster', ['a', 'b']) as input_session:
+            start_time, delta_time, rows = input_session.signals.read(4)
+            assert (start_time, delta_time) == (1000, 0.5)
+            assert [list(row) for row in rows] == [[1.0, 2.0], [3.0, 4.0]]
+
+            size_of_value_buffer = lib.nx_read_signal_waveform.call_args[0][5]
+            assert size_of_value_buffer.value == 2 * 4 * _ctypedefs.f64.BYTES
+            value_buffer = lib.nx_read_signal_waveform.call_args[0][4]
+            input_session.signals.read(4)
+            assert ctypes.addressof(lib.nx_read_signal_waveform.call_args[0][4]) == ctypes.addressof(value_buffer)
+            if implementation == 'python':
+                assert all(isinstance(row, array.array) for row in rows)
+
+            out = array.array('d', [0.0] * 6)
+            _, _, rows = input_session.signals.read(3, out=out)
+            assert list(out) == [1.0, 2.0, 0.0, 3.0, 4.0, 0.0]
+            assert list(rows[1]) == [3.0, 4.0]
+
+
+def test_xy_read(implementation):
+    lib = mock_signal_lib()
+    lib.nx_read_signal_xy.side_effect = mock_read_signal_xy([[(10, 1.5), (20, 2.5)], [(15, -1.0)]])
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_in_list', return_value=2):
+        with nixnet.SignalInXYSession('CAN1', 'db', 'cluster', ['a', 'b']) as input_session:
+            signals = input_session.signals.read(8)
+            assert [(list(timestamps), list(values)) for timestamps, values in signals] == [
+                ([10, 20], [1.5, 2.5]),
+                ([15], [-1.0])]
+            size_of_num_pairs_buffer = lib.nx_read_signal_xy.call_args[0][7]
+            assert size_of_num_pairs_buffer.value == 2 * _ctypedefs.u32.BYTES
+            assert _buffers.pool.num_bytes > 0
+            if implementation == 'python':
+                assert [type(array_) for array_ in signals[0]] == [array.array, array.array]
+    assert _buffers.pool.num_bytes == 0
+
+
+def mock_read_signal_single_point(timestamps, values):
+    """Create a `nx_read_signal_single_point` side effect returning `timestamps` and `values`."""
+    def _read_signal_single_point(
+            session_ref, value_buffer, size_of_value_buffer, timestamp_buffer, size_of_timestamp_buffer):
+        assert size_of_value_buffer.value == len(values) * _ctypedefs.f64.BYTES
+        assert size_of_timestamp_buffer.value == len(timestamps) * _ctypedefs.nxTimestamp_t.BYTES
+        for index, (timestamp, value) in enumerate(zip(timestamps, values)):
+            timestamp_buffer[index] = timestamp
+            value_buffer[index] = value
+        return _ctypedefs.u32(0)
+    return _read_signal_single_point
+
+
+def test_singlepoint_read_array(implementation):
+    lib = mock_signal_lib()
+    lib.nx_read_signal_single_point.side_effect = mock_read_signal_single_point([10, 20], [1.5, -2.0])
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_in_list', return_value=2):
+        with nixnet.SignalInSinglePointSession('CAN1', 'db', 'cluster', ['a', 'b']) as input_session:
+            timestamps, values = input_session.signals.read_array()
+            assert list(timestamps) == [10, 20]
+            assert list(values) == [1.5, -2.0]
+            assert list(input_session.signals.read()) == [(10, 1.5), (20, -2.0)]
+            first_call, second_call = lib.nx_read_signal_single_point.call_args_list
+            assert ctypes.addressof(first_call[0][1]) == ctypes.addressof(second_call[0][1])
+            pooled_bytes = _buffers.pool.num_bytes
+            assert pooled_bytes >= 2 * (_ctypedefs.f64.BYTES + _ctypedefs.nxTimestamp_t.BYTES)
+
+            timestamps_out = array.array('Q', [0, 0])
+            values_out = array.array('d', [0.0, 0.0])
+            input_session.signals.read_array(timestamps_out, values_out)
+            assert _buffers.pool.num_bytes == pooled_bytes
+            assert ctypes.addressof(lib.nx_read_signal_single_point.call_args[0][1]) == values_out.buffer_info()[0]
+            assert list(timestamps_out) == [10, 20]
+            assert list(values_out) == [1.5, -2.0]
+            with pytest.raises(ValueError):
+                input_session.signals.read_array(values=array.array('d', [0.0]))
+            with pytest.raises(TypeError):
+                input_session.signals.read_array(values=bytes(16))
+    assert _buffers.pool.num_bytes == 0
+
+
+def test_singlepoint_write_arrays(implementation):
+    written = []
+
+    def _write_signal_single_point(session_ref, value_buffer, size_of_value_buffer):
+        num_values = size_of_value_buffer.value // _ctypedefs.f64.BYTES
+        written.append((ctypes.addressof(value_buffer), [value_buffer[index].value for index in range(num_values)]))
+        return _ctypedefs.u32(0)
+
+    lib = mock_signal_lib()
+    lib.nx_write_signal_single_point.side_effect = _write_signal_single_point
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_in_list', return_value=3), \
+            mock.patch('nixnet._props.get_session_list', return_value=['a', 'b', 'c']):
+        with nixnet.SignalOutSinglePointSession('CAN1', 'db', 'cluster', ['a', 'b', 'c']) as output_session:
+            output_session.signals.write([1, 2, 3])
+            assert written.pop()[1] == [1.0, 2.0, 3.0]
+
+            values = array.array('d', [4.0, 5.0, 6.0])
+            output_session.signals.write(values)
+            address, written_values = written.pop()
+            assert written_values == [4.0, 5.0, 6.0]
+            assert address == values.buffer_info()[0]
+            output_session.signals.write(memoryview(values)[1:])
+            assert written.pop()[1] == [5.0, 6.0]
+
+            assert list(output_session.signals.values) == [0.0, 0.0, 0.0]
+            output_session.signals.set_value(0, 7.0)
+            output_session.signals.set_value('c', 9.0)
+            output_session.signals.set_value(output_session.signals['b'], 8.0)
+            output_session.signals.flush()
+            assert written.pop()[1] == [7.0, 8.0, 9.0]
+            with pytest.raises(KeyError) as excinfo:
+                output_session.signals.set_value('d', 0.0)
+            assert excinfo.value.args == ('Unknown signal', 'd')
+            for index in [-1, 3]:
+                with pytest.raises(IndexError):
+                    output_session.signals.set_value(index, 0.0)
+            assert list(output_session.signals.values) == [7.0, 8.0, 9.0]
+
+
+@pytest.mark.skipif(_arrays.numpy is None, reason="Requires NumPy")
+def test_singlepoint_write_numpy():
+    numpy = _arrays.numpy
+    lib = mock_signal_lib()
+    lib.nx_write_signal_single_point.return_value = _ctypedefs.u32(0)
+    with mock.patch('nixnet._cfuncs.lib', lib), \
+            mock.patch('nixnet._props.get_session_num_in_list', return_value=2):
+        with nixnet.SignalOutSinglePointSession('CAN1', 'db', 'cluster', ['a', 'b']) as output_session:
+            values = numpy.array([1.0, 2.0])
+            output_session.signals.write(values)
+            value_buffer = lib.nx_write_signal_single_point.call_args[0][1]
+            assert ctypes.addressof(value_buffer) == values.ctypes.data
+
+            output_session.signals.write(numpy.array([1, 2], dtype=numpy.int32))
+            value_buffer = lib.nx_write_signal_single_point.call_args[0][1]
+            assert [value.value for value in value_buffer] == [1.0, 2.0]
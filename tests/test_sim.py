@@ -0,0 +1,228 @@
+from unittest import mock  # type: ignore
+
+import pytest  # type: ignore
+
+import nixnet
+from nixnet import _cconsts
+from nixnet import _cfuncs
+from nixnet import _errors
+from nixnet import _funcs
+from nixnet import _lib
+from nixnet import _sim
+from nixnet import constants
+from nixnet import database
+from nixnet import errors
+from nixnet import types
+
+
+class FakeClock(object):
+
+    def __init__(self, start=1000):
+        self.time = start
+
+    def __call__(self):
+        self.time += 10
+        return self.time
+
+
+@pytest.fixture
+def simulator():
+    simulator = _sim.Simulator(FakeClock())
+    lib = _cfuncs.XnetLibrary(eager=True)
+    driver = _lib.XnetLibrary(_sim.SimulatedDriver(simulator))
+    with mock.patch('nixnet._lib.import_lib', return_value=driver):
+        with mock.patch('nixnet._cfuncs.lib', lib):
+            yield simulator
+
+
+def test_import_lib(monkeypatch):
+    monkeypatch.setenv(_lib.BACKEND_ENV, _lib.SIMULATED_BACKEND)
+    library = _lib.import_lib()
+    assert isinstance(library._library, _sim.SimulatedDriver)
+    assert library.nxClear is library.nxClear
+    assert library.function('nxClear') is not library.nxClear
+    with pytest.raises(_lib.XnetFunctionNotSupportedError):
+        library.nxNotAFunction
+    with pytest.raises(ValueError):
+        _lib.import_lib('bogus')
+
+
+def test_stream_loopback(simulator):
+    with nixnet.FrameInStreamSession('CAN1') as input_session:
+        with nixnet.FrameInStreamSession('LIN1') as lin_session:
+            with nixnet.FrameOutStreamSession('CAN2') as output_session:
+                input_session.start()
+                lin_session.start()
+                frames = [types.CanFrame(0x10, payload=b'\x01\x02'), types.CanFrame(0x20, payload=bytes(8))]
+                output_session.frames.write(frames)
+
+                received = list(input_session.frames.read(10))
+                assert [(frame.identifier, frame.payload) for frame in received] == [
+                    (frame.identifier, frame.payload) for frame in frames]
+                # Ticks: input start, LIN start, output auto-start, then one per frame.
+                assert input_session.time_start == 1010
+                assert [frame.timestamp for frame in received] == [1040, 1050]
+                assert input_session.state == constants.SessionInfoState.STARTED
+                assert list(lin_session.frames.read(10)) == []
+
+
+def test_output_pending_until_start(simulator):
+    with nixnet.FrameInStreamSession('CAN1') as input_session:
+        with nixnet.FrameOutStreamSession('CAN2') as output_session:
+            input_session.start()
+            output_session.auto_start = False
+            output_session.frames.write([types.CanFrame(1)])
+            assert list(input_session.frames.read(10)) == []
+            assert output_session.num_pend == 1
+
+            output_session.start()
+            assert [frame.identifier for frame in input_session.frames.read(10)] == [types.CanIdentifier(1)]
+
+
+def test_queue_overflow(simulator):
+    frame_size = 24
+    with nixnet.FrameInStreamSession('CAN1') as input_session:
+        with nixnet.FrameOutStreamSession('CAN2') as output_session:
+            input_session.queue_size = 2 * frame_size
+            input_session.start()
+            assert input_session.queue_size == 2 * frame_size
+            assert input_session.num_unused == 2
+
+            output_session.frames.write([types.CanFrame(1), types.CanFrame(2), types.CanFrame(3)])
+            assert input_session.num_pend == 2
+            assert input_session.num_unused == 0
+            with pytest.raises(errors.XnetError) as excinfo:
+                list(input_session.frames.read(10))
+            assert excinfo.value.error_code == _cconsts.NX_ERR_INPUT_QUEUE_OVERFLOW
+            assert [frame.identifier for frame in input_session.frames.read(10)] == [
+                types.CanIdentifier(1), types.CanIdentifier(2)]
+
+
+def test_snapshot(simulator):
+    with nixnet.FrameInStreamSession('CAN1') as input_session:
+        input_session.start()
+        snapshot = input_session.snapshot(['num_pend', 'queue_size', 'state', 'time_current', 'can_comm'])
+        assert snapshot.num_pend == 0
+        assert snapshot.queue_size == _sim.DEFAULT_QUEUE_SIZE
+        assert snapshot.state == constants.SessionInfoState.STARTED
+        assert snapshot.time_current > input_session.time_start
+        assert snapshot.can_comm.state == constants.CanCommState.ERROR_ACTIVE
+
+
+def test_memory_database(simulator):
+    with database.Database(':memory:') as db:
+        cluster = db.clusters.add('Cluster')
+        standard = cluster.frames.add('Standard')
+        standard.id = 0x10
+        extended = cluster.frames.add('Extended')
+        extended.id = 0x10
+        extended.can_ext_id = True
+        assert sorted(db.clusters['Cluster'].frames.keys()) == ['Extended', 'Standard']
+        assert db.clusters['Cluster'].frames['Extended'].can_ext_id
+        with pytest.raises(errors.XnetError):
+            cluster.frames.add('Standard')
+
+        with nixnet.FrameInQueuedSession('CAN1', ':memory:', 'Cluster', 'Extended') as input_session:
+            with nixnet.FrameOutStreamSession('CAN2') as output_session:
+                input_session.start()
+                output_session.frames.write([
+                    types.CanFrame(0x10, payload=b'\x01'),
+                    types.CanFrame(types.CanIdentifier(0x10, True), payload=b'\x02'),
+                ])
+                assert [frame.payload for frame in input_session.frames.read(10)] == [b'\x02']
+
+        del cluster.frames['Extended']
+        assert list(cluster.frames.keys()) == ['Standard']
+        with pytest.raises(errors.XnetError) as excinfo:
+            nixnet.FrameInQueuedSession('CAN1', ':memory:', 'Cluster', 'Extended')
+        assert excinfo.value.error_code == _cconsts.NX_ERR_FRAME_NOT_FOUND
+
+
+def test_signal_single_point(simulator):
+    input_session = nixnet.SignalInSinglePointSession('CAN1', ':memory:', 'Cluster', ['Frame.B', 'Frame.A'])
+    output_session = nixnet.SignalOutSinglePointSession('CAN2', ':memory:', 'Cluster', ['Frame.A', 'Frame.B'])
+    with input_session, output_session:
+        assert list(input_session.signals.read()) == [(0, 0.0), (0, 0.0)]
+        output_session.signals.write([1.5, -2.0])
+        assert list(input_session.signals.read()) == [(1030, -2.0), (1030, 1.5)]
+        with pytest.raises(errors.XnetError) as excinfo:
+            _funcs.nx_write_signal_single_point(input_session._handle, [0.0, 0.0])
+        assert excinfo.value.error_code == _cconsts.NX_ERR_INVALID_MODE
+
+
+def test_unsupported(simulator):
+    with pytest.raises(errors.XnetError) as excinfo:
+        nixnet.SignalInWaveformSession('CAN1', ':memory:', 'Cluster', 'Frame.Signal')
+    assert excinfo.value.error_code == _cconsts.NX_ERR_UNSUPPORTED_MODE
+    with pytest.raises(errors.XnetError) as excinfo:
+        nixnet.FrameInStreamSession('Ethernet1')
+    assert excinfo.value.error_code == _cconsts.NX_ERR_INVALID_INTERFACE
+
+
+def test_status_to_string(simulator):
+    assert _errors.status_to_string(_cconsts.NX_ERR_INVALID_MODE) == 'Simulated NI-XNET status 0x{:08X}.'.format(
+        _cconsts.NX_ERR_INVALID_MODE)
+    with nixnet.FrameInStreamSession('CAN1') as input_session:
+        with pytest.raises(errors.XnetError) as excinfo:
+            _funcs.nx_write_signal_single_point(input_session._handle, [0.0])
+    assert 'Simulated NI-XNET status' in str(excinfo.value)
+
+
+def test_handler_errors(simulator):
+    library = _lib.import_lib()
+    with nixnet.FrameInStreamSession('CAN1') as input_session:
+        ref = input_session._handle
+        status = library.nxSetProperty(ref, _cconsts.NX_PROP_SESSION_QUEUE_SIZE, 0, None)
+        assert status == _cconsts.NX_ERR_INVALID_PROPERTY_SIZE
+
+        with mock.patch.object(simulator, '_start', side_effect=RuntimeError):
+            assert library.nxStart(ref, 0) == _cconsts.NX_ERR_INTERNAL_ERROR
+
+
+def test_example_databases(simulator):
+    with database.Database('NIXNET_example') as db:
+        cluster = db.clusters['CAN_Cluster']
+        assert cluster.protocol == constants.Protocol.CAN
+        assert cluster.frames['CANEventFrame1'].id == 66
+        cluster.frames.add('Added')
+    with database.Database('NIXNET_example') as db:
+        assert 'Added' not in db.clusters['CAN_Cluster'].frames.keys()
+    with database.Database('NIXNET_exampleLDF') as db:
+        assert db.clusters['Cluster'].protocol == constants.Protocol.LIN
+
+    no_examples = _sim.Simulator(FakeClock(), examples=False)
+    driver = _lib.XnetLibrary(_sim.SimulatedDriver(no_examples))
+    with mock.patch('nixnet._lib.import_lib', return_value=driver):
+        with mock.patch('nixnet._cfuncs.lib', _cfuncs.XnetLibrary(eager=True)):
+            with pytest.raises(errors.XnetError) as excinfo:
+                nixnet.FrameInQueuedSession('CAN1', 'NIXNET_example', 'CAN_Cluster', 'CANEventFrame1')
+    assert excinfo.value.error_code == _cconsts.NX_ERR_CANNOT_OPEN_DATABASE_FILE
+
+
+def test_frame_single_point(simulator):
+    frame_names = ['CANEventFrame1', 'CANEventFrame2']
+    with nixnet.FrameInSinglePointSession('CAN1', 'NIXNET_example', 'CAN_Cluster', frame_names) as input_session:
+        with nixnet.FrameOutSinglePointSession(
+                'CAN2', 'NIXNET_example', 'CAN_Cluster', frame_names) as output_session:
+            input_session.start()
+            output_session.frames.write([types.CanFrame(67, payload=b'\x01')])
+            output_session.frames.write([types.CanFrame(66, payload=b'\x02'), types.CanFrame(67, payload=b'\x03')])
+            frames = list(input_session.frames.read())
+            assert [(frame.identifier, frame.payload) for frame in frames] == [
+                (types.CanIdentifier(66), b'\x02'), (types.CanIdentifier(67), b'\x03')]
+            assert list(input_session.frames.read()) == frames
+
+
+def test_interface_events(simulator):
+    with nixnet.FrameInStreamSession('CAN1') as input_session:
+        input_session.start()
+        input_session.wait_for_intf_communicating(0)
+        assert not input_session.can_comm.sleep
+        input_session.intf.can_tcvr_state = constants.CanTcvrState.SLEEP
+        assert input_session.can_comm.sleep
+        with pytest.raises(errors.XnetError) as excinfo:
+            input_session.wait_for_intf_remote_wakeup(0)
+        assert excinfo.value.error_type == constants.Err.EVENT_TIMEOUT
+        with pytest.raises(errors.XnetError) as excinfo:
+            input_session.connect_terminals('FrontPanel0', 'FrontPanel1')
+        assert excinfo.value.error_code == _cconsts.NX_ERR_INVALID_SYNCHRONIZATION_COMBINATION
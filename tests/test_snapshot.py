@@ -0,0 +1,133 @@
+import ctypes  # type: ignore
+import time
+
+from unittest import mock  # type: ignore
+
+import pytest  # type: ignore
+
+import nixnet
+from nixnet import _cconsts
+from nixnet import _cfuncs
+from nixnet import _ctypedefs
+from nixnet import constants
+from nixnet import errors
+from nixnet import types
+
+PROPERTIES = {
+    _cconsts.NX_PROP_SESSION_NUM_PEND: 3,
+    _cconsts.NX_PROP_SESSION_NUM_UNUSED: 97,
+    _cconsts.NX_PROP_SESSION_QUEUE_SIZE: 100,
+}
+
+STATES = {
+    constants.ReadState.SESSION_INFO.value: [constants.SessionInfoState.STARTED.value],
+    constants.ReadState.TIME_CURRENT.value: [0x1234567890],
+    constants.ReadState.CAN_COMM.value: [constants.CanCommState.ERROR_ACTIVE.value],
+}
+
+
+def _get_property(session_ref, property_id, property_size, property_value):
+    property_value.contents.value = PROPERTIES[property_id.value]
+    return _ctypedefs.u32(0)
+
+
+def _read_state(session_ref, state_id, state_size, state_value, fault):
+    value_type = _ctypedefs.nxTimestamp_t if state_id.value == constants.ReadState.TIME_CURRENT.value \
+        else _ctypedefs.u32
+    values = STATES[state_id.value]
+    assert state_size.value == len(values) * ctypes.sizeof(value_type)
+    value_array = (value_type * len(values))(*values)
+    ctypes.memmove(state_value, value_array, state_size.value)
+    return _ctypedefs.u32(0)
+
+
+def mock_snapshot_lib():
+    lib = mock.create_autospec(_cfuncs.XnetLibrary, spec_set=True, instance=True)
+    lib.nx_create_session.return_value = _ctypedefs.u32(0)
+    lib.nx_clear.return_value = _ctypedefs.u32(0)
+    lib.nx_get_property.side_effect = _get_property
+    lib.nx_read_state.side_effect = _read_state
+    return lib
+
+
+def wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_snapshot():
+    lib = mock_snapshot_lib()
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            before = time.time()
+            snapshot = input_session.snapshot()
+            assert snapshot.timestamp >= before
+            assert snapshot._replace(timestamp=None) == (
+                None, 3, 97, 100, constants.SessionInfoState.STARTED, 0x1234567890, None, None)
+            assert lib.nx_get_property.call_count == 3
+            assert lib.nx_read_state.call_count == 2
+
+            snapshot = input_session.snapshot(['num_pend', 'can_comm'])
+            assert snapshot.num_pend == 3
+            assert snapshot.num_unused is None
+            assert isinstance(snapshot.can_comm, types.CanComm)
+            assert snapshot.can_comm.state == constants.CanCommState.ERROR_ACTIVE
+
+            with pytest.raises(ValueError):
+                input_session.snapshot(['bogus'])
+
+
+def test_snapshot_reuses_arguments():
+    lib = mock_snapshot_lib()
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            input_session.snapshot(['num_pend'])
+            first = lib.nx_get_property.call_args[0]
+            input_session.snapshot(['num_pend'])
+            second = lib.nx_get_property.call_args[0]
+            assert all(first_arg is second_arg for first_arg, second_arg in zip(first, second))
+
+
+def test_snapshot_error():
+    lib = mock_snapshot_lib()
+    lib.nx_read_state.side_effect = errors.XnetError("", _cconsts.NX_ERR_INTERNAL_ERROR)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            with pytest.raises(errors.XnetError):
+                input_session.snapshot()
+
+
+def test_sampler():
+    lib = mock_snapshot_lib()
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            sampler = input_session.start_sampler(interval=0.001, fields=['num_pend', 'state'], maxlen=4)
+            assert input_session.sampler is sampler
+            with pytest.raises(RuntimeError):
+                input_session.start_sampler()
+
+            wait_for(lambda: len(sampler.samples()) == 4)
+            timestamps, values = sampler.series('num_pend')
+            assert len(timestamps) == len(values) == 4
+            assert timestamps == sorted(timestamps)
+            assert values == [3] * 4
+            with pytest.raises(ValueError):
+                sampler.series('queue_size')
+        assert not sampler.running
+        assert len(sampler.samples()) == 4
+
+
+def test_sampler_error():
+    lib = mock_snapshot_lib()
+    lib.nx_get_property.side_effect = errors.XnetError("", _cconsts.NX_ERR_INTERNAL_ERROR)
+    with mock.patch('nixnet._cfuncs.lib', lib):
+        with nixnet.FrameInStreamSession('CAN1') as input_session:
+            sampler = input_session.start_sampler(interval=0.001)
+            wait_for(lambda: not sampler.running)
+            with pytest.raises(errors.XnetError):
+                sampler.samples()
+            assert sampler.samples() == []
+            with pytest.raises(ValueError):
+                input_session.start_sampler(interval=0)